@@ -7,6 +7,13 @@ from rentl_agents.context import (
     merge_scene_summaries,
     validate_scene_input,
 )
+from rentl_agents.edit import (
+    chunk_edit_lines,
+    edit_result_to_lines,
+    format_lines_for_edit_prompt,
+    get_scene_summary_for_edit,
+    group_qa_issues_by_line,
+)
 from rentl_agents.factory import AgentConfig, AgentFactory
 from rentl_agents.harness import AgentHarness, AgentHarnessConfig
 from rentl_agents.layers import (
@@ -133,6 +140,7 @@ __all__ = [
     "ToolResolutionError",
     "TranslateDirectTranslatorAgent",
     "build_qa_summary",
+    "chunk_edit_lines",
     "chunk_lines",
     "chunk_qa_lines",
     "create_context_agent_from_profile",
@@ -141,10 +149,12 @@ __all__ = [
     "create_qa_agent_from_profile",
     "create_translate_agent_from_profile",
     "discover_agent_profiles",
+    "edit_result_to_lines",
     "empty_qa_output",
     "extract_template_variables",
     "format_annotated_lines_for_prompt",
     "format_glossary_terms",
+    "format_lines_for_edit_prompt",
     "format_lines_for_prompt",
     "format_lines_for_qa_prompt",
     "format_pretranslation_annotations",
@@ -154,9 +164,11 @@ __all__ = [
     "get_default_agents_dir",
     "get_default_prompts_dir",
     "get_default_registry",
+    "get_scene_summary_for_edit",
     "get_scene_summary_for_lines",
     "get_scene_summary_for_qa",
     "group_lines_by_scene",
+    "group_qa_issues_by_line",
     "idiom_to_annotation",
     "load_agent_profile",
     "load_layer_registry",
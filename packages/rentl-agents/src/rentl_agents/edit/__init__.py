@@ -0,0 +1,23 @@
+"""Edit phase utilities for rentl-agents.
+
+This module provides utilities for the edit phase:
+- QA issue grouping and flagged-line chunking
+- Line formatting for edit prompts
+- Edit result conversion
+"""
+
+from rentl_agents.edit.lines import (
+    chunk_edit_lines,
+    edit_result_to_lines,
+    format_lines_for_edit_prompt,
+    get_scene_summary_for_edit,
+    group_qa_issues_by_line,
+)
+
+__all__ = [
+    "chunk_edit_lines",
+    "edit_result_to_lines",
+    "format_lines_for_edit_prompt",
+    "get_scene_summary_for_edit",
+    "group_qa_issues_by_line",
+]
@@ -0,0 +1,160 @@
+"""Line utilities for edit phase.
+
+This module provides:
+- QA issue grouping so unflagged lines can skip the model
+- Line chunking for batch editing
+- Line formatting for edit prompt injection
+- Edit result conversion
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+
+from rentl_schemas.io import TranslatedLine
+from rentl_schemas.phases import SceneSummary, TranslationResultList
+from rentl_schemas.primitives import LineId, SceneId
+from rentl_schemas.qa import QaIssue
+
+
+def group_qa_issues_by_line(
+    issues: list[QaIssue] | None,
+) -> dict[LineId, list[QaIssue]]:
+    """Group QA issues by the line they flag.
+
+    Args:
+        issues: QA issues from the QA phase.
+
+    Returns:
+        Mapping of line_id to its issues, in input order.
+    """
+    grouped: dict[LineId, list[QaIssue]] = {}
+    for issue in issues or []:
+        grouped.setdefault(issue.line_id, []).append(issue)
+    return grouped
+
+
+def chunk_edit_lines(
+    translated_lines: list[TranslatedLine],
+    chunk_size: int = 10,
+) -> list[list[TranslatedLine]]:
+    """Split flagged translated lines into chunks for batch editing.
+
+    Args:
+        translated_lines: Translated lines that need edits.
+        chunk_size: Maximum lines per chunk (default 10).
+
+    Returns:
+        List of line chunks.
+
+    Raises:
+        ValueError: If chunk_size is not positive.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    return [
+        translated_lines[i : i + chunk_size]
+        for i in range(0, len(translated_lines), chunk_size)
+    ]
+
+
+def format_lines_for_edit_prompt(
+    translated_lines: list[TranslatedLine],
+    issues_by_line: dict[LineId, list[QaIssue]],
+) -> str:
+    """Format translated lines and their QA issues for edit prompt injection.
+
+    Args:
+        translated_lines: Translated lines to edit.
+        issues_by_line: QA issues keyed by line_id.
+
+    Returns:
+        Formatted string for prompt template.
+    """
+    formatted_lines: list[str] = []
+
+    for line in translated_lines:
+        header = f"[{line.line_id}]"
+        if line.speaker:
+            header = f"{header} [{line.speaker}]"
+        issue_lines = [
+            f"    - [{issue.severity}/{issue.category}] {issue.message}"
+            for issue in issues_by_line.get(line.line_id, [])
+        ]
+        formatted_lines.append(
+            "\n".join([
+                header,
+                f"  Source: {line.source_text or 'N/A'}",
+                f"  Translation: {line.text}",
+                "  QA issues:",
+                *(issue_lines or ["    - None"]),
+            ])
+        )
+
+    return "\n\n".join(formatted_lines)
+
+
+def get_scene_summary_for_edit(
+    translated_lines: list[TranslatedLine],
+    scene_summaries: list[SceneSummary] | None,
+) -> str:
+    """Get relevant scene summaries for edit context.
+
+    Args:
+        translated_lines: Translated lines with optional scene_id.
+        scene_summaries: Available scene summaries from context phase.
+
+    Returns:
+        Combined scene summary text, or "None" if none available.
+    """
+    if not scene_summaries:
+        return "None"
+
+    scene_ids: set[SceneId] = {
+        line.scene_id for line in translated_lines if line.scene_id is not None
+    }
+    summary_map: dict[SceneId, SceneSummary] = {
+        summary.scene_id: summary for summary in scene_summaries
+    }
+    relevant_summaries = [
+        f"[{scene_id}]: {summary_map[scene_id].summary}"
+        for scene_id in sorted(scene_ids)
+        if scene_id in summary_map
+    ]
+
+    return "\n".join(relevant_summaries) if relevant_summaries else "None"
+
+
+def edit_result_to_lines(
+    result: TranslationResultList,
+    translated_lines: list[TranslatedLine],
+) -> list[TranslatedLine]:
+    """Apply an LLM edit result to the lines it was produced for.
+
+    Metadata is preserved from the input lines; only the text changes.
+
+    Args:
+        result: Edit result list from the LLM.
+        translated_lines: Input lines for the chunk.
+
+    Returns:
+        Edited lines in input order.
+
+    Raises:
+        ValueError: If result line_ids do not align with input line_ids.
+    """
+    expected_ids = [line.line_id for line in translated_lines]
+    actual_ids = [edit.line_id for edit in result.translations]
+    counts = Counter(actual_ids)
+    if counts != Counter(expected_ids) or len(counts) != len(actual_ids):
+        raise ValueError(
+            "Edit alignment error: output IDs must match input IDs. "
+            f"Expected {expected_ids}, got {actual_ids}."
+        )
+
+    edit_map = {edit.line_id: edit.text for edit in result.translations}
+    return [
+        line.model_copy(update={"text": edit_map[line.line_id]})
+        for line in translated_lines
+    ]
@@ -219,7 +219,7 @@ class AgentFactory:
         Args:
             config: Agent configuration.
             output_type: Output schema type.
-            count: Number of agent instances to create.
+            count: Number of payloads the agent may run concurrently.
             max_parallel: Optional cap on concurrent tasks.
 
         Returns:
@@ -18,6 +18,7 @@ from pydantic import BaseModel, ConfigDict, Field
 from rentl_agents.templates import (
     TemplateContext,
     TemplateValidationError,
+    extract_template_variables,
     get_allowed_variables_for_layer,
     validate_template,
 )
@@ -525,6 +526,55 @@ class PromptComposer(BaseModel):
 
         return self.separator.join(parts)
 
+    def prefix_variables(self, agent_profile: AgentProfileConfig) -> frozenset[str]:
+        """Get the variables the system prompt and static context depend on.
+
+        Contexts that agree on these variables render the same prompt prefix,
+        so the composed prefix can be reused across chunks.
+
+        Args:
+            agent_profile: Agent profile with agent-layer prompts.
+
+        Returns:
+            Names of variables referenced by the prefix templates.
+        """
+        templates = [agent_profile.prompts.agent.content]
+        if self.registry.root is not None:
+            templates.append(self.registry.root.system.content)
+        phase_config = self.registry.get_phase(agent_profile.meta.phase)
+        if phase_config is not None:
+            templates.append(phase_config.system.content)
+        if agent_profile.prompts.static_context is not None:
+            templates.append(agent_profile.prompts.static_context.content)
+        names: set[str] = set()
+        for template in templates:
+            names |= extract_template_variables(template)
+        return frozenset(names)
+
+    def render_static_context(
+        self,
+        agent_profile: AgentProfileConfig,
+        context: TemplateContext,
+    ) -> str | None:
+        """Render the static context prompt, if the profile defines one.
+
+        The static context holds chunk-independent content (style guide,
+        glossary) so it can be sent as a byte-identical prefix ahead of the
+        per-chunk user prompt.
+
+        Args:
+            agent_profile: Agent profile with optional static context template.
+            context: Template context with variables for rendering.
+
+        Returns:
+            Rendered static context, or None if the profile has none.
+        """
+        static_context = agent_profile.prompts.static_context
+        if static_context is None:
+            return None
+        rendered = context.render(static_context.content, strict=True).strip()
+        return rendered or None
+
     def render_user_prompt(
         self,
         agent_profile: AgentProfileConfig,
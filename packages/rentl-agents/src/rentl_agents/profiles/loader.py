@@ -260,6 +260,13 @@ def _load_agent_profile_sync(path: Path) -> AgentProfileConfig:
             context=f"{profile.meta.name} user prompt template",
         )
 
+        if profile.prompts.static_context is not None:
+            validate_template(
+                profile.prompts.static_context.content,
+                get_allowed_variables_for_layer("static"),
+                context=f"{profile.meta.name} static context prompt",
+            )
+
         resolve_output_schema(profile.meta.output_schema)
         return profile
 
@@ -349,6 +356,13 @@ async def load_agent_profile_async(path: Path) -> AgentProfileConfig:
             context=f"{profile.meta.name} user prompt template",
         )
 
+        if profile.prompts.static_context is not None:
+            validate_template(
+                profile.prompts.static_context.content,
+                get_allowed_variables_for_layer("static"),
+                context=f"{profile.meta.name} static context prompt",
+            )
+
         # Verify output schema can be resolved
         resolve_output_schema(profile.meta.output_schema)
 
@@ -7,13 +7,16 @@ defined by TOML profiles.
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import logging
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Literal, TypeVar
 from uuid import UUID, uuid7
 
-from pydantic import Field
+from pydantic import Field, ValidationError
 from pydantic_ai import Agent
 from pydantic_ai.exceptions import UnexpectedModelBehavior, UsageLimitExceeded
 from pydantic_ai.messages import (
@@ -22,7 +25,11 @@ from pydantic_ai.messages import (
     ModelResponse,
     RetryPromptPart,
     ToolCallPart,
+    ToolReturnPart,
+    UserPromptPart,
 )
+from pydantic_ai.models import Model
+from pydantic_ai.settings import merge_model_settings
 from pydantic_ai.tools import RunContext, ToolDefinition
 from pydantic_ai.usage import RunUsage, UsageLimits
 
@@ -37,12 +44,20 @@ from rentl_agents.templates import TemplateContext
 from rentl_agents.tools.registry import ToolRegistry
 from rentl_core import AgentTelemetryEmitter
 from rentl_core.ports.orchestrator import PhaseAgentProtocol
-from rentl_llm.provider_factory import create_model
+from rentl_llm.model_registry import ModelRegistry
+from rentl_llm.provider_factory import build_prompt_cache_settings, create_model
+from rentl_llm.rate_limit import (
+    RateLimitedModel,
+    get_request_governor,
+    is_rate_limit_error,
+    retry_after_from_error,
+)
+from rentl_llm.response_cache import LlmResponseCache, build_response_cache_key
 from rentl_schemas.agents import AgentProfileConfig
 from rentl_schemas.base import BaseSchema
-from rentl_schemas.config import OpenRouterProviderRoutingConfig
+from rentl_schemas.config import CacheConfig, OpenRouterProviderRoutingConfig
 from rentl_schemas.events import ProgressEvent
-from rentl_schemas.primitives import PhaseName, RunId
+from rentl_schemas.primitives import JsonValue, PhaseName, RunId
 from rentl_schemas.progress import (
     AgentStatus,
     AgentTelemetry,
@@ -59,6 +74,9 @@ DEFAULT_MAX_OUTPUT_TOKENS = 4096
 _MAX_DIAGNOSTIC_ENTRIES = 3
 _MAX_MODEL_OUTPUT_CHARS = 2000
 
+# Values of the variables a prompt prefix depends on, in sorted name order
+type _PrefixKey = tuple[tuple[str, str | None], ...]
+
 
 @dataclass
 class _ValidationFailureInfo:
@@ -201,6 +219,28 @@ class ProfileAgentConfig(BaseSchema):
         ge=0,
         description="Output cost per million tokens (USD)",
     )
+    max_parallel_requests: int | None = Field(
+        None,
+        gt=0,
+        description="In-flight request cap shared by all agents on the endpoint",
+    )
+    phase_max_parallel_requests: int | None = Field(
+        None,
+        gt=0,
+        description="In-flight request cap for this agent's phase on the endpoint",
+    )
+    requests_per_minute: int | None = Field(
+        None, gt=0, description="Request budget per minute for the endpoint"
+    )
+    tokens_per_minute: int | None = Field(
+        None, gt=0, description="Token budget per minute for the endpoint"
+    )
+    response_cache: CacheConfig | None = Field(
+        None,
+        description=(
+            "Disk cache settings for model responses (cache_dir should be absolute)"
+        ),
+    )
 
 
 class ProfileAgent(PhaseAgentProtocol[InputT, OutputT_co]):
@@ -211,6 +251,9 @@ class ProfileAgent(PhaseAgentProtocol[InputT, OutputT_co]):
     - Uses pydantic-ai for structured output
     - Supports tool registration from profile
     - Handles retries with exponential backoff
+
+    The template context is passed per call, so one instance can serve many
+    concurrent chunks; the composed prompt prefix is cached on the agent.
     """
 
     def __init__(
@@ -222,6 +265,7 @@ class ProfileAgent(PhaseAgentProtocol[InputT, OutputT_co]):
         config: ProfileAgentConfig,
         template_context: TemplateContext | None = None,
         telemetry_emitter: AgentTelemetryEmitter | None = None,
+        model_registry: ModelRegistry | None = None,
     ) -> None:
         """Initialize the profile agent.
 
@@ -231,9 +275,13 @@ class ProfileAgent(PhaseAgentProtocol[InputT, OutputT_co]):
             layer_registry: Prompt layer registry.
             tool_registry: Tool registry.
             config: Runtime configuration.
-            template_context: Template context for prompt rendering.
+            template_context: Default template context for calls that do not
+                pass one.
             telemetry_emitter: Optional telemetry emitter for agent status.
+            model_registry: Optional registry sharing models and HTTP
+                connection pools across calls.
         """
+        tool_registry.validate_prefetched(profile.tools.prefetch)
         self._profile = profile
         self._output_type = output_type
         self._layer_registry = layer_registry
@@ -241,7 +289,16 @@ class ProfileAgent(PhaseAgentProtocol[InputT, OutputT_co]):
         self._config = config
         self._template_context = template_context or TemplateContext()
         self._composer = PromptComposer(registry=layer_registry)
+        self._prefix_variables = sorted(self._composer.prefix_variables(profile))
+        self._prefix_cache: tuple[_PrefixKey, tuple[str, str | None]] | None = None
+        self._prefetched: dict[str, dict[str, JsonValue]] | None = None
         self._telemetry_emitter = telemetry_emitter
+        self._model_registry = model_registry
+        self._response_cache = (
+            LlmResponseCache.from_config(config.response_cache)
+            if config.response_cache is not None
+            else None
+        )
 
     @property
     def profile(self) -> AgentProfileConfig:
@@ -253,19 +310,20 @@ class ProfileAgent(PhaseAgentProtocol[InputT, OutputT_co]):
         """Get the agent name."""
         return self._profile.meta.name
 
-    def update_context(self, context: TemplateContext) -> None:
-        """Update the template context.
-
-        Args:
-            context: New template context.
-        """
-        self._template_context = context
-
-    async def run(self, payload: InputT) -> OutputT_co:
+    async def run(
+        self,
+        payload: InputT,
+        context: TemplateContext | None = None,
+        cacheable: Callable[[OutputT_co], bool] | None = None,
+    ) -> OutputT_co:
         """Execute the agent with the given payload.
 
         Args:
             payload: Input payload (phase-specific).
+            context: Template context for this call; defaults to the context
+                given at construction.
+            cacheable: Check an output must pass to be stored in or served
+                from the response cache; None accepts every output.
 
         Returns:
             OutputT: Agent output matching output_type.
@@ -275,6 +333,8 @@ class ProfileAgent(PhaseAgentProtocol[InputT, OutputT_co]):
             UnexpectedModelBehavior: If the model produces invalid output.
             RuntimeError: If execution fails after all retries on transient errors.
         """
+        if context is None:
+            context = self._template_context
         last_error: Exception | None = None
         run_id = _extract_run_id(payload) if self._telemetry_emitter else None
         agent_run_id = _build_agent_run_id(self._profile.meta.name)
@@ -311,7 +371,7 @@ class ProfileAgent(PhaseAgentProtocol[InputT, OutputT_co]):
         max_attempts = self._config.max_retries + 1
         for attempt in range(1, max_attempts + 1):
             try:
-                output, usage = await self._execute(payload)
+                output, usage = await self._execute(payload, context, cacheable)
                 tool_calls_observed, required_tools_satisfied = (
                     _build_tool_reliability_markers(
                         usage=usage,
@@ -491,6 +551,10 @@ class ProfileAgent(PhaseAgentProtocol[InputT, OutputT_co]):
                             timestamp=_now_timestamp(),
                         )
                     delay = self._config.retry_base_delay * (2 ** (attempt - 1))
+                    if is_rate_limit_error(exc):
+                        retry_after = retry_after_from_error(exc)
+                        if retry_after is not None:
+                            delay = max(delay, retry_after)
                     await asyncio.sleep(delay)
                     continue
                 completed_at = _now_timestamp()
@@ -527,7 +591,10 @@ class ProfileAgent(PhaseAgentProtocol[InputT, OutputT_co]):
         ) from last_error
 
     async def _execute(
-        self, payload: InputT
+        self,
+        payload: InputT,
+        context: TemplateContext | None = None,
+        cacheable: Callable[[OutputT_co], bool] | None = None,
     ) -> tuple[OutputT_co, AgentUsageTotals | None]:
         """Execute a single agent invocation.
 
@@ -536,6 +603,9 @@ class ProfileAgent(PhaseAgentProtocol[InputT, OutputT_co]):
 
         Args:
             payload: Input payload.
+            context: Template context; defaults to the construction context.
+            cacheable: Check an output must pass to be stored in or served
+                from the response cache; None accepts every output.
 
         Returns:
             Agent output.
@@ -546,39 +616,24 @@ class ProfileAgent(PhaseAgentProtocol[InputT, OutputT_co]):
             UnexpectedModelBehavior: If model output fails validation after
                 retries.
         """
-        # Build prompts from layers
-        system_prompt = self._composer.compose_system_prompt(
-            self._profile,
-            self._template_context,
-        )
+        if context is None:
+            context = self._template_context
 
-        # Add explicit instruction for function calling with local models
-        # Local models often ignore the function name and choose their own
-        # We explicitly tell them to use "final_result"
-        system_prompt += (
-            "\n\nIMPORTANT: When returning structured output via function calling, "
-            "you MUST use the function named 'final_result'. "
-            "Do not create your own function names."
-        )
-
-        if self._config.required_tool_calls:
-            tool_names = ", ".join(self._config.required_tool_calls)
-            system_prompt += (
-                f"\n\nIMPORTANT: The following tools are required and must be called "
-                f"during this task: {tool_names}. Your output will be rejected if "
-                f"any required tool has not been called. Call them at the appropriate "
-                f"point during your work."
+        # Build prompts from layers
+        system_prompt, static_prompt = self._compose_prefix(context)
+        user_prompt = self._composer.render_user_prompt(self._profile, context)
+
+        # Prefetched tools take no arguments, so they run once per agent; the
+        # model only gets the remaining tools
+        if self._prefetched is None:
+            self._prefetched = self._tool_registry.execute_prefetched(
+                self._profile.tools.prefetch
             )
-
-        user_prompt = self._composer.render_user_prompt(
-            self._profile,
-            self._template_context,
-        )
-
-        # Get tools for this agent
-        tool_callables = self._tool_registry.get_tool_callables(
-            self._profile.tools.allowed
-        )
+        prefetched = self._prefetched
+        tool_names = [
+            name for name in self._profile.tools.allowed if name not in prefetched
+        ]
+        tool_callables = self._tool_registry.get_tool_callables(tool_names)
 
         # Detect provider and enforce tool-only compatibility
         base_url = self._config.base_url
@@ -595,16 +650,70 @@ class ProfileAgent(PhaseAgentProtocol[InputT, OutputT_co]):
         max_output_tokens = self._config.max_output_tokens
         if max_output_tokens is None:
             max_output_tokens = DEFAULT_MAX_OUTPUT_TOKENS
-        model, model_settings = create_model(
-            base_url=base_url,
-            api_key=self._config.api_key,
-            model_id=self._config.model_id,
-            temperature=self._config.temperature,
-            top_p=self._config.top_p,
-            timeout_s=self._config.timeout_s,
-            max_output_tokens=max_output_tokens,
-            openrouter_provider=self._config.openrouter_provider,
-            strict_tools=self._config.strict_tools,
+        if self._model_registry is not None:
+            model, model_settings = self._model_registry.get_model(
+                base_url=base_url,
+                api_key=self._config.api_key,
+                model_id=self._config.model_id,
+                temperature=self._config.temperature,
+                top_p=self._config.top_p,
+                timeout_s=self._config.timeout_s,
+                max_output_tokens=max_output_tokens,
+                openrouter_provider=self._config.openrouter_provider,
+                strict_tools=self._config.strict_tools,
+                max_connections=self._config.max_parallel_requests,
+            )
+        else:
+            model, model_settings = create_model(
+                base_url=base_url,
+                api_key=self._config.api_key,
+                model_id=self._config.model_id,
+                temperature=self._config.temperature,
+                top_p=self._config.top_p,
+                timeout_s=self._config.timeout_s,
+                max_output_tokens=max_output_tokens,
+                openrouter_provider=self._config.openrouter_provider,
+                strict_tools=self._config.strict_tools,
+            )
+
+        cache_key: str | None = None
+        if self._response_cache is not None:
+            cache_key = build_response_cache_key(
+                model_id=self._config.model_id,
+                model_settings={
+                    "base_url": base_url,
+                    "settings": dict(model_settings),
+                },
+                system_prompt=system_prompt,
+                user_prompt="\n\n".join(
+                    part for part in (static_prompt, user_prompt) if part
+                ),
+                output_schema=self._output_type.model_json_schema(),
+                tool_names=tool_names,
+                tool_results=prefetched,
+            )
+            cached = _load_cached_response(
+                await self._response_cache.get(cache_key), self._output_type
+            )
+            if cached is not None and (cacheable is None or cacheable(cached[0])):
+                _logger.debug("Agent %s served from response cache", self.name)
+                return cached
+
+        model = self._apply_rate_limits(model)
+
+        # Everything ahead of the user prompt is identical across the chunks
+        # of a phase, so providers can serve it from their prefix cache
+        request_settings = merge_model_settings(
+            model_settings,
+            build_prompt_cache_settings(
+                base_url,
+                _prompt_prefix_key(
+                    self._profile.meta.phase,
+                    system_prompt,
+                    static_prompt,
+                    prefetched,
+                ),
+            ),
         )
 
         prepare_output_tools = None
@@ -689,9 +798,11 @@ class ProfileAgent(PhaseAgentProtocol[InputT, OutputT_co]):
             request_limit=self._config.max_requests_per_run,
         )
 
+        message_history = _build_message_history(static_prompt, prefetched, user_prompt)
         async with agent.iter(
-            user_prompt,
-            model_settings=model_settings,
+            None,
+            message_history=message_history,
+            model_settings=request_settings,
             usage_limits=usage_limits,
         ) as agent_run:
             try:
@@ -707,6 +818,18 @@ class ProfileAgent(PhaseAgentProtocol[InputT, OutputT_co]):
                     input_cost_per_mtok=self._config.input_cost_per_mtok,
                     output_cost_per_mtok=self._config.output_cost_per_mtok,
                 )
+                if (
+                    self._response_cache is not None
+                    and cache_key is not None
+                    and (cacheable is None or cacheable(result.output))
+                ):
+                    await self._response_cache.put(
+                        cache_key,
+                        {
+                            "output": result.output.model_dump(mode="json"),
+                            "usage": usage.model_dump(mode="json") if usage else None,
+                        },
+                    )
                 return result.output, usage
             except (UnexpectedModelBehavior, UsageLimitExceeded) as e:
                 # Extract diagnostics from message history before re-raising
@@ -724,6 +847,165 @@ class ProfileAgent(PhaseAgentProtocol[InputT, OutputT_co]):
                 e._validation_failure_info = info  # type: ignore[attr-defined]
                 raise
 
+    def _compose_prefix(self, context: TemplateContext) -> tuple[str, str | None]:
+        """Compose the system prompt and static context, reusing the last result.
+
+        Chunks of a phase share the variables the prefix depends on, so the
+        prefix is rendered once and reused until those variables change.
+
+        Args:
+            context: Template context for this call.
+
+        Returns:
+            tuple[str, str | None]: System prompt and rendered static context.
+        """
+        variables = context.get_all_variables()
+        key = tuple((name, variables.get(name)) for name in self._prefix_variables)
+        cached = self._prefix_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        system_prompt = self._composer.compose_system_prompt(self._profile, context)
+
+        # Add explicit instruction for function calling with local models
+        # Local models often ignore the function name and choose their own
+        # We explicitly tell them to use "final_result"
+        system_prompt += (
+            "\n\nIMPORTANT: When returning structured output via function calling, "
+            "you MUST use the function named 'final_result'. "
+            "Do not create your own function names."
+        )
+
+        if self._config.required_tool_calls:
+            tool_names = ", ".join(self._config.required_tool_calls)
+            system_prompt += (
+                f"\n\nIMPORTANT: The following tools are required and must be called "
+                f"during this task: {tool_names}. Your output will be rejected if "
+                f"any required tool has not been called. Call them at the appropriate "
+                f"point during your work."
+            )
+
+        static_prompt = self._composer.render_static_context(self._profile, context)
+        prefix = (system_prompt, static_prompt)
+        self._prefix_cache = (key, prefix)
+        return prefix
+
+    def _apply_rate_limits(self, model: Model) -> Model:
+        """Route model requests through the shared endpoint governor.
+
+        Args:
+            model: Model created by the provider factory.
+
+        Returns:
+            Model: Rate-limited model, or the original when no limits apply.
+        """
+        config = self._config
+        if (
+            config.max_parallel_requests is None
+            and config.phase_max_parallel_requests is None
+            and config.requests_per_minute is None
+            and config.tokens_per_minute is None
+        ):
+            return model
+        limiter = get_request_governor().limiter_for(
+            config.base_url,
+            max_parallel_requests=config.max_parallel_requests,
+            requests_per_minute=config.requests_per_minute,
+            tokens_per_minute=config.tokens_per_minute,
+        )
+        return RateLimitedModel(
+            model,
+            limiter,
+            scope=str(self._profile.meta.phase),
+            scope_limit=config.phase_max_parallel_requests,
+        )
+
+
+_PREFETCH_PROMPT = "Review the project context before starting."
+
+
+def _build_message_history(
+    static_prompt: str | None,
+    results: dict[str, dict[str, JsonValue]],
+    user_prompt: str,
+) -> list[ModelMessage]:
+    # Static content comes first and the per-chunk user prompt last, so every
+    # chunk of a phase shares a byte-identical prefix. Prefetched tools are
+    # replayed as a completed tool-call turn, as if the model had called them.
+    if not results:
+        parts = [UserPromptPart(content=user_prompt)]
+        if static_prompt:
+            parts.insert(0, UserPromptPart(content=static_prompt))
+        return [ModelRequest(parts=parts)]
+    call_ids = {name: f"prefetch_{name}" for name in results}
+    return [
+        ModelRequest(parts=[UserPromptPart(content=static_prompt or _PREFETCH_PROMPT)]),
+        ModelResponse(
+            parts=[
+                ToolCallPart(tool_name=name, args={}, tool_call_id=call_ids[name])
+                for name in results
+            ]
+        ),
+        ModelRequest(
+            parts=[
+                *(
+                    ToolReturnPart(
+                        tool_name=name, content=content, tool_call_id=call_ids[name]
+                    )
+                    for name, content in results.items()
+                ),
+                UserPromptPart(content=user_prompt),
+            ]
+        ),
+    ]
+
+
+def _prompt_prefix_key(
+    phase: PhaseName | str,
+    system_prompt: str,
+    static_prompt: str | None,
+    results: dict[str, dict[str, JsonValue]],
+) -> str:
+    material = json.dumps(
+        [system_prompt, static_prompt, results],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    ).encode("utf-8")
+    digest = hashlib.sha256(material).hexdigest()[:24]
+    return f"rentl-{phase}-{digest}"
+
+
+def _load_cached_response[OutputT: BaseSchema](
+    entry: JsonValue | None, output_type: type[OutputT]
+) -> tuple[OutputT, AgentUsageTotals] | None:
+    """Rebuild an output and its usage from a response cache entry.
+
+    A replayed response spends no tokens, so token and cost totals are zero;
+    tool calls carry over so required-tool markers still describe the
+    original response.
+
+    Args:
+        entry: Cached payload, or None on a cache miss.
+        output_type: Expected output schema type.
+
+    Returns:
+        Output and usage totals, or None when the entry is missing or stale.
+    """
+    if not isinstance(entry, dict):
+        return None
+    try:
+        output = output_type.model_validate(entry.get("output"))
+        stored_usage = entry.get("usage")
+        tool_calls = (
+            AgentUsageTotals.model_validate(stored_usage).tool_calls
+            if stored_usage is not None
+            else 0
+        )
+    except ValidationError:
+        return None
+    return output, AgentUsageTotals(tool_calls=tool_calls, cost_usd=0.0)
+
 
 def _build_usage_totals(
     usage: RunUsage | None,
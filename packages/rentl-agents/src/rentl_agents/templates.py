@@ -87,6 +87,13 @@ PHASE_LAYER_VARIABLES: frozenset[str] = frozenset({
     "target_lang",
 })
 
+# Static context variables (chunk-independent project content)
+# These are added to root + phase variables for static context prompts
+STATIC_CONTEXT_VARIABLES: frozenset[str] = frozenset({
+    "style_guide",
+    "glossary_terms",
+})
+
 # Agent layer variables by phase
 # These are added to root + phase variables for agent prompts
 CONTEXT_AGENT_VARIABLES: frozenset[str] = frozenset({
@@ -127,10 +134,8 @@ QA_AGENT_VARIABLES: frozenset[str] = frozenset({
 })
 
 EDIT_AGENT_VARIABLES: frozenset[str] = frozenset({
-    "line_id",
-    "source_text",
-    "translated_text",
-    "qa_issues",
+    "lines_to_edit",
+    "line_count",
     "scene_summary",
     "alignment_feedback",
 })
@@ -163,7 +168,8 @@ def get_allowed_variables_for_layer(layer: str) -> frozenset[str]:
     """Get allowed variables for a specific layer.
 
     Args:
-        layer: Layer name ('root', 'phase', or phase name for agent layer).
+        layer: Layer name ('root', 'phase', 'static', or phase name for agent
+            layer).
 
     Returns:
         Set of allowed variable names.
@@ -175,6 +181,8 @@ def get_allowed_variables_for_layer(layer: str) -> frozenset[str]:
         return ROOT_LAYER_VARIABLES
     if layer == "phase":
         return ROOT_LAYER_VARIABLES | PHASE_LAYER_VARIABLES
+    if layer == "static":
+        return ROOT_LAYER_VARIABLES | PHASE_LAYER_VARIABLES | STATIC_CONTEXT_VARIABLES
     if layer in PHASE_AGENT_VARIABLES:
         return (
             ROOT_LAYER_VARIABLES | PHASE_LAYER_VARIABLES | PHASE_AGENT_VARIABLES[layer]
@@ -3,10 +3,12 @@
 This module provides:
 - ToolRegistry for storing and retrieving tools by name
 - Tool resolution for agent profiles
+- Local execution of prefetched tools
 """
 
 from __future__ import annotations
 
+import inspect
 from collections.abc import Callable
 from typing import Protocol, runtime_checkable
 
@@ -175,6 +177,46 @@ class ToolRegistry(BaseModel):
             for tool in tools
         ]
 
+    def validate_prefetched(self, tool_names: list[str]) -> None:
+        """Check that prefetched tools are registered and take no arguments.
+
+        Unregistered tools fail the registry lookup with ToolNotFoundError.
+
+        Args:
+            tool_names: Prefetched tool names from agent profile.
+
+        Raises:
+            ValueError: If a tool has required parameters.
+        """
+        for name in tool_names:
+            parameters = inspect.signature(self.get(name).execute).parameters
+            required = [
+                parameter.name
+                for parameter in parameters.values()
+                if parameter.default is inspect.Parameter.empty
+                and parameter.kind
+                not in {inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD}
+            ]
+            if required:
+                raise ValueError(
+                    f"Prefetched tool {name} must take no arguments; "
+                    f"it requires: {', '.join(required)}"
+                )
+
+    def execute_prefetched(
+        self,
+        tool_names: list[str],
+    ) -> dict[str, dict[str, JsonValue]]:
+        """Execute argument-free tools locally instead of via the model.
+
+        Args:
+            tool_names: Prefetched tool names from agent profile.
+
+        Returns:
+            Tool results keyed by tool name, in profile order.
+        """
+        return {name: self.get(name).execute() for name in tool_names}
+
 
 # Global default registry
 _default_registry: ToolRegistry | None = None
@@ -8,20 +8,31 @@ from __future__ import annotations
 
 import logging
 import os
-from collections import Counter
-from collections.abc import Sequence
+from collections import Counter, deque
+from collections.abc import Callable, Mapping, Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, ConfigDict, Field
-from pydantic_ai.exceptions import UnexpectedModelBehavior, UsageLimitExceeded
+from pydantic_ai.exceptions import (
+    IncompleteToolCall,
+    UnexpectedModelBehavior,
+    UsageLimitExceeded,
+)
 
 from rentl_agents.context.scene import (
     format_scene_lines,
     group_lines_by_scene,
     validate_scene_input,
 )
-from rentl_agents.layers import load_layer_registry
+from rentl_agents.edit.lines import (
+    chunk_edit_lines,
+    edit_result_to_lines,
+    format_lines_for_edit_prompt,
+    get_scene_summary_for_edit,
+    group_qa_issues_by_line,
+)
+from rentl_agents.layers import PromptLayerRegistry, load_layer_registry
 from rentl_agents.pretranslation.lines import (
     chunk_lines as chunk_pretranslation_lines,
 )
@@ -55,17 +66,27 @@ from rentl_agents.translate.lines import (
     get_scene_summary_for_lines as get_scene_summary_for_translate_lines,
 )
 from rentl_core import AgentTelemetryEmitter
-from rentl_core.orchestrator import PhaseAgentPool
+from rentl_core.chunking import (
+    derive_chunk_token_budget,
+    estimate_tokens,
+    pack_by_token_budget,
+    split_chunk,
+)
+from rentl_core.orchestrator import LanguageAgentPool, PhaseAgentPool
 from rentl_core.ports.orchestrator import (
     ContextAgentPoolProtocol,
     EditAgentPoolProtocol,
     PhaseAgentPoolProtocol,
+    PhaseAgentProtocol,
     PretranslationAgentPoolProtocol,
     QaAgentPoolProtocol,
     TranslateAgentPoolProtocol,
 )
+from rentl_llm.model_registry import ModelRegistry
+from rentl_llm.response_cache import LlmResponseCache
 from rentl_schemas.agents import AgentProfileConfig
 from rentl_schemas.config import (
+    CacheConfig,
     ModelEndpointConfig,
     ModelSettings,
     PhaseConfig,
@@ -81,18 +102,20 @@ from rentl_schemas.phases import (
     EditPhaseOutput,
     IdiomAnnotationList,
     IdiomReviewLine,
+    PretranslationAnnotation,
     PretranslationPhaseInput,
     PretranslationPhaseOutput,
     QaPhaseInput,
     QaPhaseOutput,
     SceneSummary,
+    StyleGuideReviewLine,
     StyleGuideReviewList,
     TranslatePhaseInput,
     TranslatePhaseOutput,
     TranslationResultLine,
     TranslationResultList,
 )
-from rentl_schemas.primitives import LanguageCode, PhaseName, QaSeverity
+from rentl_schemas.primitives import LanguageCode, LineId, PhaseName, QaSeverity
 from rentl_schemas.qa import LineEdit, QaIssue
 
 if TYPE_CHECKING:
@@ -147,6 +170,60 @@ def _alignment_feedback(
     return " ".join(parts)
 
 
+def _collect_aligned[ItemT](
+    items: Sequence[ItemT],
+    *,
+    pending_ids: Sequence[LineId],
+    collected: dict[LineId, ItemT],
+    line_id: Callable[[ItemT], LineId],
+) -> None:
+    # Keep the first output for each pending ID and drop extras/duplicates, so
+    # a retry only has to re-request the IDs that are still missing
+    pending = set(pending_ids)
+    for item in items:
+        item_id = line_id(item)
+        if item_id in pending and item_id not in collected:
+            collected[item_id] = item
+
+
+def _is_aligned[OutputT](
+    expected_ids: Sequence[str],
+    actual_ids: Callable[[OutputT], list[str]],
+) -> Callable[[OutputT], bool]:
+    # Only fully aligned outputs are cached, so a misaligned response is not
+    # replayed to later attempts or runs with the same prompt
+    expected = list(expected_ids)
+
+    def _check(output: OutputT) -> bool:
+        return (
+            _alignment_feedback(
+                expected_ids=expected, actual_ids=actual_ids(output), label="line"
+            )
+            is None
+        )
+
+    return _check
+
+
+def _requeue_halves[ItemT](
+    queue: deque[list[ItemT]],
+    pending: list[ItemT],
+    *,
+    error: Exception,
+    token_budget: int | None,
+) -> bool:
+    # A token-budgeted chunk whose response was truncated or hit a usage limit
+    # is retried as two smaller chunks instead of resending the same oversized
+    # request; other failures are retried whole, so a chunk that keeps failing
+    # is not split into ever more attempts
+    if not isinstance(error, UsageLimitExceeded | IncompleteToolCall):
+        return False
+    if token_budget is None or len(pending) < 2:
+        return False
+    queue.extendleft(reversed(split_chunk(pending)))
+    return True
+
+
 def _max_chunk_attempts(config: ProfileAgentConfig) -> int:
     retries = max(config.max_output_retries, 0)
     return retries + 1
@@ -211,7 +288,7 @@ class ContextSceneSummarizerAgent:
             max_attempts = _max_chunk_attempts(self._config)
             alignment_feedback = "None"
             for attempt in range(1, max_attempts + 1):
-                # Update template context for this scene
+                # Template context for this scene
                 scene_lines_text = format_scene_lines(lines)
                 context = TemplateContext(
                     root_variables={},
@@ -226,12 +303,15 @@ class ContextSceneSummarizerAgent:
                         "alignment_feedback": alignment_feedback,
                     },
                 )
-                self._profile_agent.update_context(context)
 
                 # Run the profile agent for this scene
                 # Note: ProfileAgent returns SceneSummary directly
                 try:
-                    summary = await self._profile_agent.run(payload)
+                    summary = await self._profile_agent.run(
+                        payload,
+                        context,
+                        cacheable=_is_aligned([scene_id], lambda out: [out.scene_id]),
+                    )
                 except (UnexpectedModelBehavior, UsageLimitExceeded) as exc:
                     _logger.debug(
                         "Context agent model failure on scene %s (attempt %d/%d): %s",
@@ -274,6 +354,9 @@ def create_context_agent_from_profile(
     source_lang: LanguageCode = "ja",
     target_lang: LanguageCode = "en",
     telemetry_emitter: AgentTelemetryEmitter | None = None,
+    model_registry: ModelRegistry | None = None,
+    profile: AgentProfileConfig | None = None,
+    layer_registry: PromptLayerRegistry | None = None,
 ) -> ContextSceneSummarizerAgent:
     """Create a context phase agent from a TOML profile.
 
@@ -285,6 +368,10 @@ def create_context_agent_from_profile(
         source_lang: Source language name for prompts.
         target_lang: Target language name for prompts.
         telemetry_emitter: Optional telemetry emitter for agent status.
+        model_registry: Optional shared model/HTTP client registry.
+        profile: Preloaded profile; skips reading profile_path when given.
+        layer_registry: Preloaded prompt layers; skips reading prompts_dir
+            when given.
 
     Returns:
         Context phase agent ready for orchestrator.
@@ -293,7 +380,8 @@ def create_context_agent_from_profile(
         ValueError: If profile is not for context phase.
     """
     # Load the profile
-    profile = load_agent_profile(profile_path)
+    if profile is None:
+        profile = load_agent_profile(profile_path)
 
     # Verify it's a context phase agent
     if profile.meta.phase != PhaseName.CONTEXT:
@@ -303,7 +391,8 @@ def create_context_agent_from_profile(
         )
 
     # Load prompt layers
-    layer_registry = load_layer_registry(prompts_dir)
+    if layer_registry is None:
+        layer_registry = load_layer_registry(prompts_dir)
 
     # Get tool registry
     if tool_registry is None:
@@ -319,6 +408,7 @@ def create_context_agent_from_profile(
         tool_registry=tool_registry,
         config=runtime_config,
         telemetry_emitter=telemetry_emitter,
+        model_registry=model_registry,
     )
 
     # Wrap in ContextSceneSummarizerAgent
@@ -356,10 +446,12 @@ def _with_required_tools_from_profile(
     config: ProfileAgentConfig,
     profile: AgentProfileConfig,
 ) -> ProfileAgentConfig:
-    required_tools = profile.tools.required
+    # Prefetched tools are satisfied before the model runs
+    prefetched = set(profile.tools.prefetch)
+    required_tools = [name for name in profile.tools.required if name not in prefetched]
     if not required_tools:
         return config
-    return config.model_copy(update={"required_tool_calls": list(required_tools)})
+    return config.model_copy(update={"required_tool_calls": required_tools})
 
 
 class PretranslationIdiomLabelerAgent:
@@ -378,19 +470,24 @@ class PretranslationIdiomLabelerAgent:
         chunk_size: int = 10,
         source_lang: LanguageCode = "ja",
         target_lang: LanguageCode = "en",
+        chunk_token_budget: int | None = None,
     ) -> None:
         """Initialize the pretranslation idiom labeler agent.
 
         Args:
             profile_agent: Underlying ProfileAgent for idiom identification.
             config: Runtime configuration.
-            chunk_size: Number of lines per processing chunk.
+            chunk_size: Number of lines per processing chunk (line cap when
+                chunk_token_budget is set).
             source_lang: Source language name for prompts.
             target_lang: Target language name for prompts.
+            chunk_token_budget: Estimated prompt tokens per chunk; None keeps
+                fixed-size chunks.
         """
         self._profile_agent = profile_agent
         self._config = config
         self._chunk_size = chunk_size
+        self._chunk_token_budget = chunk_token_budget
         self._source_lang = source_lang
         self._target_lang = target_lang
 
@@ -411,22 +508,33 @@ class PretranslationIdiomLabelerAgent:
                 chunk-level retries.
         """
         # Chunk lines for batch processing
-        chunks = chunk_pretranslation_lines(payload.source_lines, self._chunk_size)
+        if self._chunk_token_budget is None:
+            chunks = chunk_pretranslation_lines(payload.source_lines, self._chunk_size)
+        else:
+            chunks = pack_by_token_budget(
+                payload.source_lines,
+                cost=lambda line: estimate_tokens(format_lines_for_prompt([line])),
+                budget=self._chunk_token_budget,
+                max_items=self._chunk_size,
+                group_key=lambda line: line.scene_id,
+            )
 
         # Process each chunk
-        all_reviews: list[IdiomReviewLine] = []
+        collected: dict[LineId, IdiomReviewLine] = {}
         max_attempts = _max_chunk_attempts(self._config)
-        for chunk in chunks:
-            expected_ids = [line.line_id for line in chunk]
+        queue = deque(chunks)
+        while queue:
+            chunk = queue.popleft()
+            pending = chunk
             alignment_feedback = "None"
             for attempt in range(1, max_attempts + 1):
-                # Format lines for prompt
-                source_lines_text = format_lines_for_prompt(chunk)
+                # Format only lines still missing a review for prompt
+                source_lines_text = format_lines_for_prompt(pending)
                 scene_summary_text = get_scene_summary_for_pretranslation_lines(
-                    chunk, payload.scene_summaries
+                    pending, payload.scene_summaries
                 )
 
-                # Update template context for this chunk
+                # Template context for this chunk
                 context = TemplateContext(
                     root_variables={},
                     phase_variables={
@@ -436,16 +544,23 @@ class PretranslationIdiomLabelerAgent:
                     agent_variables={
                         "source_lines": source_lines_text,
                         "scene_summary": scene_summary_text,
-                        "line_count": str(len(chunk)),
+                        "line_count": str(len(pending)),
                         "alignment_feedback": alignment_feedback,
                     },
                 )
-                self._profile_agent.update_context(context)
 
                 # Run the profile agent for this chunk
                 # ProfileAgent returns IdiomAnnotationList with per-line reviews
+                pending_ids = [line.line_id for line in pending]
                 try:
-                    result = await self._profile_agent.run(payload)
+                    result = await self._profile_agent.run(
+                        payload,
+                        context,
+                        cacheable=_is_aligned(
+                            pending_ids,
+                            lambda out: [item.line_id for item in out.reviews],
+                        ),
+                    )
                 except (UnexpectedModelBehavior, UsageLimitExceeded) as exc:
                     _logger.debug(
                         "Pretranslation agent model failure on chunk "
@@ -454,23 +569,35 @@ class PretranslationIdiomLabelerAgent:
                         max_attempts,
                         exc,
                     )
+                    if _requeue_halves(
+                        queue,
+                        pending,
+                        error=exc,
+                        token_budget=self._chunk_token_budget,
+                    ):
+                        break
                     if attempt == max_attempts:
                         raise
                     continue
-                actual_ids = [review.line_id for review in result.reviews]
                 feedback = _alignment_feedback(
-                    expected_ids=expected_ids,
-                    actual_ids=actual_ids,
+                    expected_ids=pending_ids,
+                    actual_ids=[review.line_id for review in result.reviews],
                     label="line",
                 )
-                if feedback is not None:
-                    alignment_feedback = feedback
-                    if attempt == max_attempts:
-                        raise RuntimeError(alignment_feedback)
-                    continue
-                all_reviews.extend(result.reviews)
-                break
-
+                _collect_aligned(
+                    result.reviews,
+                    pending_ids=pending_ids,
+                    collected=collected,
+                    line_id=lambda review: review.line_id,
+                )
+                pending = [line for line in chunk if line.line_id not in collected]
+                if feedback is None or not pending:
+                    break
+                alignment_feedback = feedback
+                if attempt == max_attempts:
+                    raise RuntimeError(alignment_feedback)
+
+        all_reviews = [collected[line.line_id] for line in payload.source_lines]
         return merge_idiom_annotations(payload.run_id, all_reviews)
 
 
@@ -483,6 +610,10 @@ def create_pretranslation_agent_from_profile(
     source_lang: LanguageCode = "ja",
     target_lang: LanguageCode = "en",
     telemetry_emitter: AgentTelemetryEmitter | None = None,
+    model_registry: ModelRegistry | None = None,
+    profile: AgentProfileConfig | None = None,
+    layer_registry: PromptLayerRegistry | None = None,
+    chunk_token_budget: int | None = None,
 ) -> PretranslationIdiomLabelerAgent:
     """Create a pretranslation phase agent from a TOML profile.
 
@@ -495,6 +626,12 @@ def create_pretranslation_agent_from_profile(
         source_lang: Source language name for prompts.
         target_lang: Target language name for prompts.
         telemetry_emitter: Optional telemetry emitter for agent status.
+        model_registry: Optional shared model/HTTP client registry.
+        profile: Preloaded profile; skips reading profile_path when given.
+        layer_registry: Preloaded prompt layers; skips reading prompts_dir
+            when given.
+        chunk_token_budget: Estimated prompt tokens per chunk; None keeps
+            fixed-size chunks.
 
     Returns:
         Pretranslation phase agent ready for orchestrator.
@@ -503,7 +640,8 @@ def create_pretranslation_agent_from_profile(
         ValueError: If profile is not for pretranslation phase.
     """
     # Load the profile
-    profile = load_agent_profile(profile_path)
+    if profile is None:
+        profile = load_agent_profile(profile_path)
 
     # Verify it's a pretranslation phase agent
     if profile.meta.phase != PhaseName.PRETRANSLATION:
@@ -513,7 +651,8 @@ def create_pretranslation_agent_from_profile(
         )
 
     # Load prompt layers
-    layer_registry = load_layer_registry(prompts_dir)
+    if layer_registry is None:
+        layer_registry = load_layer_registry(prompts_dir)
 
     # Get tool registry
     if tool_registry is None:
@@ -530,6 +669,7 @@ def create_pretranslation_agent_from_profile(
             tool_registry=tool_registry,
             config=runtime_config,
             telemetry_emitter=telemetry_emitter,
+            model_registry=model_registry,
         )
     )
 
@@ -538,6 +678,7 @@ def create_pretranslation_agent_from_profile(
         profile_agent=profile_agent,
         config=config,
         chunk_size=chunk_size,
+        chunk_token_budget=chunk_token_budget,
         source_lang=source_lang,
         target_lang=target_lang,
     )
@@ -560,19 +701,24 @@ class TranslateDirectTranslatorAgent:
         chunk_size: int = 10,
         source_lang: LanguageCode = "ja",
         target_lang: LanguageCode = "en",
+        chunk_token_budget: int | None = None,
     ) -> None:
         """Initialize the translate direct translator agent.
 
         Args:
             profile_agent: Underlying ProfileAgent for translation.
             config: Runtime configuration.
-            chunk_size: Number of lines per processing chunk.
+            chunk_size: Number of lines per processing chunk (line cap when
+                chunk_token_budget is set).
             source_lang: Source language name for prompts.
             target_lang: Target language name for prompts.
+            chunk_token_budget: Estimated prompt tokens per chunk, including
+                inline annotations; None keeps fixed-size chunks.
         """
         self._profile_agent = profile_agent
         self._config = config
         self._chunk_size = chunk_size
+        self._chunk_token_budget = chunk_token_budget
         self._source_lang = source_lang
         self._target_lang = target_lang
 
@@ -594,24 +740,44 @@ class TranslateDirectTranslatorAgent:
                 chunk-level retries.
         """
         # Chunk lines for batch processing
-        chunks = chunk_translate_lines(payload.source_lines, self._chunk_size)
+        if self._chunk_token_budget is None:
+            chunks = chunk_translate_lines(payload.source_lines, self._chunk_size)
+        else:
+            annotations_by_line: dict[LineId, list[PretranslationAnnotation]] = {}
+            for annotation in payload.pretranslation_annotations or []:
+                annotations_by_line.setdefault(annotation.line_id, []).append(
+                    annotation
+                )
+            chunks = pack_by_token_budget(
+                payload.source_lines,
+                cost=lambda line: estimate_tokens(
+                    format_annotated_lines_for_prompt(
+                        [line], annotations_by_line.get(line.line_id)
+                    )
+                ),
+                budget=self._chunk_token_budget,
+                max_items=self._chunk_size,
+                group_key=lambda line: line.scene_id,
+            )
 
         # Process each chunk
-        all_translated_lines: list[TranslatedLine] = []
+        collected: dict[LineId, TranslationResultLine] = {}
         max_attempts = _max_chunk_attempts(self._config)
-        for chunk in chunks:
-            expected_ids = [line.line_id for line in chunk]
+        queue = deque(chunks)
+        while queue:
+            chunk = queue.popleft()
+            pending = chunk
             alignment_feedback = "None"
             for attempt in range(1, max_attempts + 1):
-                # Format lines with inline annotations and context for prompt
+                # Format untranslated lines with inline annotations and context
                 annotated_lines_text = format_annotated_lines_for_prompt(
-                    chunk, payload.pretranslation_annotations
+                    pending, payload.pretranslation_annotations
                 )
                 scene_summary_text = get_scene_summary_for_translate_lines(
-                    chunk, payload.scene_summaries
+                    pending, payload.scene_summaries
                 )
 
-                # Update template context for this chunk
+                # Template context for this chunk
                 context = TemplateContext(
                     root_variables={},
                     phase_variables={
@@ -621,16 +787,23 @@ class TranslateDirectTranslatorAgent:
                     agent_variables={
                         "annotated_source_lines": annotated_lines_text,
                         "scene_summary": scene_summary_text,
-                        "line_count": str(len(chunk)),
+                        "line_count": str(len(pending)),
                         "alignment_feedback": alignment_feedback,
                     },
                 )
-                self._profile_agent.update_context(context)
 
                 # Run the profile agent for this chunk
                 # ProfileAgent returns TranslationResultList with translated lines
+                pending_ids = [line.line_id for line in pending]
                 try:
-                    result = await self._profile_agent.run(payload)
+                    result = await self._profile_agent.run(
+                        payload,
+                        context,
+                        cacheable=_is_aligned(
+                            pending_ids,
+                            lambda out: [item.line_id for item in out.translations],
+                        ),
+                    )
                 except (UnexpectedModelBehavior, UsageLimitExceeded) as exc:
                     _logger.debug(
                         "Translate agent model failure on chunk (attempt %d/%d): %s",
@@ -638,30 +811,48 @@ class TranslateDirectTranslatorAgent:
                         max_attempts,
                         exc,
                     )
+                    if _requeue_halves(
+                        queue,
+                        pending,
+                        error=exc,
+                        token_budget=self._chunk_token_budget,
+                    ):
+                        break
                     if attempt == max_attempts:
                         raise
                     continue
-                actual_ids = [
-                    translation.line_id for translation in result.translations
-                ]
                 feedback = _alignment_feedback(
-                    expected_ids=expected_ids,
-                    actual_ids=actual_ids,
+                    expected_ids=pending_ids,
+                    actual_ids=[
+                        translation.line_id for translation in result.translations
+                    ],
                     label="line",
                 )
-                if feedback is not None:
-                    alignment_feedback = feedback
-                    if attempt == max_attempts:
-                        raise RuntimeError(alignment_feedback)
-                    continue
-                translated_lines = translation_result_to_lines(result, chunk)
-                all_translated_lines.extend(translated_lines)
-                break
-
+                _collect_aligned(
+                    result.translations,
+                    pending_ids=pending_ids,
+                    collected=collected,
+                    line_id=lambda translation: translation.line_id,
+                )
+                pending = [line for line in chunk if line.line_id not in collected]
+                if feedback is None or not pending:
+                    break
+                alignment_feedback = feedback
+                if attempt == max_attempts:
+                    raise RuntimeError(alignment_feedback)
+
+        translated_lines: list[TranslatedLine] = []
+        if collected:
+            aligned = TranslationResultList(
+                translations=[collected[line.line_id] for line in payload.source_lines]
+            )
+            translated_lines = translation_result_to_lines(
+                aligned, payload.source_lines
+            )
         return merge_translated_lines(
             payload.run_id,
             payload.target_language,
-            all_translated_lines,
+            translated_lines,
         )
 
 
@@ -674,6 +865,10 @@ def create_translate_agent_from_profile(
     source_lang: LanguageCode = "ja",
     target_lang: LanguageCode = "en",
     telemetry_emitter: AgentTelemetryEmitter | None = None,
+    model_registry: ModelRegistry | None = None,
+    profile: AgentProfileConfig | None = None,
+    layer_registry: PromptLayerRegistry | None = None,
+    chunk_token_budget: int | None = None,
 ) -> TranslateDirectTranslatorAgent:
     """Create a translate phase agent from a TOML profile.
 
@@ -686,6 +881,12 @@ def create_translate_agent_from_profile(
         source_lang: Source language name for prompts.
         target_lang: Target language name for prompts.
         telemetry_emitter: Optional telemetry emitter for agent status.
+        model_registry: Optional shared model/HTTP client registry.
+        profile: Preloaded profile; skips reading profile_path when given.
+        layer_registry: Preloaded prompt layers; skips reading prompts_dir
+            when given.
+        chunk_token_budget: Estimated prompt tokens per chunk; None keeps
+            fixed-size chunks.
 
     Returns:
         Translate phase agent ready for orchestrator.
@@ -694,7 +895,8 @@ def create_translate_agent_from_profile(
         ValueError: If profile is not for translate phase.
     """
     # Load the profile
-    profile = load_agent_profile(profile_path)
+    if profile is None:
+        profile = load_agent_profile(profile_path)
 
     # Verify it's a translate phase agent
     if profile.meta.phase != PhaseName.TRANSLATE:
@@ -704,7 +906,8 @@ def create_translate_agent_from_profile(
         )
 
     # Load prompt layers
-    layer_registry = load_layer_registry(prompts_dir)
+    if layer_registry is None:
+        layer_registry = load_layer_registry(prompts_dir)
 
     # Get tool registry
     if tool_registry is None:
@@ -721,6 +924,7 @@ def create_translate_agent_from_profile(
             tool_registry=tool_registry,
             config=runtime_config,
             telemetry_emitter=telemetry_emitter,
+            model_registry=model_registry,
         )
     )
 
@@ -729,6 +933,7 @@ def create_translate_agent_from_profile(
         profile_agent=profile_agent,
         config=config,
         chunk_size=chunk_size,
+        chunk_token_budget=chunk_token_budget,
         source_lang=source_lang,
         target_lang=target_lang,
     )
@@ -752,20 +957,25 @@ class QaStyleGuideCriticAgent:
         source_lang: LanguageCode = "ja",
         target_lang: LanguageCode = "en",
         severity: QaSeverity = QaSeverity.MAJOR,
+        chunk_token_budget: int | None = None,
     ) -> None:
         """Initialize the QA style guide critic agent.
 
         Args:
             profile_agent: Underlying ProfileAgent for style guide evaluation.
             config: Runtime configuration.
-            chunk_size: Number of lines per processing chunk.
+            chunk_size: Number of lines per processing chunk (line cap when
+                chunk_token_budget is set).
             source_lang: Source language name for prompts.
             target_lang: Target language name for prompts.
             severity: Severity level for style violations.
+            chunk_token_budget: Estimated prompt tokens per chunk; None keeps
+                fixed-size chunks.
         """
         self._profile_agent = profile_agent
         self._config = config
         self._chunk_size = chunk_size
+        self._chunk_token_budget = chunk_token_budget
         self._source_lang = source_lang
         self._target_lang = target_lang
         self._severity = severity
@@ -790,26 +1000,42 @@ class QaStyleGuideCriticAgent:
         if not payload.style_guide or not payload.style_guide.strip():
             return empty_qa_output(payload.run_id, payload.target_language)
 
-        # Chunk lines for batch processing
-        chunks = chunk_qa_lines(
-            payload.source_lines,
-            payload.translated_lines,
-            self._chunk_size,
-        )
+        # Chunk aligned source/translation pairs for batch processing
+        if self._chunk_token_budget is None:
+            chunks = [
+                list(zip(source_chunk, translated_chunk, strict=True))
+                for source_chunk, translated_chunk in chunk_qa_lines(
+                    payload.source_lines,
+                    payload.translated_lines,
+                    self._chunk_size,
+                )
+            ]
+        else:
+            chunks = pack_by_token_budget(
+                list(zip(payload.source_lines, payload.translated_lines, strict=True)),
+                cost=lambda pair: estimate_tokens(
+                    format_lines_for_qa_prompt([pair[0]], [pair[1]])
+                ),
+                budget=self._chunk_token_budget,
+                max_items=self._chunk_size,
+                group_key=lambda pair: pair[0].scene_id,
+            )
 
         # Process each chunk
-        all_issues: list[QaIssue] = []
+        collected: dict[LineId, StyleGuideReviewLine] = {}
         max_attempts = _max_chunk_attempts(self._config)
-        for source_chunk, translated_chunk in chunks:
-            expected_ids = [line.line_id for line in source_chunk]
+        queue = deque(chunks)
+        while queue:
+            pending = queue.popleft()
             alignment_feedback = "None"
             for attempt in range(1, max_attempts + 1):
-                # Format lines for prompt
+                # Format only lines still missing a review for prompt
                 lines_to_review = format_lines_for_qa_prompt(
-                    source_chunk, translated_chunk
+                    [source for source, _ in pending],
+                    [translated for _, translated in pending],
                 )
 
-                # Update template context for this chunk
+                # Template context for this chunk
                 context = TemplateContext(
                     root_variables={},
                     phase_variables={
@@ -822,12 +1048,19 @@ class QaStyleGuideCriticAgent:
                         "alignment_feedback": alignment_feedback,
                     },
                 )
-                self._profile_agent.update_context(context)
 
                 # Run the profile agent for this chunk
                 # ProfileAgent returns StyleGuideReviewList with all reviews found
+                pending_ids = [source.line_id for source, _ in pending]
                 try:
-                    result = await self._profile_agent.run(payload)
+                    result = await self._profile_agent.run(
+                        payload,
+                        context,
+                        cacheable=_is_aligned(
+                            pending_ids,
+                            lambda out: [item.line_id for item in out.reviews],
+                        ),
+                    )
                 except (UnexpectedModelBehavior, UsageLimitExceeded) as exc:
                     _logger.debug(
                         "QA agent model failure on chunk (attempt %d/%d): %s",
@@ -835,30 +1068,45 @@ class QaStyleGuideCriticAgent:
                         max_attempts,
                         exc,
                     )
+                    if _requeue_halves(
+                        queue,
+                        pending,
+                        error=exc,
+                        token_budget=self._chunk_token_budget,
+                    ):
+                        break
                     if attempt == max_attempts:
                         raise
                     continue
-                actual_ids = [review.line_id for review in result.reviews]
                 feedback = _alignment_feedback(
-                    expected_ids=expected_ids,
-                    actual_ids=actual_ids,
+                    expected_ids=pending_ids,
+                    actual_ids=[review.line_id for review in result.reviews],
                     label="line",
                 )
-                if feedback is not None:
-                    alignment_feedback = feedback
-                    if attempt == max_attempts:
-                        raise RuntimeError(alignment_feedback)
-                    continue
-                # Convert violations to QaIssue
-                for review in result.reviews:
-                    for violation in review.violations:
-                        issue = violation_to_qa_issue(
-                            violation,
-                            self._severity,
-                            line_id=review.line_id,
-                        )
-                        all_issues.append(issue)
-                break
+                _collect_aligned(
+                    result.reviews,
+                    pending_ids=pending_ids,
+                    collected=collected,
+                    line_id=lambda review: review.line_id,
+                )
+                pending = [pair for pair in pending if pair[0].line_id not in collected]
+                if feedback is None or not pending:
+                    break
+                alignment_feedback = feedback
+                if attempt == max_attempts:
+                    raise RuntimeError(alignment_feedback)
+
+        # Convert violations to QaIssue
+        all_issues: list[QaIssue] = []
+        for line in payload.source_lines:
+            review = collected[line.line_id]
+            for violation in review.violations:
+                issue = violation_to_qa_issue(
+                    violation,
+                    self._severity,
+                    line_id=review.line_id,
+                )
+                all_issues.append(issue)
 
         return merge_qa_agent_outputs(
             payload.run_id,
@@ -877,6 +1125,10 @@ def create_qa_agent_from_profile(
     target_lang: LanguageCode = "en",
     severity: QaSeverity = QaSeverity.MAJOR,
     telemetry_emitter: AgentTelemetryEmitter | None = None,
+    model_registry: ModelRegistry | None = None,
+    profile: AgentProfileConfig | None = None,
+    layer_registry: PromptLayerRegistry | None = None,
+    chunk_token_budget: int | None = None,
 ) -> QaStyleGuideCriticAgent:
     """Create a QA phase agent from a TOML profile.
 
@@ -890,6 +1142,12 @@ def create_qa_agent_from_profile(
         target_lang: Target language name for prompts.
         severity: Severity level for style violations.
         telemetry_emitter: Optional telemetry emitter for agent status.
+        model_registry: Optional shared model/HTTP client registry.
+        profile: Preloaded profile; skips reading profile_path when given.
+        layer_registry: Preloaded prompt layers; skips reading prompts_dir
+            when given.
+        chunk_token_budget: Estimated prompt tokens per chunk; None keeps
+            fixed-size chunks.
 
     Returns:
         QA phase agent ready for orchestrator.
@@ -898,7 +1156,8 @@ def create_qa_agent_from_profile(
         ValueError: If profile is not for QA phase.
     """
     # Load the profile
-    profile = load_agent_profile(profile_path)
+    if profile is None:
+        profile = load_agent_profile(profile_path)
 
     # Verify it's a QA phase agent
     if profile.meta.phase != PhaseName.QA:
@@ -908,7 +1167,8 @@ def create_qa_agent_from_profile(
         )
 
     # Load prompt layers
-    layer_registry = load_layer_registry(prompts_dir)
+    if layer_registry is None:
+        layer_registry = load_layer_registry(prompts_dir)
 
     # Get tool registry
     if tool_registry is None:
@@ -924,6 +1184,7 @@ def create_qa_agent_from_profile(
         tool_registry=tool_registry,
         config=runtime_config,
         telemetry_emitter=telemetry_emitter,
+        model_registry=model_registry,
     )
 
     # Wrap in QaStyleGuideCriticAgent
@@ -931,6 +1192,7 @@ def create_qa_agent_from_profile(
         profile_agent=profile_agent,
         config=config,
         chunk_size=chunk_size,
+        chunk_token_budget=chunk_token_budget,
         source_lang=source_lang,
         target_lang=target_lang,
         severity=severity,
@@ -938,30 +1200,45 @@ def create_qa_agent_from_profile(
 
 
 class EditBasicEditorAgent:
-    """Edit phase agent that applies targeted edits with a ProfileAgent."""
+    """Edit phase agent that applies targeted edits with a ProfileAgent.
+
+    This agent:
+    1. Passes lines without QA issues through unchanged
+    2. Chunks QA-flagged lines into batches for processing
+    3. Runs ProfileAgent for each chunk to produce TranslationResultList
+    4. Merges edited lines back in input order with a change log
+    """
 
     def __init__(
         self,
-        profile_agent: ProfileAgent[EditPhaseInput, TranslationResultLine],
+        profile_agent: ProfileAgent[EditPhaseInput, TranslationResultList],
         config: ProfileAgentConfig,
+        chunk_size: int = 10,
         source_lang: LanguageCode = "ja",
         target_lang: LanguageCode = "en",
+        chunk_token_budget: int | None = None,
     ) -> None:
         """Initialize the edit agent.
 
         Args:
             profile_agent: Underlying ProfileAgent for editing.
             config: Runtime configuration.
+            chunk_size: Number of flagged lines per processing chunk (line cap
+                when chunk_token_budget is set).
             source_lang: Source language name for prompts.
             target_lang: Target language name for prompts.
+            chunk_token_budget: Estimated prompt tokens per chunk, including
+                QA issues; None keeps fixed-size chunks.
         """
         self._profile_agent = profile_agent
         self._config = config
+        self._chunk_size = chunk_size
+        self._chunk_token_budget = chunk_token_budget
         self._source_lang = source_lang
         self._target_lang = target_lang
 
     async def run(self, payload: EditPhaseInput) -> EditPhaseOutput:
-        """Execute edit phase by applying fixes to each translated line.
+        """Execute edit phase by fixing QA-flagged lines in chunks.
 
         Args:
             payload: Edit phase input with translated lines and QA issues.
@@ -976,18 +1253,31 @@ class EditBasicEditorAgent:
             UsageLimitExceeded: If the model hits the request limit after all
                 chunk-level retries.
         """
-        edited_lines: list[TranslatedLine] = []
-        change_log: list[LineEdit] = []
+        issues_by_line = group_qa_issues_by_line(payload.qa_issues)
+        flagged_lines = [
+            line for line in payload.translated_lines if line.line_id in issues_by_line
+        ]
+        if self._chunk_token_budget is None:
+            chunks = chunk_edit_lines(flagged_lines, self._chunk_size)
+        else:
+            chunks = pack_by_token_budget(
+                flagged_lines,
+                cost=lambda line: estimate_tokens(
+                    format_lines_for_edit_prompt([line], issues_by_line)
+                ),
+                budget=self._chunk_token_budget,
+                max_items=self._chunk_size,
+                group_key=lambda line: line.scene_id,
+            )
+        collected: dict[LineId, TranslationResultLine] = {}
         max_attempts = _max_chunk_attempts(self._config)
 
-        for line in payload.translated_lines:
+        queue = deque(chunks)
+        while queue:
+            chunk = queue.popleft()
+            pending = chunk
             alignment_feedback = "None"
             for attempt in range(1, max_attempts + 1):
-                qa_text = self._format_qa_issues(payload.qa_issues, line.line_id)
-                scene_summary = self._find_scene_summary(
-                    payload.scene_summaries, line.scene_id
-                )
-
                 context = TemplateContext(
                     root_variables={},
                     phase_variables={
@@ -995,83 +1285,89 @@ class EditBasicEditorAgent:
                         "target_lang": self._target_lang,
                     },
                     agent_variables={
-                        "line_id": line.line_id,
-                        "source_text": line.source_text or "N/A",
-                        "translated_text": line.text,
-                        "qa_issues": qa_text,
-                        "scene_summary": scene_summary,
+                        "lines_to_edit": format_lines_for_edit_prompt(
+                            pending, issues_by_line
+                        ),
+                        "scene_summary": get_scene_summary_for_edit(
+                            pending, payload.scene_summaries
+                        ),
+                        "line_count": str(len(pending)),
                         "alignment_feedback": alignment_feedback,
                     },
                 )
-                self._profile_agent.update_context(context)
 
+                pending_ids = [line.line_id for line in pending]
                 try:
-                    result = await self._profile_agent.run(payload)
+                    result = await self._profile_agent.run(
+                        payload,
+                        context,
+                        cacheable=_is_aligned(
+                            pending_ids,
+                            lambda out: [item.line_id for item in out.translations],
+                        ),
+                    )
                 except (UnexpectedModelBehavior, UsageLimitExceeded) as exc:
                     _logger.debug(
-                        "Edit agent model failure on line %s (attempt %d/%d): %s",
-                        line.line_id,
+                        "Edit agent model failure on chunk (attempt %d/%d): %s",
                         attempt,
                         max_attempts,
                         exc,
                     )
+                    if _requeue_halves(
+                        queue,
+                        pending,
+                        error=exc,
+                        token_budget=self._chunk_token_budget,
+                    ):
+                        break
                     if attempt == max_attempts:
                         raise
                     continue
-                if result.line_id != line.line_id:
-                    alignment_feedback = (
-                        "Alignment error: line_id must match the input line. "
-                        f"Expected {line.line_id}, got {result.line_id}. "
-                        "Return the exact input line_id with no changes."
-                    )
-                    if attempt == max_attempts:
-                        raise RuntimeError(alignment_feedback)
-                    continue
-                edited_text = result.text
+                feedback = _alignment_feedback(
+                    expected_ids=pending_ids,
+                    actual_ids=[edit.line_id for edit in result.translations],
+                    label="line",
+                )
+                _collect_aligned(
+                    result.translations,
+                    pending_ids=pending_ids,
+                    collected=collected,
+                    line_id=lambda edit: edit.line_id,
+                )
+                pending = [line for line in chunk if line.line_id not in collected]
+                if feedback is None or not pending:
+                    break
+                alignment_feedback = feedback
+                if attempt == max_attempts:
+                    raise RuntimeError(alignment_feedback)
+
+        edited_by_id: dict[LineId, TranslatedLine] = {}
+        if collected:
+            aligned = TranslationResultList(
+                translations=[collected[line.line_id] for line in flagged_lines]
+            )
+            edited_by_id = {
+                edited.line_id: edited
+                for edited in edit_result_to_lines(aligned, flagged_lines)
+            }
 
-                edited_lines.append(
-                    TranslatedLine(
+        edited_lines: list[TranslatedLine] = []
+        change_log: list[LineEdit] = []
+        for line in payload.translated_lines:
+            edited = edited_by_id.get(line.line_id, line)
+            edited_lines.append(edited)
+            if edited.text != line.text:
+                change_log.append(
+                    LineEdit(
                         line_id=line.line_id,
-                        route_id=line.route_id,
-                        scene_id=line.scene_id,
-                        speaker=line.speaker,
-                        source_text=line.source_text,
-                        text=edited_text,
-                        metadata=line.metadata,
-                        source_columns=line.source_columns,
+                        original_text=line.text,
+                        edited_text=edited.text,
+                        reason="; ".join(
+                            issue.message for issue in issues_by_line[line.line_id]
+                        ),
                     )
                 )
 
-                if edited_text != line.text:
-                    change_log.append(
-                        LineEdit(
-                            line_id=line.line_id,
-                            original_text=line.text,
-                            edited_text=edited_text,
-                            reason=self._edit_reason(payload.qa_issues, line.line_id),
-                        )
-                    )
-                break
-
-        # Aggregate validation: edited output must match input lines exactly
-        input_ids = {line.line_id for line in payload.translated_lines}
-        output_ids = {line.line_id for line in edited_lines}
-        if len(edited_lines) != len(payload.translated_lines):
-            raise RuntimeError(
-                f"Edit output line count mismatch: "
-                f"expected {len(payload.translated_lines)}, "
-                f"got {len(edited_lines)}"
-            )
-        if output_ids != input_ids:
-            missing = input_ids - output_ids
-            extra = output_ids - input_ids
-            parts = []
-            if missing:
-                parts.append(f"missing={sorted(missing)}")
-            if extra:
-                parts.append(f"extra={sorted(extra)}")
-            raise RuntimeError(f"Edit output line ID mismatch: {', '.join(parts)}")
-
         return EditPhaseOutput(
             run_id=payload.run_id,
             phase=PhaseName.EDIT,
@@ -1080,57 +1376,20 @@ class EditBasicEditorAgent:
             change_log=change_log,
         )
 
-    @staticmethod
-    def _format_qa_issues(issues: list[QaIssue] | None, line_id: str) -> str:
-        if not issues:
-            return "None"
-        matches = [issue for issue in issues if issue.line_id == line_id]
-        if not matches:
-            return "None"
-        formatted = []
-        for issue in matches:
-            severity = (
-                issue.severity.value
-                if hasattr(issue.severity, "value")
-                else str(issue.severity)
-            )
-            category = (
-                issue.category.value
-                if hasattr(issue.category, "value")
-                else str(issue.category)
-            )
-            formatted.append(f"- [{severity}/{category}] {issue.message}")
-        return "\n".join(formatted)
-
-    @staticmethod
-    def _edit_reason(issues: list[QaIssue] | None, line_id: str) -> str | None:
-        if not issues:
-            return None
-        matches = [issue for issue in issues if issue.line_id == line_id]
-        if not matches:
-            return None
-        return "; ".join(issue.message for issue in matches)
-
-    @staticmethod
-    def _find_scene_summary(
-        summaries: list[SceneSummary] | None, scene_id: str | None
-    ) -> str:
-        if not summaries or not scene_id:
-            return "None"
-        for summary in summaries:
-            if summary.scene_id == scene_id:
-                return summary.summary
-        return "None"
-
 
 def create_edit_agent_from_profile(
     profile_path: Path,
     prompts_dir: Path,
     config: ProfileAgentConfig,
     tool_registry: ToolRegistry | None = None,
+    chunk_size: int = 10,
     source_lang: LanguageCode = "ja",
     target_lang: LanguageCode = "en",
     telemetry_emitter: AgentTelemetryEmitter | None = None,
+    model_registry: ModelRegistry | None = None,
+    profile: AgentProfileConfig | None = None,
+    layer_registry: PromptLayerRegistry | None = None,
+    chunk_token_budget: int | None = None,
 ) -> EditBasicEditorAgent:
     """Create an edit phase agent from a TOML profile.
 
@@ -1139,9 +1398,16 @@ def create_edit_agent_from_profile(
         prompts_dir: Path to the prompts directory (containing root.toml, phases/).
         config: Runtime configuration (API key, model settings, etc.).
         tool_registry: Tool registry to use. Defaults to the default registry.
+        chunk_size: Number of QA-flagged lines per processing chunk.
         source_lang: Source language name for prompts.
         target_lang: Target language name for prompts.
         telemetry_emitter: Optional telemetry emitter for agent status.
+        model_registry: Optional shared model/HTTP client registry.
+        profile: Preloaded profile; skips reading profile_path when given.
+        layer_registry: Preloaded prompt layers; skips reading prompts_dir
+            when given.
+        chunk_token_budget: Estimated prompt tokens per chunk; None keeps
+            fixed-size chunks.
 
     Returns:
         Edit phase agent ready for orchestrator.
@@ -1149,7 +1415,8 @@ def create_edit_agent_from_profile(
     Raises:
         ValueError: If profile is not for edit phase.
     """
-    profile = load_agent_profile(profile_path)
+    if profile is None:
+        profile = load_agent_profile(profile_path)
 
     if profile.meta.phase != PhaseName.EDIT:
         raise ValueError(
@@ -1157,25 +1424,29 @@ def create_edit_agent_from_profile(
             f"expected edit"
         )
 
-    layer_registry = load_layer_registry(prompts_dir)
+    if layer_registry is None:
+        layer_registry = load_layer_registry(prompts_dir)
 
     if tool_registry is None:
         tool_registry = get_default_registry()
 
     runtime_config = _with_required_tools_from_profile(config, profile)
 
-    profile_agent: ProfileAgent[EditPhaseInput, TranslationResultLine] = ProfileAgent(
+    profile_agent: ProfileAgent[EditPhaseInput, TranslationResultList] = ProfileAgent(
         profile=profile,
-        output_type=TranslationResultLine,
+        output_type=TranslationResultList,
         layer_registry=layer_registry,
         tool_registry=tool_registry,
         config=runtime_config,
         telemetry_emitter=telemetry_emitter,
+        model_registry=model_registry,
     )
 
     return EditBasicEditorAgent(
         profile_agent=profile_agent,
         config=config,
+        chunk_size=chunk_size,
+        chunk_token_budget=chunk_token_budget,
         source_lang=source_lang,
         target_lang=target_lang,
     )
@@ -1218,6 +1489,8 @@ def build_agent_pools(
     config: RunConfig,
     telemetry_emitter: AgentTelemetryEmitter | None = None,
     phases: Sequence[PhaseName] | None = None,
+    model_registry: ModelRegistry | None = None,
+    environ: Mapping[str, str] | None = None,
 ) -> AgentPoolBundle:
     """Build agent pools from run configuration.
 
@@ -1225,6 +1498,10 @@ def build_agent_pools(
         config: Run configuration with agent profile paths.
         telemetry_emitter: Optional telemetry emitter for agent status.
         phases: Optional phase list to limit agent wiring.
+        model_registry: Optional registry sharing models and HTTP connection
+            pools across agents; the caller owns and closes it.
+        environ: Environment API keys are read from; defaults to
+            ``os.environ``.
 
     Returns:
         AgentPoolBundle: Configured agent pools.
@@ -1238,14 +1515,21 @@ def build_agent_pools(
         prompts_dir = resolve_agent_path(agents_config.prompts_dir, workspace_dir)
         agents_dir = resolve_agent_path(agents_config.agents_dir, workspace_dir)
     source_lang = config.project.languages.source_language
+    # Context and pretranslation run once per pipeline against the primary
+    # target; language-specific phases build a pool per target on first use
     target_lang = _resolve_primary_target_language(config)
     tool_registry = get_default_registry()
-    profile_specs = _discover_agent_profile_specs(agents_dir)
+    profile_specs = _load_agent_profile_specs(agents_dir)
     phases_to_load = (
         set(phases)
         if phases is not None
         else {phase.phase for phase in config.pipeline.phases if phase.enabled}
     )
+    layer_registry = (
+        _load_layer_registry(prompts_dir)
+        if phases_to_load - {PhaseName.INGEST, PhaseName.EXPORT}
+        else None
+    )
 
     context_agents = _build_phase_agent_entries(
         PhaseName.CONTEXT,
@@ -1257,6 +1541,9 @@ def build_agent_pools(
         source_lang,
         target_lang,
         telemetry_emitter,
+        model_registry,
+        layer_registry,
+        environ,
     )
     pretranslation_agents = _build_phase_agent_entries(
         PhaseName.PRETRANSLATION,
@@ -1268,6 +1555,9 @@ def build_agent_pools(
         source_lang,
         target_lang,
         telemetry_emitter,
+        model_registry,
+        layer_registry,
+        environ,
     )
     translate_agents = _build_phase_agent_entries(
         PhaseName.TRANSLATE,
@@ -1279,6 +1569,9 @@ def build_agent_pools(
         source_lang,
         target_lang,
         telemetry_emitter,
+        model_registry,
+        layer_registry,
+        environ,
     )
     qa_agents = _build_phase_agent_entries(
         PhaseName.QA,
@@ -1290,6 +1583,9 @@ def build_agent_pools(
         source_lang,
         target_lang,
         telemetry_emitter,
+        model_registry,
+        layer_registry,
+        environ,
     )
     edit_agents = _build_phase_agent_entries(
         PhaseName.EDIT,
@@ -1301,6 +1597,9 @@ def build_agent_pools(
         source_lang,
         target_lang,
         telemetry_emitter,
+        model_registry,
+        layer_registry,
+        environ,
     )
 
     return AgentPoolBundle(
@@ -1337,6 +1636,48 @@ def resolve_agent_path(value: str, workspace_dir: Path) -> Path:
     return resolved
 
 
+# Long-lived hosts such as the API worker pool build pools for many jobs;
+# parsed profiles and prompt layers are reused until their TOML files change
+_PROFILE_SPEC_CACHE: dict[
+    Path, tuple[tuple[tuple[str, int, int], ...], dict[str, _AgentProfileSpec]]
+] = {}
+_LAYER_REGISTRY_CACHE: dict[
+    Path, tuple[tuple[tuple[str, int, int], ...], PromptLayerRegistry]
+] = {}
+
+
+def _toml_tree_signature(root: Path) -> tuple[tuple[str, int, int], ...]:
+    if not root.exists():
+        return ()
+    entries = []
+    for path in root.rglob("*.toml"):
+        stat = path.stat()
+        entries.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(sorted(entries))
+
+
+def _load_agent_profile_specs(agents_dir: Path) -> dict[str, _AgentProfileSpec]:
+    key = agents_dir.resolve()
+    signature = _toml_tree_signature(key)
+    cached = _PROFILE_SPEC_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return dict(cached[1])
+    specs = _discover_agent_profile_specs(agents_dir)
+    _PROFILE_SPEC_CACHE[key] = (signature, specs)
+    return dict(specs)
+
+
+def _load_layer_registry(prompts_dir: Path) -> PromptLayerRegistry:
+    key = prompts_dir.resolve()
+    signature = _toml_tree_signature(key)
+    cached = _LAYER_REGISTRY_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    registry = load_layer_registry(prompts_dir)
+    _LAYER_REGISTRY_CACHE[key] = (signature, registry)
+    return registry
+
+
 def _discover_agent_profile_specs(agents_dir: Path) -> dict[str, _AgentProfileSpec]:
     specs: dict[str, _AgentProfileSpec] = {}
     if not agents_dir.exists():
@@ -1418,6 +1759,22 @@ def _resolve_max_consecutive_failures(config: RunConfig, phase: PhaseName) -> in
     return config.concurrency.max_consecutive_failures
 
 
+def _resolve_phase_max_parallel_requests(
+    config: RunConfig, phase: PhaseName
+) -> int | None:
+    """Resolve the phase-level request cap when a phase explicitly sets one.
+
+    Returns:
+        The phase cap, or None to rely on the endpoint-wide limit.
+    """
+    phase_config = _resolve_phase_config(config, phase)
+    if phase_config is None or phase_config.concurrency is None:
+        return None
+    if "max_parallel_requests" not in phase_config.concurrency.model_fields_set:
+        return None
+    return phase_config.concurrency.max_parallel_requests
+
+
 def _build_phase_agent_entries(
     phase: PhaseName,
     phases_to_load: set[PhaseName],
@@ -1428,6 +1785,9 @@ def _build_phase_agent_entries(
     source_lang: LanguageCode,
     target_lang: LanguageCode,
     telemetry_emitter: AgentTelemetryEmitter | None,
+    model_registry: ModelRegistry | None = None,
+    layer_registry: PromptLayerRegistry | None = None,
+    environ: Mapping[str, str] | None = None,
 ) -> list[tuple[str, PhaseAgentPoolProtocol]]:
     if phase not in phases_to_load:
         return []
@@ -1435,92 +1795,119 @@ def _build_phase_agent_entries(
     if not resolved:
         return []
     execution = _resolve_phase_execution(config, phase)
-    agent_config = _build_profile_agent_config(config, phase)
+    agent_config = _build_profile_agent_config(config, phase, environ)
+    chunk_token_budget = _resolve_chunk_token_budget(
+        execution, _resolve_phase_model(config, phase)
+    )
     max_consecutive = _resolve_max_consecutive_failures(config, phase)
+    retry_config = _resolve_phase_retry(config, phase)
+    if layer_registry is None:
+        layer_registry = load_layer_registry(prompts_dir)
+
+    def _pool(factory: Callable[[], PhaseAgentProtocol]) -> PhaseAgentPoolProtocol:
+        return PhaseAgentPool.from_factory(
+            factory=factory,
+            count=_resolve_agent_pool_size(execution),
+            max_parallel=_resolve_agent_pool_max_parallel(execution),
+            max_consecutive_failures=max_consecutive,
+            retry_backoff_s=retry_config.backoff_s,
+            retry_max_backoff_s=retry_config.max_backoff_s,
+        )
 
     entries: list[tuple[str, PhaseAgentPoolProtocol]] = []
     for spec in resolved:
         pool: PhaseAgentPoolProtocol
+        # Profiles and layers are loaded once and shared by every agent built
+        # from this spec, including per-language pools created on first use
         match phase:
             case PhaseName.CONTEXT:
-                pool = PhaseAgentPool.from_factory(
-                    factory=lambda path=spec.path: create_context_agent_from_profile(
-                        profile_path=path,
+                pool = _pool(
+                    lambda spec=spec: create_context_agent_from_profile(
+                        profile_path=spec.path,
                         prompts_dir=prompts_dir,
                         config=agent_config,
                         tool_registry=tool_registry,
                         source_lang=source_lang,
                         target_lang=target_lang,
                         telemetry_emitter=telemetry_emitter,
-                    ),
-                    count=_resolve_agent_pool_size(execution),
-                    max_parallel=_resolve_agent_pool_max_parallel(execution),
-                    max_consecutive_failures=max_consecutive,
+                        model_registry=model_registry,
+                        profile=spec.profile,
+                        layer_registry=layer_registry,
+                    )
                 )
             case PhaseName.PRETRANSLATION:
-                pool = PhaseAgentPool.from_factory(
-                    factory=lambda path=spec.path: (
-                        create_pretranslation_agent_from_profile(
-                            profile_path=path,
-                            prompts_dir=prompts_dir,
-                            config=agent_config,
-                            tool_registry=tool_registry,
-                            chunk_size=_resolve_chunk_size(execution),
-                            source_lang=source_lang,
-                            target_lang=target_lang,
-                            telemetry_emitter=telemetry_emitter,
-                        )
-                    ),
-                    count=_resolve_agent_pool_size(execution),
-                    max_parallel=_resolve_agent_pool_max_parallel(execution),
-                    max_consecutive_failures=max_consecutive,
-                )
-            case PhaseName.TRANSLATE:
-                pool = PhaseAgentPool.from_factory(
-                    factory=lambda path=spec.path: create_translate_agent_from_profile(
-                        profile_path=path,
+                pool = _pool(
+                    lambda spec=spec: create_pretranslation_agent_from_profile(
+                        profile_path=spec.path,
                         prompts_dir=prompts_dir,
                         config=agent_config,
                         tool_registry=tool_registry,
                         chunk_size=_resolve_chunk_size(execution),
+                        chunk_token_budget=chunk_token_budget,
                         source_lang=source_lang,
                         target_lang=target_lang,
                         telemetry_emitter=telemetry_emitter,
-                    ),
-                    count=_resolve_agent_pool_size(execution),
-                    max_parallel=_resolve_agent_pool_max_parallel(execution),
-                    max_consecutive_failures=max_consecutive,
+                        model_registry=model_registry,
+                        profile=spec.profile,
+                        layer_registry=layer_registry,
+                    )
+                )
+            case PhaseName.TRANSLATE:
+                pool = LanguageAgentPool(
+                    lambda language, spec=spec: _pool(
+                        lambda: create_translate_agent_from_profile(
+                            profile_path=spec.path,
+                            prompts_dir=prompts_dir,
+                            config=agent_config,
+                            tool_registry=tool_registry,
+                            chunk_size=_resolve_chunk_size(execution),
+                            chunk_token_budget=chunk_token_budget,
+                            source_lang=source_lang,
+                            target_lang=language,
+                            telemetry_emitter=telemetry_emitter,
+                            model_registry=model_registry,
+                            profile=spec.profile,
+                            layer_registry=layer_registry,
+                        )
+                    )
                 )
             case PhaseName.QA:
-                pool = PhaseAgentPool.from_factory(
-                    factory=lambda path=spec.path: create_qa_agent_from_profile(
-                        profile_path=path,
-                        prompts_dir=prompts_dir,
-                        config=agent_config,
-                        tool_registry=tool_registry,
-                        chunk_size=_resolve_chunk_size(execution),
-                        source_lang=source_lang,
-                        target_lang=target_lang,
-                        telemetry_emitter=telemetry_emitter,
-                    ),
-                    count=_resolve_agent_pool_size(execution),
-                    max_parallel=_resolve_agent_pool_max_parallel(execution),
-                    max_consecutive_failures=max_consecutive,
+                pool = LanguageAgentPool(
+                    lambda language, spec=spec: _pool(
+                        lambda: create_qa_agent_from_profile(
+                            profile_path=spec.path,
+                            prompts_dir=prompts_dir,
+                            config=agent_config,
+                            tool_registry=tool_registry,
+                            chunk_size=_resolve_chunk_size(execution),
+                            chunk_token_budget=chunk_token_budget,
+                            source_lang=source_lang,
+                            target_lang=language,
+                            telemetry_emitter=telemetry_emitter,
+                            model_registry=model_registry,
+                            profile=spec.profile,
+                            layer_registry=layer_registry,
+                        )
+                    )
                 )
             case PhaseName.EDIT:
-                pool = PhaseAgentPool.from_factory(
-                    factory=lambda path=spec.path: create_edit_agent_from_profile(
-                        profile_path=path,
-                        prompts_dir=prompts_dir,
-                        config=agent_config,
-                        tool_registry=tool_registry,
-                        source_lang=source_lang,
-                        target_lang=target_lang,
-                        telemetry_emitter=telemetry_emitter,
-                    ),
-                    count=_resolve_agent_pool_size(execution),
-                    max_parallel=_resolve_agent_pool_max_parallel(execution),
-                    max_consecutive_failures=max_consecutive,
+                pool = LanguageAgentPool(
+                    lambda language, spec=spec: _pool(
+                        lambda: create_edit_agent_from_profile(
+                            profile_path=spec.path,
+                            prompts_dir=prompts_dir,
+                            config=agent_config,
+                            tool_registry=tool_registry,
+                            chunk_size=_resolve_chunk_size(execution),
+                            chunk_token_budget=chunk_token_budget,
+                            source_lang=source_lang,
+                            target_lang=language,
+                            telemetry_emitter=telemetry_emitter,
+                            model_registry=model_registry,
+                            profile=spec.profile,
+                            layer_registry=layer_registry,
+                        )
+                    )
                 )
             case _:
                 raise ValueError(f"Unsupported phase: {phase.value}")
@@ -1550,6 +1937,22 @@ def _resolve_chunk_size(execution: PhaseExecutionConfig | None) -> int:
     return 10
 
 
+def _resolve_chunk_token_budget(
+    execution: PhaseExecutionConfig | None, model_settings: ModelSettings
+) -> int | None:
+    if execution and execution.chunk_token_budget is not None:
+        return execution.chunk_token_budget
+    if (
+        model_settings.context_window_tokens is None
+        or model_settings.max_output_tokens is None
+    ):
+        return None
+    return derive_chunk_token_budget(
+        max_output_tokens=model_settings.max_output_tokens,
+        context_window_tokens=model_settings.context_window_tokens,
+    )
+
+
 def _resolve_agent_pool_size(execution: PhaseExecutionConfig | None) -> int:
     if execution and execution.max_parallel_agents is not None:
         return execution.max_parallel_agents
@@ -1604,12 +2007,24 @@ def _resolve_endpoint_config(
     raise ValueError(f"Unknown endpoint reference: {endpoint_ref}")
 
 
+def _resolve_response_cache(config: RunConfig) -> CacheConfig | None:
+    cache = LlmResponseCache.from_config(
+        config.cache,
+        base_dir=Path(config.project.paths.workspace_dir).resolve(),
+    )
+    if cache is None:
+        return None
+    return config.cache.model_copy(update={"cache_dir": str(cache.cache_dir)})
+
+
 def _build_profile_agent_config(
-    config: RunConfig, phase: PhaseName
+    config: RunConfig,
+    phase: PhaseName,
+    environ: Mapping[str, str] | None = None,
 ) -> ProfileAgentConfig:
     model_settings = _resolve_phase_model(config, phase)
     endpoint = _resolve_endpoint_config(config, model_settings)
-    api_key = os.getenv(endpoint.api_key_env)
+    api_key = (os.environ if environ is None else environ).get(endpoint.api_key_env)
     if api_key is None:
         raise ValueError(
             f"Missing API key environment variable: {endpoint.api_key_env}"
@@ -1630,6 +2045,11 @@ def _build_profile_agent_config(
         retry_base_delay=retry_config.backoff_s,
         input_cost_per_mtok=model_settings.input_cost_per_mtok,
         output_cost_per_mtok=model_settings.output_cost_per_mtok,
+        max_parallel_requests=config.concurrency.max_parallel_requests,
+        phase_max_parallel_requests=_resolve_phase_max_parallel_requests(config, phase),
+        requests_per_minute=endpoint.requests_per_minute,
+        tokens_per_minute=endpoint.tokens_per_minute,
+        response_cache=_resolve_response_cache(config),
     )
     if retry_config.max_output_retries is not None:
         agent_config = agent_config.model_copy(
@@ -1,8 +1,10 @@
 """rentl-core: Core pipeline logic for rentl."""
 
 from rentl_core.doctor import CheckResult, CheckStatus, DoctorReport, run_doctor
+from rentl_core.incremental import IncrementalBaseline, source_line_digest
 from rentl_core.init import InitAnswers, InitResult, generate_project
 from rentl_core.orchestrator import (
+    LanguageAgentPool,
     PhaseAgentPool,
     PipelineOrchestrator,
     PipelineRunContext,
@@ -32,7 +34,11 @@ from rentl_core.ports import (
     build_ingest_failed_log,
     build_ingest_started_log,
 )
-from rentl_core.status import build_status_result
+from rentl_core.status import (
+    StatusAggregator,
+    build_status_result,
+    replay_run_progress,
+)
 from rentl_core.telemetry import AgentTelemetryEmitter
 from rentl_core.version import VERSION
 
@@ -53,6 +59,7 @@ __all__ = [
     "ExportEvent",
     "ExportResult",
     "ExportSummary",
+    "IncrementalBaseline",
     "IngestAdapterProtocol",
     "IngestBatchError",
     "IngestError",
@@ -62,9 +69,11 @@ __all__ = [
     "IngestEvent",
     "InitAnswers",
     "InitResult",
+    "LanguageAgentPool",
     "PhaseAgentPool",
     "PipelineOrchestrator",
     "PipelineRunContext",
+    "StatusAggregator",
     "build_export_completed_log",
     "build_export_failed_log",
     "build_export_started_log",
@@ -74,5 +83,7 @@ __all__ = [
     "build_status_result",
     "generate_project",
     "hydrate_run_context",
+    "replay_run_progress",
     "run_doctor",
+    "source_line_digest",
 ]
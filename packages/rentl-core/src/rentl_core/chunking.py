@@ -0,0 +1,165 @@
+"""Token-budget-aware chunking for LLM phases.
+
+Fixed line counts either waste request overhead on short UI strings or
+overflow the output limit on long narration. These helpers estimate prompt
+tokens per item and pack chunks up to a token budget instead, keeping scenes
+together where they fit.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Hashable, Sequence
+
+# Smallest chunk budget derived from model limits
+MIN_CHUNK_TOKEN_BUDGET = 256
+
+# Prompt tokens reserved for system layers, static context and output schema
+PROMPT_OVERHEAD_TOKENS = 2048
+
+# Structured output repeats every line (ID, text, JSON framing), so output
+# grows with input; budget input at half of the output limit
+OUTPUT_TOKENS_PER_INPUT_TOKEN = 2
+
+# Code points from CJK radicals upward (kana, hanzi/kanji, hangul, fullwidth
+# forms) are roughly one token each; other text averages ~4 chars per token
+_WIDE_CODEPOINT_START = 0x2E80
+_CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of text without a model tokenizer.
+
+    Args:
+        text: Text to estimate.
+
+    Returns:
+        Estimated token count.
+    """
+    wide = sum(1 for char in text if ord(char) >= _WIDE_CODEPOINT_START)
+    narrow = len(text) - wide
+    return wide + math.ceil(narrow / _CHARS_PER_TOKEN)
+
+
+def derive_chunk_token_budget(
+    *,
+    max_output_tokens: int,
+    context_window_tokens: int | None = None,
+) -> int:
+    """Derive a per-chunk prompt token budget from model limits.
+
+    Args:
+        max_output_tokens: Maximum output tokens per response.
+        context_window_tokens: Model context window size, when known.
+
+    Returns:
+        Token budget for the chunk content of a single request.
+    """
+    budget = max_output_tokens // OUTPUT_TOKENS_PER_INPUT_TOKEN
+    if context_window_tokens is not None:
+        budget = min(
+            budget,
+            context_window_tokens - max_output_tokens - PROMPT_OVERHEAD_TOKENS,
+        )
+    return max(budget, MIN_CHUNK_TOKEN_BUDGET)
+
+
+def split_chunk[T](items: Sequence[T]) -> list[list[T]]:
+    """Split a chunk into two halves for a retry with smaller requests.
+
+    Args:
+        items: Chunk items (at least two).
+
+    Returns:
+        The two halves, in order.
+
+    Raises:
+        ValueError: If the chunk has fewer than two items.
+    """
+    if len(items) < 2:
+        raise ValueError("chunk must have at least two items to split")
+    middle = len(items) // 2
+    return [list(items[:middle]), list(items[middle:])]
+
+
+def pack_by_token_budget[T](
+    items: Sequence[T],
+    *,
+    cost: Callable[[T], int],
+    budget: int,
+    max_items: int,
+    group_key: Callable[[T], Hashable | None],
+) -> list[list[T]]:
+    """Pack items into chunks bounded by a token budget and an item cap.
+
+    Mirrors the scene-aware line chunking: consecutive items sharing a group
+    key (e.g. scene_id) stay together when the group fits, small groups are
+    combined, and groups larger than a chunk are split at budget boundaries.
+    An item that alone exceeds the budget gets a chunk of its own.
+
+    Args:
+        items: Items to pack, in order.
+        cost: Estimated prompt tokens for one item.
+        budget: Maximum estimated tokens per chunk.
+        max_items: Maximum items per chunk.
+        group_key: Grouping key for consecutive items.
+
+    Returns:
+        List of item chunks.
+
+    Raises:
+        ValueError: If budget or max_items is not positive.
+    """
+    if budget <= 0:
+        raise ValueError("budget must be positive")
+    if max_items <= 0:
+        raise ValueError("max_items must be positive")
+
+    groups: list[list[tuple[T, int]]] = []
+    current_key: Hashable | None = None
+    for item in items:
+        key = group_key(item)
+        if not groups or key != current_key:
+            groups.append([])
+            current_key = key
+        groups[-1].append((item, cost(item)))
+
+    chunks: list[list[T]] = []
+    current: list[T] = []
+    current_tokens = 0
+
+    def _flush() -> None:
+        nonlocal current, current_tokens
+        if current:
+            chunks.append(current)
+        current = []
+        current_tokens = 0
+
+    for group in groups:
+        group_tokens = sum(item_cost for _, item_cost in group)
+        fits_alone = group_tokens <= budget and len(group) <= max_items
+        if (
+            fits_alone
+            and current_tokens + group_tokens <= budget
+            and len(current) + len(group) <= max_items
+        ):
+            current.extend(item for item, _ in group)
+            current_tokens += group_tokens
+            continue
+        _flush()
+        if fits_alone:
+            current = [item for item, _ in group]
+            current_tokens = group_tokens
+            continue
+        # Split an oversized group greedily at budget boundaries
+        for item, item_cost in group:
+            if current and (
+                current_tokens + item_cost > budget or len(current) >= max_items
+            ):
+                _flush()
+            current.append(item)
+            current_tokens += item_cost
+        _flush()
+
+    _flush()
+    return chunks
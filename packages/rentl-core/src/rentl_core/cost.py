@@ -54,7 +54,7 @@ def aggregate_cost_by_phase(
     phase_costs: dict[PhaseName, float | None] = {}
     for agent in agents:
         phase = agent.phase
-        cost = _extract_agent_cost(agent)
+        cost = extract_agent_cost(agent)
         if cost is not None:
             phase_costs[phase] = (phase_costs.get(phase) or 0.0) + cost
         elif phase not in phase_costs:
@@ -75,7 +75,7 @@ def aggregate_total_cost(agents: list[AgentTelemetry]) -> float | None:
     """
     total: float | None = None
     for agent in agents:
-        cost = _extract_agent_cost(agent)
+        cost = extract_agent_cost(agent)
         if cost is not None:
             total = (total or 0.0) + cost
     return total
@@ -99,11 +99,14 @@ def aggregate_segmented_cost(
     )
 
 
-def _extract_agent_cost(agent: AgentTelemetry) -> float | None:
+def extract_agent_cost(agent: AgentTelemetry) -> float | None:
     """Extract cost from an agent telemetry record.
 
     Prefers agent-level cost_usd, falls back to usage.cost_usd.
 
+    Args:
+        agent: Agent telemetry record.
+
     Returns:
         Cost in USD, or None when unavailable.
     """
@@ -0,0 +1,418 @@
+"""Carry forward phase outputs from a prior run for unchanged lines.
+
+An incremental run diffs freshly ingested source lines against a baseline
+run by line_id and content hash. Lines whose source text, scene summary and
+relevant glossary entries are unchanged keep the baseline outputs, so only
+the delta goes through the LLM phases.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from rentl_schemas.io import SourceLine
+from rentl_schemas.phases import (
+    ContextPhaseOutput,
+    EditPhaseOutput,
+    GlossaryTerm,
+    PretranslationPhaseOutput,
+    QaPhaseOutput,
+    TranslatePhaseOutput,
+)
+from rentl_schemas.pipeline import PhaseDependency
+from rentl_schemas.primitives import LanguageCode, LineId, PhaseName, RunId, SceneId
+from rentl_schemas.qa import QaIssue
+
+if TYPE_CHECKING:
+    from rentl_core.orchestrator import PipelineRunContext
+
+
+def source_line_digest(line: SourceLine) -> str:
+    """Hash the content of a source line, ignoring its identifier.
+
+    Args:
+        line: Source line to hash.
+
+    Returns:
+        str: SHA-256 hex digest of the line content.
+    """
+    payload = line.model_dump(mode="json", exclude={"line_id"})
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class IncrementalBaseline(BaseModel):
+    """Outputs of a prior run that unchanged lines are carried forward from."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    run_id: RunId = Field(..., description="Baseline run identifier")
+    source_lines: list[SourceLine] = Field(
+        ..., description="Source lines ingested by the baseline run"
+    )
+    context_output: ContextPhaseOutput | None = Field(
+        None, description="Baseline context phase output"
+    )
+    pretranslation_output: PretranslationPhaseOutput | None = Field(
+        None, description="Baseline pretranslation phase output"
+    )
+    translate_outputs: dict[LanguageCode, TranslatePhaseOutput] = Field(
+        default_factory=dict, description="Baseline translate outputs by language"
+    )
+    qa_outputs: dict[LanguageCode, QaPhaseOutput] = Field(
+        default_factory=dict, description="Baseline QA outputs by language"
+    )
+    edit_outputs: dict[LanguageCode, EditPhaseOutput] = Field(
+        default_factory=dict, description="Baseline edit outputs by language"
+    )
+    phase_revisions: dict[tuple[PhaseName, LanguageCode | None], int] = Field(
+        default_factory=dict, description="Baseline revision per phase key"
+    )
+
+    @classmethod
+    def from_run(cls, run: PipelineRunContext) -> IncrementalBaseline:
+        """Build a baseline from a hydrated prior run.
+
+        Args:
+            run: Run context with outputs loaded from storage.
+
+        Returns:
+            IncrementalBaseline: Baseline for an incremental run.
+
+        Raises:
+            ValueError: If the run has no ingested source lines.
+        """
+        if not run.source_lines:
+            raise ValueError(f"Baseline run {run.run_id} has no ingested source lines")
+        return cls(
+            run_id=run.run_id,
+            source_lines=run.source_lines,
+            context_output=run.context_output,
+            pretranslation_output=run.pretranslation_output,
+            translate_outputs=run.translate_outputs,
+            qa_outputs=run.qa_outputs,
+            edit_outputs=run.edit_outputs,
+            phase_revisions=run.phase_revisions,
+        )
+
+    def unchanged_line_ids(self, source_lines: list[SourceLine]) -> set[LineId]:
+        """Return lines whose id and content match the baseline.
+
+        Args:
+            source_lines: Freshly ingested source lines.
+
+        Returns:
+            set[LineId]: Line ids with identical content in the baseline.
+        """
+        baseline = self._line_digests()
+        return {
+            line.line_id
+            for line in source_lines
+            if baseline.get(line.line_id) == source_line_digest(line)
+        }
+
+    def reusable_scene_ids(self, source_lines: list[SourceLine]) -> set[SceneId]:
+        """Return scenes whose lines are unchanged from the baseline.
+
+        Args:
+            source_lines: Freshly ingested source lines.
+
+        Returns:
+            set[SceneId]: Scenes with the same lines and content as the baseline.
+        """
+        unchanged = self.unchanged_line_ids(source_lines)
+        current = _scene_line_ids(source_lines)
+        baseline = _scene_line_ids(self.source_lines)
+        return {
+            scene_id
+            for scene_id, line_ids in current.items()
+            if baseline.get(scene_id) == line_ids and line_ids <= unchanged
+        }
+
+    def reusable_line_ids(
+        self,
+        source_lines: list[SourceLine],
+        context_output: ContextPhaseOutput | None,
+    ) -> set[LineId]:
+        """Return lines whose source and context inputs are unchanged.
+
+        A line qualifies when its content matches the baseline, its scene
+        summary is identical, and the glossary entries it mentions are too.
+
+        Args:
+            source_lines: Freshly ingested source lines.
+            context_output: Context output of the current run.
+
+        Returns:
+            set[LineId]: Line ids whose baseline outputs can be reused.
+        """
+        unchanged = self.unchanged_line_ids(source_lines)
+        current_summaries = _scene_summaries(context_output)
+        baseline_summaries = _scene_summaries(self.context_output)
+        current_glossary = _glossary(context_output)
+        baseline_glossary = _glossary(self.context_output)
+        reusable: set[LineId] = set()
+        for line in source_lines:
+            if line.line_id not in unchanged:
+                continue
+            if line.scene_id is not None and current_summaries.get(
+                line.scene_id
+            ) != baseline_summaries.get(line.scene_id):
+                continue
+            if _relevant_terms(line, current_glossary) != _relevant_terms(
+                line, baseline_glossary
+            ):
+                continue
+            reusable.add(line.line_id)
+        return reusable
+
+    def carry_context(
+        self, run: PipelineRunContext
+    ) -> tuple[ContextPhaseOutput | None, set[LineId]]:
+        """Select baseline context output for unchanged scenes.
+
+        Scenes are reused whole; lines outside any scene are reused per line.
+
+        Args:
+            run: Incremental run context with source lines ingested.
+
+        Returns:
+            tuple[ContextPhaseOutput | None, set[LineId]]: Carried output and
+            the lines it covers.
+        """
+        baseline = self.context_output
+        source_lines = run.source_lines or []
+        if baseline is None:
+            return None, set()
+        scene_ids = self.reusable_scene_ids(source_lines)
+        unchanged = self.unchanged_line_ids(source_lines)
+        line_ids = {
+            line.line_id
+            for line in source_lines
+            if (line.scene_id is None and line.line_id in unchanged)
+            or line.scene_id in scene_ids
+        }
+        if not line_ids:
+            return None, set()
+        carried = baseline.model_copy(
+            update={
+                "run_id": run.run_id,
+                "scene_summaries": [
+                    summary
+                    for summary in baseline.scene_summaries
+                    if summary.scene_id in scene_ids
+                ],
+                "context_notes": [
+                    note
+                    for note in baseline.context_notes
+                    if (note.scene_id is not None and note.scene_id in scene_ids)
+                    or (note.line_id is not None and note.line_id in line_ids)
+                ],
+            }
+        )
+        return carried, line_ids
+
+    def carry_pretranslation(
+        self, run: PipelineRunContext
+    ) -> tuple[PretranslationPhaseOutput | None, set[LineId]]:
+        """Select baseline pretranslation output for reusable lines.
+
+        Args:
+            run: Incremental run context.
+
+        Returns:
+            tuple[PretranslationPhaseOutput | None, set[LineId]]: Carried
+            output and the lines it covers.
+        """
+        baseline = self.pretranslation_output
+        if baseline is None:
+            return None, set()
+        source_lines = run.source_lines or []
+        line_ids = self.reusable_line_ids(source_lines, run.context_output)
+        if not line_ids:
+            return None, set()
+        texts = [line.text for line in source_lines if line.line_id in line_ids]
+        carried = baseline.model_copy(
+            update={
+                "run_id": run.run_id,
+                "annotations": [
+                    annotation
+                    for annotation in baseline.annotations
+                    if annotation.line_id in line_ids
+                ],
+                "term_candidates": [
+                    candidate
+                    for candidate in baseline.term_candidates
+                    if any(candidate.term in text for text in texts)
+                ],
+            }
+        )
+        return carried, line_ids
+
+    def carry_translate(
+        self, run: PipelineRunContext, target_language: LanguageCode
+    ) -> tuple[TranslatePhaseOutput | None, set[LineId]]:
+        """Select baseline translations for reusable lines.
+
+        Args:
+            run: Incremental run context.
+            target_language: Target language code.
+
+        Returns:
+            tuple[TranslatePhaseOutput | None, set[LineId]]: Carried output
+            and the lines it covers.
+        """
+        baseline = self.translate_outputs.get(target_language)
+        if baseline is None:
+            return None, set()
+        line_ids = self.reusable_line_ids(run.source_lines or [], run.context_output)
+        lines = [line for line in baseline.translated_lines if line.line_id in line_ids]
+        if not lines:
+            return None, set()
+        carried = baseline.model_copy(
+            update={"run_id": run.run_id, "translated_lines": lines}
+        )
+        return carried, {line.line_id for line in lines}
+
+    def carry_qa(
+        self, run: PipelineRunContext, target_language: LanguageCode
+    ) -> tuple[list[QaIssue], set[LineId]]:
+        """Select baseline QA issues for lines translated as in the baseline.
+
+        Args:
+            run: Incremental run context with translations for the language.
+            target_language: Target language code.
+
+        Returns:
+            tuple[list[QaIssue], set[LineId]]: Carried issues and the lines
+            they cover.
+        """
+        baseline = self.qa_outputs.get(target_language)
+        if baseline is None:
+            return [], set()
+        line_ids = self._unchanged_translation_ids(run, target_language)
+        issues = [issue for issue in baseline.issues if issue.line_id in line_ids]
+        return issues, line_ids
+
+    def carry_edit(
+        self, run: PipelineRunContext, target_language: LanguageCode
+    ) -> tuple[EditPhaseOutput | None, set[LineId]]:
+        """Select baseline edits for lines with unchanged translation and QA.
+
+        Args:
+            run: Incremental run context with translations for the language.
+            target_language: Target language code.
+
+        Returns:
+            tuple[EditPhaseOutput | None, set[LineId]]: Carried output and
+            the lines it covers.
+        """
+        baseline = self.edit_outputs.get(target_language)
+        if baseline is None:
+            return None, set()
+        qa_output = run.qa_outputs.get(target_language)
+        baseline_qa = self.qa_outputs.get(target_language)
+        current = _issue_ids_by_line(qa_output.issues if qa_output else None)
+        previous = _issue_ids_by_line(baseline_qa.issues if baseline_qa else None)
+        line_ids = {
+            line_id
+            for line_id in self._unchanged_translation_ids(run, target_language)
+            if current.get(line_id, set()) == previous.get(line_id, set())
+        }
+        lines = [line for line in baseline.edited_lines if line.line_id in line_ids]
+        if not lines:
+            return None, set()
+        carried = baseline.model_copy(
+            update={
+                "run_id": run.run_id,
+                "edited_lines": lines,
+                "change_log": [
+                    edit for edit in baseline.change_log if edit.line_id in line_ids
+                ],
+            }
+        )
+        return carried, {line.line_id for line in lines}
+
+    def dependency(
+        self, phase: PhaseName, target_language: LanguageCode | None
+    ) -> PhaseDependency | None:
+        """Reference the baseline output a phase carried lines forward from.
+
+        Args:
+            phase: Phase that reused baseline output.
+            target_language: Target language for language-specific phases.
+
+        Returns:
+            PhaseDependency | None: Dependency on the baseline revision.
+        """
+        revision = self.phase_revisions.get((phase, target_language))
+        if revision is None:
+            return None
+        return PhaseDependency(
+            phase=phase,
+            revision=revision,
+            target_language=target_language,
+            run_id=self.run_id,
+        )
+
+    def _line_digests(self) -> dict[LineId, str]:
+        return {line.line_id: source_line_digest(line) for line in self.source_lines}
+
+    def _unchanged_translation_ids(
+        self, run: PipelineRunContext, target_language: LanguageCode
+    ) -> set[LineId]:
+        baseline = self.translate_outputs.get(target_language)
+        current = run.translate_outputs.get(target_language)
+        if baseline is None or current is None:
+            return set()
+        line_ids = self.reusable_line_ids(run.source_lines or [], run.context_output)
+        baseline_text = {line.line_id: line.text for line in baseline.translated_lines}
+        return {
+            line.line_id
+            for line in current.translated_lines
+            if line.line_id in line_ids and baseline_text.get(line.line_id) == line.text
+        }
+
+
+def _scene_line_ids(source_lines: list[SourceLine]) -> dict[SceneId, set[LineId]]:
+    scenes: dict[SceneId, set[LineId]] = {}
+    for line in source_lines:
+        if line.scene_id is not None:
+            scenes.setdefault(line.scene_id, set()).add(line.line_id)
+    return scenes
+
+
+def _scene_summaries(output: ContextPhaseOutput | None) -> dict[SceneId, str]:
+    if output is None:
+        return {}
+    return {
+        summary.scene_id: summary.model_dump_json()
+        for summary in output.scene_summaries
+    }
+
+
+def _glossary(output: ContextPhaseOutput | None) -> list[GlossaryTerm]:
+    if output is None or output.glossary is None:
+        return []
+    return output.glossary
+
+
+def _relevant_terms(
+    line: SourceLine, glossary: list[GlossaryTerm]
+) -> list[tuple[str, str, str | None]]:
+    return sorted(
+        (term.term, term.translation, term.notes)
+        for term in glossary
+        if term.term in line.text
+    )
+
+
+def _issue_ids_by_line(issues: list[QaIssue] | None) -> dict[LineId, set[str]]:
+    grouped: dict[LineId, set[str]] = {}
+    for issue in issues or []:
+        grouped.setdefault(issue.line_id, set()).add(str(issue.issue_id))
+    return grouped
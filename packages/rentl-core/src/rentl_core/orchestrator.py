@@ -6,14 +6,24 @@ import asyncio
 import hashlib
 import json
 import logging
-from collections.abc import Awaitable, Callable, Sequence
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Sequence,
+)
 from datetime import UTC, datetime
+from functools import cached_property, partial
+from itertools import starmap
 from typing import TypeVar
 from uuid import uuid7
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, ValidationError
 from pydantic_ai.exceptions import UnexpectedModelBehavior, UsageLimitExceeded
 
+from rentl_core.chunking import estimate_tokens
+from rentl_core.incremental import IncrementalBaseline
 from rentl_core.ports.export import (
     ExportAdapterProtocol,
     ExportBatchError,
@@ -34,6 +44,7 @@ from rentl_core.ports.ingest import (
 from rentl_core.ports.orchestrator import (
     ContextAgentPoolProtocol,
     EditAgentPoolProtocol,
+    FlushableSinkProtocol,
     LogSinkProtocol,
     OrchestrationError,
     OrchestrationErrorCode,
@@ -52,7 +63,12 @@ from rentl_core.ports.orchestrator import (
     build_run_failed_log,
     build_run_started_log,
 )
-from rentl_core.ports.storage import ArtifactStoreProtocol, RunStateStoreProtocol
+from rentl_core.ports.storage import (
+    ArtifactStoreProtocol,
+    PhaseCheckpointStoreProtocol,
+    RunStateStoreProtocol,
+    StorageError,
+)
 from rentl_core.qa.runner import DeterministicQaRunner
 from rentl_schemas.base import BaseSchema
 from rentl_schemas.config import (
@@ -132,6 +148,7 @@ from rentl_schemas.storage import (
     ArtifactFormat,
     ArtifactMetadata,
     ArtifactRole,
+    PhaseCheckpointRecord,
     RunIndexRecord,
     RunStateRecord,
     StorageReference,
@@ -142,17 +159,30 @@ OutputT_co = TypeVar("OutputT_co", bound=BaseSchema, covariant=True)
 PhaseKey = tuple[PhaseName, LanguageCode | None]
 
 
+_logger = logging.getLogger(__name__)
 _pool_logger = logging.getLogger(__name__ + ".PhaseAgentPool")
 
 
 class PhaseAgentPool(PhaseAgentPoolProtocol[InputT, OutputT_co]):
-    """Concurrent agent pool with retry logic for transient failures."""
+    """Concurrent agent pool with retry logic for transient failures.
+
+    Payloads are scheduled through a shared work queue: each worker pulls the
+    next payload as soon as it finishes the previous one, so a single slow
+    request never stalls the other workers. Retryable failures are re-enqueued
+    at the back of the queue after an exponential backoff. Workers check agents
+    out of the pool per payload, so concurrent runs (e.g. several target
+    languages) share the pool's agents as one concurrency budget. Each entry in
+    agents is one concurrency slot; listing a re-entrant agent several times
+    lets it serve that many payloads at once.
+    """
 
     def __init__(
         self,
         agents: Sequence[PhaseAgentProtocol[InputT, OutputT_co]],
         max_parallel: int | None = None,
         max_consecutive_failures: int = 3,
+        retry_backoff_s: float = 0.0,
+        retry_max_backoff_s: float | None = None,
     ) -> None:
         """Initialize the agent pool.
 
@@ -160,6 +190,8 @@ class PhaseAgentPool(PhaseAgentPoolProtocol[InputT, OutputT_co]):
             agents: Agent instances used for execution.
             max_parallel: Optional cap on concurrent tasks.
             max_consecutive_failures: Consecutive task failures before aborting.
+            retry_backoff_s: Base delay before a failed payload is retried.
+            retry_max_backoff_s: Optional cap on the retry delay.
 
         Raises:
             ValueError: If agents are empty or max_parallel is not positive.
@@ -171,6 +203,12 @@ class PhaseAgentPool(PhaseAgentPoolProtocol[InputT, OutputT_co]):
         self._agents: Sequence[PhaseAgentProtocol[InputT, OutputT_co]] = agents
         self._max_parallel: int | None = max_parallel
         self._max_consecutive_failures = max_consecutive_failures
+        self._retry_backoff_s = max(retry_backoff_s, 0.0)
+        self._retry_max_backoff_s = retry_max_backoff_s
+        self._idle_agents: asyncio.Queue[PhaseAgentProtocol[InputT, OutputT_co]] = (
+            asyncio.Queue()
+        )
+        self._idle_loop: asyncio.AbstractEventLoop | None = None
 
     @classmethod
     def from_factory(
@@ -179,14 +217,22 @@ class PhaseAgentPool(PhaseAgentPoolProtocol[InputT, OutputT_co]):
         count: int,
         max_parallel: int | None = None,
         max_consecutive_failures: int = 3,
+        retry_backoff_s: float = 0.0,
+        retry_max_backoff_s: float | None = None,
     ) -> PhaseAgentPool[InputT, OutputT_co]:
-        """Create a pool by instantiating agents from a factory.
+        """Create a pool that shares one agent from a factory across workers.
+
+        Agents must be re-entrant: the single instance serves up to count
+        payloads concurrently, so count sets concurrency without building
+        count copies of the agent stack.
 
         Args:
-            factory: Callable that creates new agent instances.
-            count: Number of agents to create.
+            factory: Callable that creates the agent instance.
+            count: Number of payloads the agent may run concurrently.
             max_parallel: Optional cap on concurrent tasks.
             max_consecutive_failures: Consecutive task failures before aborting.
+            retry_backoff_s: Base delay before a failed payload is retried.
+            retry_max_backoff_s: Optional cap on the retry delay.
 
         Returns:
             PhaseAgentPool: Constructed agent pool.
@@ -196,11 +242,13 @@ class PhaseAgentPool(PhaseAgentPoolProtocol[InputT, OutputT_co]):
         """
         if count <= 0:
             raise ValueError("count must be positive")
-        agents = [factory() for _ in range(count)]
+        agent = factory()
         return cls(
-            agents=agents,
+            agents=[agent] * count,
             max_parallel=max_parallel,
             max_consecutive_failures=max_consecutive_failures,
+            retry_backoff_s=retry_backoff_s,
+            retry_max_backoff_s=retry_max_backoff_s,
         )
 
     @staticmethod
@@ -220,6 +268,28 @@ class PhaseAgentPool(PhaseAgentPoolProtocol[InputT, OutputT_co]):
         Args:
             payloads: Phase input payloads.
 
+        Returns:
+            list[OutputT]: Outputs aligned to input order.
+        """
+        return await self.run_stream(payloads)
+
+    async def run_stream(
+        self,
+        payloads: list[InputT] | AsyncIterable[InputT],
+        *,
+        max_parallel: int | None = None,
+        on_result: Callable[[InputT, OutputT_co], Awaitable[None]] | None = None,
+    ) -> list[OutputT_co]:
+        """Execute payloads through a work queue, reporting each completion.
+
+        Payloads from an async iterable are queued as they arrive, so workers
+        start on the first payloads while later ones are still being produced.
+
+        Args:
+            payloads: Phase input payloads, as a list or an async iterable.
+            max_parallel: Optional per-call cap on concurrent workers.
+            on_result: Optional callback invoked as each payload completes.
+
         Returns:
             list[OutputT]: Outputs aligned to input order.
 
@@ -228,97 +298,121 @@ class PhaseAgentPool(PhaseAgentPoolProtocol[InputT, OutputT_co]):
             RuntimeError: If consecutive failures exceed threshold or
                 a non-retryable error occurs.
         """
-        if not payloads:
-            return []
-        max_parallel = self._max_parallel or len(self._agents)
-        max_parallel = min(max_parallel, len(self._agents))
-        semaphore = asyncio.Semaphore(max_parallel)
+        total: int | None = None
+        if isinstance(payloads, list):
+            if not payloads:
+                return []
+            total = len(payloads)
+        worker_count = self._resolve_worker_count(max_parallel, total)
+        idle_agents = self._idle_agent_queue()
+        queue: asyncio.Queue[tuple[int, InputT, int]] = asyncio.Queue()
+        if isinstance(payloads, list):
+            for index, payload in enumerate(payloads):
+                queue.put_nowait((index, payload, 1))
         results: dict[int, OutputT_co] = {}
-
-        # Pending items: list of (original_index, payload)
-        pending: list[tuple[int, InputT]] = list(enumerate(payloads))
+        finished = asyncio.Event()
+        fatal: list[tuple[str | None, BaseException]] = []
+        retry_tasks: set[asyncio.Task[None]] = set()
         consecutive_failures = 0
 
-        async def _run(
-            index: int, payload: InputT
-        ) -> tuple[int, OutputT_co | None, BaseException | None]:
-            agent = self._agents[index % len(self._agents)]
-            async with semaphore:
+        def _abort(message: str | None, exc: BaseException) -> None:
+            if not fatal:
+                fatal.append((message, exc))
+            finished.set()
+
+        async def _requeue(item: tuple[int, InputT, int], delay: float) -> None:
+            await asyncio.sleep(delay)
+            queue.put_nowait(item)
+
+        async def _feed(stream: AsyncIterable[InputT]) -> None:
+            nonlocal total
+            count = 0
+            try:
+                async for payload in stream:
+                    queue.put_nowait((count, payload, 1))
+                    count += 1
+            except Exception as exc:
+                _abort(None, exc)
+                return
+            total = count
+            if len(results) == total:
+                finished.set()
+
+        async def _worker() -> None:
+            nonlocal consecutive_failures
+            while not finished.is_set():
+                index, payload, attempt = await queue.get()
+                agent = await idle_agents.get()
                 try:
-                    result = await agent.run(payload)
-                    return (index, result, None)
+                    result: OutputT_co | None = await agent.run(payload)
+                    error: BaseException | None = (
+                        None
+                        if result is not None
+                        else RuntimeError("Agent returned None")
+                    )
                 except Exception as exc:
-                    return (index, None, exc)
-
-        while pending:
-            batch = list(pending)
-            pending.clear()
-
-            tasks = [asyncio.ensure_future(_run(idx, pl)) for idx, pl in batch]
-            done = await asyncio.gather(*tasks)
-
-            # Separate successes and failures
-            successes: list[tuple[int, OutputT_co]] = []
-            failures: list[tuple[int, InputT, BaseException]] = []
-            payload_by_index = dict(batch)
-
-            for index, result, exc in done:
-                if exc is None and result is not None:
-                    successes.append((index, result))
-                elif exc is not None:
-                    failures.append((index, payload_by_index[index], exc))
-                else:
-                    # result is None with no exception — treat as error
-                    failures.append((
-                        index,
-                        payload_by_index[index],
-                        RuntimeError("Agent returned None"),
-                    ))
-
-            # Process successes first — each resets the failure counter
-            for index, result in successes:
-                results[index] = result
-                consecutive_failures = 0
-
-            # Process failures
-            for index, payload, exc in failures:
-                if not self._is_retryable(exc):
-                    raise RuntimeError(
-                        f"Agent pool task failed (non-retryable): {exc}"
-                    ) from exc
+                    result = None
+                    error = exc
+                finally:
+                    idle_agents.put_nowait(agent)
+
+                if error is None and result is not None:
+                    results[index] = result
+                    consecutive_failures = 0
+                    if on_result is not None:
+                        try:
+                            await on_result(payload, result)
+                        except Exception as exc:
+                            _abort(None, exc)
+                            return
+                    if len(results) == total:
+                        finished.set()
+                    continue
+
+                if not self._is_retryable(error):
+                    _abort(f"Agent pool task failed (non-retryable): {error}", error)
+                    return
 
                 consecutive_failures += 1
-                _pool_logger.debug(
-                    "Retryable failure on payload %d (%d/%d consecutive): %s",
-                    index,
-                    consecutive_failures,
-                    self._max_consecutive_failures,
-                    exc,
-                )
-                # Surface last validation diagnostic if available
-                diag_info = getattr(exc, "_validation_failure_info", None)
-                if diag_info is not None and getattr(diag_info, "diagnostics", None):
-                    last_diag = diag_info.diagnostics[-1]
-                    _pool_logger.debug(
-                        "  Last diagnostic: retry_index=%d, errors=%s, output=%.200s",
-                        last_diag.retry_index,
-                        last_diag.validation_errors,
-                        last_diag.model_output,
-                    )
-
+                self._log_retryable_failure(index, consecutive_failures, error)
                 if consecutive_failures >= self._max_consecutive_failures:
-                    raise RuntimeError(
+                    _abort(
                         f"Agent pool aborted: {consecutive_failures} consecutive "
                         f"failures (threshold={self._max_consecutive_failures}). "
-                        f"Last error: {exc}"
-                    ) from exc
+                        f"Last error: {error}",
+                        error,
+                    )
+                    return
 
-                # Re-queue for retry
-                pending.append((index, payload))
+                # Re-enqueue at the back so other payloads keep flowing
+                item = (index, payload, attempt + 1)
+                delay = self._retry_delay(attempt)
+                if delay <= 0:
+                    queue.put_nowait(item)
+                else:
+                    task = asyncio.create_task(_requeue(item, delay))
+                    retry_tasks.add(task)
+                    task.add_done_callback(retry_tasks.discard)
+
+        workers = [asyncio.create_task(_worker()) for _ in range(worker_count)]
+        if not isinstance(payloads, list):
+            workers.append(asyncio.create_task(_feed(payloads)))
+        try:
+            await finished.wait()
+        finally:
+            for task in (*workers, *retry_tasks):
+                task.cancel()
+            await asyncio.gather(*workers, *retry_tasks, return_exceptions=True)
+
+        if fatal:
+            message, cause = fatal[0]
+            if message is None:
+                raise cause
+            raise RuntimeError(message) from cause
 
         # Assemble ordered results
         resolved: list[OutputT_co] = []
-        for i in range(len(payloads)):
+        for i in range(total or 0):
             result = results.get(i)
             if result is None:
                 raise OrchestrationError(
@@ -331,6 +425,182 @@ class PhaseAgentPool(PhaseAgentPoolProtocol[InputT, OutputT_co]):
             resolved.append(result)
         return resolved
 
+    def _idle_agent_queue(
+        self,
+    ) -> asyncio.Queue[PhaseAgentProtocol[InputT, OutputT_co]]:
+        # Queues bind to one event loop; start fresh when the loop changes
+        loop = asyncio.get_running_loop()
+        if self._idle_loop is not loop:
+            self._idle_agents = asyncio.Queue()
+            for agent in self._agents:
+                self._idle_agents.put_nowait(agent)
+            self._idle_loop = loop
+        return self._idle_agents
+
+    def _resolve_worker_count(self, max_parallel: int | None, total: int | None) -> int:
+        limit = len(self._agents)
+        if self._max_parallel is not None:
+            limit = min(limit, self._max_parallel)
+        if max_parallel is not None and max_parallel > 0:
+            limit = min(limit, max_parallel)
+        if total is not None:
+            limit = min(limit, total)
+        return max(1, limit)
+
+    def _retry_delay(self, attempt: int) -> float:
+        if self._retry_backoff_s <= 0:
+            return 0.0
+        delay = self._retry_backoff_s * (2 ** (attempt - 1))
+        if self._retry_max_backoff_s is not None:
+            delay = min(delay, self._retry_max_backoff_s)
+        return delay
+
+    def _log_retryable_failure(
+        self, index: int, consecutive_failures: int, exc: BaseException
+    ) -> None:
+        _pool_logger.debug(
+            "Retryable failure on payload %d (%d/%d consecutive): %s",
+            index,
+            consecutive_failures,
+            self._max_consecutive_failures,
+            exc,
+        )
+        # Surface last validation diagnostic if available
+        diag_info = getattr(exc, "_validation_failure_info", None)
+        if diag_info is not None and getattr(diag_info, "diagnostics", None):
+            last_diag = diag_info.diagnostics[-1]
+            _pool_logger.debug(
+                "  Last diagnostic: retry_index=%d, errors=%s, output=%.200s",
+                last_diag.retry_index,
+                last_diag.validation_errors,
+                last_diag.model_output,
+            )
+
+
+class LanguageAgentPool(PhaseAgentPoolProtocol[InputT, OutputT_co]):
+    """Agent pool that routes payloads to per-target-language pools.
+
+    Language-specific agents bake their target language into prompts, so each
+    language gets its own pool. Pools are built on first use and cached, which
+    lets concurrent language branches share one wiring step.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[LanguageCode], PhaseAgentPoolProtocol[InputT, OutputT_co]],
+    ) -> None:
+        """Initialize the language-routing pool.
+
+        Args:
+            factory: Builds the pool for a target language.
+        """
+        self._factory = factory
+        self._pools: dict[LanguageCode, PhaseAgentPoolProtocol[InputT, OutputT_co]] = {}
+
+    @property
+    def languages(self) -> list[LanguageCode]:
+        """Target languages whose pools have been built."""
+        return list(self._pools)
+
+    def pool_for(
+        self, target_language: LanguageCode
+    ) -> PhaseAgentPoolProtocol[InputT, OutputT_co]:
+        """Return the pool for a target language, building it on first use.
+
+        Args:
+            target_language: Target language code.
+
+        Returns:
+            PhaseAgentPoolProtocol: Cached pool for the language.
+        """
+        pool = self._pools.get(target_language)
+        if pool is None:
+            pool = self._factory(target_language)
+            self._pools[target_language] = pool
+        return pool
+
+    async def run_batch(self, payloads: list[InputT]) -> list[OutputT_co]:
+        """Execute payloads on the pools for their target languages.
+
+        Args:
+            payloads: Phase input payloads carrying a target_language.
+
+        Returns:
+            list[OutputT]: Outputs aligned to input order.
+        """
+        return await self.run_stream(payloads)
+
+    async def run_stream(
+        self,
+        payloads: list[InputT] | AsyncIterable[InputT],
+        *,
+        max_parallel: int | None = None,
+        on_result: Callable[[InputT, OutputT_co], Awaitable[None]] | None = None,
+    ) -> list[OutputT_co]:
+        """Stream payloads through the pools for their target languages.
+
+        An async iterable is routed as it arrives and must carry a single
+        target language, as one language branch's phase run does.
+
+        Args:
+            payloads: Phase input payloads carrying a target_language.
+            max_parallel: Optional per-call cap on concurrent workers.
+            on_result: Optional callback invoked as each payload completes.
+
+        Returns:
+            list[OutputT]: Outputs aligned to input order.
+        """
+        if not isinstance(payloads, list):
+            return await self._run_language_stream(payloads, max_parallel, on_result)
+        groups: dict[LanguageCode, list[int]] = {}
+        for index, payload in enumerate(payloads):
+            groups.setdefault(_payload_language(payload), []).append(index)
+        results: dict[int, OutputT_co] = {}
+        for language, indexes in groups.items():
+            group = [payloads[index] for index in indexes]
+            outputs = await _run_agent_pool(
+                self.pool_for(language),
+                group,
+                max_parallel,
+                _per_result_callback(on_result),
+            )
+            results.update(zip(indexes, outputs, strict=True))
+        return [results[index] for index in range(len(payloads))]
+
+    async def _run_language_stream(
+        self,
+        payloads: AsyncIterable[InputT],
+        max_parallel: int | None,
+        on_result: Callable[[InputT, OutputT_co], Awaitable[None]] | None,
+    ) -> list[OutputT_co]:
+        iterator = aiter(payloads)
+        try:
+            first = await anext(iterator)
+        except StopAsyncIteration:
+            return []
+        language = _payload_language(first)
+
+        async def _same_language() -> AsyncIterator[InputT]:
+            yield first
+            async for payload in iterator:
+                if _payload_language(payload) != language:
+                    raise ValueError("Streamed payloads must share one target_language")
+                yield payload
+
+        return await _run_agent_pool(
+            self.pool_for(language),
+            _same_language(),
+            max_parallel,
+            _per_result_callback(on_result),
+        )
+
+
+def _payload_language(payload: BaseSchema) -> LanguageCode:
+    language = getattr(payload, "target_language", None)
+    if language is None:
+        raise ValueError("Payload has no target_language to route on")
+    return language
+
 
 class PipelineRunContext(BaseModel):
     """In-memory run context for orchestration."""
@@ -386,6 +656,27 @@ class PipelineRunContext(BaseModel):
     phase_revisions: dict[PhaseKey, int] = Field(
         default_factory=dict, description="Revision counts per phase key"
     )
+    baseline: IncrementalBaseline | None = Field(
+        default=None,
+        description="Prior run whose outputs unchanged lines are carried from",
+    )
+    # Phases in flight, innermost last; concurrent language branches can run
+    # the same phase more than once at a time
+    _active_phases: list[PhaseName] = PrivateAttr(default_factory=list)
+    # Per-language (completed, total) units feeding the shared phase metric
+    _phase_units: dict[PhaseName, dict[LanguageCode | None, tuple[int, int]]] = (
+        PrivateAttr(default_factory=dict)
+    )
+    # Delta progress updates emitted since the last full snapshot
+    _progress_deltas: int = PrivateAttr(default=0)
+    # Hash of the last persisted run state, the pending debounced save and
+    # the error of a debounced save that failed, raised on the next save
+    _persisted_state_digest: str | None = PrivateAttr(default=None)
+    _pending_persist: asyncio.Task[None] | None = PrivateAttr(default=None)
+    _persist_error: Exception | None = PrivateAttr(default=None)
+    # Lines published by an ingest that downstream phases consume while it
+    # streams; set by run_plan for the duration of the overlap
+    _ingest_feed: _SourceLineFeed | None = PrivateAttr(default=None)
 
 
 class PipelineOrchestrator:
@@ -407,7 +698,10 @@ class PipelineOrchestrator:
         progress_sink: ProgressSinkProtocol | None = None,
         run_state_store: RunStateStoreProtocol | None = None,
         artifact_store: ArtifactStoreProtocol | None = None,
+        checkpoint_store: PhaseCheckpointStoreProtocol | None = None,
         clock: Callable[[], Timestamp] | None = None,
+        progress_snapshot_interval: int = 50,
+        run_state_debounce_s: float = 0.5,
     ) -> None:
         """Initialize the orchestrator.
 
@@ -423,7 +717,13 @@ class PipelineOrchestrator:
             progress_sink: Optional progress sink.
             run_state_store: Optional run state store.
             artifact_store: Optional artifact store.
+            checkpoint_store: Optional store for per-chunk phase checkpoints.
             clock: Optional timestamp provider.
+            progress_snapshot_interval: Phase progress updates emitted as
+                deltas between full run progress snapshots.
+            run_state_debounce_s: Seconds that run state saves for phase and
+                run starts are held back to coalesce with later saves; zero
+                saves every transition immediately.
         """
         self._ingest_adapter = ingest_adapter
         self._export_adapter = export_adapter
@@ -438,7 +738,11 @@ class PipelineOrchestrator:
         self._progress_sink = progress_sink
         self._run_state_store = run_state_store
         self._artifact_store = artifact_store
+        self._checkpoint_store = checkpoint_store
         self._clock = clock or _now_timestamp
+        self._progress_snapshot_interval = max(1, progress_snapshot_interval)
+        self._run_state_debounce_s = max(0.0, run_state_debounce_s)
+        self._persist_lock = asyncio.Lock()
 
     def create_run(self, run_id: RunId, config: RunConfig) -> PipelineRunContext:
         """Create a new run context.
@@ -508,35 +812,39 @@ class PipelineOrchestrator:
         run.status = RunStatus.RUNNING
         if run.started_at is None:
             run.started_at = self._clock()
-        await self._persist_run_state(run)
+        await self._persist_run_state(run, debounce=True)
         await self._emit_run_progress(run, ProgressEvent.RUN_STARTED)
 
         await self._emit_log(
             build_run_started_log(self._clock(), run.run_id, planned_phases)
         )
-        for phase, language in plan:
-            if phase == PhaseName.INGEST:
-                await self.run_phase(run, phase, ingest_source=ingest_source)
+        # Language-specific steps between global phases form independent
+        # per-language branches; global phases act as barriers between them
+        stages: list[list[tuple[PhaseName, LanguageCode | None]]] = []
+        for step in plan:
+            if step[1] is not None and stages and stages[-1][0][1] is not None:
+                stages[-1].append(step)
                 continue
-            if phase == PhaseName.EXPORT:
-                export_target = None
-                if export_targets is not None and language is not None:
-                    export_target = export_targets.get(language)
-                await self.run_phase(
-                    run,
-                    phase,
-                    target_language=language,
-                    export_target=export_target,
-                )
+            stages.append([step])
+        position = 0
+        while position < len(stages):
+            stage = stages[position]
+            position += 1
+            if stage[0][0] != PhaseName.INGEST:
+                await self._run_stage(run, stage, export_targets)
                 continue
-            if phase in {PhaseName.TRANSLATE, PhaseName.QA, PhaseName.EDIT}:
-                await self.run_phase(
-                    run,
-                    phase,
-                    target_language=language,
+            following = stages[position] if position < len(stages) else None
+            if (
+                following is not None
+                and ingest_source is not None
+                and _can_stream_ingest(run, following)
+            ):
+                position += 1
+                await self._run_streaming_ingest(
+                    run, ingest_source, following, export_targets
                 )
                 continue
-            await self.run_phase(run, phase)
+            await self.run_phase(run, PhaseName.INGEST, ingest_source=ingest_source)
         run.status = RunStatus.COMPLETED
         run.current_phase = None
         run.completed_at = self._clock()
@@ -545,6 +853,84 @@ class PipelineOrchestrator:
         await self._emit_log(
             build_run_completed_log(self._clock(), run.run_id, RunStatus.COMPLETED)
         )
+        await self._flush_sinks()
+
+    async def _run_stage(
+        self,
+        run: PipelineRunContext,
+        stage: list[tuple[PhaseName, LanguageCode | None]],
+        export_targets: dict[LanguageCode, ExportTarget] | None,
+    ) -> None:
+        phase, language = stage[0]
+        if language is None:
+            await self.run_phase(run, phase)
+            return
+        await self._run_language_branches(
+            run,
+            [(phase, language) for phase, language in stage if language is not None],
+            export_targets,
+        )
+
+    async def _run_streaming_ingest(
+        self,
+        run: PipelineRunContext,
+        ingest_source: IngestSource,
+        stage: list[tuple[PhaseName, LanguageCode | None]],
+        export_targets: dict[LanguageCode, ExportTarget] | None,
+    ) -> None:
+        # The next stage cuts chunks from the feed as ingest publishes lines,
+        # so the first chunks reach agents before the source is fully read
+        run._ingest_feed = _SourceLineFeed()
+        downstream = asyncio.create_task(self._run_stage(run, stage, export_targets))
+        try:
+            try:
+                await self.run_phase(run, PhaseName.INGEST, ingest_source=ingest_source)
+            except BaseException:
+                downstream.cancel()
+                await asyncio.gather(downstream, return_exceptions=True)
+                raise
+            await downstream
+        finally:
+            run._ingest_feed = None
+
+    async def _run_language_branches(
+        self,
+        run: PipelineRunContext,
+        steps: list[tuple[PhaseName, LanguageCode]],
+        export_targets: dict[LanguageCode, ExportTarget] | None,
+    ) -> None:
+        if not steps:
+            return
+        branches: dict[LanguageCode, list[PhaseName]] = {}
+        for phase, language in steps:
+            branches.setdefault(language, []).append(phase)
+        limit = asyncio.Semaphore(run.config.concurrency.max_parallel_languages)
+        failures: list[BaseException] = []
+
+        async def _run_branch(language: LanguageCode, phases: list[PhaseName]) -> None:
+            async with limit:
+                for phase in phases:
+                    # A failed branch stops new phases from starting; phases
+                    # already in flight finish so their outputs are persisted
+                    if failures:
+                        return
+                    export_target = None
+                    if phase == PhaseName.EXPORT and export_targets is not None:
+                        export_target = export_targets.get(language)
+                    try:
+                        await self.run_phase(
+                            run,
+                            phase,
+                            target_language=language,
+                            export_target=export_target,
+                        )
+                    except Exception as exc:
+                        failures.append(exc)
+                        return
+
+        await asyncio.gather(*starmap(_run_branch, branches.items()))
+        if failures:
+            raise failures[0]
 
     async def run_phase(
         self,
@@ -603,12 +989,16 @@ class PipelineOrchestrator:
         run.status = RunStatus.RUNNING
         if run.started_at is None:
             run.started_at = timestamp
-            await self._persist_run_state(run)
+            await self._persist_run_state(run, debounce=True)
             await self._emit_run_progress(run, ProgressEvent.RUN_STARTED)
             await self._emit_log(build_run_started_log(timestamp, run.run_id, [phase]))
+        if phase not in run._active_phases:
+            # First in-flight run of this phase starts its shared progress
+            run._phase_units.pop(phase, None)
+            self._update_phase_status(run, phase, PhaseStatus.RUNNING, timestamp)
+        run._active_phases.append(phase)
         run.current_phase = phase
-        self._update_phase_status(run, phase, PhaseStatus.RUNNING, timestamp)
-        await self._persist_run_state(run)
+        await self._persist_run_state(run, debounce=True)
         await self._emit_progress(run, phase, ProgressEvent.PHASE_STARTED)
         await self._emit_log(
             build_phase_log(
@@ -654,6 +1044,7 @@ class PipelineOrchestrator:
                         )
                     )
         except OrchestrationError as exc:
+            _release_active_phase(run, phase)
             await self._emit_phase_failure(
                 run,
                 phase,
@@ -663,15 +1054,25 @@ class PipelineOrchestrator:
             )
             raise
         except Exception as exc:
+            _release_active_phase(run, phase)
             exc_type = type(exc).__qualname__
             message = f"{exc_type}: {exc}" if str(exc) else exc_type
             await self._emit_phase_failure(run, phase, message, language, None)
             raise
+        except BaseException:
+            _release_active_phase(run, phase)
+            raise
 
         completed_at = self._clock()
         record.started_at = timestamp
         record.completed_at = completed_at
-        self._update_phase_status(run, phase, PhaseStatus.COMPLETED, completed_at)
+        _release_active_phase(run, phase)
+        if phase not in run._active_phases and _phase_status(run, phase) in {
+            PhaseStatus.RUNNING,
+            None,
+        }:
+            # Siblings still running (or a failed sibling) keep the phase open
+            self._update_phase_status(run, phase, PhaseStatus.COMPLETED, completed_at)
         await self._emit_progress(run, phase, ProgressEvent.PHASE_COMPLETED)
         completed_data = _build_phase_log_data(run, phase, language, shard_plan)
         if record.summary is not None:
@@ -686,8 +1087,8 @@ class PipelineOrchestrator:
                 data=completed_data,
             )
         )
-        run.current_phase = None
         await self._persist_run_state(run)
+        await self._flush_sinks()
         return record
 
     async def _run_ingest(
@@ -714,8 +1115,17 @@ class PipelineOrchestrator:
         await self._emit_log(
             build_ingest_started_log(self._clock(), run.run_id, ingest_source)
         )
+        feed = run._ingest_feed or _SourceLineFeed()
+        source_lines = feed.lines
         try:
-            run.source_lines = await self._ingest_adapter.load_source(ingest_source)
+            async for batch in self._ingest_adapter.iter_source(ingest_source):
+                feed.add(batch)
+                await self._emit_progress(
+                    run,
+                    PhaseName.INGEST,
+                    ProgressEvent.PHASE_PROGRESS,
+                    message=f"Loaded {len(source_lines)} source lines",
+                )
         except IngestBatchError as exc:
             primary_error = exc.errors[0]
             await self._emit_log(
@@ -735,13 +1145,8 @@ class PipelineOrchestrator:
                 )
             )
             raise
-        line_count = len(run.source_lines)
-        await self._emit_progress(
-            run,
-            PhaseName.INGEST,
-            ProgressEvent.PHASE_PROGRESS,
-            message=f"Loaded {line_count} source lines",
-        )
+        run.source_lines = source_lines
+        line_count = len(source_lines)
         artifact_ids = await self._persist_phase_artifact(
             run,
             PhaseName.INGEST,
@@ -776,6 +1181,9 @@ class PipelineOrchestrator:
         record.artifact_ids = artifact_ids
         run.phase_history.append(record)
         await _update_stale_flags(run, self._log_sink, self._clock)
+        # Closed once the ingest record exists so streaming phases that finish
+        # next depend on this ingest revision
+        feed.close()
         return record
 
     async def _run_context(
@@ -791,31 +1199,36 @@ class PipelineOrchestrator:
                     details=OrchestrationErrorDetails(phase=PhaseName.CONTEXT),
                 )
             )
-        chunks = _build_work_chunks(
-            run.source_lines or [], execution, PhaseName.CONTEXT
+        carried, reused = (
+            run.baseline.carry_context(run) if run.baseline else (None, set())
         )
-        inputs = [
-            ContextPhaseInput(
-                run_id=run.run_id,
-                source_lines=chunk.source_lines,
-                project_context=None,
-                style_guide=None,
-                glossary=None,
-            )
-            for chunk in chunks
-        ]
-        scene_ids = {
+        carried_outputs = [carried] if carried is not None else []
+        chunks = _phase_chunks(run, reused, execution, PhaseName.CONTEXT)
+        # Streaming ingest tracks scenes as lines arrive, so totals are read
+        # when progress is reported
+        feed = run._ingest_feed
+        scene_ids = (
+            feed.scene_ids
+            if feed is not None
+            else {
+                line.scene_id
+                for line in (run.source_lines or [])
+                if line.scene_id is not None
+            }
+        )
+
+        reused_scenes = {
             line.scene_id
             for line in (run.source_lines or [])
-            if line.scene_id is not None
+            if line.scene_id is not None and line.line_id in reused
         }
-        use_scenes = bool(scene_ids)
-        total_units = len(scene_ids) if use_scenes else len(run.source_lines or [])
 
         agent_outputs: list[ContextPhaseOutput] = []
-        for agent_name, pool in self._context_agents:
-            completed_units = 0
-            processed_scenes: set[str] = set()
+        for agent_name, pool in (
+            self._context_agents if await chunks.has_chunks() else []
+        ):
+            completed_lines = len(reused)
+            processed_scenes: set[str] = set(reused_scenes)
 
             async def _on_batch(
                 batch_inputs: list[ContextPhaseInput],
@@ -823,17 +1236,20 @@ class PipelineOrchestrator:
                 _agent_name: str = agent_name,
                 _processed_scenes: set[str] = processed_scenes,
             ) -> None:
-                nonlocal completed_units
-                if use_scenes:
-                    for payload in batch_inputs:
-                        for line in payload.source_lines:
-                            if line.scene_id is not None:
-                                _processed_scenes.add(line.scene_id)
+                nonlocal completed_lines
+                for payload in batch_inputs:
+                    completed_lines += len(payload.source_lines)
+                    _processed_scenes.update(
+                        line.scene_id
+                        for line in payload.source_lines
+                        if line.scene_id is not None
+                    )
+                if scene_ids:
                     completed_units = len(_processed_scenes)
+                    total_units = len(scene_ids)
                 else:
-                    completed_units += sum(
-                        len(payload.source_lines) for payload in batch_inputs
-                    )
+                    completed_units = completed_lines
+                    total_units = _source_line_count(run)
                 await self._emit_phase_progress_update(
                     run,
                     PhaseName.CONTEXT,
@@ -844,13 +1260,23 @@ class PipelineOrchestrator:
                     message=_agent_name,
                 )
 
-            outputs = await _run_agent_pool(
+            outputs = await self._run_checkpointed_pool(
+                run,
+                PhaseName.CONTEXT,
+                None,
+                agent_name,
                 pool,
-                inputs,
-                execution.max_parallel_agents if execution else None,
+                chunks,
+                partial(_build_context_input, run),
+                ContextPhaseOutput,
+                _resolve_agent_parallelism(run.config, PhaseName.CONTEXT, execution),
                 on_batch=_on_batch,
             )
-            agent_outputs.append(_merge_context_outputs(run, outputs))
+            agent_outputs.append(
+                _merge_context_outputs(run, [*carried_outputs, *outputs])
+            )
+        if not agent_outputs and carried_outputs:
+            agent_outputs.append(_merge_context_outputs(run, carried_outputs))
 
         run.context_output = _merge_context_outputs_across_agents(agent_outputs)
         artifact_ids = await self._persist_phase_artifact(
@@ -860,9 +1286,11 @@ class PipelineOrchestrator:
             None,
             description="Context output",
         )
+        await self._clear_phase_checkpoints(run, PhaseName.CONTEXT, None)
         revision = _next_revision(run, PhaseName.CONTEXT, None)
         dependencies = _build_dependencies(run, PhaseName.CONTEXT, None)
-        summary = _build_context_summary(run.context_output)
+        dependencies.extend(_carried_dependencies(run, PhaseName.CONTEXT, None, reused))
+        summary = _with_reused_lines(_build_context_summary(run.context_output), reused)
         record = _build_phase_record(
             run,
             PhaseName.CONTEXT,
@@ -891,15 +1319,18 @@ class PipelineOrchestrator:
                     details=OrchestrationErrorDetails(phase=PhaseName.PRETRANSLATION),
                 )
             )
-        chunks = _build_work_chunks(
-            run.source_lines or [], execution, PhaseName.PRETRANSLATION
+        carried, reused = (
+            run.baseline.carry_pretranslation(run) if run.baseline else (None, set())
         )
-        inputs = [_build_pretranslation_input(run, chunk) for chunk in chunks]
-        total_units = len(run.source_lines or [])
+        carried_outputs = [carried] if carried is not None else []
+        chunks = _phase_chunks(run, reused, execution, PhaseName.PRETRANSLATION)
+        index = _RunContextIndex(run)
 
         agent_outputs: list[PretranslationPhaseOutput] = []
-        for agent_name, pool in self._pretranslation_agents:
-            completed_units = 0
+        for agent_name, pool in (
+            self._pretranslation_agents if await chunks.has_chunks() else []
+        ):
+            completed_units = len(reused)
 
             async def _on_batch(
                 batch_inputs: list[PretranslationPhaseInput],
@@ -916,17 +1347,29 @@ class PipelineOrchestrator:
                     "lines_annotated",
                     ProgressUnit.LINES,
                     completed_units,
-                    total_units,
+                    _source_line_count(run),
                     message=_agent_name,
                 )
 
-            outputs = await _run_agent_pool(
+            outputs = await self._run_checkpointed_pool(
+                run,
+                PhaseName.PRETRANSLATION,
+                None,
+                agent_name,
                 pool,
-                inputs,
-                execution.max_parallel_agents if execution else None,
+                chunks,
+                partial(_build_pretranslation_input, run, index=index),
+                PretranslationPhaseOutput,
+                _resolve_agent_parallelism(
+                    run.config, PhaseName.PRETRANSLATION, execution
+                ),
                 on_batch=_on_batch,
             )
-            agent_outputs.append(_merge_pretranslation_outputs(run, outputs))
+            agent_outputs.append(
+                _merge_pretranslation_outputs(run, [*carried_outputs, *outputs])
+            )
+        if not agent_outputs and carried_outputs:
+            agent_outputs.append(_merge_pretranslation_outputs(run, carried_outputs))
 
         run.pretranslation_output = _merge_pretranslation_outputs_across_agents(
             run, agent_outputs
@@ -938,9 +1381,15 @@ class PipelineOrchestrator:
             None,
             description="Pretranslation output",
         )
+        await self._clear_phase_checkpoints(run, PhaseName.PRETRANSLATION, None)
         revision = _next_revision(run, PhaseName.PRETRANSLATION, None)
         dependencies = _build_dependencies(run, PhaseName.PRETRANSLATION, None)
-        summary = _build_pretranslation_summary(run, run.pretranslation_output)
+        dependencies.extend(
+            _carried_dependencies(run, PhaseName.PRETRANSLATION, None, reused)
+        )
+        summary = _with_reused_lines(
+            _build_pretranslation_summary(run, run.pretranslation_output), reused
+        )
         record = _build_phase_record(
             run,
             PhaseName.PRETRANSLATION,
@@ -973,17 +1422,20 @@ class PipelineOrchestrator:
                     ),
                 )
             )
-        chunks = _build_work_chunks(
-            run.source_lines or [], execution, PhaseName.TRANSLATE
+        carried, reused = (
+            run.baseline.carry_translate(run, target_language)
+            if run.baseline
+            else (None, set())
         )
-        inputs = [
-            _build_translate_input(run, target_language, chunk) for chunk in chunks
-        ]
-        total_units = len(run.source_lines or [])
+        carried_outputs = [carried] if carried is not None else []
+        chunks = _phase_chunks(run, reused, execution, PhaseName.TRANSLATE)
+        index = _RunContextIndex(run, target_language)
 
         agent_outputs: list[TranslatePhaseOutput] = []
-        for agent_name, pool in self._translate_agents:
-            completed_units = 0
+        for agent_name, pool in (
+            self._translate_agents if await chunks.has_chunks() else []
+        ):
+            completed_units = len(reused)
 
             async def _on_batch(
                 batch_inputs: list[TranslatePhaseInput],
@@ -1000,19 +1452,30 @@ class PipelineOrchestrator:
                     "lines_translated",
                     ProgressUnit.LINES,
                     completed_units,
-                    total_units,
+                    _source_line_count(run),
                     message=_agent_name,
+                    target_language=target_language,
                 )
 
-            outputs = await _run_agent_pool(
+            outputs = await self._run_checkpointed_pool(
+                run,
+                PhaseName.TRANSLATE,
+                target_language,
+                agent_name,
                 pool,
-                inputs,
-                execution.max_parallel_agents if execution else None,
+                chunks,
+                partial(_build_translate_input, run, target_language, index=index),
+                TranslatePhaseOutput,
+                _resolve_agent_parallelism(run.config, PhaseName.TRANSLATE, execution),
                 on_batch=_on_batch,
             )
             agent_outputs.append(
-                _merge_translate_outputs(run, target_language, outputs)
+                _merge_translate_outputs(
+                    run, target_language, [*carried_outputs, *outputs]
+                )
             )
+        if not agent_outputs:
+            agent_outputs = carried_outputs
 
         merged_output = _merge_translate_outputs_across_agents(
             run, target_language, agent_outputs
@@ -1025,9 +1488,13 @@ class PipelineOrchestrator:
             target_language,
             description=f"Translate output ({target_language})",
         )
+        await self._clear_phase_checkpoints(run, PhaseName.TRANSLATE, target_language)
         revision = _next_revision(run, PhaseName.TRANSLATE, target_language)
         dependencies = _build_dependencies(run, PhaseName.TRANSLATE, target_language)
-        summary = _build_translate_summary(merged_output)
+        dependencies.extend(
+            _carried_dependencies(run, PhaseName.TRANSLATE, target_language, reused)
+        )
+        summary = _with_reused_lines(_build_translate_summary(merged_output), reused)
         record = _build_phase_record(
             run,
             PhaseName.TRANSLATE,
@@ -1049,6 +1516,9 @@ class PipelineOrchestrator:
         target_language: LanguageCode,
         execution: PhaseExecutionConfig | None,
     ) -> PhaseRunRecord:
+        carried_issues, reused = (
+            run.baseline.carry_qa(run, target_language) if run.baseline else ([], set())
+        )
         # Run deterministic checks first (if configured)
         deterministic_config = _get_deterministic_qa_config(run.config)
         deterministic_issues: list[QaIssue] = []
@@ -1057,9 +1527,11 @@ class PipelineOrchestrator:
             translate_output = run.translate_outputs.get(target_language)
             if translate_output is not None:
                 runner = _build_deterministic_qa_runner(deterministic_config)
-                deterministic_issues = runner.run_checks(
-                    translate_output.translated_lines
-                )
+                deterministic_issues = runner.run_checks([
+                    line
+                    for line in translate_output.translated_lines
+                    if line.line_id not in reused
+                ])
 
         if not self._qa_agents:
             total_units = len(run.source_lines or [])
@@ -1071,17 +1543,18 @@ class PipelineOrchestrator:
                 total_units,
                 total_units,
                 message="deterministic",
+                target_language=target_language,
             )
 
         # Run LLM-based QA agents (if configured)
         agent_outputs: list[QaPhaseOutput] = []
         if self._qa_agents:
-            chunks = _build_work_chunks(run.source_lines or [], execution, PhaseName.QA)
-            inputs = [_build_qa_input(run, target_language, chunk) for chunk in chunks]
+            chunks = _phase_chunks(run, reused, execution, PhaseName.QA)
+            index = _RunContextIndex(run, target_language)
             total_units = len(run.source_lines or [])
 
             for agent_name, pool in self._qa_agents:
-                completed_units = 0
+                completed_units = len(reused)
 
                 async def _on_batch(
                     batch_inputs: list[QaPhaseInput],
@@ -1100,19 +1573,29 @@ class PipelineOrchestrator:
                         completed_units,
                         total_units,
                         message=_agent_name,
+                        target_language=target_language,
                     )
 
-                outputs = await _run_agent_pool(
+                outputs = await self._run_checkpointed_pool(
+                    run,
+                    PhaseName.QA,
+                    target_language,
+                    agent_name,
                     pool,
-                    inputs,
-                    execution.max_parallel_agents if execution else None,
+                    chunks,
+                    partial(_build_qa_input, run, target_language, index=index),
+                    QaPhaseOutput,
+                    _resolve_agent_parallelism(run.config, PhaseName.QA, execution),
                     on_batch=_on_batch,
                 )
                 agent_outputs.append(_merge_qa_outputs(run, target_language, outputs))
 
         # Merge all QA outputs (deterministic + agent-based)
         merged_output = _merge_qa_outputs_with_deterministic(
-            run, target_language, agent_outputs, deterministic_issues
+            run,
+            target_language,
+            agent_outputs,
+            [*carried_issues, *deterministic_issues],
         )
         run.qa_outputs[target_language] = merged_output
         artifact_ids = await self._persist_phase_artifact(
@@ -1122,9 +1605,13 @@ class PipelineOrchestrator:
             target_language,
             description=f"QA output ({target_language})",
         )
+        await self._clear_phase_checkpoints(run, PhaseName.QA, target_language)
         revision = _next_revision(run, PhaseName.QA, target_language)
         dependencies = _build_dependencies(run, PhaseName.QA, target_language)
-        summary = _build_qa_result_summary(merged_output)
+        dependencies.extend(
+            _carried_dependencies(run, PhaseName.QA, target_language, reused)
+        )
+        summary = _with_reused_lines(_build_qa_result_summary(merged_output), reused)
         record = _build_phase_record(
             run,
             PhaseName.QA,
@@ -1157,13 +1644,19 @@ class PipelineOrchestrator:
                     ),
                 )
             )
-        chunks = _build_work_chunks(run.source_lines or [], execution, PhaseName.EDIT)
-        inputs = [_build_edit_input(run, target_language, chunk) for chunk in chunks]
+        carried, reused = (
+            run.baseline.carry_edit(run, target_language)
+            if run.baseline
+            else (None, set())
+        )
+        carried_outputs = [carried] if carried is not None else []
+        chunks = _phase_chunks(run, reused, execution, PhaseName.EDIT)
+        index = _RunContextIndex(run, target_language)
         total_units = len(run.source_lines or [])
 
         agent_outputs: list[EditPhaseOutput] = []
-        for agent_name, pool in self._edit_agents:
-            completed_units = 0
+        for agent_name, pool in self._edit_agents if await chunks.has_chunks() else []:
+            completed_units = len(reused)
 
             async def _on_batch(
                 batch_inputs: list[EditPhaseInput],
@@ -1182,15 +1675,26 @@ class PipelineOrchestrator:
                     completed_units,
                     total_units,
                     message=_agent_name,
+                    target_language=target_language,
                 )
 
-            outputs = await _run_agent_pool(
+            outputs = await self._run_checkpointed_pool(
+                run,
+                PhaseName.EDIT,
+                target_language,
+                agent_name,
                 pool,
-                inputs,
-                execution.max_parallel_agents if execution else None,
+                chunks,
+                partial(_build_edit_input, run, target_language, index=index),
+                EditPhaseOutput,
+                _resolve_agent_parallelism(run.config, PhaseName.EDIT, execution),
                 on_batch=_on_batch,
             )
-            agent_outputs.append(_merge_edit_outputs(run, target_language, outputs))
+            agent_outputs.append(
+                _merge_edit_outputs(run, target_language, [*carried_outputs, *outputs])
+            )
+        if not agent_outputs:
+            agent_outputs = carried_outputs
 
         merged_output = _merge_edit_outputs_across_agents(
             run, target_language, agent_outputs
@@ -1203,10 +1707,14 @@ class PipelineOrchestrator:
             target_language,
             description=f"Edit output ({target_language})",
         )
+        await self._clear_phase_checkpoints(run, PhaseName.EDIT, target_language)
         run.edit_outputs[target_language] = merged_output
         revision = _next_revision(run, PhaseName.EDIT, target_language)
         dependencies = _build_dependencies(run, PhaseName.EDIT, target_language)
-        summary = _build_edit_summary(merged_output)
+        dependencies.extend(
+            _carried_dependencies(run, PhaseName.EDIT, target_language, reused)
+        )
+        summary = _with_reused_lines(_build_edit_summary(merged_output), reused)
         record = _build_phase_record(
             run,
             PhaseName.EDIT,
@@ -1331,6 +1839,12 @@ class PipelineOrchestrator:
     async def _emit_log(self, entry: LogEntry) -> None:
         await self._log_sink.emit_log(entry)
 
+    async def _flush_sinks(self) -> None:
+        # Phase and run boundaries are durability points for buffered sinks
+        for sink in (self._log_sink, self._progress_sink):
+            if isinstance(sink, FlushableSinkProtocol):
+                await sink.flush()
+
     async def _emit_run_progress(
         self,
         run: PipelineRunContext,
@@ -1340,6 +1854,7 @@ class PipelineOrchestrator:
         if self._progress_sink is None:
             return
         update = _build_run_progress_update(run, event, timestamp or self._clock())
+        run._progress_deltas = 0
         await self._progress_sink.emit_progress(update)
 
     async def _emit_progress(
@@ -1352,13 +1867,27 @@ class PipelineOrchestrator:
     ) -> None:
         if self._progress_sink is None:
             return
-        update = _build_progress_update(
-            run,
-            phase,
-            event,
-            timestamp or self._clock(),
-            message=message,
-        )
+        # Phase progress is sent as one-phase deltas with a full snapshot
+        # every N updates, so readers only replay the tail of the stream
+        delta = event == ProgressEvent.PHASE_PROGRESS
+        if delta and run._progress_deltas + 1 < self._progress_snapshot_interval:
+            run._progress_deltas += 1
+            update = _build_progress_delta_update(
+                run,
+                phase,
+                event,
+                timestamp or self._clock(),
+                message=message,
+            )
+        else:
+            run._progress_deltas = 0
+            update = _build_progress_update(
+                run,
+                phase,
+                event,
+                timestamp or self._clock(),
+                message=message,
+            )
         await self._progress_sink.emit_progress(update)
 
     async def _emit_phase_progress_update(
@@ -1370,12 +1899,20 @@ class PipelineOrchestrator:
         completed_units: int,
         total_units: int,
         message: str | None = None,
+        target_language: LanguageCode | None = None,
     ) -> None:
         phase_progress = next(
             progress for progress in run.progress.phases if progress.phase == phase
         )
         now = self._clock()
-        clamped_completed = min(completed_units, total_units)
+        # Concurrent language branches share one phase metric: sum their units
+        phase_units = run._phase_units.setdefault(phase, {})
+        phase_units[target_language] = (
+            min(completed_units, total_units),
+            total_units,
+        )
+        clamped_completed = sum(completed for completed, _ in phase_units.values())
+        total_units = sum(total for _, total in phase_units.values())
         eta_seconds = _estimate_eta_seconds(
             phase_progress.started_at, now, clamped_completed, total_units
         )
@@ -1421,7 +1958,7 @@ class PipelineOrchestrator:
         run.status = RunStatus.FAILED
         if run.started_at is None:
             run.started_at = timestamp
-        run.current_phase = None
+        run.current_phase = run._active_phases[-1] if run._active_phases else None
         run.completed_at = timestamp
         error_details: dict[str, JsonValue] = {"phase": phase.value}
         if target_language is not None:
@@ -1472,24 +2009,70 @@ class PipelineOrchestrator:
             )
         )
         await self._persist_run_state(run)
+        await self._flush_sinks()
 
-    async def _persist_run_state(self, run: PipelineRunContext) -> None:
+    async def _persist_run_state(
+        self, run: PipelineRunContext, *, debounce: bool = False
+    ) -> None:
         if self._run_state_store is None:
             return
-        timestamp = self._clock()
-        run_state = _build_run_state(run)
-        await self._run_state_store.save_run_state(
-            RunStateRecord(
-                run_id=run.run_id,
-                stored_at=timestamp,
-                state=run_state,
-                location=None,
-                checksum_sha256=None,
+        if run._persist_error is not None:
+            error, run._persist_error = run._persist_error, None
+            raise error
+        if debounce and self._run_state_debounce_s > 0:
+            # Start transitions are cheap to lose on a crash; the next save
+            # within the window writes them along with whatever followed
+            if run._pending_persist is None:
+                run._pending_persist = asyncio.create_task(
+                    self._persist_run_state_later(run)
+                )
+            return
+        pending, run._pending_persist = run._pending_persist, None
+        if pending is not None:
+            # Let the cancelled save unwind first so it cannot land after
+            # this one
+            pending.cancel()
+            await asyncio.gather(pending, return_exceptions=True)
+        await self._write_run_state(run)
+
+    async def _persist_run_state_later(self, run: PipelineRunContext) -> None:
+        await asyncio.sleep(self._run_state_debounce_s)
+        run._pending_persist = None
+        try:
+            await self._write_run_state(run)
+        except Exception as exc:
+            # Nobody awaits this task; hand the failure to the run's next save
+            _logger.warning("Failed to persist run state: %s", exc)
+            run._persist_error = exc
+
+    async def _write_run_state(self, run: PipelineRunContext) -> None:
+        if self._run_state_store is None:
+            return
+        # Concurrent language branches persist the same run; serialize writes
+        # so the stored snapshot and index always come from one state
+        async with self._persist_lock:
+            run_state = _build_run_state(run)
+            # The record checksum covers the serialized state only; it also
+            # detects unchanged state without rewriting it
+            digest = hashlib.sha256(
+                run_state.model_dump_json().encode("utf-8")
+            ).hexdigest()
+            if digest == run._persisted_state_digest:
+                return
+            timestamp = self._clock()
+            await self._run_state_store.save_run_state(
+                RunStateRecord(
+                    run_id=run.run_id,
+                    stored_at=timestamp,
+                    state=run_state,
+                    location=None,
+                    checksum_sha256=digest,
+                )
             )
-        )
-        await self._run_state_store.save_run_index(
-            _build_run_index_record(run, timestamp)
-        )
+            await self._run_state_store.save_run_index(
+                _build_run_index_record(run, timestamp)
+            )
+            run._persisted_state_digest = digest
 
     async def _persist_phase_artifact(
         self,
@@ -1531,6 +2114,118 @@ class PipelineOrchestrator:
         _record_artifact_reference(run, phase, stored)
         return [stored.artifact_id]
 
+    async def _run_checkpointed_pool[InputT: BaseSchema, OutputT: BaseSchema](
+        self,
+        run: PipelineRunContext,
+        phase: PhaseName,
+        target_language: LanguageCode | None,
+        agent_name: str,
+        pool: PhaseAgentPoolProtocol[InputT, OutputT],
+        chunks: _ChunkStream,
+        build_input: Callable[[_WorkChunk], InputT],
+        output_model: type[OutputT],
+        max_parallel: int | None,
+        on_batch: Callable[[list[InputT], list[OutputT]], Awaitable[None]],
+    ) -> list[OutputT]:
+        if self._checkpoint_store is None:
+            payloads = (build_input(chunk) async for chunk in chunks)
+            return await _run_agent_pool(pool, payloads, max_parallel, on_batch)
+        store = self._checkpoint_store
+        stored_outputs = {
+            record.chunk_fingerprint: record.output
+            for record in await store.load_checkpoints(
+                run.run_id, phase, target_language
+            )
+            if record.agent_name == agent_name
+        }
+        restored: dict[int, OutputT] = {}
+        pending: list[int] = []
+        fingerprint_by_payload: dict[int, tuple[_WorkChunk, str]] = {}
+
+        def _restore(fingerprint: str) -> OutputT | None:
+            stored = stored_outputs.get(fingerprint)
+            if stored is None:
+                return None
+            try:
+                return output_model.model_validate_json(json.dumps(stored))
+            except ValidationError:
+                return None
+
+        async def _pending_payloads() -> AsyncIterator[InputT]:
+            # Checkpointed chunks are reported as they are restored; the rest
+            # go to the pool as soon as they are cut
+            restored_inputs: list[InputT] = []
+            restored_outputs: list[OutputT] = []
+            index = 0
+            async for chunk in chunks:
+                payload = build_input(chunk)
+                fingerprint = _chunk_fingerprint(chunk, payload)
+                output = _restore(fingerprint)
+                if output is not None:
+                    restored[index] = output
+                    restored_inputs.append(payload)
+                    restored_outputs.append(output)
+                else:
+                    if restored_inputs:
+                        await on_batch(restored_inputs, restored_outputs)
+                        restored_inputs, restored_outputs = [], []
+                    pending.append(index)
+                    fingerprint_by_payload[id(payload)] = (chunk, fingerprint)
+                    yield payload
+                index += 1
+            if restored_inputs:
+                await on_batch(restored_inputs, restored_outputs)
+
+        async def _on_checkpoint(
+            batch_inputs: list[InputT], batch_outputs: list[OutputT]
+        ) -> None:
+            for payload, output in zip(batch_inputs, batch_outputs, strict=True):
+                chunk, fingerprint = fingerprint_by_payload[id(payload)]
+                record = PhaseCheckpointRecord(
+                    run_id=run.run_id,
+                    phase=phase,
+                    target_language=target_language,
+                    agent_name=agent_name,
+                    chunk_fingerprint=fingerprint,
+                    line_ids=[line.line_id for line in chunk.source_lines],
+                    created_at=self._clock(),
+                    output=output.model_dump(mode="json"),
+                )
+                try:
+                    await store.append_checkpoint(record)
+                except StorageError as exc:
+                    _logger.warning("Failed to write phase checkpoint: %s", exc)
+            await on_batch(batch_inputs, batch_outputs)
+
+        outputs = await _run_agent_pool(
+            pool, _pending_payloads(), max_parallel, on_batch=_on_checkpoint
+        )
+        if restored:
+            _logger.info(
+                "Resumed %s (%s) from %d of %d checkpointed chunks",
+                phase.value,
+                agent_name,
+                len(restored),
+                len(restored) + len(pending),
+            )
+        restored.update(zip(pending, outputs, strict=True))
+        return [restored[index] for index in range(len(restored))]
+
+    async def _clear_phase_checkpoints(
+        self,
+        run: PipelineRunContext,
+        phase: PhaseName,
+        target_language: LanguageCode | None,
+    ) -> None:
+        if self._checkpoint_store is None:
+            return
+        try:
+            await self._checkpoint_store.clear_checkpoints(
+                run.run_id, phase, target_language
+            )
+        except StorageError as exc:
+            _logger.warning("Failed to clear phase checkpoints: %s", exc)
+
     def _update_phase_status(
         self,
         run: PipelineRunContext,
@@ -1794,6 +2489,19 @@ def _build_deterministic_qa_runner(
     return runner
 
 
+def _release_active_phase(run: PipelineRunContext, phase: PhaseName) -> None:
+    if phase in run._active_phases:
+        run._active_phases.remove(phase)
+    run.current_phase = run._active_phases[-1] if run._active_phases else None
+
+
+def _phase_status(run: PipelineRunContext, phase: PhaseName) -> PhaseStatus | None:
+    for phase_progress in run.progress.phases:
+        if phase_progress.phase == phase:
+            return PhaseStatus(phase_progress.status)
+    return None
+
+
 def _resolve_target_language(
     run: PipelineRunContext,
     phase: PhaseName,
@@ -1836,7 +2544,7 @@ def _require_language(
 
 
 def _require_source_lines(run: PipelineRunContext, phase: PhaseName) -> None:
-    if not run.source_lines:
+    if not run.source_lines and _streaming_feed(run) is None:
         raise OrchestrationError(
             OrchestrationErrorInfo(
                 code=OrchestrationErrorCode.MISSING_DEPENDENCY,
@@ -2053,52 +2761,236 @@ def _build_work_chunks(
 ) -> list[_WorkChunk]:
     if not source_lines:
         return []
-    strategy = execution.strategy if execution else PhaseWorkStrategy.FULL
-    if strategy == PhaseWorkStrategy.FULL:
-        return [_WorkChunk(source_lines=source_lines)]
-    if strategy == PhaseWorkStrategy.CHUNK:
-        chunk_size = execution.chunk_size if execution else None
-        if chunk_size is None:
-            return [_WorkChunk(source_lines=source_lines)]
-        return [
-            _WorkChunk(source_lines=source_lines[index : index + chunk_size])
-            for index in range(0, len(source_lines), chunk_size)
-        ]
-    if strategy == PhaseWorkStrategy.SCENE:
-        scene_groups = _group_by_scene(source_lines)
-        if execution is None or execution.scene_batch_size is None:
-            return [_WorkChunk(source_lines=group) for group in scene_groups]
-        batch_size = execution.scene_batch_size
+    builder = _WorkChunkBuilder(execution, phase)
+    chunks = builder.add(source_lines)
+    chunks.extend(builder.finish())
+    return chunks
+
+
+class _WorkChunkBuilder:
+    # Cuts work chunks as source lines are added; feeding every line and
+    # finishing gives the same chunks however the lines are batched
+
+    def __init__(
+        self, execution: PhaseExecutionConfig | None, phase: PhaseName
+    ) -> None:
+        self._phase = phase
+        self._strategy = execution.strategy if execution else PhaseWorkStrategy.FULL
+        self._chunk_size: int | None = None
+        self._token_budget: int | None = None
+        self._groups_per_chunk = 1
+        if execution is not None:
+            if self._strategy == PhaseWorkStrategy.CHUNK:
+                self._chunk_size = execution.chunk_size
+                self._token_budget = execution.chunk_token_budget
+            elif self._strategy == PhaseWorkStrategy.SCENE:
+                self._groups_per_chunk = execution.scene_batch_size or 1
+            elif self._strategy == PhaseWorkStrategy.ROUTE:
+                self._groups_per_chunk = execution.route_batch_size or 1
+        self._pending: list[SourceLine] = []
+        self._pending_tokens = 0
+        self._pending_groups = 0
+        self._group: list[SourceLine] = []
+        self._group_key: str | None = None
+
+    def add(self, source_lines: Sequence[SourceLine]) -> list[_WorkChunk]:
         chunks: list[_WorkChunk] = []
-        for index in range(0, len(scene_groups), batch_size):
-            batch: list[SourceLine] = []
-            for group in scene_groups[index : index + batch_size]:
-                batch.extend(group)
-            chunks.append(_WorkChunk(source_lines=batch))
+        grouped = self._strategy in {PhaseWorkStrategy.SCENE, PhaseWorkStrategy.ROUTE}
+        for line in source_lines:
+            if not grouped:
+                if self._token_budget is not None:
+                    tokens = estimate_tokens(line.text)
+                    if (
+                        self._pending
+                        and self._pending_tokens + tokens > self._token_budget
+                    ):
+                        chunks.append(self._cut())
+                    self._pending_tokens += tokens
+                self._pending.append(line)
+                if (
+                    self._chunk_size is not None
+                    and len(self._pending) >= self._chunk_size
+                ):
+                    chunks.append(self._cut())
+                continue
+            key = self._group_key_for(line)
+            if self._group and key != self._group_key:
+                self._close_group(chunks)
+            self._group_key = key
+            self._group.append(line)
         return chunks
-    if strategy == PhaseWorkStrategy.ROUTE:
-        if any(line.route_id is None for line in source_lines):
+
+    def finish(self) -> list[_WorkChunk]:
+        chunks: list[_WorkChunk] = []
+        if self._group:
+            self._close_group(chunks)
+        if self._pending:
+            chunks.append(self._cut())
+        return chunks
+
+    def _group_key_for(self, line: SourceLine) -> str | None:
+        if self._strategy == PhaseWorkStrategy.SCENE:
+            return line.scene_id
+        if line.route_id is None:
             raise OrchestrationError(
                 OrchestrationErrorInfo(
                     code=OrchestrationErrorCode.INVALID_STATE,
                     message="Route strategy requires route_id on all source lines",
                     details=OrchestrationErrorDetails(
-                        phase=phase, reason="route_id_missing"
+                        phase=self._phase, reason="route_id_missing"
                     ),
                 )
             )
-        route_groups = _group_by_route(source_lines)
-        if execution is None or execution.route_batch_size is None:
-            return [_WorkChunk(source_lines=group) for group in route_groups]
-        batch_size = execution.route_batch_size
-        chunks: list[_WorkChunk] = []
-        for index in range(0, len(route_groups), batch_size):
-            batch: list[SourceLine] = []
-            for group in route_groups[index : index + batch_size]:
-                batch.extend(group)
-            chunks.append(_WorkChunk(source_lines=batch))
-        return chunks
-    return [_WorkChunk(source_lines=source_lines)]
+        return line.route_id
+
+    def _close_group(self, chunks: list[_WorkChunk]) -> None:
+        self._pending.extend(self._group)
+        self._group = []
+        self._pending_groups += 1
+        if self._pending_groups >= self._groups_per_chunk:
+            chunks.append(self._cut())
+
+    def _cut(self) -> _WorkChunk:
+        chunk = _WorkChunk(source_lines=self._pending)
+        self._pending = []
+        self._pending_tokens = 0
+        self._pending_groups = 0
+        return chunk
+
+
+class _SourceLineFeed:
+    # Source lines published by a streaming ingest; each reader replays them
+    # from the first line and waits for more until ingest closes the feed
+
+    def __init__(self) -> None:
+        self.lines: list[SourceLine] = []
+        self.scene_ids: set[str] = set()
+        self.closed = False
+        self._changed = asyncio.Event()
+
+    def add(self, source_lines: Sequence[SourceLine]) -> None:
+        self.lines.extend(source_lines)
+        self.scene_ids.update(
+            line.scene_id for line in source_lines if line.scene_id is not None
+        )
+        self._wake()
+
+    def close(self) -> None:
+        self.closed = True
+        self._wake()
+
+    async def batches(self) -> AsyncIterator[list[SourceLine]]:
+        position = 0
+        while True:
+            if position < len(self.lines):
+                batch = self.lines[position:]
+                position += len(batch)
+                yield batch
+                continue
+            if self.closed:
+                return
+            await self._changed.wait()
+
+    def _wake(self) -> None:
+        # Swap in a fresh event so every waiting reader sees this change
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+
+class _ChunkStream:
+    # Work chunks for one phase run, either cut up front or cut from a feed
+    # as ingest streams; every iteration replays the chunks cut so far, so
+    # each agent of a phase sees the same chunks
+
+    def __init__(
+        self,
+        chunks: list[_WorkChunk],
+        pending: AsyncIterator[list[_WorkChunk]] | None = None,
+    ) -> None:
+        self._chunks = chunks
+        self._pending = pending
+        self._lock = asyncio.Lock()
+
+    async def __aiter__(self) -> AsyncIterator[_WorkChunk]:
+        position = 0
+        while position < len(self._chunks) or await self._pull(position):
+            yield self._chunks[position]
+            position += 1
+
+    async def has_chunks(self) -> bool:
+        return bool(self._chunks) or await self._pull(0)
+
+    async def _pull(self, known: int) -> bool:
+        async with self._lock:
+            while len(self._chunks) <= known and self._pending is not None:
+                try:
+                    self._chunks.extend(await anext(self._pending))
+                except StopAsyncIteration:
+                    self._pending = None
+            return len(self._chunks) > known
+
+
+def _phase_chunks(
+    run: PipelineRunContext,
+    reused: set[LineId],
+    execution: PhaseExecutionConfig | None,
+    phase: PhaseName,
+) -> _ChunkStream:
+    feed = _streaming_feed(run)
+    if feed is None:
+        return _ChunkStream(
+            _build_work_chunks(_pending_source_lines(run, reused), execution, phase)
+        )
+    return _ChunkStream([], _cut_feed_chunks(run, feed, execution, phase))
+
+
+async def _cut_feed_chunks(
+    run: PipelineRunContext,
+    feed: _SourceLineFeed,
+    execution: PhaseExecutionConfig | None,
+    phase: PhaseName,
+) -> AsyncIterator[list[_WorkChunk]]:
+    builder = _WorkChunkBuilder(execution, phase)
+    async for batch in feed.batches():
+        chunks = builder.add(batch)
+        if chunks:
+            yield chunks
+    # Ingest has finished; an empty source fails like a sequential run would
+    _require_source_lines(run, phase)
+    yield builder.finish()
+
+
+def _streaming_feed(run: PipelineRunContext) -> _SourceLineFeed | None:
+    feed = run._ingest_feed
+    if feed is None or feed.closed:
+        return None
+    return feed
+
+
+def _source_line_count(run: PipelineRunContext) -> int:
+    feed = run._ingest_feed
+    if feed is not None:
+        return len(feed.lines)
+    return len(run.source_lines or [])
+
+
+def _can_stream_ingest(
+    run: PipelineRunContext, stage: list[tuple[PhaseName, LanguageCode | None]]
+) -> bool:
+    # Phases whose chunk inputs need only their own lines and earlier phase
+    # outputs can start on ingested lines; incremental runs carry outputs by
+    # comparing the full source, so they wait for ingest to finish
+    if run.baseline is not None:
+        return False
+    phase, language = stage[0]
+    if language is None:
+        return phase in {PhaseName.CONTEXT, PhaseName.PRETRANSLATION}
+    first_phases: dict[LanguageCode | None, PhaseName] = {}
+    for branch_phase, branch_language in stage:
+        first_phases.setdefault(branch_language, branch_phase)
+    return all(
+        branch_phase == PhaseName.TRANSLATE for branch_phase in first_phases.values()
+    )
 
 
 def _resolve_execution_plan(
@@ -2139,7 +3031,11 @@ def _build_shard_plan(
         return None
     strategy = execution.strategy if execution else PhaseWorkStrategy.FULL
     strategy_value = getattr(strategy, "value", str(strategy))
-    if not source_lines:
+    shard_count: int | None
+    if source_lines is None:
+        # Unknown until ingest finishes streaming the source
+        shard_count = None
+    elif not source_lines:
         shard_count = 0
     else:
         shard_count = len(_build_work_chunks(source_lines, execution, phase))
@@ -2152,34 +3048,28 @@ def _build_shard_plan(
     return data
 
 
-def _group_by_scene(source_lines: list[SourceLine]) -> list[list[SourceLine]]:
-    groups: list[list[SourceLine]] = []
-    current_group: list[SourceLine] = []
-    current_scene = source_lines[0].scene_id
-    for line in source_lines:
-        if line.scene_id != current_scene and current_group:
-            groups.append(current_group)
-            current_group = []
-        current_scene = line.scene_id
-        current_group.append(line)
-    if current_group:
-        groups.append(current_group)
-    return groups
-
-
-def _group_by_route(source_lines: list[SourceLine]) -> list[list[SourceLine]]:
-    groups: list[list[SourceLine]] = []
-    current_group: list[SourceLine] = []
-    current_route = source_lines[0].route_id
-    for line in source_lines:
-        if line.route_id != current_route and current_group:
-            groups.append(current_group)
-            current_group = []
-        current_route = line.route_id
-        current_group.append(line)
-    if current_group:
-        groups.append(current_group)
-    return groups
+def _resolve_agent_parallelism(
+    config: RunConfig,
+    phase: PhaseName,
+    execution: PhaseExecutionConfig | None,
+) -> int | None:
+    max_parallel = execution.max_parallel_agents if execution else None
+    if execution is None or execution.strategy != PhaseWorkStrategy.SCENE:
+        return max_parallel
+    # Scene-sharded work honors max_parallel_scenes (phase override first)
+    max_parallel_scenes = config.concurrency.max_parallel_scenes
+    phase_config = _get_phase_config(config, phase)
+    if (
+        phase_config is not None
+        and phase_config.concurrency is not None
+        and "max_parallel_scenes" in phase_config.concurrency.model_fields_set
+    ):
+        max_parallel_scenes = phase_config.concurrency.max_parallel_scenes
+    scenes_per_chunk = execution.scene_batch_size or 1
+    scene_cap = max(1, max_parallel_scenes // scenes_per_chunk)
+    if max_parallel is None:
+        return scene_cap
+    return min(max_parallel, scene_cap)
 
 
 class _WorkChunk(BaseModel):
@@ -2189,11 +3079,11 @@ class _WorkChunk(BaseModel):
         description="Source lines in this work chunk"
     )
 
-    @property
+    @cached_property
     def line_ids(self) -> set[LineId]:
         return {line.line_id for line in self.source_lines}
 
-    @property
+    @cached_property
     def scene_ids(self) -> set[str]:
         return {
             line.scene_id for line in self.source_lines if line.scene_id is not None
@@ -2206,21 +3096,46 @@ class _WorkChunk(BaseModel):
         }
 
 
+def _chunk_fingerprint(chunk: _WorkChunk, payload: BaseSchema) -> str:
+    input_hash = hashlib.sha256(payload.model_dump_json().encode("utf-8")).hexdigest()
+    fingerprint = {
+        "line_ids": [line.line_id for line in chunk.source_lines],
+        "input_sha256": input_hash,
+    }
+    serialized = json.dumps(fingerprint, separators=(",", ":"))
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
 async def _run_agent_pool[InputT: BaseSchema, OutputT_co: BaseSchema](
     pool: PhaseAgentPoolProtocol[InputT, OutputT_co],
-    payloads: list[InputT],
+    payloads: list[InputT] | AsyncIterable[InputT],
     max_parallel: int | None,
     on_batch: Callable[[list[InputT], list[OutputT_co]], Awaitable[None]] | None = None,
 ) -> list[OutputT_co]:
-    if not payloads:
+    if isinstance(payloads, list) and not payloads:
         return []
 
+    if isinstance(pool, (PhaseAgentPool, LanguageAgentPool)):
+        # Stream payloads through the pool's work queue, reporting per chunk
+        on_result: Callable[[InputT, OutputT_co], Awaitable[None]] | None = None
+        if on_batch is not None:
+            report = on_batch
+
+            async def _on_result(payload: InputT, result: OutputT_co) -> None:
+                await report([payload], [result])
+
+            on_result = _on_result
+        return await pool.run_stream(
+            payloads, max_parallel=max_parallel, on_result=on_result
+        )
+
+    if not isinstance(payloads, list):
+        # Batch-only pools need the full payload list up front
+        payloads = [payload async for payload in payloads]
+        if not payloads:
+            return []
+
     effective_parallel = max_parallel
-    if (effective_parallel is None or effective_parallel <= 0) and isinstance(
-        pool, PhaseAgentPool
-    ):
-        pool_parallel = pool._max_parallel or len(pool._agents)
-        effective_parallel = pool_parallel
     if effective_parallel is None or effective_parallel <= 0:
         effective_parallel = len(payloads)
 
@@ -2240,25 +3155,139 @@ async def _run_agent_pool[InputT: BaseSchema, OutputT_co: BaseSchema](
     return results
 
 
-def _build_pretranslation_input(
+def _per_result_callback[InputT: BaseSchema, OutputT_co: BaseSchema](
+    on_result: Callable[[InputT, OutputT_co], Awaitable[None]] | None,
+) -> Callable[[list[InputT], list[OutputT_co]], Awaitable[None]] | None:
+    if on_result is None:
+        return None
+    report = on_result
+
+    async def _on_batch(inputs: list[InputT], outputs: list[OutputT_co]) -> None:
+        for payload, result in zip(inputs, outputs, strict=True):
+            await report(payload, result)
+
+    return _on_batch
+
+
+# Built once per phase so chunk inputs are assembled by key lookups instead of
+# rescanning every phase output per chunk. Matches keep phase output order.
+class _RunContextIndex:
+    def __init__(
+        self, run: PipelineRunContext, target_language: LanguageCode | None = None
+    ) -> None:
+        context_output = run.context_output
+        pretranslation_output = run.pretranslation_output
+        translate_output = (
+            run.translate_outputs.get(target_language) if target_language else None
+        )
+        qa_output = run.qa_outputs.get(target_language) if target_language else None
+        self.has_context = context_output is not None
+        self.has_pretranslation = pretranslation_output is not None
+        self.has_qa = qa_output is not None
+        self._scene_summaries = _index_by(
+            context_output.scene_summaries if context_output else [],
+            lambda summary: summary.scene_id,
+        )
+        context_notes = context_output.context_notes if context_output else []
+        self._notes_by_line = _index_by(context_notes, lambda note: note.line_id)
+        self._notes_by_scene = _index_by(context_notes, lambda note: note.scene_id)
+        self._annotations = _index_by(
+            pretranslation_output.annotations if pretranslation_output else [],
+            lambda annotation: annotation.line_id,
+        )
+        self._translated_lines = _index_by(
+            translate_output.translated_lines if translate_output else [],
+            lambda line: line.line_id,
+        )
+        self._qa_issues = _index_by(
+            qa_output.issues if qa_output else [], lambda issue: issue.line_id
+        )
+
+    def scene_summaries(self, chunk: _WorkChunk) -> list[SceneSummary] | None:
+        if not self.has_context:
+            return None
+        return _collect_indexed((self._scene_summaries, chunk.scene_ids))
+
+    def context_notes(self, chunk: _WorkChunk) -> list[ContextNote] | None:
+        if not self.has_context:
+            return None
+        return _collect_indexed(
+            (self._notes_by_line, chunk.line_ids),
+            (self._notes_by_scene, chunk.scene_ids),
+        )
+
+    def pretranslation_annotations(
+        self, chunk: _WorkChunk
+    ) -> list[PretranslationAnnotation] | None:
+        if not self.has_pretranslation:
+            return None
+        return _collect_indexed((self._annotations, chunk.line_ids))
+
+    def translated_lines(self, chunk: _WorkChunk) -> list[TranslatedLine]:
+        return _collect_indexed((self._translated_lines, chunk.line_ids))
+
+    def qa_issues(self, chunk: _WorkChunk) -> list[QaIssue] | None:
+        if not self.has_qa:
+            return None
+        return _collect_indexed((self._qa_issues, chunk.line_ids))
+
+
+def _index_by[T](
+    items: Sequence[T], key: Callable[[T], str | None]
+) -> dict[str, list[tuple[int, T]]]:
+    index: dict[str, list[tuple[int, T]]] = {}
+    for position, item in enumerate(items):
+        item_key = key(item)
+        if item_key is not None:
+            index.setdefault(item_key, []).append((position, item))
+    return index
+
+
+def _collect_indexed[T](
+    *lookups: tuple[dict[str, list[tuple[int, T]]], set[str]],
+) -> list[T]:
+    # Each index is queried only with its own kind of key (line or scene IDs).
+    # Indexes over the same output share positions, so dedupe and reorder by them
+    matches: dict[int, T] = {}
+    for index, keys in lookups:
+        for key in keys:
+            for position, item in index.get(key, ()):
+                matches[position] = item
+    return [matches[position] for position in sorted(matches)]
+
+
+def _build_context_input(
     run: PipelineRunContext, chunk: _WorkChunk
+) -> ContextPhaseInput:
+    return ContextPhaseInput(
+        run_id=run.run_id,
+        source_lines=chunk.source_lines,
+        project_context=None,
+        style_guide=None,
+        glossary=None,
+    )
+
+
+def _build_pretranslation_input(
+    run: PipelineRunContext, chunk: _WorkChunk, index: _RunContextIndex
 ) -> PretranslationPhaseInput:
-    scene_summaries = _filter_scene_summaries(run, chunk)
-    context_notes = _filter_context_notes(run, chunk)
     project_context = run.context_output.project_context if run.context_output else None
     glossary = run.context_output.glossary if run.context_output else None
     return PretranslationPhaseInput(
         run_id=run.run_id,
         source_lines=chunk.source_lines,
-        scene_summaries=scene_summaries,
-        context_notes=context_notes,
+        scene_summaries=index.scene_summaries(chunk),
+        context_notes=index.context_notes(chunk),
         project_context=project_context,
         glossary=glossary,
     )
 
 
 def _build_translate_input(
-    run: PipelineRunContext, target_language: LanguageCode, chunk: _WorkChunk
+    run: PipelineRunContext,
+    target_language: LanguageCode,
+    chunk: _WorkChunk,
+    index: _RunContextIndex,
 ) -> TranslatePhaseInput:
     context_output = run.context_output
     pretranslation_output = run.pretranslation_output
@@ -2266,12 +3295,10 @@ def _build_translate_input(
         run_id=run.run_id,
         target_language=target_language,
         source_lines=chunk.source_lines,
-        scene_summaries=_filter_scene_summaries(run, chunk),
-        context_notes=_filter_context_notes(run, chunk),
+        scene_summaries=index.scene_summaries(chunk),
+        context_notes=index.context_notes(chunk),
         project_context=context_output.project_context if context_output else None,
-        pretranslation_annotations=_filter_pretranslation_annotations(
-            pretranslation_output, chunk
-        ),
+        pretranslation_annotations=index.pretranslation_annotations(chunk),
         term_candidates=pretranslation_output.term_candidates
         if pretranslation_output
         else None,
@@ -2281,19 +3308,19 @@ def _build_translate_input(
 
 
 def _build_qa_input(
-    run: PipelineRunContext, target_language: LanguageCode, chunk: _WorkChunk
+    run: PipelineRunContext,
+    target_language: LanguageCode,
+    chunk: _WorkChunk,
+    index: _RunContextIndex,
 ) -> QaPhaseInput:
     context_output = run.context_output
-    translated_lines = _filter_translated_lines(
-        run.translate_outputs[target_language].translated_lines, chunk
-    )
     return QaPhaseInput(
         run_id=run.run_id,
         target_language=target_language,
         source_lines=chunk.source_lines,
-        translated_lines=translated_lines,
-        scene_summaries=_filter_scene_summaries(run, chunk),
-        context_notes=_filter_context_notes(run, chunk),
+        translated_lines=index.translated_lines(chunk),
+        scene_summaries=index.scene_summaries(chunk),
+        context_notes=index.context_notes(chunk),
         project_context=context_output.project_context if context_output else None,
         glossary=context_output.glossary if context_output else None,
         style_guide=context_output.style_guide if context_output else None,
@@ -2301,26 +3328,23 @@ def _build_qa_input(
 
 
 def _build_edit_input(
-    run: PipelineRunContext, target_language: LanguageCode, chunk: _WorkChunk
+    run: PipelineRunContext,
+    target_language: LanguageCode,
+    chunk: _WorkChunk,
+    index: _RunContextIndex,
 ) -> EditPhaseInput:
     context_output = run.context_output
     pretranslation_output = run.pretranslation_output
-    qa_output = run.qa_outputs.get(target_language)
-    translated_lines = _filter_translated_lines(
-        run.translate_outputs[target_language].translated_lines, chunk
-    )
     return EditPhaseInput(
         run_id=run.run_id,
         target_language=target_language,
-        translated_lines=translated_lines,
-        qa_issues=_filter_qa_issues(qa_output, chunk),
+        translated_lines=index.translated_lines(chunk),
+        qa_issues=index.qa_issues(chunk),
         reviewer_notes=None,
-        scene_summaries=_filter_scene_summaries(run, chunk),
-        context_notes=_filter_context_notes(run, chunk),
+        scene_summaries=index.scene_summaries(chunk),
+        context_notes=index.context_notes(chunk),
         project_context=context_output.project_context if context_output else None,
-        pretranslation_annotations=_filter_pretranslation_annotations(
-            pretranslation_output, chunk
-        ),
+        pretranslation_annotations=index.pretranslation_annotations(chunk),
         term_candidates=pretranslation_output.term_candidates
         if pretranslation_output
         else None,
@@ -2329,66 +3353,6 @@ def _build_edit_input(
     )
 
 
-def _filter_scene_summaries(
-    run: PipelineRunContext, chunk: _WorkChunk
-) -> list[SceneSummary] | None:
-    if run.context_output is None:
-        return None
-    if not chunk.scene_ids:
-        return []
-    return [
-        summary
-        for summary in run.context_output.scene_summaries
-        if summary.scene_id in chunk.scene_ids
-    ]
-
-
-def _filter_context_notes(
-    run: PipelineRunContext, chunk: _WorkChunk
-) -> list[ContextNote] | None:
-    if run.context_output is None:
-        return None
-    line_ids = chunk.line_ids
-    scene_ids = chunk.scene_ids
-    return [
-        note
-        for note in run.context_output.context_notes
-        if (note.line_id in line_ids) or (note.scene_id in scene_ids)
-    ]
-
-
-def _filter_pretranslation_annotations(
-    output: PretranslationPhaseOutput | None,
-    chunk: _WorkChunk,
-) -> list[PretranslationAnnotation] | None:
-    if output is None:
-        return None
-    line_ids = chunk.line_ids
-    return [
-        annotation
-        for annotation in output.annotations
-        if annotation.line_id in line_ids
-    ]
-
-
-def _filter_translated_lines(
-    translated_lines: list[TranslatedLine],
-    chunk: _WorkChunk,
-) -> list[TranslatedLine]:
-    line_ids = chunk.line_ids
-    return [line for line in translated_lines if line.line_id in line_ids]
-
-
-def _filter_qa_issues(
-    output: QaPhaseOutput | None,
-    chunk: _WorkChunk,
-) -> list[QaIssue] | None:
-    if output is None:
-        return None
-    line_ids = chunk.line_ids
-    return [issue for issue in output.issues if issue.line_id in line_ids]
-
-
 def _merge_context_outputs(
     run: PipelineRunContext, outputs: list[ContextPhaseOutput]
 ) -> ContextPhaseOutput:
@@ -3163,6 +4127,35 @@ def _build_dependencies(
     return dependencies
 
 
+def _pending_source_lines(
+    run: PipelineRunContext, reused: set[LineId]
+) -> list[SourceLine]:
+    return [line for line in run.source_lines or [] if line.line_id not in reused]
+
+
+def _carried_dependencies(
+    run: PipelineRunContext,
+    phase: PhaseName,
+    target_language: LanguageCode | None,
+    reused: set[LineId],
+) -> list[PhaseDependency]:
+    if run.baseline is None or not reused:
+        return []
+    dependency = run.baseline.dependency(phase, target_language)
+    return [dependency] if dependency is not None else []
+
+
+def _with_reused_lines(
+    summary: PhaseResultSummary, reused: set[LineId]
+) -> PhaseResultSummary:
+    if not reused:
+        return summary
+    metric = _build_result_metric(
+        "reused_line_count", ResultMetricUnit.LINES, len(reused)
+    )
+    return summary.model_copy(update={"metrics": [*summary.metrics, metric]})
+
+
 def _build_phase_record(
     run: PipelineRunContext,
     phase: PhaseName,
@@ -3228,6 +4221,9 @@ def _is_record_stale(run: PipelineRunContext, record: PhaseRunRecord) -> bool:
     if record.dependencies is None:
         return False
     for dependency in record.dependencies:
+        # Outputs carried forward from a prior run are immutable
+        if dependency.run_id is not None:
+            continue
         key = (dependency.phase, dependency.target_language)
         latest_revision = run.phase_revisions.get(key)
         if latest_revision is not None and latest_revision > dependency.revision:
@@ -3279,6 +4275,30 @@ def _build_progress_update(
     )
 
 
+def _build_progress_delta_update(
+    run: PipelineRunContext,
+    phase: PhaseName,
+    event: ProgressEvent,
+    timestamp: Timestamp,
+    message: str | None = None,
+) -> ProgressUpdate:
+    phase_progress = next(
+        progress for progress in run.progress.phases if progress.phase == phase
+    )
+    return ProgressUpdate(
+        run_id=run.run_id,
+        event=event,
+        timestamp=timestamp,
+        phase=phase,
+        phase_status=PhaseStatus(phase_progress.status),
+        run_progress=None,
+        phase_progress=phase_progress,
+        run_summary=run.progress.summary,
+        metric=None,
+        message=message,
+    )
+
+
 def _build_run_progress_update(
     run: PipelineRunContext, event: ProgressEvent, timestamp: Timestamp
 ) -> ProgressUpdate:
@@ -32,6 +32,7 @@ from rentl_core.ports.orchestrator import (
     ContextAgentProtocol,
     EditAgentPoolProtocol,
     EditAgentProtocol,
+    FlushableSinkProtocol,
     LogSinkProtocol,
     OrchestrationError,
     OrchestrationErrorCode,
@@ -55,7 +56,9 @@ from rentl_core.ports.orchestrator import (
 )
 from rentl_core.ports.storage import (
     ArtifactStoreProtocol,
+    ClosableStoreProtocol,
     LogStoreProtocol,
+    PhaseCheckpointStoreProtocol,
     RunStateStoreProtocol,
     StorageBatchError,
     StorageError,
@@ -66,6 +69,7 @@ from rentl_core.ports.storage import (
 
 __all__ = [
     "ArtifactStoreProtocol",
+    "ClosableStoreProtocol",
     "ContextAgentPoolProtocol",
     "ContextAgentProtocol",
     "EditAgentPoolProtocol",
@@ -79,6 +83,7 @@ __all__ = [
     "ExportEvent",
     "ExportResult",
     "ExportSummary",
+    "FlushableSinkProtocol",
     "IngestAdapterProtocol",
     "IngestBatchError",
     "IngestError",
@@ -95,6 +100,7 @@ __all__ = [
     "OrchestrationErrorInfo",
     "PhaseAgentPoolProtocol",
     "PhaseAgentProtocol",
+    "PhaseCheckpointStoreProtocol",
     "PretranslationAgentPoolProtocol",
     "PretranslationAgentProtocol",
     "ProgressSinkProtocol",
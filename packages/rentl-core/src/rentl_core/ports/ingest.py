@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from enum import StrEnum
 from typing import Protocol, runtime_checkable
 
@@ -134,6 +135,21 @@ class IngestAdapterProtocol(Protocol):
         """
         raise NotImplementedError
 
+    def iter_source(
+        self, source: IngestSource, *, batch_size: int = 1000
+    ) -> AsyncIterator[list[SourceLine]]:
+        """Stream a source file as batches of SourceLine records.
+
+        Batches are yielded as they are parsed, so consumers can start work
+        before the whole file is read. Per-record issues are collected and
+        raised once the stream is exhausted.
+
+        Raises:
+            IngestError: For fatal ingest errors.
+            IngestBatchError: For per-record validation issues.
+        """
+        raise NotImplementedError
+
 
 def build_ingest_started_log(
     timestamp: Timestamp, run_id: RunId, source: IngestSource
@@ -111,6 +111,19 @@ class ProgressSinkProtocol(Protocol):
         raise NotImplementedError
 
 
+@runtime_checkable
+class FlushableSinkProtocol(Protocol):
+    """Protocol for log/progress sinks that buffer writes in the background."""
+
+    async def flush(self) -> None:
+        """Write all buffered entries before returning."""
+        raise NotImplementedError
+
+    async def aclose(self) -> None:
+        """Flush buffered entries and stop the background writer."""
+        raise NotImplementedError
+
+
 class OrchestrationErrorCode(StrEnum):
     """Categorized error codes for orchestration failures."""
 
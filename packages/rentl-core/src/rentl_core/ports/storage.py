@@ -11,11 +11,18 @@ from pydantic import Field
 from rentl_schemas.base import BaseSchema
 from rentl_schemas.exit_codes import resolve_exit_code
 from rentl_schemas.logs import LogEntry
-from rentl_schemas.primitives import ArtifactId, RunId, RunStatus
+from rentl_schemas.primitives import (
+    ArtifactId,
+    LanguageCode,
+    PhaseName,
+    RunId,
+    RunStatus,
+)
 from rentl_schemas.responses import ErrorDetails, ErrorResponse
 from rentl_schemas.storage import (
     ArtifactMetadata,
     LogFileReference,
+    PhaseCheckpointRecord,
     RunIndexRecord,
     RunStateRecord,
     StorageBackend,
@@ -163,6 +170,42 @@ class ArtifactStoreProtocol(Protocol):
         raise NotImplementedError
 
 
+@runtime_checkable
+class PhaseCheckpointStoreProtocol(Protocol):
+    """Protocol for persisting per-chunk phase outputs for crash-resume."""
+
+    async def append_checkpoint(self, record: PhaseCheckpointRecord) -> None:
+        """Append a completed chunk checkpoint."""
+        raise NotImplementedError
+
+    async def load_checkpoints(
+        self,
+        run_id: RunId,
+        phase: PhaseName,
+        target_language: LanguageCode | None = None,
+    ) -> list[PhaseCheckpointRecord]:
+        """Load checkpoints recorded for a phase."""
+        raise NotImplementedError
+
+    async def clear_checkpoints(
+        self,
+        run_id: RunId,
+        phase: PhaseName,
+        target_language: LanguageCode | None = None,
+    ) -> None:
+        """Remove checkpoints once the phase output is persisted."""
+        raise NotImplementedError
+
+
+@runtime_checkable
+class ClosableStoreProtocol(Protocol):
+    """Protocol for stores that hold open database connections."""
+
+    def close(self) -> None:
+        """Close the store's connections."""
+        raise NotImplementedError
+
+
 @runtime_checkable
 class LogStoreProtocol(Protocol):
     """Protocol for persisting JSONL log entries."""
@@ -5,8 +5,9 @@ from __future__ import annotations
 from collections import Counter
 from collections.abc import Iterable, Sequence
 from datetime import UTC, datetime
+from decimal import Decimal
 
-from rentl_core.cost import aggregate_total_cost
+from rentl_core.cost import extract_agent_cost
 from rentl_schemas.events import ProgressEvent
 from rentl_schemas.pipeline import RunState
 from rentl_schemas.primitives import PhaseName, RunId, RunStatus, Timestamp
@@ -15,6 +16,8 @@ from rentl_schemas.progress import (
     AgentTelemetry,
     AgentTelemetrySummary,
     AgentUsageTotals,
+    PhaseProgress,
+    ProgressSummary,
     ProgressUpdate,
     RunProgress,
 )
@@ -42,147 +45,311 @@ def build_status_result(
     Returns:
         RunStatusResult: Aggregated status snapshot.
     """
-    updated_at = _select_updated_at(run_state, progress_updates)
-    status = _select_run_status(run_state, progress_updates)
-    current_phase = _select_current_phase(run_state, progress_updates)
-    run_progress = _select_run_progress(run_state, progress_updates)
-    agents, agent_summary = _aggregate_agents(progress_updates)
-    return RunStatusResult(
-        run_id=run_id,
-        status=status,
-        current_phase=current_phase,
-        updated_at=updated_at,
-        progress=run_progress,
+    aggregator = StatusAggregator(run_id)
+    aggregator.ingest(progress_updates)
+    return aggregator.build_result(
         run_state=run_state,
-        agent_summary=agent_summary,
-        agents=agents or None,
-        log_file=log_reference,
+        log_reference=log_reference,
         progress_file=progress_file,
     )
 
 
-def _select_updated_at(
-    run_state: RunState | None,
-    updates: Sequence[ProgressUpdate],
-) -> Timestamp:
-    if updates:
-        return updates[-1].timestamp
-    if run_state is None:
-        return _now_timestamp()
-    return (
-        run_state.metadata.completed_at
-        or run_state.metadata.started_at
-        or run_state.metadata.created_at
-    )
+class StatusAggregator:
+    """Fold progress updates into a run status incrementally.
 
+    Each update is applied in constant time: the latest telemetry per agent
+    attempt, status counts, usage and cost totals and the waste ratio inputs
+    are maintained as running totals, so a long-lived watcher can ingest new
+    updates as they arrive without re-walking the whole progress stream.
+    The built result is cached until the next update or a different run
+    state, so polling between updates does not rebuild it.
+    """
 
-def _select_run_status(
-    run_state: RunState | None,
-    updates: Sequence[ProgressUpdate],
-) -> RunStatus:
-    for update in reversed(updates):
-        if update.event == ProgressEvent.RUN_COMPLETED:
-            return RunStatus.COMPLETED
-        if update.event == ProgressEvent.RUN_FAILED:
-            return RunStatus.FAILED
-    if run_state is not None:
-        return RunStatus(run_state.metadata.status)
-    if updates:
-        return RunStatus.RUNNING
-    return RunStatus.PENDING
+    def __init__(self, run_id: RunId) -> None:
+        """Initialize an empty aggregator.
 
+        Args:
+            run_id: Run identifier.
+        """
+        self._run_id = run_id
+        self._updated_at: Timestamp | None = None
+        self._terminal_status: RunStatus | None = None
+        self._current_phase: PhaseName | None = None
+        self._snapshot: RunProgress | None = None
+        self._phase_deltas: dict[PhaseName, PhaseProgress] = {}
+        self._summary_delta: ProgressSummary | None = None
+        self._agents: dict[tuple[str, int], AgentTelemetry] = {}
+        self._by_status: Counter[AgentStatus] = Counter()
+        self._usage = _UsageTotals()
+        self._cost = _CostTotal()
+        self._finalized_tokens = 0
+        self._waste_tokens = 0
+        self._agent_view: (
+            tuple[list[AgentTelemetry], AgentTelemetrySummary | None] | None
+        ) = None
+        self._result: RunStatusResult | None = None
+        self._result_inputs: tuple[object, ...] | None = None
 
-def _select_current_phase(
-    run_state: RunState | None,
-    updates: Sequence[ProgressUpdate],
-) -> PhaseName | None:
-    if run_state is not None and run_state.metadata.current_phase is not None:
-        return PhaseName(run_state.metadata.current_phase)
-    for update in reversed(updates):
-        if update.phase is not None:
-            return PhaseName(update.phase)
-    return None
+    def ingest(self, updates: Iterable[ProgressUpdate]) -> None:
+        """Apply progress updates in emission order.
 
+        Args:
+            updates: New progress updates for the run.
+        """
+        for update in updates:
+            self._apply(update)
 
-def _select_run_progress(
-    run_state: RunState | None,
-    updates: Sequence[ProgressUpdate],
-) -> RunProgress | None:
-    for update in reversed(updates):
+    def build_result(
+        self,
+        *,
+        run_state: RunState | None,
+        log_reference: LogFileReference | None,
+        progress_file: StorageReference | None,
+    ) -> RunStatusResult:
+        """Build a status snapshot from the updates ingested so far.
+
+        Args:
+            run_state: Latest run state snapshot if available.
+            log_reference: Log file reference if available.
+            progress_file: Progress JSONL reference if available.
+
+        Returns:
+            RunStatusResult: Aggregated status snapshot.
+        """
+        inputs = (run_state, log_reference, progress_file)
+        if (
+            self._result is not None
+            and self._result_inputs is not None
+            and all(a is b for a, b in zip(inputs, self._result_inputs, strict=True))
+        ):
+            return self._result
+        agents, agent_summary = self._agent_snapshot()
+        result = RunStatusResult(
+            run_id=self._run_id,
+            status=self._select_run_status(run_state),
+            current_phase=self._select_current_phase(run_state),
+            updated_at=self._select_updated_at(run_state),
+            progress=self._select_run_progress(run_state),
+            run_state=run_state,
+            agent_summary=agent_summary,
+            agents=agents or None,
+            log_file=log_reference,
+            progress_file=progress_file,
+        )
+        # Without any update or run state the timestamp is "now", so keep it live
+        if self._updated_at is not None or run_state is not None:
+            self._result = result
+            self._result_inputs = inputs
+        return result
+
+    def _agent_snapshot(
+        self,
+    ) -> tuple[list[AgentTelemetry], AgentTelemetrySummary | None]:
+        if self._agent_view is None:
+            self._agent_view = (
+                list(self._agents.values()),
+                self._build_agent_summary(),
+            )
+        return self._agent_view
+
+    def _apply(self, update: ProgressUpdate) -> None:
+        self._result = None
+        self._updated_at = update.timestamp
+        if update.event == ProgressEvent.RUN_COMPLETED:
+            self._terminal_status = RunStatus.COMPLETED
+        elif update.event == ProgressEvent.RUN_FAILED:
+            self._terminal_status = RunStatus.FAILED
+        if update.phase is not None:
+            self._current_phase = PhaseName(update.phase)
         if update.run_progress is not None:
-            return update.run_progress
-    if run_state is not None:
-        return run_state.progress
-    return None
-
-
-def _aggregate_agents(
-    updates: Iterable[ProgressUpdate],
-) -> tuple[list[AgentTelemetry], AgentTelemetrySummary | None]:
-    latest: dict[tuple[str, int], AgentTelemetry] = {}
-    for update in updates:
-        if update.agent_update is None:
-            continue
-        agent = update.agent_update
+            self._snapshot = update.run_progress
+            self._phase_deltas.clear()
+            self._summary_delta = None
+        else:
+            if update.phase_progress is not None:
+                phase = PhaseName(update.phase_progress.phase)
+                self._phase_deltas[phase] = update.phase_progress
+            if update.run_summary is not None:
+                self._summary_delta = update.run_summary
+        if update.agent_update is not None:
+            self._apply_agent(update.agent_update)
+
+    def _apply_agent(self, agent: AgentTelemetry) -> None:
         key = (agent.agent_run_id, agent.attempt or 1)
-        latest[key] = agent
-    agents = list(latest.values())
-    if not agents:
-        return [], None
+        previous = self._agents.get(key)
+        self._agent_view = None
+        if previous is not None:
+            self._account_agent(previous, -1)
+        self._agents[key] = agent
+        self._account_agent(agent, 1)
 
-    by_status: dict[AgentStatus, int] = dict(
-        Counter(AgentStatus(agent.status) for agent in agents)
-    )
-    usage_total: AgentUsageTotals | None = None
-    finalized_tokens = 0
-    waste_tokens = 0
-    for agent in agents:
+    def _account_agent(self, agent: AgentTelemetry, sign: int) -> None:
+        self._by_status[AgentStatus(agent.status)] += sign
+        self._cost.add(extract_agent_cost(agent), sign)
         if agent.usage is None:
-            continue
-        usage_total = _add_usage(usage_total, agent.usage)
+            return
+        self._usage.add(agent.usage, sign)
         if agent.status == AgentStatus.RUNNING:
-            continue
-        finalized_tokens += agent.usage.total_tokens
+            return
+        self._finalized_tokens += sign * agent.usage.total_tokens
         if agent.status == AgentStatus.FAILED or (
             agent.attempt is not None and agent.attempt > 1
         ):
-            waste_tokens += agent.usage.total_tokens
+            self._waste_tokens += sign * agent.usage.total_tokens
 
-    waste_ratio = waste_tokens / finalized_tokens if finalized_tokens > 0 else 0.0
-    total_cost_usd = aggregate_total_cost(agents)
+    def _build_agent_summary(self) -> AgentTelemetrySummary | None:
+        if not self._agents:
+            return None
+        waste_ratio = (
+            self._waste_tokens / self._finalized_tokens
+            if self._finalized_tokens > 0
+            else 0.0
+        )
+        return AgentTelemetrySummary(
+            total=len(self._agents),
+            by_status={
+                status: count for status, count in self._by_status.items() if count
+            },
+            usage=self._usage.totals(),
+            total_cost_usd=self._cost.total(),
+            waste_ratio=waste_ratio,
+        )
 
-    summary = AgentTelemetrySummary(
-        total=len(agents),
-        by_status=by_status,
-        usage=usage_total,
-        total_cost_usd=total_cost_usd,
-        waste_ratio=waste_ratio,
-    )
-    return agents, summary
-
-
-def _add_usage(
-    total: AgentUsageTotals | None,
-    usage: AgentUsageTotals,
-) -> AgentUsageTotals:
-    if total is None:
-        return usage
-    cost: float | None = None
-    if total.cost_usd is not None or usage.cost_usd is not None:
-        cost = (total.cost_usd or 0.0) + (usage.cost_usd or 0.0)
-    return AgentUsageTotals(
-        input_tokens=total.input_tokens + usage.input_tokens,
-        output_tokens=total.output_tokens + usage.output_tokens,
-        total_tokens=total.total_tokens + usage.total_tokens,
-        cache_read_tokens=total.cache_read_tokens + usage.cache_read_tokens,
-        cache_write_tokens=total.cache_write_tokens + usage.cache_write_tokens,
-        reasoning_tokens=total.reasoning_tokens + usage.reasoning_tokens,
-        request_count=total.request_count + usage.request_count,
-        tool_calls=total.tool_calls + usage.tool_calls,
-        cost_usd=cost,
+    def _select_updated_at(self, run_state: RunState | None) -> Timestamp:
+        if self._updated_at is not None:
+            return self._updated_at
+        if run_state is None:
+            return _now_timestamp()
+        return (
+            run_state.metadata.completed_at
+            or run_state.metadata.started_at
+            or run_state.metadata.created_at
+        )
+
+    def _select_run_status(self, run_state: RunState | None) -> RunStatus:
+        if self._terminal_status is not None:
+            return self._terminal_status
+        if run_state is not None:
+            return RunStatus(run_state.metadata.status)
+        if self._updated_at is not None:
+            return RunStatus.RUNNING
+        return RunStatus.PENDING
+
+    def _select_current_phase(self, run_state: RunState | None) -> PhaseName | None:
+        if run_state is not None and run_state.metadata.current_phase is not None:
+            return PhaseName(run_state.metadata.current_phase)
+        return self._current_phase
+
+    def _select_run_progress(self, run_state: RunState | None) -> RunProgress | None:
+        base = self._snapshot
+        if base is None and run_state is not None:
+            base = run_state.progress
+        return _apply_progress_deltas(base, self._phase_deltas, self._summary_delta)
+
+
+def replay_run_progress(
+    updates: Sequence[ProgressUpdate],
+    base: RunProgress | None = None,
+) -> RunProgress | None:
+    """Reconstruct run progress from a snapshot and delta progress stream.
+
+    Full updates carry ``run_progress``; delta updates carry only the changed
+    ``phase_progress`` and the ``run_summary``. Replay starts at the latest
+    full snapshot and applies the deltas after it, so streams written before
+    deltas existed resolve to their last snapshot unchanged.
+
+    Args:
+        updates: Progress updates in emission order.
+        base: Progress to apply deltas to when no snapshot is present.
+
+    Returns:
+        RunProgress | None: Reconstructed progress, or None when unknown.
+    """
+    start = 0
+    for index in range(len(updates) - 1, -1, -1):
+        if updates[index].run_progress is not None:
+            base = updates[index].run_progress
+            start = index + 1
+            break
+    phase_deltas: dict[PhaseName, PhaseProgress] = {}
+    summary_delta: ProgressSummary | None = None
+    for update in updates[start:]:
+        if update.phase_progress is not None:
+            phase_deltas[PhaseName(update.phase_progress.phase)] = update.phase_progress
+        if update.run_summary is not None:
+            summary_delta = update.run_summary
+    return _apply_progress_deltas(base, phase_deltas, summary_delta)
+
+
+def _apply_progress_deltas(
+    base: RunProgress | None,
+    phase_deltas: dict[PhaseName, PhaseProgress],
+    summary_delta: ProgressSummary | None,
+) -> RunProgress | None:
+    if base is None or (not phase_deltas and summary_delta is None):
+        return base
+    return base.model_copy(
+        update={
+            "phases": [
+                phase_deltas.get(PhaseName(phase.phase), phase) for phase in base.phases
+            ],
+            "summary": summary_delta or base.summary,
+        }
     )
 
 
+class _UsageTotals:
+    def __init__(self) -> None:
+        self.count = 0
+        self.with_cost = 0
+        # Decimal keeps repeated add/subtract of the same entry from drifting
+        self.cost_usd = Decimal(0)
+        self.fields: Counter[str] = Counter()
+
+    def add(self, usage: AgentUsageTotals, sign: int) -> None:
+        self.count += sign
+        for name in _USAGE_FIELDS:
+            self.fields[name] += sign * getattr(usage, name)
+        if usage.cost_usd is not None:
+            self.with_cost += sign
+            self.cost_usd += sign * Decimal(str(usage.cost_usd))
+
+    def totals(self) -> AgentUsageTotals | None:
+        if self.count == 0:
+            return None
+        return AgentUsageTotals(
+            **{name: self.fields[name] for name in _USAGE_FIELDS},
+            cost_usd=float(self.cost_usd) if self.with_cost else None,
+        )
+
+
+class _CostTotal:
+    def __init__(self) -> None:
+        self.count = 0
+        self.value = Decimal(0)
+
+    def add(self, cost: float | None, sign: int) -> None:
+        if cost is None:
+            return
+        self.count += sign
+        self.value += sign * Decimal(str(cost))
+
+    def total(self) -> float | None:
+        return float(self.value) if self.count else None
+
+
+_USAGE_FIELDS = (
+    "input_tokens",
+    "output_tokens",
+    "total_tokens",
+    "cache_read_tokens",
+    "cache_write_tokens",
+    "reasoning_tokens",
+    "request_count",
+    "tool_calls",
+)
+
+
 def _now_timestamp() -> Timestamp:
     value = datetime.now(tz=UTC).isoformat()
     return value.replace("+00:00", "Z")
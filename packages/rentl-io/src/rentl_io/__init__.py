@@ -14,9 +14,12 @@ from rentl_io.ingest import (
     JsonlIngestAdapter,
     TxtIngestAdapter,
     get_ingest_adapter,
+    iter_source,
     load_source,
 )
 from rentl_io.storage import (
+    BufferedLogSink,
+    BufferedProgressSink,
     CompositeLogSink,
     CompositeProgressSink,
     ConsoleLogSink,
@@ -26,6 +29,9 @@ from rentl_io.storage import (
     FileSystemRunStateStore,
     InMemoryProgressSink,
     NoopLogSink,
+    SqliteArtifactStore,
+    SqliteLogStore,
+    SqliteRunStateStore,
     StorageLogSink,
     build_log_sink,
 )
@@ -33,6 +39,8 @@ from rentl_io.storage import (
 __version__ = "0.1.0"
 
 __all__ = [
+    "BufferedLogSink",
+    "BufferedProgressSink",
     "CompositeLogSink",
     "CompositeProgressSink",
     "ConsoleLogSink",
@@ -46,12 +54,16 @@ __all__ = [
     "JsonlExportAdapter",
     "JsonlIngestAdapter",
     "NoopLogSink",
+    "SqliteArtifactStore",
+    "SqliteLogStore",
+    "SqliteRunStateStore",
     "StorageLogSink",
     "TxtExportAdapter",
     "TxtIngestAdapter",
     "build_log_sink",
     "get_export_adapter",
     "get_ingest_adapter",
+    "iter_source",
     "load_source",
     "select_export_lines",
     "write_output",
@@ -2,13 +2,16 @@
 
 from rentl_io.ingest.csv_adapter import CsvIngestAdapter
 from rentl_io.ingest.jsonl_adapter import JsonlIngestAdapter
-from rentl_io.ingest.router import get_ingest_adapter, load_source
+from rentl_io.ingest.router import get_ingest_adapter, iter_source, load_source
+from rentl_io.ingest.streaming import DEFAULT_INGEST_BATCH_SIZE
 from rentl_io.ingest.txt_adapter import TxtIngestAdapter
 
 __all__ = [
+    "DEFAULT_INGEST_BATCH_SIZE",
     "CsvIngestAdapter",
     "JsonlIngestAdapter",
     "TxtIngestAdapter",
     "get_ingest_adapter",
+    "iter_source",
     "load_source",
 ]
@@ -5,8 +5,9 @@ from __future__ import annotations
 import asyncio
 import csv
 import json
+from collections.abc import AsyncIterator, Generator
 
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from rentl_core.ports.ingest import (
     IngestBatchError,
@@ -15,6 +16,7 @@ from rentl_core.ports.ingest import (
     IngestErrorDetails,
     IngestErrorInfo,
 )
+from rentl_io.ingest.streaming import DEFAULT_INGEST_BATCH_SIZE, iter_line_batches
 from rentl_schemas.io import IngestSource, SourceLine
 from rentl_schemas.primitives import FileFormat, JsonValue
 
@@ -24,6 +26,9 @@ KNOWN_COLUMNS = set(REQUIRED_COLUMNS + OPTIONAL_COLUMNS)
 EXPECTED_FIELDS = [*REQUIRED_COLUMNS, *OPTIONAL_COLUMNS]
 CSV_HEADER_EXAMPLE = "line_id,text,scene_id,speaker,metadata"
 CSV_ROW_EXAMPLE = 'line_1,Hello,scene_1,Alice,"{""tone"":""calm""}"'
+BULK_BLOCK_ROWS = 2048
+
+_SOURCE_LINES = TypeAdapter(list[SourceLine])
 
 
 class CsvIngestAdapter:
@@ -42,8 +47,26 @@ class CsvIngestAdapter:
         """
         return await asyncio.to_thread(_load_csv_sync, source)
 
+    def iter_source(
+        self, source: IngestSource, *, batch_size: int = DEFAULT_INGEST_BATCH_SIZE
+    ) -> AsyncIterator[list[SourceLine]]:
+        """Stream CSV content as batches of SourceLine records.
+
+        Args:
+            source: Ingest source descriptor.
+            batch_size: Maximum lines per batch.
+
+        Returns:
+            AsyncIterator[list[SourceLine]]: Parsed source line batches.
+        """
+        return iter_line_batches(_iter_csv_sync(source), batch_size)
+
 
 def _load_csv_sync(source: IngestSource) -> list[SourceLine]:
+    return list(_iter_csv_sync(source))
+
+
+def _iter_csv_sync(source: IngestSource) -> Generator[SourceLine]:
     try:
         normalized_format = FileFormat(source.format)
     except ValueError as exc:
@@ -74,12 +97,12 @@ def _load_csv_sync(source: IngestSource) -> list[SourceLine]:
             )
         )
 
-    source_lines: list[SourceLine] = []
     errors: list[IngestErrorInfo] = []
     try:
         with open(source.input_path, newline="", encoding="utf-8") as handle:
-            reader = csv.DictReader(handle)
-            if reader.fieldnames is None:
+            reader = csv.reader(handle)
+            fieldnames = next(reader, None)
+            if fieldnames is None:
                 raise IngestError(
                     IngestErrorInfo(
                         code=IngestErrorCode.MISSING_FIELD,
@@ -93,9 +116,7 @@ def _load_csv_sync(source: IngestSource) -> list[SourceLine]:
                     )
                 )
 
-            missing = [
-                name for name in REQUIRED_COLUMNS if name not in reader.fieldnames
-            ]
+            missing = [name for name in REQUIRED_COLUMNS if name not in fieldnames]
             if missing:
                 raise IngestError(
                     IngestErrorInfo(
@@ -111,78 +132,21 @@ def _load_csv_sync(source: IngestSource) -> list[SourceLine]:
                     )
                 )
 
-            source_columns = list(reader.fieldnames)
-            row_number = 2
+            source_columns = list(fieldnames)
+            block: list[tuple[int, list[str]]] = []
+            row_number = 1
             for row in reader:
-                try:
-                    line_id_value = row.get("line_id")
-                    text_value = row.get("text")
-                    if not line_id_value:
-                        raise IngestError(
-                            IngestErrorInfo(
-                                code=IngestErrorCode.MISSING_FIELD,
-                                message="CSV row missing line_id",
-                                details=IngestErrorDetails(
-                                    field="line_id",
-                                    row_number=row_number,
-                                    source_path=source.input_path,
-                                    expected_fields=EXPECTED_FIELDS,
-                                    example=CSV_ROW_EXAMPLE,
-                                ),
-                            )
-                        )
-                    if not text_value:
-                        raise IngestError(
-                            IngestErrorInfo(
-                                code=IngestErrorCode.MISSING_FIELD,
-                                message="CSV row missing text",
-                                details=IngestErrorDetails(
-                                    field="text",
-                                    row_number=row_number,
-                                    source_path=source.input_path,
-                                    expected_fields=EXPECTED_FIELDS,
-                                    example=CSV_ROW_EXAMPLE,
-                                ),
-                            )
-                        )
-
-                    scene_id_value = _optional_str(row.get("scene_id"))
-                    speaker_value = _optional_str(row.get("speaker"))
-                    metadata_value = _optional_str(row.get("metadata"))
-
-                    metadata = _parse_metadata(
-                        metadata_value, row_number, source.input_path
-                    )
-                    extra_metadata = _extract_extra_metadata(row)
-                    metadata = _merge_metadata(
-                        metadata, extra_metadata, row_number, source.input_path
-                    )
-
-                    source_line = SourceLine(
-                        line_id=line_id_value,
-                        scene_id=scene_id_value,
-                        speaker=speaker_value,
-                        text=text_value,
-                        metadata=metadata,
-                        source_columns=source_columns,
+                # Blank rows are skipped and not counted, as csv.DictReader does
+                if not row:
+                    continue
+                row_number += 1
+                block.append((row_number, row))
+                if len(block) >= BULK_BLOCK_ROWS:
+                    yield from _parse_block(
+                        block, source_columns, source.input_path, errors
                     )
-                except IngestError as exc:
-                    errors.append(exc.info)
-                except ValidationError as exc:
-                    errors.append(
-                        IngestErrorInfo(
-                            code=IngestErrorCode.VALIDATION_ERROR,
-                            message=str(exc),
-                            details=IngestErrorDetails(
-                                row_number=row_number,
-                                source_path=source.input_path,
-                            ),
-                        )
-                    )
-                else:
-                    source_lines.append(source_line)
-                finally:
-                    row_number += 1
+                    block = []
+            yield from _parse_block(block, source_columns, source.input_path, errors)
     except IngestError:
         raise
     except OSError as exc:
@@ -197,9 +161,149 @@ def _load_csv_sync(source: IngestSource) -> list[SourceLine]:
     if errors:
         raise IngestBatchError(errors)
 
+
+def _parse_block(
+    block: list[tuple[int, list[str]]],
+    source_columns: list[str],
+    source_path: str,
+    errors: list[IngestErrorInfo],
+) -> list[SourceLine]:
+    if not block:
+        return []
+    try:
+        records = _bulk_fields(block, source_columns)
+        if records is not None:
+            return _SOURCE_LINES.validate_python(records)
+    except json.JSONDecodeError, ValidationError:
+        pass
+    # A block the bulk path cannot take is parsed row by row so diagnostics
+    # match the per-row rules exactly
+    source_lines: list[SourceLine] = []
+    for row_number, row in block:
+        try:
+            fields = _row_fields(
+                _as_dict_row(source_columns, row),
+                row_number,
+                source_columns,
+                source_path,
+            )
+            source_lines.append(SourceLine.model_validate(fields))
+        except IngestError as exc:
+            errors.append(exc.info)
+        except ValidationError as exc:
+            errors.append(
+                IngestErrorInfo(
+                    code=IngestErrorCode.VALIDATION_ERROR,
+                    message=str(exc),
+                    details=IngestErrorDetails(
+                        row_number=row_number,
+                        source_path=source_path,
+                    ),
+                )
+            )
     return source_lines
 
 
+def _bulk_fields(
+    block: list[tuple[int, list[str]]], source_columns: list[str]
+) -> list[dict[str, JsonValue]] | None:
+    # Rows of known columns map straight onto SourceLine fields; extra
+    # columns, ragged rows and anything validation rejects take the per-row
+    # path instead
+    if not KNOWN_COLUMNS.issuperset(source_columns) or len(set(source_columns)) != len(
+        source_columns
+    ):
+        return None
+    width = len(source_columns)
+    index = {name: position for position, name in enumerate(source_columns)}
+    line_id_at = index["line_id"]
+    text_at = index["text"]
+    scene_id_at = index.get("scene_id")
+    speaker_at = index.get("speaker")
+    metadata_at = index.get("metadata")
+    columns: list[JsonValue] = list(source_columns)
+    records: list[dict[str, JsonValue]] = []
+    for _, row in block:
+        if len(row) != width:
+            return None
+        metadata: JsonValue = None
+        if metadata_at is not None and row[metadata_at]:
+            metadata = json.loads(row[metadata_at])
+            if not isinstance(metadata, dict):
+                return None
+        records.append({
+            "line_id": row[line_id_at],
+            "scene_id": row[scene_id_at] or None if scene_id_at is not None else None,
+            "speaker": row[speaker_at] or None if speaker_at is not None else None,
+            "text": row[text_at],
+            "metadata": metadata,
+            "source_columns": columns,
+        })
+    return records
+
+
+def _as_dict_row(fieldnames: list[str], row: list[str]) -> dict[str, str | None]:
+    # Same shape csv.DictReader gives: short rows are padded with None and
+    # values beyond the header are dropped
+    values: dict[str, str | None] = dict(zip(fieldnames, row, strict=False))
+    for name in fieldnames[len(row) :]:
+        values[name] = None
+    return values
+
+
+def _row_fields(
+    row: dict[str, str | None],
+    row_number: int,
+    source_columns: list[str],
+    source_path: str,
+) -> dict[str, JsonValue]:
+    line_id_value = row.get("line_id")
+    text_value = row.get("text")
+    if not line_id_value:
+        raise IngestError(
+            IngestErrorInfo(
+                code=IngestErrorCode.MISSING_FIELD,
+                message="CSV row missing line_id",
+                details=IngestErrorDetails(
+                    field="line_id",
+                    row_number=row_number,
+                    source_path=source_path,
+                    expected_fields=EXPECTED_FIELDS,
+                    example=CSV_ROW_EXAMPLE,
+                ),
+            )
+        )
+    if not text_value:
+        raise IngestError(
+            IngestErrorInfo(
+                code=IngestErrorCode.MISSING_FIELD,
+                message="CSV row missing text",
+                details=IngestErrorDetails(
+                    field="text",
+                    row_number=row_number,
+                    source_path=source_path,
+                    expected_fields=EXPECTED_FIELDS,
+                    example=CSV_ROW_EXAMPLE,
+                ),
+            )
+        )
+
+    metadata = _parse_metadata(
+        _optional_str(row.get("metadata")), row_number, source_path
+    )
+    metadata = _merge_metadata(
+        metadata, _extract_extra_metadata(row), row_number, source_path
+    )
+    return {
+        "line_id": line_id_value,
+        "scene_id": _optional_str(row.get("scene_id")),
+        "speaker": _optional_str(row.get("speaker")),
+        "text": text_value,
+        "metadata": metadata,
+        "source_columns": list(source_columns),
+    }
+
+
 def _optional_str(value: str | None) -> str | None:
     if value is None:
         return None
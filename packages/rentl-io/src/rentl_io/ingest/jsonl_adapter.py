@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import json
+from collections.abc import AsyncIterator, Generator
 
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from rentl_core.ports.ingest import (
     IngestBatchError,
@@ -14,6 +15,7 @@ from rentl_core.ports.ingest import (
     IngestErrorDetails,
     IngestErrorInfo,
 )
+from rentl_io.ingest.streaming import DEFAULT_INGEST_BATCH_SIZE, iter_line_batches
 from rentl_schemas.io import IngestSource, SourceLine
 from rentl_schemas.primitives import FileFormat, JsonValue
 
@@ -30,6 +32,9 @@ JSONL_EXAMPLE = (
     '{"line_id":"line_1","text":"Hello","scene_id":"scene_1",'
     '"speaker":"Alice","metadata":{"tone":"calm"}}'
 )
+BULK_BLOCK_LINES = 2048
+
+_SOURCE_LINES = TypeAdapter(list[SourceLine])
 
 
 class JsonlIngestAdapter:
@@ -48,8 +53,26 @@ class JsonlIngestAdapter:
         """
         return await asyncio.to_thread(_load_jsonl_sync, source)
 
+    def iter_source(
+        self, source: IngestSource, *, batch_size: int = DEFAULT_INGEST_BATCH_SIZE
+    ) -> AsyncIterator[list[SourceLine]]:
+        """Stream JSONL content as batches of SourceLine records.
+
+        Args:
+            source: Ingest source descriptor.
+            batch_size: Maximum lines per batch.
+
+        Returns:
+            AsyncIterator[list[SourceLine]]: Parsed source line batches.
+        """
+        return iter_line_batches(_iter_jsonl_sync(source), batch_size)
+
 
 def _load_jsonl_sync(source: IngestSource) -> list[SourceLine]:
+    return list(_iter_jsonl_sync(source))
+
+
+def _iter_jsonl_sync(source: IngestSource) -> Generator[SourceLine]:
     try:
         normalized_format = FileFormat(source.format)
     except ValueError as exc:
@@ -80,132 +103,18 @@ def _load_jsonl_sync(source: IngestSource) -> list[SourceLine]:
             )
         )
 
-    source_lines: list[SourceLine] = []
     errors: list[IngestErrorInfo] = []
     try:
         with open(source.input_path, encoding="utf-8") as handle:
+            block: list[tuple[int, str]] = []
             for line_number, raw_line in enumerate(handle, start=1):
                 if not raw_line.strip():
                     continue
-                try:
-                    parsed: JsonValue = json.loads(raw_line)
-                except json.JSONDecodeError:
-                    errors.append(
-                        IngestErrorInfo(
-                            code=IngestErrorCode.PARSE_ERROR,
-                            message="JSONL line is not valid JSON",
-                            details=IngestErrorDetails(
-                                line_number=line_number,
-                                source_path=source.input_path,
-                                expected_fields=EXPECTED_FIELDS,
-                                example=JSONL_EXAMPLE,
-                            ),
-                        )
-                    )
-                    continue
-
-                if not isinstance(parsed, dict):
-                    errors.append(
-                        IngestErrorInfo(
-                            code=IngestErrorCode.VALIDATION_ERROR,
-                            message="JSONL line must be a JSON object",
-                            details=IngestErrorDetails(
-                                line_number=line_number,
-                                source_path=source.input_path,
-                                expected_fields=EXPECTED_FIELDS,
-                                example=JSONL_EXAMPLE,
-                            ),
-                        )
-                    )
-                    continue
-
-                if not all(isinstance(key, str) for key in parsed):
-                    errors.append(
-                        IngestErrorInfo(
-                            code=IngestErrorCode.VALIDATION_ERROR,
-                            message="JSONL object keys must be strings",
-                            details=IngestErrorDetails(
-                                line_number=line_number,
-                                source_path=source.input_path,
-                                expected_fields=EXPECTED_FIELDS,
-                                example=JSONL_EXAMPLE,
-                            ),
-                        )
-                    )
-                    continue
-
-                json_obj: dict[str, JsonValue] = {
-                    key: value for key, value in parsed.items() if isinstance(key, str)
-                }
-                unknown_keys = [key for key in json_obj if key not in ALLOWED_KEYS]
-                if unknown_keys:
-                    errors.append(
-                        IngestErrorInfo(
-                            code=IngestErrorCode.VALIDATION_ERROR,
-                            message="JSONL object has unexpected fields",
-                            details=IngestErrorDetails(
-                                field=", ".join(unknown_keys),
-                                line_number=line_number,
-                                source_path=source.input_path,
-                                expected_fields=EXPECTED_FIELDS,
-                                example=JSONL_EXAMPLE,
-                            ),
-                        )
-                    )
-                    continue
-
-                try:
-                    line_id_value = _require_str(
-                        json_obj, "line_id", line_number, source.input_path
-                    )
-                    text_value = _require_str(
-                        json_obj, "text", line_number, source.input_path
-                    )
-                    route_id_value = _optional_str_value(
-                        json_obj.get("route_id"),
-                        "route_id",
-                        line_number,
-                        source.input_path,
-                    )
-                    scene_id_value = _optional_str_value(
-                        json_obj.get("scene_id"),
-                        "scene_id",
-                        line_number,
-                        source.input_path,
-                    )
-                    speaker_value = _optional_str_value(
-                        json_obj.get("speaker"),
-                        "speaker",
-                        line_number,
-                        source.input_path,
-                    )
-                    metadata_value = _optional_metadata(
-                        json_obj, line_number, source.input_path
-                    )
-
-                    source_line = SourceLine(
-                        line_id=line_id_value,
-                        route_id=route_id_value,
-                        scene_id=scene_id_value,
-                        speaker=speaker_value,
-                        text=text_value,
-                        metadata=metadata_value,
-                    )
-                except IngestError as exc:
-                    errors.append(exc.info)
-                except ValidationError as exc:
-                    errors.append(
-                        IngestErrorInfo(
-                            code=IngestErrorCode.VALIDATION_ERROR,
-                            message=str(exc),
-                            details=IngestErrorDetails(
-                                line_number=line_number,
-                                source_path=source.input_path,
-                            ),
-                        )
-                    )
-                else:
-                    source_lines.append(source_line)
+                block.append((line_number, raw_line))
+                if len(block) >= BULK_BLOCK_LINES:
+                    yield from _parse_block(block, source.input_path, errors)
+                    block = []
+            yield from _parse_block(block, source.input_path, errors)
     except IngestError:
         raise
     except OSError as exc:
@@ -220,9 +129,143 @@ def _load_jsonl_sync(source: IngestSource) -> list[SourceLine]:
     if errors:
         raise IngestBatchError(errors)
 
+
+def _parse_block(
+    block: list[tuple[int, str]],
+    source_path: str,
+    errors: list[IngestErrorInfo],
+) -> list[SourceLine]:
+    if not block:
+        return []
+    source_lines = _validate_block(block)
+    if source_lines is not None:
+        return source_lines
+    # A block with any bad record is re-parsed line by line so diagnostics
+    # match the per-line rules exactly
+    source_lines = []
+    for line_number, raw_line in block:
+        try:
+            source_lines.append(_parse_line(raw_line, line_number, source_path))
+        except IngestError as exc:
+            errors.append(exc.info)
+        except ValidationError as exc:
+            errors.append(
+                IngestErrorInfo(
+                    code=IngestErrorCode.VALIDATION_ERROR,
+                    message=str(exc),
+                    details=IngestErrorDetails(
+                        line_number=line_number,
+                        source_path=source_path,
+                    ),
+                )
+            )
     return source_lines
 
 
+def _validate_block(block: list[tuple[int, str]]) -> list[SourceLine] | None:
+    # Each line is decoded on its own so a record can never span two lines;
+    # only the schema validation runs in bulk
+    try:
+        records = [json.loads(raw) for _, raw in block]
+    except json.JSONDecodeError:
+        return None
+    if not all(
+        isinstance(record, dict) and record.keys() <= ALLOWED_KEYS for record in records
+    ):
+        return None
+    try:
+        return _SOURCE_LINES.validate_python(records)
+    except ValidationError:
+        return None
+
+
+def _parse_line(raw_line: str, line_number: int, source_path: str) -> SourceLine:
+    try:
+        parsed: JsonValue = json.loads(raw_line)
+    except json.JSONDecodeError as exc:
+        raise IngestError(
+            IngestErrorInfo(
+                code=IngestErrorCode.PARSE_ERROR,
+                message="JSONL line is not valid JSON",
+                details=IngestErrorDetails(
+                    line_number=line_number,
+                    source_path=source_path,
+                    expected_fields=EXPECTED_FIELDS,
+                    example=JSONL_EXAMPLE,
+                ),
+            )
+        ) from exc
+
+    if not isinstance(parsed, dict):
+        raise IngestError(
+            IngestErrorInfo(
+                code=IngestErrorCode.VALIDATION_ERROR,
+                message="JSONL line must be a JSON object",
+                details=IngestErrorDetails(
+                    line_number=line_number,
+                    source_path=source_path,
+                    expected_fields=EXPECTED_FIELDS,
+                    example=JSONL_EXAMPLE,
+                ),
+            )
+        )
+
+    if not all(isinstance(key, str) for key in parsed):
+        raise IngestError(
+            IngestErrorInfo(
+                code=IngestErrorCode.VALIDATION_ERROR,
+                message="JSONL object keys must be strings",
+                details=IngestErrorDetails(
+                    line_number=line_number,
+                    source_path=source_path,
+                    expected_fields=EXPECTED_FIELDS,
+                    example=JSONL_EXAMPLE,
+                ),
+            )
+        )
+
+    json_obj: dict[str, JsonValue] = {
+        key: value for key, value in parsed.items() if isinstance(key, str)
+    }
+    unknown_keys = [key for key in json_obj if key not in ALLOWED_KEYS]
+    if unknown_keys:
+        raise IngestError(
+            IngestErrorInfo(
+                code=IngestErrorCode.VALIDATION_ERROR,
+                message="JSONL object has unexpected fields",
+                details=IngestErrorDetails(
+                    field=", ".join(unknown_keys),
+                    line_number=line_number,
+                    source_path=source_path,
+                    expected_fields=EXPECTED_FIELDS,
+                    example=JSONL_EXAMPLE,
+                ),
+            )
+        )
+
+    line_id_value = _require_str(json_obj, "line_id", line_number, source_path)
+    text_value = _require_str(json_obj, "text", line_number, source_path)
+    route_id_value = _optional_str_value(
+        json_obj.get("route_id"), "route_id", line_number, source_path
+    )
+    scene_id_value = _optional_str_value(
+        json_obj.get("scene_id"), "scene_id", line_number, source_path
+    )
+    speaker_value = _optional_str_value(
+        json_obj.get("speaker"), "speaker", line_number, source_path
+    )
+    metadata_value = _optional_metadata(json_obj, line_number, source_path)
+
+    return SourceLine(
+        line_id=line_id_value,
+        route_id=route_id_value,
+        scene_id=scene_id_value,
+        speaker=speaker_value,
+        text=text_value,
+        metadata=metadata_value,
+    )
+
+
 def _require_str(
     payload: dict[str, JsonValue],
     field: str,
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+
 from rentl_core.ports.ingest import (
     IngestAdapterProtocol,
     IngestError,
@@ -11,6 +13,7 @@ from rentl_core.ports.ingest import (
 )
 from rentl_io.ingest.csv_adapter import CsvIngestAdapter
 from rentl_io.ingest.jsonl_adapter import JsonlIngestAdapter
+from rentl_io.ingest.streaming import DEFAULT_INGEST_BATCH_SIZE
 from rentl_io.ingest.txt_adapter import TxtIngestAdapter
 from rentl_schemas.io import IngestSource, SourceLine
 from rentl_schemas.primitives import FileFormat
@@ -76,3 +79,19 @@ async def load_source(source: IngestSource) -> list[SourceLine]:
     """
     adapter = get_ingest_adapter(source.format)
     return await adapter.load_source(source)
+
+
+def iter_source(
+    source: IngestSource, *, batch_size: int = DEFAULT_INGEST_BATCH_SIZE
+) -> AsyncIterator[list[SourceLine]]:
+    """Stream a source file as SourceLine batches via the router.
+
+    Args:
+        source: Ingest source descriptor.
+        batch_size: Maximum lines per batch.
+
+    Returns:
+        AsyncIterator[list[SourceLine]]: Parsed source line batches.
+    """
+    adapter = get_ingest_adapter(source.format)
+    return adapter.iter_source(source, batch_size=batch_size)
@@ -0,0 +1,71 @@
+"""Thread-backed batching for streaming ingest adapters."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Generator
+
+from rentl_schemas.io import SourceLine
+
+DEFAULT_INGEST_BATCH_SIZE = 1000
+
+
+async def iter_line_batches(
+    lines: Generator[SourceLine], batch_size: int = DEFAULT_INGEST_BATCH_SIZE
+) -> AsyncIterator[list[SourceLine]]:
+    """Yield batches from a blocking source line parser.
+
+    Each batch is parsed on a worker thread, so the event loop stays free and
+    only one batch is held here at a time. Errors the parser raises once it is
+    exhausted, such as ``IngestBatchError``, surface after the last batch.
+
+    Args:
+        lines: Blocking generator of parsed source lines.
+        batch_size: Maximum lines per batch.
+
+    Yields:
+        list[SourceLine]: Next batch of parsed source lines.
+
+    Raises:
+        ValueError: If ``batch_size`` is not positive.
+        CancelledError: If the consumer is cancelled; a batch being parsed
+            finishes before the parser is closed.
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    try:
+        while True:
+            parse = asyncio.ensure_future(
+                asyncio.to_thread(_next_batch, lines, batch_size)
+            )
+            try:
+                batch, error = await asyncio.shield(parse)
+            except asyncio.CancelledError:
+                # The worker thread is still inside the parser, and closing a
+                # running generator fails; let the batch finish first
+                await asyncio.gather(parse, return_exceptions=True)
+                raise
+            if batch:
+                yield batch
+            if error is not None:
+                raise error
+            if len(batch) < batch_size:
+                return
+    finally:
+        # Release the parser's file handle when a consumer stops early
+        lines.close()
+
+
+def _next_batch(
+    lines: Generator[SourceLine], batch_size: int
+) -> tuple[list[SourceLine], Exception | None]:
+    # Keep lines parsed before an error so they are delivered ahead of it
+    batch: list[SourceLine] = []
+    try:
+        for line in lines:
+            batch.append(line)
+            if len(batch) >= batch_size:
+                break
+    except Exception as exc:
+        return batch, exc
+    return batch, None
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import AsyncIterator, Generator
 
 from pydantic import ValidationError
 
@@ -13,6 +14,7 @@ from rentl_core.ports.ingest import (
     IngestErrorDetails,
     IngestErrorInfo,
 )
+from rentl_io.ingest.streaming import DEFAULT_INGEST_BATCH_SIZE, iter_line_batches
 from rentl_schemas.io import IngestSource, SourceLine
 from rentl_schemas.primitives import FileFormat, JsonValue
 
@@ -33,8 +35,26 @@ class TxtIngestAdapter:
         """
         return await asyncio.to_thread(_load_txt_sync, source)
 
+    def iter_source(
+        self, source: IngestSource, *, batch_size: int = DEFAULT_INGEST_BATCH_SIZE
+    ) -> AsyncIterator[list[SourceLine]]:
+        """Stream TXT content as batches of SourceLine records.
+
+        Args:
+            source: Ingest source descriptor.
+            batch_size: Maximum lines per batch.
+
+        Returns:
+            AsyncIterator[list[SourceLine]]: Parsed source line batches.
+        """
+        return iter_line_batches(_iter_txt_sync(source), batch_size)
+
 
 def _load_txt_sync(source: IngestSource) -> list[SourceLine]:
+    return list(_iter_txt_sync(source))
+
+
+def _iter_txt_sync(source: IngestSource) -> Generator[SourceLine]:
     try:
         normalized_format = FileFormat(source.format)
     except ValueError as exc:
@@ -65,7 +85,6 @@ def _load_txt_sync(source: IngestSource) -> list[SourceLine]:
             )
         )
 
-    source_lines: list[SourceLine] = []
     errors: list[IngestErrorInfo] = []
     try:
         with open(source.input_path, encoding="utf-8") as handle:
@@ -107,7 +126,7 @@ def _load_txt_sync(source: IngestSource) -> list[SourceLine]:
                         )
                     )
                 else:
-                    source_lines.append(source_line)
+                    yield source_line
     except IngestError:
         raise
     except OSError as exc:
@@ -122,8 +141,6 @@ def _load_txt_sync(source: IngestSource) -> list[SourceLine]:
     if errors:
         raise IngestBatchError(errors)
 
-    return source_lines
-
 
 def _strip_line_ending(value: str) -> str:
     value = value.removesuffix("\n")
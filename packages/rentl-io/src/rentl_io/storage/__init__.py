@@ -6,6 +6,7 @@ from rentl_io.storage.filesystem import (
     FileSystemRunStateStore,
 )
 from rentl_io.storage.log_sink import (
+    BufferedLogSink,
     CompositeLogSink,
     ConsoleLogSink,
     NoopLogSink,
@@ -14,12 +15,20 @@ from rentl_io.storage.log_sink import (
     build_log_sink,
 )
 from rentl_io.storage.progress_sink import (
+    BufferedProgressSink,
     CompositeProgressSink,
     FileSystemProgressSink,
     InMemoryProgressSink,
 )
+from rentl_io.storage.sqlite import (
+    SqliteArtifactStore,
+    SqliteLogStore,
+    SqliteRunStateStore,
+)
 
 __all__ = [
+    "BufferedLogSink",
+    "BufferedProgressSink",
     "CompositeLogSink",
     "CompositeProgressSink",
     "ConsoleLogSink",
@@ -30,6 +39,9 @@ __all__ = [
     "InMemoryProgressSink",
     "NoopLogSink",
     "RedactingLogSink",
+    "SqliteArtifactStore",
+    "SqliteLogStore",
+    "SqliteRunStateStore",
     "StorageLogSink",
     "build_log_sink",
 ]
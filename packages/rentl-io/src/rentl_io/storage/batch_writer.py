@@ -0,0 +1,145 @@
+"""Background batch writer shared by buffered log and progress sinks."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+
+
+class BatchWriter[ItemT]:
+    """Coalesce queued items into batched writes on a background task.
+
+    Items are written once ``batch_size`` are pending or ``flush_interval_s``
+    has passed since the writer woke up, whichever comes first. ``put``
+    blocks while ``max_pending`` items are waiting, so slow storage applies
+    backpressure to producers instead of growing memory without bound.
+
+    The pending buffer is not tied to an event loop: a writer used from a
+    later ``asyncio.run`` call resumes writing whatever an earlier loop left
+    behind. A failed write is re-raised from the next ``put`` or ``flush``.
+    """
+
+    def __init__(
+        self,
+        write_batch: Callable[[list[ItemT]], Awaitable[None]],
+        *,
+        batch_size: int = 256,
+        flush_interval_s: float = 0.25,
+        max_pending: int = 4096,
+    ) -> None:
+        """Initialize the batch writer.
+
+        Args:
+            write_batch: Coroutine function that persists one batch.
+            batch_size: Maximum items per write; reaching it flushes early.
+            flush_interval_s: Maximum seconds a pending item waits.
+            max_pending: Buffered items at which ``put`` starts blocking.
+
+        Raises:
+            ValueError: If the limits are not positive or ``max_pending`` is
+                smaller than ``batch_size``.
+        """
+        if batch_size <= 0 or flush_interval_s <= 0:
+            raise ValueError("batch_size and flush_interval_s must be positive")
+        if max_pending < batch_size:
+            raise ValueError("max_pending must be at least batch_size")
+        self._write_batch = write_batch
+        self._batch_size = batch_size
+        self._flush_interval_s = flush_interval_s
+        self._max_pending = max_pending
+        self._items: deque[ItemT] = deque()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._wakeup = asyncio.Event()
+        self._room = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._urgent = False
+        self._error: Exception | None = None
+
+    async def put(self, item: ItemT) -> None:
+        """Queue an item, waiting while the buffer is full.
+
+        Args:
+            item: Item to write.
+        """
+        self._raise_error()
+        self._bind()
+        while len(self._items) >= self._max_pending:
+            self._room.clear()
+            self._urgent = True
+            self._wakeup.set()
+            await self._room.wait()
+        writer_sleeping = self._idle.is_set()
+        self._items.append(item)
+        self._idle.clear()
+        if len(self._items) >= self._batch_size:
+            self._urgent = True
+            self._wakeup.set()
+        elif writer_sleeping:
+            self._wakeup.set()
+
+    async def flush(self) -> None:
+        """Write every queued item before returning."""
+        self._bind()
+        if not self._idle.is_set():
+            self._urgent = True
+            self._wakeup.set()
+            await self._idle.wait()
+        self._raise_error()
+
+    async def aclose(self) -> None:
+        """Flush queued items and stop the background task."""
+        await self.flush()
+        task, self._task, self._loop = self._task, None, None
+        if task is not None and not task.done():
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+    def _bind(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._task is not None and not self._task.done():
+            return
+        # Events belong to the loop that first awaits them; rebuild per loop
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._room = asyncio.Event()
+        self._idle = asyncio.Event()
+        if len(self._items) < self._max_pending:
+            self._room.set()
+        if self._items:
+            self._wakeup.set()
+        else:
+            self._idle.set()
+        self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            if not self._items:
+                self._idle.set()
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            if not self._urgent and len(self._items) < self._batch_size:
+                self._wakeup.clear()
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), timeout=self._flush_interval_s
+                    )
+            self._urgent = False
+            batch = [
+                self._items.popleft()
+                for _ in range(min(self._batch_size, len(self._items)))
+            ]
+            self._room.set()
+            try:
+                await self._write_batch(batch)
+            except Exception as exc:
+                self._error = exc
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import json
+import os
+import threading
+from abc import ABC, abstractmethod
 from collections.abc import Sequence
 from datetime import UTC, datetime
 from json import JSONDecodeError
@@ -15,6 +18,7 @@ from pydantic import ValidationError
 from rentl_core.ports.storage import (
     ArtifactStoreProtocol,
     LogStoreProtocol,
+    PhaseCheckpointStoreProtocol,
     RunStateStoreProtocol,
     StorageError,
     StorageErrorCode,
@@ -23,11 +27,19 @@ from rentl_core.ports.storage import (
 )
 from rentl_schemas.base import BaseSchema
 from rentl_schemas.logs import LogEntry
-from rentl_schemas.primitives import ArtifactId, RunId, RunStatus, Timestamp
+from rentl_schemas.primitives import (
+    ArtifactId,
+    LanguageCode,
+    PhaseName,
+    RunId,
+    RunStatus,
+    Timestamp,
+)
 from rentl_schemas.storage import (
     ArtifactFormat,
     ArtifactMetadata,
     LogFileReference,
+    PhaseCheckpointRecord,
     RunIndexRecord,
     RunStateRecord,
     StorageBackend,
@@ -59,13 +71,24 @@ class FileSystemRunStateStore(RunStateStoreProtocol):
         self._index_dir = self._base_dir / "index"
         self._backend = backend
 
+    def state_path(self, run_id: RunId) -> Path:
+        """Return the snapshot file for a run.
+
+        Args:
+            run_id: Run identifier.
+
+        Returns:
+            Path: Location of the run state JSON snapshot.
+        """
+        return self._state_dir / f"{run_id}.json"
+
     async def save_run_state(self, record: RunStateRecord) -> None:
         """Persist a run state snapshot to disk.
 
         Raises:
             StorageError: If the snapshot cannot be written.
         """
-        path = self._state_dir / f"{record.run_id}.json"
+        path = self.state_path(record.run_id)
         try:
             await asyncio.to_thread(_write_json_file, path, record)
         except OSError as exc:
@@ -91,7 +114,7 @@ class FileSystemRunStateStore(RunStateStoreProtocol):
         Raises:
             StorageError: If the snapshot cannot be read.
         """
-        path = self._state_dir / f"{run_id}.json"
+        path = self.state_path(run_id)
         if not await asyncio.to_thread(path.exists):
             return None
         try:
@@ -189,17 +212,133 @@ class FileSystemRunStateStore(RunStateStoreProtocol):
         return records
 
 
-class FileSystemArtifactStore(ArtifactStoreProtocol):
-    """Filesystem-backed artifact store."""
+class _ArtifactIndex:
+    # Lazily built artifact_id -> (shard, byte offset) map. Shards are
+    # append-only, so a shard whose size/mtime changed is rescanned from the
+    # last indexed offset; unknown IDs scan unindexed shards newest-first.
+    # The legacy global index is parsed once per size/mtime, grouped by run.
+    def __init__(self, base_dir: Path, legacy_path: Path) -> None:
+        self._base_dir = base_dir
+        self._legacy_path = legacy_path
+        self._offsets: dict[str, tuple[Path, int]] = {}
+        self._scanned: dict[Path, tuple[int, int]] = {}
+        self._legacy_runs: dict[RunId, list[ArtifactMetadata]] = {}
+        self._legacy_signature: tuple[int, int] | None = None
+        self._lock = threading.Lock()
+
+    def shard_path(self, run_id: RunId) -> Path:
+        return self._base_dir / str(run_id) / "index.jsonl"
+
+    def find(self, artifact_id: ArtifactId) -> ArtifactMetadata | None:
+        key = str(artifact_id)
+        with self._lock:
+            entry = self._offsets.get(key)
+            if entry is not None and self._is_stale(entry[0]):
+                self._scan(entry[0])
+                entry = self._offsets.get(key)
+            if entry is None:
+                entry = self._search(key)
+        if entry is None:
+            return None
+        path, offset = entry
+        with open(path, "rb") as handle:
+            handle.seek(offset)
+            return ArtifactMetadata.model_validate_json(handle.readline())
+
+    def list_run(self, run_id: RunId) -> list[ArtifactMetadata]:
+        return [
+            *self._legacy_run(run_id),
+            *_read_artifacts_for_run(self.shard_path(run_id), run_id),
+        ]
+
+    def _legacy_run(self, run_id: RunId) -> list[ArtifactMetadata]:
+        try:
+            stat = self._legacy_path.stat()
+        except FileNotFoundError:
+            return []
+        signature = (stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            if self._legacy_signature != signature:
+                self._legacy_runs = _read_artifacts_by_run(self._legacy_path)
+                self._legacy_signature = signature
+            return list(self._legacy_runs.get(run_id, ()))
+
+    def _search(self, key: str) -> tuple[Path, int] | None:
+        shards = list(self._base_dir.glob("*/index.jsonl"))
+        if self._legacy_path.exists():
+            shards.append(self._legacy_path)
+        stats = {path: path.stat() for path in shards}
+        for path in sorted(
+            shards, key=lambda path: stats[path].st_mtime_ns, reverse=True
+        ):
+            stat = stats[path]
+            if self._scanned.get(path) == (stat.st_size, stat.st_mtime_ns):
+                continue
+            self._scan(path)
+            if key in self._offsets:
+                return self._offsets[key]
+        return None
+
+    def _is_stale(self, path: Path) -> bool:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return True
+        return self._scanned.get(path) != (stat.st_size, stat.st_mtime_ns)
+
+    def _scan(self, path: Path) -> None:
+        previous = self._scanned.pop(path, None)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            stat = None
+        start = previous[0] if previous is not None else 0
+        if stat is None or stat.st_size < start:
+            # Shard was removed or rewritten; drop its offsets and start over.
+            self._offsets = {
+                key: entry for key, entry in self._offsets.items() if entry[0] != path
+            }
+            start = 0
+        if stat is None:
+            return
+        offset = start
+        with open(path, "rb") as handle:
+            handle.seek(start)
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    # Torn trailing write; index it once the line completes.
+                    break
+                if line.strip():
+                    artifact_id = json.loads(line).get("artifact_id")
+                    if not isinstance(artifact_id, str):
+                        raise ValueError("Artifact index entry has no artifact_id")
+                    self._offsets[artifact_id] = (path, offset)
+                offset += len(line)
+        self._scanned[path] = (offset, stat.st_mtime_ns)
+
+
+class _ArtifactFileStore(ArtifactStoreProtocol, PhaseCheckpointStoreProtocol, ABC):
+    """Artifact payload files and chunk checkpoints on the filesystem.
+
+    Subclasses provide the artifact metadata index through the index hooks.
+    """
 
     def __init__(
         self,
         base_dir: str,
+        index_path: Path,
         backend: StorageBackend = StorageBackend.FILESYSTEM,
     ) -> None:
-        """Initialize the artifact store."""
+        """Initialize the artifact store.
+
+        Args:
+            base_dir: Directory for artifact payload files and checkpoints.
+            index_path: Location of the artifact metadata index, reported in
+                storage errors.
+            backend: Backend recorded in artifact locations.
+        """
         self._base_dir = Path(base_dir)
-        self._index_path = self._base_dir / "index.jsonl"
+        self._index_path = index_path
         self._backend = backend
 
     async def write_artifact_json(
@@ -240,7 +379,7 @@ class FileSystemArtifactStore(ArtifactStoreProtocol):
         stored = self._with_location(metadata, path)
         try:
             await asyncio.to_thread(_write_json_file, path, payload, redactor)
-            await asyncio.to_thread(_append_jsonl, self._index_path, stored)
+            await asyncio.to_thread(self._record_artifact, stored)
         except OSError as exc:
             raise StorageError(
                 StorageErrorInfo(
@@ -295,7 +434,7 @@ class FileSystemArtifactStore(ArtifactStoreProtocol):
         stored = self._with_location(metadata, path)
         try:
             await asyncio.to_thread(_write_jsonl_file, path, payload, redactor)
-            await asyncio.to_thread(_append_jsonl, self._index_path, stored)
+            await asyncio.to_thread(self._record_artifact, stored)
         except OSError as exc:
             raise StorageError(
                 StorageErrorInfo(
@@ -321,12 +460,8 @@ class FileSystemArtifactStore(ArtifactStoreProtocol):
         Raises:
             StorageError: If artifacts cannot be read.
         """
-        if not await asyncio.to_thread(self._index_path.exists):
-            return []
         try:
-            return await asyncio.to_thread(
-                _read_artifacts_for_run, self._index_path, run_id
-            )
+            return await asyncio.to_thread(self._list_run_artifacts, run_id)
         except (ValidationError, JSONDecodeError, ValueError) as exc:
             error_info = _build_record_parse_error_info(
                 entity="Artifact index entry",
@@ -363,9 +498,7 @@ class FileSystemArtifactStore(ArtifactStoreProtocol):
             StorageError: If the artifact is missing or unreadable.
         """
         try:
-            metadata = await asyncio.to_thread(
-                _find_artifact_metadata, self._index_path, artifact_id
-            )
+            metadata = await asyncio.to_thread(self._find_artifact, artifact_id)
         except (ValidationError, JSONDecodeError, ValueError) as exc:
             error_info = _build_record_parse_error_info(
                 entity="Artifact index entry",
@@ -442,9 +575,7 @@ class FileSystemArtifactStore(ArtifactStoreProtocol):
             StorageError: If the artifact is missing or unreadable.
         """
         try:
-            metadata = await asyncio.to_thread(
-                _find_artifact_metadata, self._index_path, artifact_id
-            )
+            metadata = await asyncio.to_thread(self._find_artifact, artifact_id)
         except (ValidationError, JSONDecodeError, ValueError) as exc:
             error_info = _build_record_parse_error_info(
                 entity="Artifact index entry",
@@ -509,6 +640,137 @@ class FileSystemArtifactStore(ArtifactStoreProtocol):
                 )
             ) from exc
 
+    async def append_checkpoint(
+        self,
+        record: PhaseCheckpointRecord,
+        redactor: Redactor | None = None,
+    ) -> None:
+        """Append a completed chunk checkpoint to the phase checkpoint JSONL.
+
+        Args:
+            record: Checkpoint record to append
+            redactor: Optional redactor to apply before serialization
+
+        Raises:
+            StorageError: If the checkpoint cannot be written.
+        """
+        path = self._checkpoint_path(
+            record.run_id, record.phase, record.target_language
+        )
+        try:
+            await asyncio.to_thread(_append_checkpoint, path, record, redactor)
+        except OSError as exc:
+            raise StorageError(
+                StorageErrorInfo(
+                    code=StorageErrorCode.IO_ERROR,
+                    message=str(exc),
+                    details=StorageErrorDetails(
+                        operation="append_checkpoint",
+                        run_id=record.run_id,
+                        backend=self._backend,
+                        path=str(path),
+                    ),
+                )
+            ) from exc
+
+    async def load_checkpoints(
+        self,
+        run_id: RunId,
+        phase: PhaseName,
+        target_language: LanguageCode | None = None,
+    ) -> list[PhaseCheckpointRecord]:
+        """Load chunk checkpoints recorded for a phase.
+
+        A torn trailing line left by a crash mid-write is skipped so the
+        remaining checkpoints stay usable.
+
+        Args:
+            run_id: Run identifier
+            phase: Phase name
+            target_language: Target language for language-specific phases
+
+        Returns:
+            list[PhaseCheckpointRecord]: Checkpoints in write order.
+
+        Raises:
+            StorageError: If the checkpoint file cannot be read.
+        """
+        path = self._checkpoint_path(run_id, phase, target_language)
+        if not await asyncio.to_thread(path.exists):
+            return []
+        try:
+            return await asyncio.to_thread(_read_checkpoints, path)
+        except OSError as exc:
+            raise StorageError(
+                StorageErrorInfo(
+                    code=StorageErrorCode.IO_ERROR,
+                    message=str(exc),
+                    details=StorageErrorDetails(
+                        operation="load_checkpoints",
+                        run_id=run_id,
+                        backend=self._backend,
+                        path=str(path),
+                    ),
+                )
+            ) from exc
+
+    async def clear_checkpoints(
+        self,
+        run_id: RunId,
+        phase: PhaseName,
+        target_language: LanguageCode | None = None,
+    ) -> None:
+        """Remove the checkpoint file for a phase.
+
+        Args:
+            run_id: Run identifier
+            phase: Phase name
+            target_language: Target language for language-specific phases
+
+        Raises:
+            StorageError: If the checkpoint file cannot be removed.
+        """
+        path = self._checkpoint_path(run_id, phase, target_language)
+        try:
+            await asyncio.to_thread(path.unlink, missing_ok=True)
+        except OSError as exc:
+            raise StorageError(
+                StorageErrorInfo(
+                    code=StorageErrorCode.IO_ERROR,
+                    message=str(exc),
+                    details=StorageErrorDetails(
+                        operation="clear_checkpoints",
+                        run_id=run_id,
+                        backend=self._backend,
+                        path=str(path),
+                    ),
+                )
+            ) from exc
+
+    # Index hooks run in a worker thread
+    @abstractmethod
+    def _record_artifact(self, metadata: ArtifactMetadata) -> None: ...
+
+    @abstractmethod
+    def _find_artifact(self, artifact_id: ArtifactId) -> ArtifactMetadata | None: ...
+
+    @abstractmethod
+    def _list_run_artifacts(self, run_id: RunId) -> list[ArtifactMetadata]: ...
+
+    def _checkpoint_path(
+        self,
+        run_id: RunId,
+        phase: PhaseName,
+        target_language: LanguageCode | None,
+    ) -> Path:
+        phase_value = phase.value if isinstance(phase, PhaseName) else str(phase)
+        name = (
+            phase_value
+            if target_language is None
+            else (f"{phase_value}-{target_language}")
+        )
+        return self._base_dir / str(run_id) / "checkpoints" / f"{name}.jsonl"
+
     def _artifact_path(
         self, run_id: RunId, artifact_id: ArtifactId, format: ArtifactFormat
     ) -> Path:
@@ -523,6 +785,36 @@ class FileSystemArtifactStore(ArtifactStoreProtocol):
         return metadata.model_copy(update={"location": location})
 
 
+class FileSystemArtifactStore(_ArtifactFileStore):
+    """Filesystem-backed artifact store with per-phase chunk checkpoints.
+
+    Artifact metadata is indexed in one JSONL shard per run, so listing a
+    run's artifacts reads only that run's shard and ID lookups go through a
+    lazily built in-process offset map instead of scanning all history.
+    Workspaces written before sharding keep a global ``index.jsonl`` that is
+    still read.
+    """
+
+    def __init__(
+        self,
+        base_dir: str,
+        backend: StorageBackend = StorageBackend.FILESYSTEM,
+    ) -> None:
+        """Initialize the artifact store."""
+        legacy_index_path = Path(base_dir) / "index.jsonl"
+        super().__init__(base_dir, index_path=legacy_index_path, backend=backend)
+        self._index = _ArtifactIndex(self._base_dir, legacy_index_path)
+
+    def _record_artifact(self, metadata: ArtifactMetadata) -> None:
+        _append_jsonl(self._index.shard_path(metadata.run_id), metadata)
+
+    def _find_artifact(self, artifact_id: ArtifactId) -> ArtifactMetadata | None:
+        return self._index.find(artifact_id)
+
+    def _list_run_artifacts(self, run_id: RunId) -> list[ArtifactMetadata]:
+        return self._index.list_run(run_id)
+
+
 class FileSystemLogStore(LogStoreProtocol):
     """Filesystem-backed JSONL log store."""
 
@@ -645,7 +937,24 @@ def _write_json_file(
         payload_json = json.dumps(redacted_dict)
     else:
         payload_json = payload.model_dump_json(exclude_none=True)
-    path.write_text(payload_json, encoding="utf-8")
+    _replace_file(path, payload_json)
+
+
+def _replace_file(path: Path, content: str) -> None:
+    # Write a sibling temp file and rename it over the target so readers and
+    # crashes never observe a partially written document
+    temp_path = path.with_name(
+        f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            handle.write(content)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
 
 
 def _write_jsonl_file(
@@ -681,6 +990,34 @@ def _append_jsonl_many(
         )
 
 
+def _append_checkpoint(
+    path: Path, record: PhaseCheckpointRecord, redactor: Redactor | None
+) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if redactor is not None:
+        record_dict = record.model_dump(mode="json", exclude_none=True)
+        line = json.dumps(redactor.redact_dict(record_dict))
+    else:
+        line = record.model_dump_json(exclude_none=True)
+    with open(path, "a", encoding="utf-8") as handle:
+        handle.write(line + "\n")
+        handle.flush()
+        os.fsync(handle.fileno())
+
+
+def _read_checkpoints(path: Path) -> list[PhaseCheckpointRecord]:
+    records: list[PhaseCheckpointRecord] = []
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            try:
+                records.append(PhaseCheckpointRecord.model_validate_json(line))
+            except ValidationError:
+                continue
+    return records
+
+
 def _read_json_model[ModelT: BaseSchema](
     path: Path,
     model: _SchemaModel[ModelT],
@@ -723,20 +1060,15 @@ def _read_artifacts_for_run(index_path: Path, run_id: RunId) -> list[ArtifactMet
     return artifacts
 
 
-def _find_artifact_metadata(
-    index_path: Path, artifact_id: ArtifactId
-) -> ArtifactMetadata | None:
-    if not index_path.exists():
-        return None
-    found: ArtifactMetadata | None = None
+def _read_artifacts_by_run(index_path: Path) -> dict[RunId, list[ArtifactMetadata]]:
+    artifacts: dict[RunId, list[ArtifactMetadata]] = {}
     with open(index_path, encoding="utf-8") as handle:
         for line in handle:
             if not line.strip():
                 continue
             artifact = ArtifactMetadata.model_validate_json(line)
-            if artifact.artifact_id == artifact_id:
-                found = artifact
-    return found
+            artifacts.setdefault(artifact.run_id, []).append(artifact)
+    return artifacts
 
 
 def _location_path(metadata: ArtifactMetadata) -> Path:
@@ -5,10 +5,12 @@ from __future__ import annotations
 import sys
 from collections.abc import Iterable
 from datetime import UTC, datetime
+from itertools import groupby
 from typing import TYPE_CHECKING, TextIO
 
-from rentl_core.ports.orchestrator import LogSinkProtocol
+from rentl_core.ports.orchestrator import FlushableSinkProtocol, LogSinkProtocol
 from rentl_core.ports.storage import LogStoreProtocol
+from rentl_io.storage.batch_writer import BatchWriter
 from rentl_schemas.config import LoggingConfig
 from rentl_schemas.logs import LogEntry
 from rentl_schemas.primitives import LogLevel, LogSinkType
@@ -29,7 +31,58 @@ class StorageLogSink(LogSinkProtocol):
         await self._store.append_log(entry)
 
 
-class CompositeLogSink(LogSinkProtocol):
+class BufferedLogSink(LogSinkProtocol, FlushableSinkProtocol):
+    """Log sink that batches entries into background log store writes.
+
+    Entries are coalesced into ``append_logs`` calls instead of one file
+    append per event; call ``flush`` at durability points and ``aclose`` at
+    shutdown.
+    """
+
+    def __init__(
+        self,
+        store: LogStoreProtocol,
+        *,
+        batch_size: int = 256,
+        flush_interval_s: float = 0.25,
+        max_pending: int = 4096,
+    ) -> None:
+        """Initialize the buffered log sink.
+
+        Args:
+            store: Log store that persists batches.
+            batch_size: Maximum entries per store write.
+            flush_interval_s: Maximum seconds an entry stays buffered.
+            max_pending: Buffered entries at which emitters start waiting.
+        """
+        self._store = store
+        self._writer = BatchWriter(
+            self._write_batch,
+            batch_size=batch_size,
+            flush_interval_s=flush_interval_s,
+            max_pending=max_pending,
+        )
+
+    async def emit_log(self, entry: LogEntry) -> None:
+        """Queue a log entry for the background writer."""
+        # Snapshot now: callers may keep mutating the entry's data afterwards
+        await self._writer.put(entry.model_copy(deep=True))
+
+    async def flush(self) -> None:
+        """Write all buffered log entries."""
+        await self._writer.flush()
+
+    async def aclose(self) -> None:
+        """Flush buffered log entries and stop the background writer."""
+        await self._writer.aclose()
+
+    async def _write_batch(self, entries: list[LogEntry]) -> None:
+        # Store batches are per run; split on run_id while keeping order
+        for _, group in groupby(entries, key=lambda entry: entry.run_id):
+            await self._store.append_logs(list(group))
+
+
+class CompositeLogSink(LogSinkProtocol, FlushableSinkProtocol):
     """Log sink that forwards entries to multiple sinks."""
 
     def __init__(self, sinks: Iterable[LogSinkProtocol]) -> None:
@@ -41,6 +94,18 @@ class CompositeLogSink(LogSinkProtocol):
         for sink in self._sinks:
             await sink.emit_log(entry)
 
+    async def flush(self) -> None:
+        """Flush any buffered sinks."""
+        for sink in self._sinks:
+            if isinstance(sink, FlushableSinkProtocol):
+                await sink.flush()
+
+    async def aclose(self) -> None:
+        """Close any buffered sinks."""
+        for sink in self._sinks:
+            if isinstance(sink, FlushableSinkProtocol):
+                await sink.aclose()
+
 
 class ConsoleLogSink(LogSinkProtocol):
     """Log sink that writes JSONL entries to stdout."""
@@ -68,7 +133,7 @@ class NoopLogSink(LogSinkProtocol):
         return None
 
 
-class RedactingLogSink(LogSinkProtocol):
+class RedactingLogSink(LogSinkProtocol, FlushableSinkProtocol):
     """Log sink wrapper that redacts secrets before forwarding to a delegate sink."""
 
     def __init__(self, delegate: LogSinkProtocol, redactor: Redactor) -> None:
@@ -120,6 +185,16 @@ class RedactingLogSink(LogSinkProtocol):
             )
             await self._delegate.emit_log(debug_entry)
 
+    async def flush(self) -> None:
+        """Flush the delegate sink if it buffers writes."""
+        if isinstance(self._delegate, FlushableSinkProtocol):
+            await self._delegate.flush()
+
+    async def aclose(self) -> None:
+        """Close the delegate sink if it buffers writes."""
+        if isinstance(self._delegate, FlushableSinkProtocol):
+            await self._delegate.aclose()
+
 
 def build_log_sink(
     logging_config: LoggingConfig,
@@ -127,6 +202,7 @@ def build_log_sink(
     *,
     stream: TextIO | None = None,
     redactor: Redactor | None = None,
+    buffered: bool = False,
 ) -> LogSinkProtocol:
     """Build a log sink from configuration.
 
@@ -135,6 +211,8 @@ def build_log_sink(
         log_store: Log store for file-backed logging.
         stream: Optional stream for console logging.
         redactor: Optional redactor to apply before writing logs.
+        buffered: Batch file-backed log writes on a background task. Callers
+            must flush or close the returned sink.
 
     Returns:
         LogSinkProtocol: Configured log sink.
@@ -146,7 +224,11 @@ def build_log_sink(
     for sink_config in logging_config.sinks:
         match sink_config.type:
             case LogSinkType.FILE:
-                sinks.append(StorageLogSink(log_store))
+                sinks.append(
+                    BufferedLogSink(log_store)
+                    if buffered
+                    else StorageLogSink(log_store)
+                )
             case LogSinkType.CONSOLE:
                 sinks.append(ConsoleLogSink(stream=stream))
             case LogSinkType.NOOP:
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from pathlib import Path
 
-from rentl_core.ports.orchestrator import ProgressSinkProtocol
+from rentl_core.ports.orchestrator import FlushableSinkProtocol, ProgressSinkProtocol
+from rentl_io.storage.batch_writer import BatchWriter
 from rentl_schemas.base import BaseSchema
 from rentl_schemas.progress import ProgressUpdate
 
@@ -23,6 +24,55 @@ class FileSystemProgressSink(ProgressSinkProtocol):
         await asyncio.to_thread(_append_jsonl, self._path, update)
 
 
+class BufferedProgressSink(ProgressSinkProtocol, FlushableSinkProtocol):
+    """Progress sink that appends JSONL updates to a file in batches.
+
+    Updates are written by a background task, one append per batch instead
+    of one per event; call ``flush`` at durability points and ``aclose`` at
+    shutdown.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        batch_size: int = 256,
+        flush_interval_s: float = 0.25,
+        max_pending: int = 4096,
+    ) -> None:
+        """Initialize the buffered progress sink.
+
+        Args:
+            path: JSONL file to append updates to.
+            batch_size: Maximum updates per file append.
+            flush_interval_s: Maximum seconds an update stays buffered.
+            max_pending: Buffered updates at which emitters start waiting.
+        """
+        self._path = Path(path)
+        self._writer = BatchWriter(
+            self._write_batch,
+            batch_size=batch_size,
+            flush_interval_s=flush_interval_s,
+            max_pending=max_pending,
+        )
+
+    async def emit_progress(self, update: ProgressUpdate) -> None:
+        """Queue a progress update for the background writer."""
+        # Serialize now: updates reference live run progress that keeps changing
+        await self._writer.put(update.model_dump_json(exclude_none=True))
+
+    async def flush(self) -> None:
+        """Write all buffered progress updates."""
+        await self._writer.flush()
+
+    async def aclose(self) -> None:
+        """Flush buffered progress updates and stop the background writer."""
+        await self._writer.aclose()
+
+    async def _write_batch(self, lines: list[str]) -> None:
+        await asyncio.to_thread(_append_lines, self._path, lines)
+
+
 class InMemoryProgressSink(ProgressSinkProtocol):
     """Progress sink that stores updates in memory."""
 
@@ -40,7 +90,7 @@ class InMemoryProgressSink(ProgressSinkProtocol):
         self._updates.append(update)
 
 
-class CompositeProgressSink(ProgressSinkProtocol):
+class CompositeProgressSink(ProgressSinkProtocol, FlushableSinkProtocol):
     """Progress sink that forwards updates to multiple sinks."""
 
     def __init__(self, sinks: Iterable[ProgressSinkProtocol]) -> None:
@@ -52,9 +102,24 @@ class CompositeProgressSink(ProgressSinkProtocol):
         for sink in self._sinks:
             await sink.emit_progress(update)
 
+    async def flush(self) -> None:
+        """Flush any buffered sinks."""
+        for sink in self._sinks:
+            if isinstance(sink, FlushableSinkProtocol):
+                await sink.flush()
+
+    async def aclose(self) -> None:
+        """Close any buffered sinks."""
+        for sink in self._sinks:
+            if isinstance(sink, FlushableSinkProtocol):
+                await sink.aclose()
+
 
 def _append_jsonl(path: Path, payload: BaseSchema) -> None:
+    _append_lines(path, [payload.model_dump_json(exclude_none=True)])
+
+
+def _append_lines(path: Path, lines: Sequence[str]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    payload_json = payload.model_dump_json(exclude_none=True)
     with open(path, "a", encoding="utf-8") as handle:
-        handle.write(payload_json + "\n")
+        handle.writelines(line + "\n" for line in lines)
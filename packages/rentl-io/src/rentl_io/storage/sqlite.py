@@ -0,0 +1,471 @@
+"""SQLite-backed storage adapters."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+from collections.abc import Sequence
+from json import JSONDecodeError
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from rentl_core.ports.storage import (
+    ClosableStoreProtocol,
+    LogStoreProtocol,
+    RunStateStoreProtocol,
+    StorageError,
+    StorageErrorCode,
+    StorageErrorDetails,
+    StorageErrorInfo,
+)
+from rentl_io.storage.filesystem import (
+    _ArtifactFileStore,
+    _build_record_parse_error_info,
+)
+from rentl_schemas.logs import LogEntry
+from rentl_schemas.primitives import ArtifactId, RunId, RunStatus
+from rentl_schemas.storage import (
+    ArtifactMetadata,
+    LogFileReference,
+    RunIndexRecord,
+    RunStateRecord,
+    StorageBackend,
+    StorageReference,
+)
+
+_BUSY_TIMEOUT_S = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS run_state (
+    run_id TEXT PRIMARY KEY,
+    payload TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS run_index (
+    run_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS run_index_updated_at ON run_index (updated_at);
+CREATE INDEX IF NOT EXISTS run_index_status ON run_index (status, updated_at);
+CREATE TABLE IF NOT EXISTS artifacts (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    artifact_id TEXT NOT NULL UNIQUE,
+    run_id TEXT NOT NULL,
+    phase TEXT,
+    target_language TEXT,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS artifacts_run_phase ON artifacts (run_id, phase);
+CREATE TABLE IF NOT EXISTS logs (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS logs_run_id ON logs (run_id, seq);
+"""
+
+
+class _SqliteDatabase:
+    # Each worker thread keeps one connection for the database's lifetime, so
+    # connection setup and PRAGMAs run once per thread instead of per call;
+    # WAL lets readers (e.g. `rentl status`) proceed while a run writes.
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._initialized = False
+        self._lock = threading.Lock()
+        self._connections: dict[threading.Thread, sqlite3.Connection] = {}
+
+    def execute(
+        self, sql: str, parameters: Sequence[object] = ()
+    ) -> list[tuple[object, ...]]:
+        with self._connection() as connection:
+            return connection.execute(sql, parameters).fetchall()
+
+    def executemany(self, sql: str, rows: Sequence[Sequence[object]]) -> None:
+        with self._connection() as connection:
+            connection.executemany(sql, rows)
+
+    def close(self) -> None:
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        for connection in connections:
+            connection.close()
+
+    def _connection(self) -> sqlite3.Connection:
+        thread = threading.current_thread()
+        with self._lock:
+            connection = self._connections.get(thread)
+            if connection is not None:
+                return connection
+            # Executor threads of finished event loops never return
+            stale = [
+                self._connections.pop(owner)
+                for owner in list(self._connections)
+                if not owner.is_alive()
+            ]
+        for stale_connection in stale:
+            stale_connection.close()
+        connection = self._connect()
+        with self._lock:
+            self._connections[thread] = connection
+        return connection
+
+    def _connect(self) -> sqlite3.Connection:
+        with self._lock:
+            if not self._initialized:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Connections are used only by their own thread but may be closed from
+        # another one
+        connection = sqlite3.connect(
+            self.path, timeout=_BUSY_TIMEOUT_S, check_same_thread=False
+        )
+        try:
+            # Only the first connection switches to WAL and creates the schema
+            with self._lock:
+                if not self._initialized:
+                    connection.execute("PRAGMA journal_mode=WAL")
+                    connection.executescript(_SCHEMA)
+                    self._initialized = True
+            connection.execute("PRAGMA synchronous=NORMAL")
+        except sqlite3.Error:
+            connection.close()
+            raise
+        return connection
+
+
+class SqliteRunStateStore(RunStateStoreProtocol, ClosableStoreProtocol):
+    """SQLite-backed run state store with an indexed run history."""
+
+    def __init__(self, database_path: str) -> None:
+        """Initialize the run state store.
+
+        Args:
+            database_path: Path to the SQLite database file.
+        """
+        self._database = _SqliteDatabase(Path(database_path))
+
+    @property
+    def database_path(self) -> Path:
+        """Path to the SQLite database file."""
+        return self._database.path
+
+    def close(self) -> None:
+        """Close the store's database connections."""
+        self._database.close()
+
+    async def save_run_state(self, record: RunStateRecord) -> None:
+        """Persist a run state snapshot.
+
+        Raises:
+            StorageError: If the snapshot cannot be written.
+        """
+        try:
+            await asyncio.to_thread(
+                self._database.execute,
+                "INSERT INTO run_state (run_id, payload) VALUES (?, ?) "
+                "ON CONFLICT (run_id) DO UPDATE SET payload = excluded.payload",
+                (str(record.run_id), record.model_dump_json(exclude_none=True)),
+            )
+        except sqlite3.Error as exc:
+            raise StorageError(
+                _sqlite_error_info(
+                    exc, "save_run_state", self._database.path, run_id=record.run_id
+                )
+            ) from exc
+
+    async def load_run_state(self, run_id: RunId) -> RunStateRecord | None:
+        """Load a run state snapshot if present.
+
+        Returns:
+            RunStateRecord | None: Stored run state if available.
+
+        Raises:
+            StorageError: If the snapshot cannot be read.
+        """
+        try:
+            rows = await asyncio.to_thread(
+                self._database.execute,
+                "SELECT payload FROM run_state WHERE run_id = ?",
+                (str(run_id),),
+            )
+            if not rows:
+                return None
+            return RunStateRecord.model_validate_json(str(rows[0][0]))
+        except (ValidationError, JSONDecodeError, ValueError) as exc:
+            raise StorageError(
+                _build_record_parse_error_info(
+                    entity="Run state snapshot",
+                    operation="load_run_state",
+                    run_id=run_id,
+                    path=self._database.path,
+                    backend=StorageBackend.SQLITE,
+                    exc=exc,
+                )
+            ) from exc
+        except sqlite3.Error as exc:
+            raise StorageError(
+                _sqlite_error_info(
+                    exc, "load_run_state", self._database.path, run_id=run_id
+                )
+            ) from exc
+
+    async def save_run_index(self, record: RunIndexRecord) -> None:
+        """Persist or update a run index record.
+
+        Raises:
+            StorageError: If the index record cannot be written.
+        """
+        run_id = record.metadata.run_id
+        try:
+            await asyncio.to_thread(
+                self._database.execute,
+                "INSERT INTO run_index (run_id, status, updated_at, payload) "
+                "VALUES (?, ?, ?, ?) ON CONFLICT (run_id) DO UPDATE SET "
+                "status = excluded.status, updated_at = excluded.updated_at, "
+                "payload = excluded.payload",
+                (
+                    str(run_id),
+                    str(record.metadata.status),
+                    record.updated_at,
+                    record.model_dump_json(exclude_none=True),
+                ),
+            )
+        except sqlite3.Error as exc:
+            raise StorageError(
+                _sqlite_error_info(
+                    exc, "save_run_index", self._database.path, run_id=run_id
+                )
+            ) from exc
+
+    async def list_run_index(
+        self,
+        status: RunStatus | None = None,
+        limit: int | None = None,
+    ) -> list[RunIndexRecord]:
+        """List run index records, newest first.
+
+        Filtering and limiting happen in SQL, so only the requested records
+        are parsed regardless of how much history the database holds.
+
+        Returns:
+            list[RunIndexRecord]: Run index records ordered by update time.
+
+        Raises:
+            StorageError: If index records cannot be read.
+        """
+        sql = "SELECT payload FROM run_index"
+        parameters: list[object] = []
+        if status is not None:
+            sql += " WHERE status = ?"
+            parameters.append(str(status))
+        sql += " ORDER BY updated_at DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            parameters.append(limit)
+        try:
+            rows = await asyncio.to_thread(self._database.execute, sql, parameters)
+            return [RunIndexRecord.model_validate_json(str(row[0])) for row in rows]
+        except (ValidationError, JSONDecodeError, ValueError) as exc:
+            raise StorageError(
+                _build_record_parse_error_info(
+                    entity="Run index record",
+                    operation="list_run_index",
+                    path=self._database.path,
+                    backend=StorageBackend.SQLITE,
+                    exc=exc,
+                )
+            ) from exc
+        except sqlite3.Error as exc:
+            raise StorageError(
+                _sqlite_error_info(exc, "list_run_index", self._database.path)
+            ) from exc
+
+
+class SqliteArtifactStore(_ArtifactFileStore, ClosableStoreProtocol):
+    """Artifact store keeping payload files on disk and metadata in SQLite.
+
+    Artifact lookups use the database's indexes instead of a JSONL index;
+    payloads and chunk checkpoints stay filesystem-backed.
+    """
+
+    def __init__(self, base_dir: str, database_path: str) -> None:
+        """Initialize the artifact store.
+
+        Args:
+            base_dir: Directory for artifact payload files and checkpoints.
+            database_path: Path to the SQLite database file.
+        """
+        self._database = _SqliteDatabase(Path(database_path))
+        super().__init__(base_dir, index_path=self._database.path)
+
+    def close(self) -> None:
+        """Close the store's database connections."""
+        self._database.close()
+
+    def _record_artifact(self, metadata: ArtifactMetadata) -> None:
+        try:
+            self._database.execute(
+                "INSERT INTO artifacts "
+                "(artifact_id, run_id, phase, target_language, payload) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT (artifact_id) DO UPDATE SET "
+                "run_id = excluded.run_id, phase = excluded.phase, "
+                "target_language = excluded.target_language, "
+                "payload = excluded.payload",
+                (
+                    str(metadata.artifact_id),
+                    str(metadata.run_id),
+                    None if metadata.phase is None else str(metadata.phase),
+                    metadata.target_language,
+                    metadata.model_dump_json(exclude_none=True),
+                ),
+            )
+        except sqlite3.Error as exc:
+            raise StorageError(
+                _sqlite_error_info(
+                    exc,
+                    "record_artifact",
+                    self._database.path,
+                    run_id=metadata.run_id,
+                    artifact_id=metadata.artifact_id,
+                )
+            ) from exc
+
+    def _find_artifact(self, artifact_id: ArtifactId) -> ArtifactMetadata | None:
+        try:
+            rows = self._database.execute(
+                "SELECT payload FROM artifacts WHERE artifact_id = ?",
+                (str(artifact_id),),
+            )
+        except sqlite3.Error as exc:
+            raise StorageError(
+                _sqlite_error_info(
+                    exc, "find_artifact", self._database.path, artifact_id=artifact_id
+                )
+            ) from exc
+        if not rows:
+            return None
+        return ArtifactMetadata.model_validate_json(str(rows[0][0]))
+
+    def _list_run_artifacts(self, run_id: RunId) -> list[ArtifactMetadata]:
+        try:
+            rows = self._database.execute(
+                "SELECT payload FROM artifacts WHERE run_id = ? ORDER BY seq",
+                (str(run_id),),
+            )
+        except sqlite3.Error as exc:
+            raise StorageError(
+                _sqlite_error_info(
+                    exc, "list_artifacts", self._database.path, run_id=run_id
+                )
+            ) from exc
+        return [ArtifactMetadata.model_validate_json(str(row[0])) for row in rows]
+
+
+class SqliteLogStore(LogStoreProtocol, ClosableStoreProtocol):
+    """SQLite-backed log store."""
+
+    def __init__(self, database_path: str) -> None:
+        """Initialize the log store.
+
+        Args:
+            database_path: Path to the SQLite database file.
+        """
+        self._database = _SqliteDatabase(Path(database_path))
+
+    def close(self) -> None:
+        """Close the store's database connections."""
+        self._database.close()
+
+    async def append_log(self, entry: LogEntry) -> None:
+        """Append a single log entry."""
+        await self.append_logs([entry])
+
+    async def append_logs(self, entries: list[LogEntry]) -> None:
+        """Append log entries in a single transaction.
+
+        Raises:
+            StorageError: If the log entries cannot be written.
+        """
+        if not entries:
+            return
+        rows = [
+            (
+                str(entry.run_id),
+                entry.timestamp,
+                entry.model_dump_json(exclude_none=False),
+            )
+            for entry in entries
+        ]
+        try:
+            await asyncio.to_thread(
+                self._database.executemany,
+                "INSERT INTO logs (run_id, timestamp, payload) VALUES (?, ?, ?)",
+                rows,
+            )
+        except sqlite3.Error as exc:
+            raise StorageError(
+                _sqlite_error_info(
+                    exc, "append_logs", self._database.path, run_id=entries[0].run_id
+                )
+            ) from exc
+
+    async def get_log_reference(self, run_id: RunId) -> LogFileReference | None:
+        """Return a reference to the run's stored log entries.
+
+        Returns:
+            LogFileReference | None: Log reference if entries exist.
+
+        Raises:
+            StorageError: If the log reference cannot be read.
+        """
+        try:
+            rows = await asyncio.to_thread(
+                self._database.execute,
+                "SELECT COUNT(*), MIN(timestamp), MAX(timestamp) "
+                "FROM logs WHERE run_id = ?",
+                (str(run_id),),
+            )
+        except sqlite3.Error as exc:
+            raise StorageError(
+                _sqlite_error_info(
+                    exc, "get_log_reference", self._database.path, run_id=run_id
+                )
+            ) from exc
+        count, created_at, updated_at = rows[0]
+        if not isinstance(count, int) or count == 0:
+            return None
+        return LogFileReference(
+            run_id=run_id,
+            created_at=str(created_at),
+            updated_at=str(updated_at),
+            location=StorageReference(
+                backend=StorageBackend.SQLITE, path=str(self._database.path)
+            ),
+            entry_count=count,
+        )
+
+
+def _sqlite_error_info(
+    exc: sqlite3.Error,
+    operation: str,
+    path: Path,
+    *,
+    run_id: RunId | None = None,
+    artifact_id: ArtifactId | None = None,
+) -> StorageErrorInfo:
+    return StorageErrorInfo(
+        code=StorageErrorCode.IO_ERROR,
+        message=str(exc),
+        details=StorageErrorDetails(
+            operation=operation,
+            run_id=run_id,
+            artifact_id=artifact_id,
+            backend=StorageBackend.SQLITE,
+            path=str(path),
+        ),
+    )
@@ -1,5 +1,6 @@
 """LLM runtime adapters for rentl."""
 
+from rentl_llm.model_registry import ModelRegistry
 from rentl_llm.openai_runtime import OpenAICompatibleRuntime
 from rentl_llm.provider_factory import (
     PreflightEndpoint,
@@ -7,17 +8,23 @@ from rentl_llm.provider_factory import (
     PreflightResult,
     ProviderFactoryError,
     assert_preflight,
+    build_prompt_cache_settings,
     create_model,
     run_preflight_checks,
 )
+from rentl_llm.response_cache import LlmResponseCache, build_response_cache_key
 
 __all__ = [
+    "LlmResponseCache",
+    "ModelRegistry",
     "OpenAICompatibleRuntime",
     "PreflightEndpoint",
     "PreflightIssue",
     "PreflightResult",
     "ProviderFactoryError",
     "assert_preflight",
+    "build_prompt_cache_settings",
+    "build_response_cache_key",
     "create_model",
     "run_preflight_checks",
 ]
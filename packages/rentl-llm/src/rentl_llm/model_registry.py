@@ -0,0 +1,240 @@
+"""Per-run registry of models and pooled HTTP clients.
+
+Building a provider per agent call creates a fresh ``AsyncOpenAI`` client and
+throws away warm connections. The registry hands out one model per distinct
+configuration and one ``httpx.AsyncClient`` per endpoint, with the connection
+pool sized to the endpoint's concurrency limit. Close it when the run ends.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from types import TracebackType
+from typing import Self
+
+import httpx
+from pydantic_ai.models import Model
+from pydantic_ai.settings import ModelSettings
+
+from rentl_llm.provider_factory import create_model
+from rentl_schemas.config import OpenRouterProviderRoutingConfig
+from rentl_schemas.primitives import ReasoningEffort
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_KEEPALIVE_EXPIRY_S = 30.0
+DEFAULT_CONNECT_TIMEOUT_S = 10.0
+
+
+class ModelRegistry:
+    """Share models and HTTP connection pools across agent calls."""
+
+    def __init__(
+        self,
+        *,
+        http2: bool = True,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        keepalive_expiry_s: float = DEFAULT_KEEPALIVE_EXPIRY_S,
+        connect_timeout_s: float = DEFAULT_CONNECT_TIMEOUT_S,
+    ) -> None:
+        """Initialize the registry.
+
+        Args:
+            http2: Negotiate HTTP/2 with providers that support it.
+            max_connections: Pool size used when an endpoint has no limit.
+            keepalive_expiry_s: Seconds idle connections stay in the pool.
+            connect_timeout_s: TCP/TLS connect timeout in seconds.
+
+        Raises:
+            ValueError: If max_connections is not positive.
+        """
+        if max_connections <= 0:
+            raise ValueError("max_connections must be positive")
+        self._http2 = http2
+        self._max_connections = max_connections
+        self._keepalive_expiry_s = keepalive_expiry_s
+        self._connect_timeout_s = connect_timeout_s
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._models: dict[str, tuple[Model, ModelSettings]] = {}
+        self._closed = False
+
+    @property
+    def http2(self) -> bool:
+        """Whether pooled clients negotiate HTTP/2."""
+        return self._http2
+
+    @property
+    def closed(self) -> bool:
+        """Whether the registry has been closed."""
+        return self._closed
+
+    def http_client_for(
+        self, base_url: str, *, max_connections: int | None = None
+    ) -> httpx.AsyncClient:
+        """Return the pooled HTTP client for an endpoint.
+
+        The first caller for an endpoint fixes its pool size.
+
+        Args:
+            base_url: Endpoint base URL.
+            max_connections: Connection cap, normally the endpoint's
+                in-flight request limit.
+
+        Returns:
+            httpx.AsyncClient: Shared client for the endpoint.
+
+        Raises:
+            RuntimeError: If the registry has been closed.
+        """
+        if self._closed:
+            raise RuntimeError("Model registry is closed")
+        key = base_url.rstrip("/")
+        client = self._clients.get(key)
+        if client is None or client.is_closed:
+            pool_size = max_connections or self._max_connections
+            client = httpx.AsyncClient(
+                http2=self._http2,
+                limits=httpx.Limits(
+                    max_connections=pool_size,
+                    max_keepalive_connections=pool_size,
+                    keepalive_expiry=self._keepalive_expiry_s,
+                ),
+                # Per-request timeouts come from the model settings
+                timeout=httpx.Timeout(None, connect=self._connect_timeout_s),
+            )
+            self._clients[key] = client
+        return client
+
+    def get_model(
+        self,
+        *,
+        base_url: str,
+        api_key: str,
+        model_id: str,
+        temperature: float,
+        top_p: float = 1.0,
+        timeout_s: float = 60.0,
+        max_output_tokens: int | None = None,
+        presence_penalty: float = 0.0,
+        frequency_penalty: float = 0.0,
+        reasoning_effort: ReasoningEffort | str | None = None,
+        openrouter_provider: OpenRouterProviderRoutingConfig | None = None,
+        strict_tools: bool = False,
+        max_connections: int | None = None,
+    ) -> tuple[Model, ModelSettings]:
+        """Return a cached model for the configuration, creating it once.
+
+        Args:
+            base_url: Endpoint base URL.
+            api_key: API key for the provider.
+            model_id: Model identifier.
+            temperature: Sampling temperature.
+            top_p: Top-p sampling.
+            timeout_s: Request timeout in seconds.
+            max_output_tokens: Maximum output tokens (None uses model default).
+            presence_penalty: Presence penalty.
+            frequency_penalty: Frequency penalty.
+            reasoning_effort: Reasoning effort level when supported.
+            openrouter_provider: OpenRouter provider routing config.
+            strict_tools: Send strict tool definitions to the provider.
+            max_connections: Connection cap for the endpoint's pool.
+
+        Returns:
+            Tuple of (Model, ModelSettings) ready for pydantic-ai Agent.
+        """
+        key = _model_key(
+            base_url=base_url,
+            api_key=api_key,
+            model_id=model_id,
+            temperature=temperature,
+            top_p=top_p,
+            timeout_s=timeout_s,
+            max_output_tokens=max_output_tokens,
+            presence_penalty=presence_penalty,
+            frequency_penalty=frequency_penalty,
+            reasoning_effort=reasoning_effort,
+            openrouter_provider=openrouter_provider,
+            strict_tools=strict_tools,
+        )
+        cached = self._models.get(key)
+        if cached is not None:
+            return cached
+        http_client = self.http_client_for(base_url, max_connections=max_connections)
+        created = create_model(
+            base_url=base_url,
+            api_key=api_key,
+            model_id=model_id,
+            temperature=temperature,
+            top_p=top_p,
+            timeout_s=timeout_s,
+            max_output_tokens=max_output_tokens,
+            presence_penalty=presence_penalty,
+            frequency_penalty=frequency_penalty,
+            reasoning_effort=reasoning_effort,
+            openrouter_provider=openrouter_provider,
+            strict_tools=strict_tools,
+            http_client=http_client,
+        )
+        self._models[key] = created
+        return created
+
+    async def aclose(self) -> None:
+        """Close every pooled HTTP client and drop cached models."""
+        self._closed = True
+        clients = list(self._clients.values())
+        self._clients.clear()
+        self._models.clear()
+        for client in clients:
+            await client.aclose()
+
+    async def __aenter__(self) -> Self:
+        """Enter the registry context.
+
+        Returns:
+            Self: The registry.
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the registry on context exit."""
+        await self.aclose()
+
+
+def _model_key(
+    *,
+    base_url: str,
+    api_key: str,
+    model_id: str,
+    temperature: float,
+    top_p: float,
+    timeout_s: float,
+    max_output_tokens: int | None,
+    presence_penalty: float,
+    frequency_penalty: float,
+    reasoning_effort: ReasoningEffort | str | None,
+    openrouter_provider: OpenRouterProviderRoutingConfig | None,
+    strict_tools: bool,
+) -> str:
+    payload = {
+        "base_url": base_url.rstrip("/"),
+        # Keep raw keys out of the in-memory index
+        "api_key": hashlib.sha256(api_key.encode("utf-8")).hexdigest(),
+        "model_id": model_id,
+        "temperature": temperature,
+        "top_p": top_p,
+        "timeout_s": timeout_s,
+        "max_output_tokens": max_output_tokens,
+        "presence_penalty": presence_penalty,
+        "frequency_penalty": frequency_penalty,
+        "reasoning_effort": str(reasoning_effort) if reasoning_effort else None,
+        "openrouter_provider": openrouter_provider.model_dump(mode="json")
+        if openrouter_provider is not None
+        else None,
+        "strict_tools": strict_tools,
+    }
+    return json.dumps(payload, sort_keys=True)
@@ -9,8 +9,9 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Literal, cast
+from typing import TYPE_CHECKING, Literal, cast
 
+import httpx
 from pydantic import Field
 from pydantic_ai import Agent
 from pydantic_ai.models import Model
@@ -30,6 +31,9 @@ from rentl_schemas.base import BaseSchema
 from rentl_schemas.config import OpenRouterProviderRoutingConfig
 from rentl_schemas.primitives import ReasoningEffort
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
 _log = logging.getLogger(__name__)
 
 _OPENROUTER_MODEL_ID_RE = re.compile(r"^[^/]+/.+")
@@ -54,6 +58,7 @@ def create_model(
     reasoning_effort: ReasoningEffort | str | None = None,
     openrouter_provider: OpenRouterProviderRoutingConfig | None = None,
     strict_tools: bool = False,
+    http_client: httpx.AsyncClient | None = None,
 ) -> tuple[Model, ModelSettings]:
     """Create the correct provider/model pair from configuration.
 
@@ -73,6 +78,8 @@ def create_model(
         reasoning_effort: Reasoning effort level when supported.
         openrouter_provider: OpenRouter provider routing config.
         strict_tools: Send strict tool definitions to the provider.
+        http_client: Shared HTTP client for the provider (None uses the
+            pydantic-ai default client).
 
     Returns:
         Tuple of (Model, ModelSettings) ready for pydantic-ai Agent.
@@ -92,6 +99,7 @@ def create_model(
             reasoning_effort=reasoning_effort,
             openrouter_provider=openrouter_provider,
             strict_tools=strict_tools,
+            http_client=http_client,
         )
     return _create_openai_model(
         base_url=base_url,
@@ -105,9 +113,29 @@ def create_model(
         frequency_penalty=frequency_penalty,
         reasoning_effort=reasoning_effort,
         strict_tools=strict_tools,
+        http_client=http_client,
     )
 
 
+def build_prompt_cache_settings(base_url: str, prefix_key: str) -> ModelSettings:
+    """Build provider prompt-cache hints for requests sharing a static prefix.
+
+    Providers with automatic prefix caching route requests by a cache key;
+    sending the same key for every chunk of a phase keeps them on the same
+    cache shard. Providers without such a hint get no extra settings.
+
+    Args:
+        base_url: Endpoint base URL.
+        prefix_key: Stable identifier of the static prompt prefix.
+
+    Returns:
+        Settings to merge into the model settings (empty when unsupported).
+    """
+    if not detect_provider(base_url).supports_prompt_cache_key:
+        return {}
+    return {"extra_body": {"prompt_cache_key": prefix_key}}
+
+
 def validate_openrouter_model_id(model_id: str) -> None:
     """Validate an OpenRouter model ID matches the required format.
 
@@ -405,6 +433,19 @@ def _check_openrouter_constraints(
     return issues
 
 
+def _without_sdk_retries(client: AsyncOpenAI) -> AsyncOpenAI:
+    """Copy an OpenAI client with the SDK's own retry loop disabled.
+
+    Retries are paced by the endpoint rate limiter instead: a 429 retried
+    inside the SDK holds the limiter slot, bypasses the RPM/TPM buckets, and
+    only starts the shared cooldown once the SDK gives up.
+
+    Returns:
+        Client sharing the original's transport, headers, and credentials.
+    """
+    return client.with_options(max_retries=0)
+
+
 def _create_openrouter_model(
     *,
     api_key: str,
@@ -418,6 +459,7 @@ def _create_openrouter_model(
     reasoning_effort: ReasoningEffort | str | None,
     openrouter_provider: OpenRouterProviderRoutingConfig | None,
     strict_tools: bool = False,
+    http_client: httpx.AsyncClient | None = None,
 ) -> tuple[Model, ModelSettings]:
     """Create an OpenRouter model and settings.
 
@@ -427,7 +469,11 @@ def _create_openrouter_model(
     validate_openrouter_model_id(model_id)
     enforce_provider_allowlist(model_id, openrouter_provider)
 
-    provider = OpenRouterProvider(api_key=api_key)
+    provider = OpenRouterProvider(
+        openai_client=_without_sdk_retries(
+            OpenRouterProvider(api_key=api_key, http_client=http_client).client
+        )
+    )
     profile = OpenAIModelProfile(
         openai_supports_strict_tool_definition=strict_tools,
     )
@@ -470,13 +516,20 @@ def _create_openai_model(
     frequency_penalty: float,
     reasoning_effort: ReasoningEffort | str | None,
     strict_tools: bool = False,
+    http_client: httpx.AsyncClient | None = None,
 ) -> tuple[Model, ModelSettings]:
     """Create a generic OpenAI-compatible model and settings.
 
     Returns:
         Tuple of (Model, ModelSettings) for OpenAI-compatible endpoint.
     """
-    provider = OpenAIProvider(base_url=base_url, api_key=api_key)
+    provider = OpenAIProvider(
+        openai_client=_without_sdk_retries(
+            OpenAIProvider(
+                base_url=base_url, api_key=api_key, http_client=http_client
+            ).client
+        )
+    )
     profile = OpenAIModelProfile(
         openai_supports_strict_tool_definition=strict_tools,
     )
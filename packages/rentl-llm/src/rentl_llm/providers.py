@@ -21,6 +21,8 @@ class ProviderCapabilities(BaseModel):
         is_openrouter: Whether the provider is OpenRouter.
         supports_tool_calling: Whether tool calling is supported.
         supports_tool_choice_required: Whether tool_choice:required is supported.
+        supports_prompt_cache_key: Whether requests accept a prompt_cache_key
+            routing hint for prefix caching.
     """
 
     model_config = ConfigDict(frozen=True, extra="forbid")
@@ -31,6 +33,9 @@ class ProviderCapabilities(BaseModel):
     supports_tool_choice_required: bool = Field(
         description="Whether tool_choice:required is supported"
     )
+    supports_prompt_cache_key: bool = Field(
+        False, description="Whether requests accept a prompt_cache_key hint"
+    )
 
 
 # Provider capability definitions
@@ -46,6 +51,7 @@ OPENAI_CAPABILITIES = ProviderCapabilities(
     is_openrouter=False,
     supports_tool_calling=True,
     supports_tool_choice_required=True,
+    supports_prompt_cache_key=True,
 )
 
 # Local/self-hosted endpoints (LM Studio, etc.)
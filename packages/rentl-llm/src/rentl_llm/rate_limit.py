@@ -0,0 +1,572 @@
+"""Process-wide request governor for LLM endpoints.
+
+Every model request issued by rentl agents passes through a shared
+:class:`EndpointRateLimiter` keyed by endpoint. Each limiter combines:
+
+- a concurrency cap (``max_parallel_requests``), optionally narrowed per scope
+  (e.g. per pipeline phase),
+- token buckets for requests per minute and tokens per minute, and
+- a cooldown window fed by HTTP 429 responses and their ``Retry-After`` hints.
+
+Agents share limiters through :func:`get_request_governor`, so running several
+agent pools against the same provider stays within one quota instead of each
+pool bursting independently.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+from pydantic_ai.exceptions import ModelHTTPError
+from pydantic_ai.messages import ModelMessage, ModelResponse
+from pydantic_ai.models import Model, ModelRequestParameters
+from pydantic_ai.models.wrapper import WrapperModel
+from pydantic_ai.settings import ModelSettings
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_RATE_LIMIT_COOLDOWN_S = 5.0
+MAX_RATE_LIMIT_COOLDOWN_S = 300.0
+_CHARS_PER_TOKEN = 4
+_RATE_LIMIT_STATUS = 429
+
+
+class _TokenBucket:
+    """Reservation-based token bucket refilled continuously per minute."""
+
+    def __init__(self, per_minute: int, now: float) -> None:
+        self.capacity = float(per_minute)
+        self.refill_per_s = per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated_at = now
+
+    def reserve(self, amount: float, now: float) -> float:
+        self._refill(now)
+        self.tokens -= min(amount, self.capacity)
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.refill_per_s
+
+    def adjust(self, delta: float, now: float) -> None:
+        self._refill(now)
+        self.tokens = min(self.capacity, self.tokens + delta)
+
+    def drain(self, now: float) -> None:
+        self._refill(now)
+        self.tokens = min(self.tokens, 0.0)
+
+    def resize(self, per_minute: int, now: float) -> None:
+        # Keeps the current balance (including any debt) within the new cap
+        self._refill(now)
+        self.capacity = float(per_minute)
+        self.refill_per_s = per_minute / 60.0
+        self.tokens = min(self.tokens, self.capacity)
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self.updated_at)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_s)
+        self.updated_at = now
+
+
+class _Slots:
+    """Resizable concurrency slots that rebind when used from a new event loop.
+
+    Unlike ``asyncio.Semaphore`` the limit can change while slots are held:
+    holders keep their slots and waiters are admitted once usage drops below
+    the new limit. A limit of None admits everyone but still counts holders,
+    so a later cap accounts for requests already in flight.
+    """
+
+    def __init__(self, limit: int | None) -> None:
+        self.limit = limit
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._in_use = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    def resize(self, limit: int | None) -> None:
+        self.limit = limit
+        self._wake()
+
+    async def acquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._in_use = 0
+            self._waiters.clear()
+        if self._has_room() and not self._waiters:
+            self._in_use += 1
+            return
+        waiter: asyncio.Future[None] = loop.create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was granted just before cancellation; hand it on
+                self.release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        # Holders from a previous event loop may release after the rebind
+        self._in_use = max(0, self._in_use - 1)
+        self._wake()
+
+    def _has_room(self) -> bool:
+        return self.limit is None or self._in_use < self.limit
+
+    def _wake(self) -> None:
+        while self._waiters and self._has_room():
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_use += 1
+                waiter.set_result(None)
+
+
+class EndpointRateLimiter:
+    """Shared limiter for requests against a single endpoint."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_parallel_requests: int | None = None,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the limiter.
+
+        Limits are validated by update_limits.
+
+        Args:
+            name: Endpoint identifier used in logs.
+            max_parallel_requests: Optional cap on in-flight requests.
+            requests_per_minute: Optional request budget per minute.
+            tokens_per_minute: Optional token budget per minute.
+            clock: Monotonic clock used for buckets and cooldowns.
+        """
+        self._name = name
+        self._clock = clock
+        self._max_parallel_requests: int | None = None
+        self._requests_per_minute: int | None = None
+        self._tokens_per_minute: int | None = None
+        self._slots = _Slots(max_parallel_requests)
+        self._scoped_slots: dict[str, _Slots] = {}
+        self._request_bucket: _TokenBucket | None = None
+        self._token_bucket: _TokenBucket | None = None
+        self._blocked_until = 0.0
+        self._in_flight = 0
+        self.update_limits(
+            max_parallel_requests=max_parallel_requests,
+            requests_per_minute=requests_per_minute,
+            tokens_per_minute=tokens_per_minute,
+        )
+
+    @property
+    def name(self) -> str:
+        """Endpoint identifier."""
+        return self._name
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently holding a slot."""
+        return self._in_flight
+
+    @property
+    def limits(self) -> tuple[int | None, int | None, int | None]:
+        """Configured (max_parallel_requests, requests/min, tokens/min)."""
+        return (
+            self._max_parallel_requests,
+            self._requests_per_minute,
+            self._tokens_per_minute,
+        )
+
+    def update_limits(
+        self,
+        *,
+        max_parallel_requests: int | None = None,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+    ) -> None:
+        """Change the limits in place without dropping in-flight accounting.
+
+        Held slots stay held, token buckets keep their current balance and
+        any rate-limit cooldown keeps running.
+
+        Args:
+            max_parallel_requests: Optional cap on in-flight requests.
+            requests_per_minute: Optional request budget per minute.
+            tokens_per_minute: Optional token budget per minute.
+
+        Raises:
+            ValueError: If any limit is not positive.
+        """
+        for label, value in (
+            ("max_parallel_requests", max_parallel_requests),
+            ("requests_per_minute", requests_per_minute),
+            ("tokens_per_minute", tokens_per_minute),
+        ):
+            if value is not None and value <= 0:
+                raise ValueError(f"{label} must be positive")
+        now = self._clock()
+        self._max_parallel_requests = max_parallel_requests
+        self._requests_per_minute = requests_per_minute
+        self._tokens_per_minute = tokens_per_minute
+        self._slots.resize(max_parallel_requests)
+        self._request_bucket = _resize_bucket(
+            self._request_bucket, requests_per_minute, now
+        )
+        self._token_bucket = _resize_bucket(self._token_bucket, tokens_per_minute, now)
+
+    @asynccontextmanager
+    async def acquire(
+        self,
+        estimated_tokens: int = 0,
+        *,
+        scope: str | None = None,
+        scope_limit: int | None = None,
+    ) -> AsyncIterator[None]:
+        """Hold a request slot once concurrency and rate budgets allow it.
+
+        Args:
+            estimated_tokens: Expected tokens for the request (input + output).
+            scope: Optional sub-scope (e.g. phase) with its own concurrency cap.
+            scope_limit: Concurrency cap for ``scope``.
+
+        Yields:
+            None: While the caller issues its request.
+        """
+        scope_slots = self._scope_slots(scope, scope_limit)
+        if scope_slots is not None:
+            await scope_slots.acquire()
+        try:
+            await self._slots.acquire()
+            try:
+                await self._wait_for_budget(estimated_tokens)
+                self._in_flight += 1
+                try:
+                    yield
+                finally:
+                    self._in_flight -= 1
+            finally:
+                self._slots.release()
+        finally:
+            if scope_slots is not None:
+                scope_slots.release()
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Reconcile the token budget with the tokens actually used.
+
+        Args:
+            estimated_tokens: Tokens reserved before the request.
+            actual_tokens: Tokens reported by the provider.
+        """
+        if self._token_bucket is None or actual_tokens <= 0:
+            return
+        self._token_bucket.adjust(estimated_tokens - actual_tokens, self._clock())
+
+    def record_rate_limit(self, retry_after_s: float | None = None) -> float:
+        """Pause all requests after the provider reported a rate limit.
+
+        Args:
+            retry_after_s: Provider ``Retry-After`` hint in seconds, if any.
+
+        Returns:
+            float: Cooldown applied, in seconds.
+        """
+        cooldown = (
+            DEFAULT_RATE_LIMIT_COOLDOWN_S if retry_after_s is None else retry_after_s
+        )
+        cooldown = min(max(cooldown, 0.0), MAX_RATE_LIMIT_COOLDOWN_S)
+        now = self._clock()
+        self._blocked_until = max(self._blocked_until, now + cooldown)
+        if self._request_bucket is not None:
+            self._request_bucket.drain(now)
+        _logger.info(
+            "Endpoint %s rate limited; pausing requests for %.1fs",
+            self._name,
+            cooldown,
+        )
+        return cooldown
+
+    def cooldown_remaining(self) -> float:
+        """Seconds left in the current rate-limit cooldown.
+
+        Returns:
+            float: Remaining cooldown, or 0.0 when requests may proceed.
+        """
+        return max(0.0, self._blocked_until - self._clock())
+
+    def _scope_slots(self, scope: str | None, scope_limit: int | None) -> _Slots | None:
+        if scope is None or scope_limit is None:
+            return None
+        slots = self._scoped_slots.get(scope)
+        if slots is None:
+            slots = _Slots(scope_limit)
+            self._scoped_slots[scope] = slots
+        elif slots.limit != scope_limit:
+            slots.resize(scope_limit)
+        return slots
+
+    async def _wait_for_budget(self, estimated_tokens: int) -> None:
+        cooldown = self.cooldown_remaining()
+        if cooldown > 0:
+            await asyncio.sleep(cooldown)
+        now = self._clock()
+        wait = 0.0
+        if self._request_bucket is not None:
+            wait = max(wait, self._request_bucket.reserve(1, now))
+        if self._token_bucket is not None and estimated_tokens > 0:
+            wait = max(wait, self._token_bucket.reserve(estimated_tokens, now))
+        if wait > 0:
+            _logger.debug("Endpoint %s throttled for %.2fs", self._name, wait)
+            await asyncio.sleep(wait)
+        # A 429 may have arrived while this request was waiting
+        cooldown = self.cooldown_remaining()
+        if cooldown > 0:
+            await asyncio.sleep(cooldown)
+
+
+def _resize_bucket(
+    bucket: _TokenBucket | None, per_minute: int | None, now: float
+) -> _TokenBucket | None:
+    if per_minute is None:
+        return None
+    if bucket is None:
+        return _TokenBucket(per_minute, now)
+    bucket.resize(per_minute, now)
+    return bucket
+
+
+class RequestGovernor:
+    """Registry of endpoint limiters shared across the process."""
+
+    def __init__(self) -> None:
+        """Initialize an empty governor."""
+        self._lock = threading.Lock()
+        self._limiters: dict[str, EndpointRateLimiter] = {}
+
+    def limiter_for(
+        self,
+        endpoint: str,
+        *,
+        max_parallel_requests: int | None = None,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+    ) -> EndpointRateLimiter:
+        """Get the shared limiter for an endpoint, creating it if needed.
+
+        An endpoint keeps one limiter for the life of the process. When the
+        requested limits differ from the registered ones the limiter is
+        updated in place, so callers with different limits still share its
+        in-flight slots, token buckets and rate-limit cooldown.
+
+        Args:
+            endpoint: Endpoint key (typically the base URL).
+            max_parallel_requests: Optional cap on in-flight requests.
+            requests_per_minute: Optional request budget per minute.
+            tokens_per_minute: Optional token budget per minute.
+
+        Returns:
+            EndpointRateLimiter: Limiter shared by all callers of the endpoint.
+        """
+        limits = (max_parallel_requests, requests_per_minute, tokens_per_minute)
+        with self._lock:
+            limiter = self._limiters.get(endpoint)
+            if limiter is None:
+                limiter = EndpointRateLimiter(
+                    endpoint,
+                    max_parallel_requests=max_parallel_requests,
+                    requests_per_minute=requests_per_minute,
+                    tokens_per_minute=tokens_per_minute,
+                )
+                self._limiters[endpoint] = limiter
+            elif limiter.limits != limits:
+                limiter.update_limits(
+                    max_parallel_requests=max_parallel_requests,
+                    requests_per_minute=requests_per_minute,
+                    tokens_per_minute=tokens_per_minute,
+                )
+            return limiter
+
+    def clear(self) -> None:
+        """Drop every registered limiter."""
+        with self._lock:
+            self._limiters.clear()
+
+
+_GOVERNOR = RequestGovernor()
+
+
+def get_request_governor() -> RequestGovernor:
+    """Return the process-wide request governor.
+
+    Returns:
+        RequestGovernor: Shared governor instance.
+    """
+    return _GOVERNOR
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """Check whether an exception (or its cause chain) is an HTTP 429.
+
+    Args:
+        exc: Exception raised by a model request.
+
+    Returns:
+        bool: True when the provider rejected the request with 429.
+    """
+    return any(
+        getattr(error, "status_code", None) == _RATE_LIMIT_STATUS
+        for error in _iter_exception_chain(exc)
+    )
+
+
+def retry_after_from_error(exc: BaseException) -> float | None:
+    """Extract a ``Retry-After`` hint in seconds from a provider error.
+
+    Args:
+        exc: Exception raised by a model request.
+
+    Returns:
+        float | None: Seconds to wait, or None when no hint is available.
+    """
+    for error in _iter_exception_chain(exc):
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+        if headers is None:
+            continue
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms is not None:
+            try:
+                return float(retry_after_ms) / 1000.0
+            except ValueError:
+                pass
+        retry_after = headers.get("retry-after")
+        if retry_after is not None:
+            return _parse_retry_after(retry_after)
+    return None
+
+
+def _parse_retry_after(value: str) -> float | None:
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except TypeError, ValueError:
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+def _iter_exception_chain(exc: BaseException) -> list[BaseException]:
+    chain: list[BaseException] = []
+    current: BaseException | None = exc
+    while current is not None and current not in chain:
+        chain.append(current)
+        current = current.__cause__ or current.__context__
+    return chain
+
+
+def estimate_request_tokens(
+    messages: list[ModelMessage], model_settings: ModelSettings | None
+) -> int:
+    """Roughly estimate tokens a request will consume (input + max output).
+
+    Args:
+        messages: Messages sent to the model.
+        model_settings: Model settings for the request.
+
+    Returns:
+        int: Estimated token count.
+    """
+    chars = 0
+    for message in messages:
+        for part in message.parts:
+            content = getattr(part, "content", None)
+            if isinstance(content, str):
+                chars += len(content)
+            elif content is not None:
+                chars += len(str(content))
+            args = getattr(part, "args", None)
+            if args is not None:
+                chars += len(str(args))
+    max_tokens = (model_settings or {}).get("max_tokens") or 0
+    return chars // _CHARS_PER_TOKEN + int(max_tokens)
+
+
+class RateLimitedModel(WrapperModel):
+    """Model wrapper that routes every request through an endpoint limiter."""
+
+    def __init__(
+        self,
+        wrapped: Model,
+        limiter: EndpointRateLimiter,
+        *,
+        scope: str | None = None,
+        scope_limit: int | None = None,
+    ) -> None:
+        """Initialize the wrapper.
+
+        Args:
+            wrapped: Model to wrap.
+            limiter: Shared endpoint limiter.
+            scope: Optional sub-scope with its own concurrency cap.
+            scope_limit: Concurrency cap for ``scope``.
+        """
+        super().__init__(wrapped)
+        self._limiter = limiter
+        self._scope = scope
+        self._scope_limit = scope_limit
+
+    @property
+    def limiter(self) -> EndpointRateLimiter:
+        """Endpoint limiter used for requests."""
+        return self._limiter
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        """Issue a request once the endpoint budget allows it.
+
+        Args:
+            messages: Messages sent to the model.
+            model_settings: Model settings for the request.
+            model_request_parameters: Request parameters from the agent.
+
+        Returns:
+            ModelResponse: Response from the wrapped model.
+
+        Raises:
+            ModelHTTPError: Re-raised after 429 responses feed the cooldown.
+        """
+        estimated = estimate_request_tokens(messages, model_settings)
+        async with self._limiter.acquire(
+            estimated, scope=self._scope, scope_limit=self._scope_limit
+        ):
+            try:
+                response = await self.wrapped.request(
+                    messages, model_settings, model_request_parameters
+                )
+            except ModelHTTPError as exc:
+                if exc.status_code == _RATE_LIMIT_STATUS:
+                    self._limiter.record_rate_limit(retry_after_from_error(exc))
+                raise
+        self._limiter.record_usage(estimated, response.usage.total_tokens)
+        return response
@@ -0,0 +1,316 @@
+"""Disk-backed cache for structured LLM responses.
+
+Entries are content-addressed: the key is a SHA-256 digest over everything
+that determines a model response (model id, model settings, composed system
+prompt, rendered user prompt, output schema, tool names, and results of
+prefetched tools). Re-running a pipeline over unchanged inputs therefore
+reuses prior outputs instead of paying for identical requests again.
+
+Each entry is stored as a JSON file under ``cache_dir``. Entries expire after
+``ttl_s`` seconds. Once the cache grows beyond ``max_entries``, the least
+recently used entries are evicted in one batch down to a low-water mark, so
+the directory is scanned once per batch rather than on every insert.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+import operator
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Mapping, Sequence
+from pathlib import Path
+
+from rentl_schemas.config import CacheConfig
+from rentl_schemas.primitives import JsonValue
+
+_logger = logging.getLogger(__name__)
+
+# Bumped whenever the key material or entry payload layout changes
+CACHE_FORMAT_VERSION = 2
+DEFAULT_CACHE_DIR = ".rentl/cache"
+_ENTRY_SUFFIX = ".json"
+# Fraction of max_entries kept after an eviction pass
+_EVICTION_LOW_WATER = 0.9
+
+
+class _EntryCounter:
+    # Entry count shared by every cache instance over one directory; None
+    # until the directory is first scanned
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.count: int | None = None
+
+
+_counters: dict[Path, _EntryCounter] = {}
+_counters_lock = threading.Lock()
+
+
+def _counter_for(cache_dir: Path) -> _EntryCounter:
+    key = cache_dir.resolve()
+    with _counters_lock:
+        counter = _counters.get(key)
+        if counter is None:
+            counter = _EntryCounter()
+            _counters[key] = counter
+        return counter
+
+
+def build_response_cache_key(
+    *,
+    model_id: str,
+    model_settings: Mapping[str, object],
+    system_prompt: str,
+    user_prompt: str,
+    output_schema: Mapping[str, object],
+    tool_names: Sequence[str] = (),
+    tool_results: Mapping[str, object] | None = None,
+) -> str:
+    """Build a content-addressed cache key for an LLM request.
+
+    Args:
+        model_id: Model identifier.
+        model_settings: Provider model settings sent with the request.
+        system_prompt: Fully composed system prompt.
+        user_prompt: Rendered user prompt.
+        output_schema: JSON schema of the structured output type.
+        tool_names: Names of tools exposed to the model.
+        tool_results: Results of tools executed before the request, keyed by
+            tool name.
+
+    Returns:
+        Hex-encoded SHA-256 digest identifying the request.
+    """
+    material = {
+        "version": CACHE_FORMAT_VERSION,
+        "model_id": model_id,
+        "model_settings": model_settings,
+        "system_prompt": system_prompt,
+        "user_prompt": user_prompt,
+        "output_schema": output_schema,
+        "tools": sorted(tool_names),
+    }
+    if tool_results:
+        material["tool_results"] = tool_results
+    encoded = json.dumps(
+        material, sort_keys=True, separators=(",", ":"), default=str
+    ).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class LlmResponseCache:
+    """Disk cache for structured LLM responses with TTL and LRU eviction."""
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        *,
+        ttl_s: int | None = None,
+        max_entries: int | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the response cache.
+
+        Args:
+            cache_dir: Directory holding cache entries.
+            ttl_s: Optional time-to-live for entries in seconds.
+            max_entries: Optional maximum number of entries to retain.
+            clock: Wall-clock source used for expiry and recency.
+        """
+        self._cache_dir = cache_dir
+        self._ttl_s = ttl_s
+        self._max_entries = max_entries
+        self._clock = clock
+        # Agents each build a cache over the same directory; sharing the
+        # count keeps their evictions consistent
+        self._counter = _counter_for(cache_dir)
+
+    @classmethod
+    def from_config(
+        cls, config: CacheConfig, *, base_dir: Path | None = None
+    ) -> LlmResponseCache | None:
+        """Build a cache from run configuration.
+
+        Args:
+            config: Cache configuration.
+            base_dir: Directory used to resolve a relative ``cache_dir``.
+
+        Returns:
+            LlmResponseCache | None: Cache instance, or None when disabled.
+        """
+        if not config.enabled:
+            return None
+        cache_dir = Path(config.cache_dir or DEFAULT_CACHE_DIR)
+        if not cache_dir.is_absolute() and base_dir is not None:
+            cache_dir = base_dir / cache_dir
+        return cls(
+            cache_dir,
+            ttl_s=config.ttl_s,
+            max_entries=config.max_entries,
+        )
+
+    @property
+    def cache_dir(self) -> Path:
+        """Get the cache directory."""
+        return self._cache_dir
+
+    async def get(self, key: str) -> JsonValue | None:
+        """Load a cached response payload.
+
+        Args:
+            key: Cache key from :func:`build_response_cache_key`.
+
+        Returns:
+            JsonValue | None: Cached payload, or None on miss or expiry.
+        """
+        return await asyncio.to_thread(self.get_sync, key)
+
+    async def put(self, key: str, payload: JsonValue) -> None:
+        """Store a response payload.
+
+        Args:
+            key: Cache key from :func:`build_response_cache_key`.
+            payload: JSON-serializable response payload.
+        """
+        await asyncio.to_thread(self.put_sync, key, payload)
+
+    def get_sync(self, key: str) -> JsonValue | None:
+        """Load a cached response payload synchronously.
+
+        Args:
+            key: Cache key from :func:`build_response_cache_key`.
+
+        Returns:
+            JsonValue | None: Cached payload, or None on miss or expiry.
+        """
+        path = self._entry_path(key)
+        try:
+            raw = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        except OSError as exc:
+            _logger.warning("Failed to read cache entry %s: %s", path, exc)
+            return None
+        try:
+            entry = json.loads(raw)
+        except json.JSONDecodeError:
+            self._remove(path)
+            return None
+        if not isinstance(entry, dict) or entry.get("key") != key:
+            self._remove(path)
+            return None
+        created_at = entry.get("created_at")
+        if self._is_expired(created_at):
+            self._remove(path)
+            return None
+        now = self._clock()
+        with contextlib.suppress(OSError):
+            os.utime(path, (now, now))
+        return entry.get("payload")
+
+    def put_sync(self, key: str, payload: JsonValue) -> None:
+        """Store a response payload synchronously.
+
+        Args:
+            key: Cache key from :func:`build_response_cache_key`.
+            payload: JSON-serializable response payload.
+        """
+        path = self._entry_path(key)
+        now = self._clock()
+        entry = {
+            "version": CACHE_FORMAT_VERSION,
+            "key": key,
+            "created_at": now,
+            "payload": payload,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            existed = path.exists()
+            fd, tmp_name = tempfile.mkstemp(
+                dir=path.parent, prefix=".tmp-", suffix=_ENTRY_SUFFIX
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    json.dump(entry, handle, ensure_ascii=False)
+                os.replace(tmp_name, path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+            os.utime(path, (now, now))
+        except OSError as exc:
+            _logger.warning("Failed to write cache entry %s: %s", path, exc)
+            return
+        if not existed:
+            self._record_insert()
+
+    def clear(self) -> None:
+        """Remove every cache entry."""
+        with self._counter.lock:
+            for path in self._iter_entries():
+                self._remove(path)
+            self._counter.count = 0
+
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+        return sum(1 for _ in self._iter_entries())
+
+    def _entry_path(self, key: str) -> Path:
+        return self._cache_dir / key[:2] / f"{key}{_ENTRY_SUFFIX}"
+
+    def _is_expired(self, created_at: object) -> bool:
+        if not isinstance(created_at, int | float):
+            return True
+        if self._ttl_s is None:
+            return False
+        return self._clock() - created_at > self._ttl_s
+
+    def _iter_entries(self) -> list[Path]:
+        if not self._cache_dir.exists():
+            return []
+        return [
+            path
+            for path in self._cache_dir.glob(f"*/*{_ENTRY_SUFFIX}")
+            if not path.name.startswith(".tmp-")
+        ]
+
+    def _record_insert(self) -> None:
+        if self._max_entries is None:
+            return
+        counter = self._counter
+        with counter.lock:
+            if counter.count is None:
+                counter.count = len(self._iter_entries())
+            else:
+                counter.count += 1
+            if counter.count > self._max_entries:
+                counter.count = self._evict(self._max_entries)
+
+    def _evict(self, max_entries: int) -> int:
+        entries: list[tuple[float, Path]] = []
+        for path in self._iter_entries():
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+        if len(entries) <= max_entries:
+            # Another process already trimmed the directory
+            return len(entries)
+        keep = max(1, int(max_entries * _EVICTION_LOW_WATER))
+        entries.sort(key=operator.itemgetter(0))
+        for _, path in entries[: len(entries) - keep]:
+            self._remove(path)
+        return keep
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            path.unlink(missing_ok=True)
+        except OSError as exc:
+            _logger.warning("Failed to remove cache entry %s: %s", path, exc)
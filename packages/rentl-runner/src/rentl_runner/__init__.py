@@ -0,0 +1 @@
+"""rentl-runner: Pipeline job runner shared by the CLI and API."""
@@ -0,0 +1,1141 @@
+"""Pipeline execution shared by the CLI and long-lived hosts.
+
+This module loads run configuration, builds the run storage and sink bundle,
+wires profile agents into a ``PipelineOrchestrator`` and runs phase plans
+against it. ``rentl run-pipeline`` and the API worker pool both run pipelines
+through these functions, so a run behaves the same wherever it executes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import tomllib
+from collections.abc import Callable, Mapping, Sequence
+from datetime import UTC, datetime
+from functools import partial
+from pathlib import Path
+from typing import NamedTuple, TypeVar, cast
+from uuid import UUID
+
+from dotenv import dotenv_values, load_dotenv
+
+from rentl_agents.wiring import build_agent_pools
+from rentl_core import AgentTelemetryEmitter
+from rentl_core.incremental import IncrementalBaseline
+from rentl_core.migrate import ConfigDict, MigrateError, auto_migrate_file
+from rentl_core.orchestrator import (
+    PipelineOrchestrator,
+    PipelineRunContext,
+    hydrate_run_context,
+)
+from rentl_core.ports.export import ExportResult
+from rentl_core.ports.orchestrator import (
+    FlushableSinkProtocol,
+    LogSinkProtocol,
+    ProgressSinkProtocol,
+)
+from rentl_core.ports.storage import (
+    ArtifactStoreProtocol,
+    ClosableStoreProtocol,
+    LogStoreProtocol,
+    PhaseCheckpointStoreProtocol,
+    RunStateStoreProtocol,
+)
+from rentl_io.export.router import get_export_adapter
+from rentl_io.ingest.router import get_ingest_adapter
+from rentl_io.storage.filesystem import (
+    FileSystemArtifactStore,
+    FileSystemLogStore,
+    FileSystemRunStateStore,
+)
+from rentl_io.storage.log_sink import CompositeLogSink, build_log_sink
+from rentl_io.storage.progress_sink import (
+    BufferedProgressSink,
+    CompositeProgressSink,
+)
+from rentl_io.storage.sqlite import (
+    SqliteArtifactStore,
+    SqliteLogStore,
+    SqliteRunStateStore,
+)
+from rentl_llm.model_registry import ModelRegistry
+from rentl_llm.provider_factory import PreflightEndpoint, assert_preflight
+from rentl_schemas.base import BaseSchema
+from rentl_schemas.config import (
+    LanguageConfig,
+    LoggingConfig,
+    LogSinkConfig,
+    ModelSettings,
+    RunConfig,
+)
+from rentl_schemas.io import ExportTarget, IngestSource, SourceLine
+from rentl_schemas.phases import (
+    ContextPhaseOutput,
+    EditPhaseOutput,
+    PretranslationPhaseOutput,
+    QaPhaseOutput,
+    TranslatePhaseOutput,
+)
+from rentl_schemas.pipeline import PhaseRunRecord, RunState
+from rentl_schemas.primitives import (
+    ArtifactId,
+    FileFormat,
+    JsonValue,
+    LanguageCode,
+    LogSinkType,
+    PhaseName,
+    PhaseStatus,
+    RunId,
+)
+from rentl_schemas.redaction import (
+    DEFAULT_PATTERNS,
+    RedactionConfig,
+    Redactor,
+    build_redactor,
+)
+from rentl_schemas.storage import (
+    ArtifactMetadata,
+    PhaseCheckpointRecord,
+    StorageBackend,
+)
+from rentl_schemas.validation import validate_run_config
+
+type ConfigMigrator = Callable[[Path, dict[str, JsonValue]], dict[str, JsonValue]]
+
+_LLM_PHASES = {
+    PhaseName.CONTEXT,
+    PhaseName.PRETRANSLATION,
+    PhaseName.TRANSLATE,
+    PhaseName.QA,
+    PhaseName.EDIT,
+}
+
+
+class PipelineConfigError(Exception):
+    """Raised when a run configuration cannot be loaded or used."""
+
+
+class StorageBundle(NamedTuple):
+    """Run storage backends and the sinks a run reports to."""
+
+    run_state_store: RunStateStoreProtocol
+    artifact_store: ArtifactStoreProtocol
+    log_store: LogStoreProtocol
+    log_sink: LogSinkProtocol
+    progress_sink: ProgressSinkProtocol
+    progress_path: Path
+    redactor: Redactor | None
+
+
+_ModelT = TypeVar("_ModelT", bound=BaseSchema)
+
+
+class RedactingArtifactStore:
+    """Artifact store wrapper that automatically injects redactor."""
+
+    def __init__(
+        self,
+        delegate: FileSystemArtifactStore | SqliteArtifactStore,
+        redactor: Redactor | None,
+    ) -> None:
+        """Initialize the wrapper.
+
+        Args:
+            delegate: Underlying artifact store
+            redactor: Redactor to inject into write operations
+        """
+        self._delegate = delegate
+        self._redactor = redactor
+
+    async def write_artifact_json(
+        self, metadata: ArtifactMetadata, payload: BaseSchema
+    ) -> ArtifactMetadata:
+        """Write a JSON artifact with automatic redaction.
+
+        Returns:
+            ArtifactMetadata: Stored artifact metadata.
+        """
+        return await self._delegate.write_artifact_json(
+            metadata, payload, redactor=self._redactor
+        )
+
+    async def write_artifact_jsonl(
+        self, metadata: ArtifactMetadata, payload: Sequence[BaseSchema]
+    ) -> ArtifactMetadata:
+        """Write a JSONL artifact with automatic redaction.
+
+        Returns:
+            ArtifactMetadata: Stored artifact metadata.
+        """
+        return await self._delegate.write_artifact_jsonl(
+            metadata, payload, redactor=self._redactor
+        )
+
+    async def list_artifacts(self, run_id: RunId) -> list[ArtifactMetadata]:
+        """List artifacts for a run.
+
+        Returns:
+            list[ArtifactMetadata]: List of artifacts for the run.
+        """
+        return await self._delegate.list_artifacts(run_id)
+
+    async def load_artifact_json(
+        self, artifact_id: ArtifactId, model: type[_ModelT]
+    ) -> _ModelT:
+        """Load a JSON artifact.
+
+        Returns:
+            _ModelT: Parsed artifact model.
+        """
+        return await self._delegate.load_artifact_json(artifact_id, model)
+
+    async def load_artifact_jsonl(
+        self, artifact_id: ArtifactId, model: type[_ModelT]
+    ) -> list[_ModelT]:
+        """Load a JSONL artifact.
+
+        Returns:
+            list[_ModelT]: List of parsed artifact models.
+        """
+        return await self._delegate.load_artifact_jsonl(artifact_id, model)
+
+    async def append_checkpoint(self, record: PhaseCheckpointRecord) -> None:
+        """Append a phase checkpoint with automatic redaction."""
+        await self._delegate.append_checkpoint(record, redactor=self._redactor)
+
+    async def load_checkpoints(
+        self,
+        run_id: RunId,
+        phase: PhaseName,
+        target_language: LanguageCode | None = None,
+    ) -> list[PhaseCheckpointRecord]:
+        """Load phase checkpoints.
+
+        Returns:
+            list[PhaseCheckpointRecord]: Checkpoints recorded for the phase.
+        """
+        return await self._delegate.load_checkpoints(run_id, phase, target_language)
+
+    async def clear_checkpoints(
+        self,
+        run_id: RunId,
+        phase: PhaseName,
+        target_language: LanguageCode | None = None,
+    ) -> None:
+        """Remove phase checkpoints."""
+        await self._delegate.clear_checkpoints(run_id, phase, target_language)
+
+    def close(self) -> None:
+        """Close the underlying store's database connections, if any."""
+        if isinstance(self._delegate, ClosableStoreProtocol):
+            self._delegate.close()
+
+
+def load_run_config(
+    config_path: Path,
+    *,
+    migrate: ConfigMigrator | None = None,
+    workspace_root: Path | None = None,
+) -> RunConfig:
+    """Load a run configuration with paths resolved against its workspace.
+
+    Outdated configs are migrated in place, and project and agent paths are
+    resolved to absolute paths that must stay within the workspace. ``.env``
+    files are not loaded here; see ``load_dotenv_files`` and
+    ``read_dotenv_files``.
+
+    Args:
+        config_path: Path to the TOML run configuration.
+        migrate: Optional hook that migrates the raw payload; defaults to a
+            silent in-place auto-migration.
+        workspace_root: Optional directory the configured workspace must lie
+            within, for hosts that confine the files a run may touch.
+
+    Returns:
+        RunConfig: Validated configuration with resolved paths.
+
+    Raises:
+        PipelineConfigError: If the config is missing, unreadable or not a
+            TOML table, or its workspace lies outside ``workspace_root``.
+    """
+    if not config_path.exists():
+        raise PipelineConfigError(f"Config not found: {config_path}")
+    try:
+        with open(config_path, "rb") as handle:
+            payload: dict[str, JsonValue] = tomllib.load(handle)
+    except (OSError, tomllib.TOMLDecodeError) as exc:
+        raise PipelineConfigError(f"Failed to read config: {exc}") from exc
+    if not isinstance(payload, dict):
+        raise PipelineConfigError("Config root must be a TOML table")
+    payload = (migrate or _auto_migrate)(config_path, payload)
+    config = validate_run_config(payload)
+    config = _resolve_project_paths(config, config_path)
+    if workspace_root is not None:
+        # Every other project path is confined to the workspace directory
+        resolve_workspace_path(Path(config.project.paths.workspace_dir), workspace_root)
+    return _resolve_agent_paths(config)
+
+
+def load_dotenv_files(config_path: Path) -> None:
+    """Load .env and .env.local files from config directory.
+
+    .env.local takes precedence over .env (loaded second with override=False).
+
+    Args:
+        config_path: Path to the run configuration.
+    """
+    config_dir = config_path.parent
+    env_path = config_dir / ".env"
+    env_local_path = config_dir / ".env.local"
+
+    if env_path.exists():
+        load_dotenv(env_path, override=False)
+    if env_local_path.exists():
+        load_dotenv(env_local_path, override=False)
+
+
+def read_dotenv_files(config_path: Path) -> dict[str, str]:
+    """Resolve a run's environment without changing ``os.environ``.
+
+    Long-lived hosts run many jobs in one process, so each job reads its
+    ``.env`` files into its own mapping. Precedence matches
+    ``load_dotenv_files``: process variables, then .env, then .env.local.
+
+    Args:
+        config_path: Path to the run configuration.
+
+    Returns:
+        dict[str, str]: Environment variables visible to the run.
+    """
+    config_dir = config_path.parent
+    environ: dict[str, str] = {}
+    for env_path in (config_dir / ".env.local", config_dir / ".env"):
+        if env_path.exists():
+            environ.update(
+                (name, value)
+                for name, value in dotenv_values(env_path).items()
+                if value is not None
+            )
+    environ.update(os.environ)
+    return environ
+
+
+def resolve_workspace_path(path: Path, base_dir: Path) -> Path:
+    """Resolve a path against a workspace directory.
+
+    Args:
+        path: Absolute path or path relative to ``base_dir``.
+        base_dir: Workspace directory the path must stay within.
+
+    Returns:
+        Path: Resolved absolute path.
+
+    Raises:
+        PipelineConfigError: If the path escapes the workspace.
+    """
+    base_dir = base_dir.resolve()
+    resolved = path if path.is_absolute() else base_dir / path
+    resolved = resolved.resolve()
+    try:
+        resolved.relative_to(base_dir)
+    except ValueError as exc:
+        raise PipelineConfigError(
+            f"Path must stay within workspace: {resolved}"
+        ) from exc
+    return resolved
+
+
+def resolve_enabled_phases(config: RunConfig) -> list[PhaseName]:
+    """Return the enabled pipeline phases in configured order.
+
+    Args:
+        config: Run configuration.
+
+    Returns:
+        list[PhaseName]: Enabled phases.
+    """
+    return [PhaseName(phase.phase) for phase in config.pipeline.phases if phase.enabled]
+
+
+def resolve_target_languages(
+    config: RunConfig, target_languages: list[str] | None
+) -> list[LanguageCode]:
+    """Validate a target language override against the configuration.
+
+    Args:
+        config: Run configuration.
+        target_languages: Optional subset of target languages.
+
+    Returns:
+        list[LanguageCode]: Requested languages, or all configured targets.
+    """
+    if target_languages is None:
+        return config.project.languages.target_languages
+    validated = LanguageConfig(
+        source_language=config.project.languages.source_language,
+        target_languages=target_languages,
+    )
+    return validated.target_languages
+
+
+def build_storage_bundle(
+    config: RunConfig,
+    run_id: RunId,
+    progress_sink: ProgressSinkProtocol | None = None,
+    *,
+    allow_console_logs: bool = True,
+    environ: Mapping[str, str] | None = None,
+) -> StorageBundle:
+    """Build the storage backends and sinks for a run.
+
+    Args:
+        config: Run configuration with resolved paths.
+        run_id: Run identifier.
+        progress_sink: Optional progress sink replacing the JSONL file sink.
+        allow_console_logs: Whether configured console log sinks are kept.
+        environ: Environment holding API keys to redact; defaults to
+            ``os.environ``.
+
+    Returns:
+        StorageBundle: Stores and sinks for the run.
+    """
+    log_store = build_log_store(config)
+    progress_path = build_progress_path(config.project.paths.logs_dir, run_id)
+    logging_config = _build_logging_config(config, allow_console_logs)
+    redactor = build_config_redactor(config, environ)
+    log_sink = build_log_sink(
+        logging_config, log_store, redactor=redactor, buffered=True
+    )
+    file_progress_sink = BufferedProgressSink(str(progress_path))
+    raw_artifact_store = build_artifact_store(config)
+    wrapped_artifact_store = RedactingArtifactStore(raw_artifact_store, redactor)
+    return StorageBundle(
+        run_state_store=build_run_state_store(config),
+        artifact_store=wrapped_artifact_store,
+        log_store=log_store,
+        log_sink=log_sink,
+        progress_sink=progress_sink or file_progress_sink,
+        progress_path=progress_path,
+        redactor=redactor,
+    )
+
+
+async def close_sinks(bundle: StorageBundle) -> None:
+    """Flush and close the bundle's buffered sinks.
+
+    Args:
+        bundle: Storage bundle whose sinks are closed.
+    """
+    for sink in (bundle.log_sink, bundle.progress_sink):
+        if isinstance(sink, FlushableSinkProtocol):
+            await sink.aclose()
+
+
+def close_stores(bundle: StorageBundle) -> None:
+    """Close the database connections held by the bundle's stores.
+
+    Close the sinks first; buffered log entries are written to the log store.
+
+    Args:
+        bundle: Storage bundle whose stores are closed.
+    """
+    for store in (bundle.run_state_store, bundle.artifact_store, bundle.log_store):
+        if isinstance(store, ClosableStoreProtocol):
+            store.close()
+
+
+def build_config_redactor(
+    config: RunConfig, environ: Mapping[str, str] | None = None
+) -> Redactor:
+    """Build a redactor from config and resolved env var values.
+
+    Args:
+        config: Runtime configuration with endpoint definitions
+        environ: Environment holding the API keys; defaults to ``os.environ``
+
+    Returns:
+        Redactor: Configured redactor instance
+    """
+    # Collect all api_key_env names from config
+    env_var_names: list[str] = []
+
+    # Legacy single endpoint
+    if config.endpoint is not None:
+        env_var_names.append(config.endpoint.api_key_env)
+
+    # Multi-endpoint configuration
+    if config.endpoints is not None:
+        for endpoint in config.endpoints.endpoints:
+            env_var_names.append(endpoint.api_key_env)
+
+    # Build redaction config with default patterns
+    redaction_config = RedactionConfig(
+        patterns=DEFAULT_PATTERNS, env_var_names=env_var_names
+    )
+
+    # Collect actual env var values
+    if environ is None:
+        environ = os.environ
+    env_values = {name: environ[name] for name in env_var_names if name in environ}
+
+    return build_redactor(redaction_config, env_values)
+
+
+def storage_database_path(config: RunConfig) -> str | None:
+    """Return the SQLite database path when the SQLite backend is configured.
+
+    Args:
+        config: Run configuration with resolved paths.
+
+    Returns:
+        str | None: Database path, or None for filesystem storage.
+    """
+    storage = config.storage
+    if storage.backend != StorageBackend.SQLITE:
+        return None
+    workspace_dir = Path(config.project.paths.workspace_dir)
+    database_path = Path(storage.database_path or ".rentl/rentl.db")
+    return str(resolve_workspace_path(database_path, workspace_dir))
+
+
+def build_run_state_store(config: RunConfig) -> RunStateStoreProtocol:
+    """Build the configured run state store.
+
+    Args:
+        config: Run configuration with resolved paths.
+
+    Returns:
+        RunStateStoreProtocol: Run state store.
+    """
+    database_path = storage_database_path(config)
+    if database_path is not None:
+        return SqliteRunStateStore(database_path=database_path)
+    return FileSystemRunStateStore(base_dir=str(_storage_dir(config) / "run_state"))
+
+
+def build_artifact_store(
+    config: RunConfig,
+) -> FileSystemArtifactStore | SqliteArtifactStore:
+    """Build the configured artifact store.
+
+    Args:
+        config: Run configuration with resolved paths.
+
+    Returns:
+        FileSystemArtifactStore | SqliteArtifactStore: Artifact store.
+    """
+    artifact_dir = str(_storage_dir(config) / "artifacts")
+    database_path = storage_database_path(config)
+    if database_path is not None:
+        return SqliteArtifactStore(base_dir=artifact_dir, database_path=database_path)
+    return FileSystemArtifactStore(base_dir=artifact_dir)
+
+
+def build_log_store(config: RunConfig) -> LogStoreProtocol:
+    """Build the configured log store.
+
+    Args:
+        config: Run configuration with resolved paths.
+
+    Returns:
+        LogStoreProtocol: Log store.
+    """
+    database_path = storage_database_path(config)
+    if database_path is not None:
+        return SqliteLogStore(database_path=database_path)
+    return FileSystemLogStore(logs_dir=config.project.paths.logs_dir)
+
+
+def build_progress_path(logs_dir: str, run_id: RunId) -> Path:
+    """Return the progress JSONL path for a run.
+
+    Args:
+        logs_dir: Logs directory.
+        run_id: Run identifier.
+
+    Returns:
+        Path: Progress JSONL path.
+    """
+    return Path(logs_dir) / "progress" / f"{run_id}.jsonl"
+
+
+async def load_run_state(bundle: StorageBundle, run_id: RunId) -> RunState | None:
+    """Load the latest stored state of a run.
+
+    Args:
+        bundle: Storage bundle holding the run state store.
+        run_id: Run identifier.
+
+    Returns:
+        RunState | None: Stored run state, or None for unknown runs.
+    """
+    record = await bundle.run_state_store.load_run_state(run_id)
+    if record is None:
+        return None
+    return record.state
+
+
+async def load_or_create_run_context(
+    orchestrator: PipelineOrchestrator,
+    bundle: StorageBundle,
+    run_id: RunId,
+    config: RunConfig,
+) -> PipelineRunContext:
+    """Resume a stored run with its phase outputs, or create a new one.
+
+    Args:
+        orchestrator: Orchestrator that creates new runs.
+        bundle: Storage bundle holding run state and artifacts.
+        run_id: Run identifier.
+        config: Run configuration.
+
+    Returns:
+        PipelineRunContext: Run context ready for execution.
+    """
+    record = await bundle.run_state_store.load_run_state(run_id)
+    if record is None:
+        return orchestrator.create_run(run_id=run_id, config=config)
+    run = hydrate_run_context(config, record.state)
+    await _hydrate_run_outputs(bundle, run, record.state)
+    return run
+
+
+async def run_phase_plan(
+    config: RunConfig,
+    bundle: StorageBundle,
+    *,
+    run_id: RunId,
+    phases: list[PhaseName],
+    target_languages: list[LanguageCode] | None,
+    input_path: Path | None = None,
+    output_path: Path | None = None,
+    baseline_run_id: RunId | None = None,
+    model_registry: ModelRegistry | None = None,
+    environ: Mapping[str, str] | None = None,
+) -> PipelineRunContext:
+    """Run a phase plan against run storage.
+
+    API keys and endpoints are checked before any phase runs. The bundle's
+    buffered sinks are closed on success and failure, so the tail of the
+    progress JSONL is always written.
+
+    Args:
+        config: Run configuration with resolved paths.
+        bundle: Storage bundle for the run.
+        run_id: Run identifier; an existing run is resumed.
+        phases: Phases to run, in order.
+        target_languages: Target languages, or None for all configured.
+        input_path: Optional ingest input overriding the configured one.
+        output_path: Optional export path for a single target language.
+        baseline_run_id: Optional earlier run to reuse unchanged outputs from.
+        model_registry: Optional caller-owned model registry; a registry
+            scoped to this run is used otherwise.
+        environ: Environment API keys are read from; defaults to
+            ``os.environ``.
+
+    Returns:
+        PipelineRunContext: Run context after the plan completed.
+    """
+    if environ is None:
+        environ = os.environ
+    try:
+        _ensure_api_keys(config, phases, environ)
+        preflight_endpoints = _build_preflight_endpoints(config, phases, environ)
+        if preflight_endpoints:
+            await assert_preflight(preflight_endpoints)
+        # A caller-owned registry keeps HTTP pools warm across runs
+        registry_scope = (
+            ModelRegistry()
+            if model_registry is None
+            else contextlib.nullcontext(model_registry)
+        )
+        async with registry_scope as registry:
+            orchestrator = await asyncio.to_thread(
+                _build_orchestrator, config, bundle, phases, registry, environ
+            )
+            run = await load_or_create_run_context(orchestrator, bundle, run_id, config)
+            if baseline_run_id is not None:
+                run.baseline = await _load_incremental_baseline(
+                    bundle, config, run.run_id, baseline_run_id
+                )
+            ingest_source = _build_ingest_source(config, phases, input_path)
+            export_targets = await asyncio.to_thread(
+                _build_export_targets,
+                config,
+                phases,
+                run.run_id,
+                target_languages,
+                output_path,
+            )
+            await orchestrator.run_plan(
+                run,
+                phases=phases,
+                target_languages=target_languages,
+                ingest_source=ingest_source,
+                export_targets=export_targets,
+            )
+    finally:
+        await close_sinks(bundle)
+    return run
+
+
+async def run_pipeline_job(
+    config_path: Path,
+    *,
+    run_id: RunId,
+    target_languages: list[str] | None = None,
+    input_path: Path | None = None,
+    model_registry: ModelRegistry | None = None,
+    progress_sink: ProgressSinkProtocol | None = None,
+    log_sink: LogSinkProtocol | None = None,
+    workspace_root: Path | None = None,
+) -> PipelineRunContext:
+    """Run the full pipeline in-process for a long-lived host.
+
+    This is ``rentl run-pipeline`` without terminal rendering or the run
+    report, for services such as the API worker pool that run many jobs in
+    one process. Passing a shared ``model_registry`` keeps provider
+    connections warm between jobs; extra sinks receive the run's events
+    alongside storage. The run's store connections are closed when it ends.
+    Each job reads its ``.env`` files into its own environment, so keys from
+    one job never reach another through ``os.environ``.
+
+    Args:
+        config_path: Path to the run configuration.
+        run_id: Run identifier; an existing run is resumed.
+        target_languages: Optional subset of configured target languages.
+        input_path: Optional ingest input overriding the configured one.
+        model_registry: Optional caller-owned model registry.
+        progress_sink: Optional extra sink for progress updates.
+        log_sink: Optional extra sink for log entries.
+        workspace_root: Optional directory the configured workspace must lie
+            within.
+
+    Returns:
+        PipelineRunContext: Run context after the pipeline completed.
+
+    Raises:
+        ValueError: If no phases are enabled.
+    """
+    config = await asyncio.to_thread(
+        partial(load_run_config, config_path, workspace_root=workspace_root)
+    )
+    environ = await asyncio.to_thread(read_dotenv_files, config_path)
+    bundle = await asyncio.to_thread(
+        partial(
+            build_storage_bundle,
+            config,
+            run_id,
+            allow_console_logs=False,
+            environ=environ,
+        )
+    )
+    if progress_sink is not None:
+        bundle = bundle._replace(
+            progress_sink=CompositeProgressSink([bundle.progress_sink, progress_sink])
+        )
+    if log_sink is not None:
+        bundle = bundle._replace(log_sink=CompositeLogSink([bundle.log_sink, log_sink]))
+    try:
+        phases = resolve_enabled_phases(config)
+        if not phases:
+            raise ValueError("No enabled phases configured")
+        return await run_phase_plan(
+            config,
+            bundle,
+            run_id=run_id,
+            phases=phases,
+            target_languages=resolve_target_languages(config, target_languages),
+            input_path=input_path,
+            model_registry=model_registry,
+            environ=environ,
+        )
+    finally:
+        close_stores(bundle)
+
+
+def _auto_migrate(
+    config_path: Path, payload: dict[str, JsonValue]
+) -> dict[str, JsonValue]:
+    try:
+        result = auto_migrate_file(config_path, cast(ConfigDict, payload))
+    except MigrateError as exc:
+        raise PipelineConfigError(str(exc)) from exc
+    if not result.migrated:
+        return payload
+    return cast(dict[str, JsonValue], result.config_dict)
+
+
+def _resolve_project_paths(config: RunConfig, config_path: Path) -> RunConfig:
+    config_dir = config_path.parent
+    workspace_dir = Path(config.project.paths.workspace_dir)
+    if not workspace_dir.is_absolute():
+        workspace_dir = (config_dir / workspace_dir).resolve()
+    input_path = resolve_workspace_path(
+        Path(config.project.paths.input_path), workspace_dir
+    )
+    output_dir = resolve_workspace_path(
+        Path(config.project.paths.output_dir), workspace_dir
+    )
+    logs_dir = resolve_workspace_path(
+        Path(config.project.paths.logs_dir), workspace_dir
+    )
+    updated_paths = config.project.paths.model_copy(
+        update={
+            "workspace_dir": str(workspace_dir),
+            "input_path": str(input_path),
+            "output_dir": str(output_dir),
+            "logs_dir": str(logs_dir),
+        }
+    )
+    updated_project = config.project.model_copy(update={"paths": updated_paths})
+    return config.model_copy(update={"project": updated_project})
+
+
+def _resolve_agent_paths(config: RunConfig) -> RunConfig:
+    if config.agents is None:
+        return config
+    workspace_dir = Path(config.project.paths.workspace_dir)
+    agents_config = config.agents
+    updated_agents = agents_config.model_copy(
+        update={
+            "prompts_dir": str(
+                resolve_workspace_path(Path(agents_config.prompts_dir), workspace_dir)
+            ),
+            "agents_dir": str(
+                resolve_workspace_path(Path(agents_config.agents_dir), workspace_dir)
+            ),
+        }
+    )
+    return config.model_copy(update={"agents": updated_agents})
+
+
+def _resolve_phase_model(config: RunConfig, phase: PhaseName) -> ModelSettings | None:
+    for entry in config.pipeline.phases:
+        if entry.phase == phase:
+            if entry.model is not None:
+                return entry.model
+            return config.pipeline.default_model
+    return config.pipeline.default_model
+
+
+def _ensure_api_keys(
+    config: RunConfig, phases: list[PhaseName], environ: Mapping[str, str]
+) -> None:
+    if not any(phase in _LLM_PHASES for phase in phases):
+        return
+    if config.endpoints is None:
+        endpoint = config.endpoint
+        if endpoint is None:
+            raise PipelineConfigError("Missing endpoint configuration")
+        env_var = endpoint.api_key_env
+        if env_var not in environ:
+            raise PipelineConfigError(
+                f"Missing API key environment variable: {env_var}"
+            )
+        return
+    lookup = {
+        endpoint.provider_name: endpoint for endpoint in config.endpoints.endpoints
+    }
+    used_refs: set[str] = set()
+    for phase in phases:
+        if phase not in _LLM_PHASES:
+            continue
+        model = _resolve_phase_model(config, phase)
+        endpoint_ref = config.resolve_endpoint_ref(model=model)
+        if endpoint_ref is None:
+            continue
+        used_refs.add(endpoint_ref)
+    for endpoint_ref in sorted(used_refs):
+        endpoint = lookup.get(endpoint_ref)
+        if endpoint is None:
+            raise PipelineConfigError(f"Unknown endpoint reference: {endpoint_ref}")
+        env_var = endpoint.api_key_env
+        if env_var not in environ:
+            raise PipelineConfigError(
+                "Missing API key environment variable: "
+                f"{env_var} (endpoint: {endpoint_ref})"
+            )
+
+
+def _build_preflight_endpoints(
+    config: RunConfig, phases: list[PhaseName], environ: Mapping[str, str]
+) -> list[PreflightEndpoint]:
+    # Deduplicated by (base_url, model_id, endpoint_ref) so endpoints sharing
+    # URL/model but using different refs or routing are each validated
+    endpoints: list[PreflightEndpoint] = []
+    seen: set[tuple[str, str, str | None]] = set()
+
+    for phase in phases:
+        if phase not in _LLM_PHASES:
+            continue
+        model = _resolve_phase_model(config, phase)
+        if model is None:
+            continue
+        endpoint_ref = config.resolve_endpoint_ref(model=model)
+
+        if config.endpoints is not None and endpoint_ref is not None:
+            lookup = {ep.provider_name: ep for ep in config.endpoints.endpoints}
+            ep_config = lookup.get(endpoint_ref)
+            if ep_config is None:
+                continue
+            base_url = ep_config.base_url
+            api_key_env = ep_config.api_key_env
+            openrouter_provider = ep_config.openrouter_provider
+            strict_tools = ep_config.strict_tools
+        elif config.endpoint is not None:
+            base_url = config.endpoint.base_url
+            api_key_env = config.endpoint.api_key_env
+            openrouter_provider = config.endpoint.openrouter_provider
+            strict_tools = config.endpoint.strict_tools
+        else:
+            continue
+
+        key = (base_url, model.model_id, endpoint_ref)
+        if key in seen:
+            continue
+        seen.add(key)
+
+        api_key = environ.get(api_key_env, "")
+
+        endpoints.append(
+            PreflightEndpoint(
+                base_url=base_url,
+                api_key=api_key,
+                model_id=model.model_id,
+                phase_label=phase,
+                endpoint_ref=endpoint_ref,
+                openrouter_provider=openrouter_provider,
+                strict_tools=strict_tools,
+            )
+        )
+
+    return endpoints
+
+
+def _storage_dir(config: RunConfig) -> Path:
+    return Path(config.project.paths.workspace_dir) / ".rentl"
+
+
+def _build_logging_config(config: RunConfig, allow_console_logs: bool) -> LoggingConfig:
+    if allow_console_logs:
+        return config.logging
+    sinks = [sink for sink in config.logging.sinks if sink.type != LogSinkType.CONSOLE]
+    if not sinks:
+        sinks = [LogSinkConfig(type=LogSinkType.FILE)]
+    return LoggingConfig(sinks=sinks)
+
+
+def _build_orchestrator(
+    config: RunConfig,
+    bundle: StorageBundle,
+    phases: list[PhaseName],
+    model_registry: ModelRegistry | None = None,
+    environ: Mapping[str, str] | None = None,
+) -> PipelineOrchestrator:
+    agent_pools = None
+    if any(phase in _LLM_PHASES for phase in phases):
+        telemetry_emitter = AgentTelemetryEmitter(
+            progress_sink=bundle.progress_sink,
+            log_sink=bundle.log_sink,
+            clock=_now_timestamp,
+        )
+        try:
+            agent_pools = build_agent_pools(
+                config=config,
+                telemetry_emitter=telemetry_emitter,
+                phases=phases,
+                model_registry=model_registry,
+                environ=environ,
+            )
+        except ValueError as exc:
+            raise PipelineConfigError(str(exc)) from exc
+    return PipelineOrchestrator(
+        ingest_adapter=get_ingest_adapter(config.project.formats.input_format),
+        export_adapter=get_export_adapter(config.project.formats.output_format),
+        context_agents=agent_pools.context_agents if agent_pools else None,
+        pretranslation_agents=agent_pools.pretranslation_agents
+        if agent_pools
+        else None,
+        translate_agents=agent_pools.translate_agents if agent_pools else None,
+        qa_agents=agent_pools.qa_agents if agent_pools else None,
+        edit_agents=agent_pools.edit_agents if agent_pools else None,
+        log_sink=bundle.log_sink,
+        progress_sink=bundle.progress_sink,
+        run_state_store=bundle.run_state_store,
+        artifact_store=bundle.artifact_store,
+        checkpoint_store=bundle.artifact_store
+        if isinstance(bundle.artifact_store, PhaseCheckpointStoreProtocol)
+        else None,
+    )
+
+
+def _latest_phase_records(
+    state: RunState,
+) -> dict[tuple[PhaseName, LanguageCode | None], PhaseRunRecord]:
+    latest: dict[tuple[PhaseName, LanguageCode | None], PhaseRunRecord] = {}
+    for record in state.phase_history or []:
+        if record.status != PhaseStatus.COMPLETED:
+            continue
+        if record.stale:
+            continue
+        key = (PhaseName(record.phase), record.target_language)
+        existing = latest.get(key)
+        if existing is None or record.revision > existing.revision:
+            latest[key] = record
+    return latest
+
+
+async def _load_single_artifact[ModelT: BaseSchema](
+    store: ArtifactStoreProtocol,
+    artifact_id: UUID,
+    model: type[ModelT],
+) -> ModelT | None:
+    items = await store.load_artifact_jsonl(artifact_id, model)
+    if not items:
+        return None
+    return items[0]
+
+
+async def _hydrate_run_outputs(
+    bundle: StorageBundle,
+    run: PipelineRunContext,
+    state: RunState,
+) -> None:
+    latest_records = _latest_phase_records(state)
+    if not latest_records:
+        return
+    store = bundle.artifact_store
+
+    for (phase, target_language), record in latest_records.items():
+        if not record.artifact_ids:
+            continue
+        artifact_id = record.artifact_ids[-1]
+        match phase:
+            case PhaseName.INGEST:
+                if run.source_lines:
+                    continue
+                run.source_lines = await store.load_artifact_jsonl(
+                    artifact_id, SourceLine
+                )
+            case PhaseName.CONTEXT:
+                if run.context_output is not None:
+                    continue
+                payload = await _load_single_artifact(
+                    store, artifact_id, ContextPhaseOutput
+                )
+                if payload is not None:
+                    run.context_output = payload
+            case PhaseName.PRETRANSLATION:
+                if run.pretranslation_output is not None:
+                    continue
+                payload = await _load_single_artifact(
+                    store, artifact_id, PretranslationPhaseOutput
+                )
+                if payload is not None:
+                    run.pretranslation_output = payload
+            case PhaseName.TRANSLATE if target_language is not None:
+                if target_language in run.translate_outputs:
+                    continue
+                payload = await _load_single_artifact(
+                    store, artifact_id, TranslatePhaseOutput
+                )
+                if payload is not None:
+                    run.translate_outputs[target_language] = payload
+            case PhaseName.QA if target_language is not None:
+                if target_language in run.qa_outputs:
+                    continue
+                payload = await _load_single_artifact(store, artifact_id, QaPhaseOutput)
+                if payload is not None:
+                    run.qa_outputs[target_language] = payload
+            case PhaseName.EDIT if target_language is not None:
+                if target_language in run.edit_outputs:
+                    continue
+                payload = await _load_single_artifact(
+                    store, artifact_id, EditPhaseOutput
+                )
+                if payload is not None:
+                    run.edit_outputs[target_language] = payload
+            case PhaseName.EXPORT if target_language is not None:
+                if target_language in run.export_results:
+                    continue
+                payload = await _load_single_artifact(store, artifact_id, ExportResult)
+                if payload is not None:
+                    run.export_results[target_language] = payload
+
+
+async def _load_incremental_baseline(
+    bundle: StorageBundle,
+    config: RunConfig,
+    run_id: RunId,
+    baseline_run_id: RunId,
+) -> IncrementalBaseline:
+    if baseline_run_id == run_id:
+        raise ValueError("--incremental-from must reference a different run")
+    state = await load_run_state(bundle, baseline_run_id)
+    if state is None:
+        raise ValueError(f"Baseline run not found: {baseline_run_id}")
+    baseline_run = hydrate_run_context(config, state)
+    await _hydrate_run_outputs(bundle, baseline_run, state)
+    return IncrementalBaseline.from_run(baseline_run)
+
+
+def _build_ingest_source(
+    config: RunConfig,
+    phases: list[PhaseName],
+    input_path: Path | None,
+) -> IngestSource | None:
+    if PhaseName.INGEST not in phases:
+        if input_path is not None:
+            raise ValueError("input_path is only valid when running ingest")
+        return None
+    workspace_dir = Path(config.project.paths.workspace_dir)
+    resolved = input_path or Path(config.project.paths.input_path)
+    if input_path is not None:
+        resolved = resolve_workspace_path(resolved, workspace_dir)
+    return IngestSource(
+        input_path=str(resolved),
+        format=FileFormat(config.project.formats.input_format),
+    )
+
+
+def _build_export_targets(
+    config: RunConfig,
+    phases: list[PhaseName],
+    run_id: RunId,
+    target_languages: list[LanguageCode] | None,
+    output_path: Path | None,
+) -> dict[LanguageCode, ExportTarget] | None:
+    if PhaseName.EXPORT not in phases:
+        if output_path is not None:
+            raise ValueError("output_path is only valid when running export")
+        return None
+    languages = target_languages or config.project.languages.target_languages
+    if not languages:
+        raise ValueError("No target languages configured")
+    if output_path is not None and len(languages) > 1:
+        raise ValueError("output_path requires a single target language")
+    output_format = FileFormat(config.project.formats.output_format)
+    output_dir = Path(config.project.paths.output_dir)
+    run_dir = output_dir / f"run-{run_id}"
+    run_dir.mkdir(parents=True, exist_ok=True)
+    resolved_override: Path | None = None
+    if output_path is not None:
+        resolved_override = resolve_workspace_path(
+            output_path, Path(config.project.paths.workspace_dir)
+        )
+    targets: dict[LanguageCode, ExportTarget] = {}
+    for language in languages:
+        path = resolved_override
+        if path is None:
+            path = run_dir / f"{language}.{output_format.value}"
+        target = ExportTarget(output_path=str(path), format=output_format)
+        targets[language] = target
+    return targets
+
+
+def _now_timestamp() -> str:
+    timestamp = datetime.now(UTC).isoformat()
+    return timestamp.replace("+00:00", "Z")
@@ -39,6 +39,7 @@ from rentl_schemas.config import (
     ProjectPaths,
     RetryConfig,
     RunConfig,
+    StorageConfig,
 )
 from rentl_schemas.events import (
     AgentEvent,
@@ -191,6 +192,7 @@ from rentl_schemas.storage import (
     ArtifactMetadata,
     ArtifactRole,
     LogFileReference,
+    PhaseCheckpointRecord,
     RunIndexRecord,
     RunStateRecord,
     StorageBackend,
@@ -318,6 +320,7 @@ __all__ = [
     "OpenRouterQuantization",
     "OutputValidationDiagnostic",
     "PhaseArtifacts",
+    "PhaseCheckpointRecord",
     "PhaseConfig",
     "PhaseDependency",
     "PhaseEventData",
@@ -387,6 +390,7 @@ __all__ = [
     "SegmentedUsageTotals",
     "SourceLine",
     "StorageBackend",
+    "StorageConfig",
     "StorageReference",
     "TermCandidate",
     "Timestamp",
@@ -130,6 +130,13 @@ class AgentPromptConfig(BaseSchema):
     user_template: AgentPromptContent = Field(
         ..., description="User prompt template with {{variable}} placeholders"
     )
+    static_context: AgentPromptContent | None = Field(
+        None,
+        description=(
+            "Chunk-independent user content (style guide, glossary) sent ahead "
+            "of the user prompt so every chunk shares a cacheable prefix"
+        ),
+    )
 
 
 class ToolAccessConfig(BaseSchema):
@@ -146,8 +153,15 @@ class ToolAccessConfig(BaseSchema):
         default_factory=list,
         description="List of tools that must be called before output",
     )
+    prefetch: list[str] = Field(
+        default_factory=list,
+        description=(
+            "Argument-free tools executed locally before the run, with results "
+            "given to the model as an already completed tool call"
+        ),
+    )
 
-    @field_validator("allowed", "required")
+    @field_validator("allowed", "required", "prefetch")
     @classmethod
     def validate_allowed_tools(cls, v: list[str]) -> list[str]:
         """Validate tool names.
@@ -170,20 +184,26 @@ class ToolAccessConfig(BaseSchema):
 
     @model_validator(mode="after")
     def validate_required_subset(self) -> ToolAccessConfig:
-        """Validate required tools are a subset of allowed tools.
+        """Validate required and prefetched tools are a subset of allowed tools.
 
         Returns:
             ToolAccessConfig: Validated tool access config.
 
         Raises:
-            ValueError: If required tools are not included in allowed tools.
+            ValueError: If required or prefetched tools are not included in
+                allowed tools.
         """
-        required_set = set(self.required)
         allowed_set = set(self.allowed)
-        if not required_set.issubset(allowed_set):
-            missing = sorted(required_set.difference(allowed_set))
-            joined = ", ".join(missing)
-            raise ValueError(f"required tools must be in allowed tools: {joined}")
+        for field_name, names in (
+            ("required", self.required),
+            ("prefetch", self.prefetch),
+        ):
+            missing = sorted(set(names).difference(allowed_set))
+            if missing:
+                joined = ", ".join(missing)
+                raise ValueError(
+                    f"{field_name} tools must be in allowed tools: {joined}"
+                )
         return self
 
 
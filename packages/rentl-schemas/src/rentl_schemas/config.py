@@ -20,6 +20,7 @@ from rentl_schemas.primitives import (
     QaSeverity,
     ReasoningEffort,
 )
+from rentl_schemas.storage import StorageBackend
 from rentl_schemas.version import VersionInfo
 
 _OPENROUTER_MODEL_ID_RE = re.compile(r"^[^/]+/.+")
@@ -239,6 +240,16 @@ class ModelEndpointConfig(BaseSchema):
             "enable only if the provider benefits from server-side strict enforcement."
         ),
     )
+    requests_per_minute: int | None = Field(
+        None,
+        gt=0,
+        description="Request budget per minute shared by all agents on this endpoint",
+    )
+    tokens_per_minute: int | None = Field(
+        None,
+        gt=0,
+        description="Token budget per minute shared by all agents on this endpoint",
+    )
 
     @field_validator("base_url")
     @classmethod
@@ -334,6 +345,13 @@ class ModelSettings(BaseSchema):
         ge=1,
         description="Maximum tokens for responses (defaults to 4096)",
     )
+    context_window_tokens: int | None = Field(
+        None,
+        ge=1024,
+        description=(
+            "Model context window size; enables token-budgeted chunking when set"
+        ),
+    )
     reasoning_effort: ReasoningEffort | None = Field(
         None, description="Reasoning effort level when supported"
     )
@@ -390,6 +408,14 @@ class ConcurrencyConfig(BaseSchema):
     max_parallel_scenes: int = Field(
         4, ge=1, description="Max concurrent scene processing"
     )
+    max_parallel_languages: int = Field(
+        4,
+        ge=1,
+        description=(
+            "Max target languages whose translate/QA/edit/export branches run "
+            "concurrently"
+        ),
+    )
     max_consecutive_failures: int = Field(
         3,
         ge=1,
@@ -411,6 +437,44 @@ class CacheConfig(BaseSchema):
     max_entries: int | None = Field(None, gt=0, description="Maximum cache entries")
 
 
+class StorageConfig(BaseSchema):
+    """Persistence backend for run state, artifact metadata, and logs."""
+
+    backend: StorageBackend = Field(
+        StorageBackend.FILESYSTEM,
+        strict=False,
+        description="Storage backend (filesystem|sqlite)",
+    )
+    database_path: str | None = Field(
+        None,
+        min_length=1,
+        description=(
+            "SQLite database path, relative to workspace_dir (default .rentl/rentl.db)"
+        ),
+    )
+
+    @model_validator(mode="after")
+    def validate_backend(self) -> StorageConfig:
+        """Ensure the backend is one rentl can run against.
+
+        Returns:
+            StorageConfig: Validated storage configuration.
+
+        Raises:
+            ValueError: If the backend is unsupported or the database path is
+                set for a non-SQLite backend.
+        """
+        supported = {StorageBackend.FILESYSTEM, StorageBackend.SQLITE}
+        if self.backend not in supported:
+            raise ValueError(
+                f"storage backend {self.backend} is not supported; "
+                "use filesystem or sqlite"
+            )
+        if self.database_path is not None and self.backend != StorageBackend.SQLITE:
+            raise ValueError("database_path requires the sqlite storage backend")
+        return self
+
+
 class AgentsConfig(BaseSchema):
     """Agent discovery and prompt configuration."""
 
@@ -461,6 +525,14 @@ class PhaseExecutionConfig(BaseSchema):
     chunk_size: int | None = Field(
         None, gt=0, description="Line count per chunk for chunk strategy"
     )
+    chunk_token_budget: int | None = Field(
+        None,
+        gt=0,
+        description=(
+            "Estimated prompt tokens per chunk for chunk strategy; chunk_size "
+            "becomes the line cap"
+        ),
+    )
     scene_batch_size: int | None = Field(
         None, gt=0, description="Scene count per chunk for scene strategy"
     )
@@ -498,6 +570,11 @@ class PhaseExecutionConfig(BaseSchema):
             )
         if self.strategy == PhaseWorkStrategy.CHUNK and self.chunk_size is None:
             raise ValueError("chunk_size is required for chunk strategy")
+        if (
+            self.strategy != PhaseWorkStrategy.CHUNK
+            and self.chunk_token_budget is not None
+        ):
+            raise ValueError("chunk_token_budget is only valid for chunk strategy")
         if self.strategy == PhaseWorkStrategy.CHUNK and (
             self.scene_batch_size is not None or self.route_batch_size is not None
         ):
@@ -673,6 +750,9 @@ class RunConfig(BaseSchema):
     )
     retry: RetryConfig = Field(..., description="Global retry defaults")
     cache: CacheConfig = Field(..., description="Cache settings")
+    storage: StorageConfig = Field(
+        default_factory=StorageConfig, description="Storage backend settings"
+    )
 
     @model_validator(mode="after")
     def validate_endpoint_config(self) -> RunConfig:
@@ -66,6 +66,10 @@ class PhaseDependency(BaseSchema):
     target_language: LanguageCode | None = Field(
         None, description="Target language for the dependency if applicable"
     )
+    run_id: RunId | None = Field(
+        None,
+        description="Prior run the output was carried forward from, if not this run",
+    )
 
 
 class PhaseRevision(BaseSchema):
@@ -442,6 +442,10 @@ class ProgressUpdate(BaseSchema):
     phase_progress: PhaseProgress | None = Field(
         None, description="Optional phase progress payload"
     )
+    run_summary: ProgressSummary | None = Field(
+        None,
+        description="Run summary for delta updates that omit run_progress",
+    )
     metric: ProgressMetric | None = Field(
         None, description="Optional metric update payload"
     )
@@ -475,6 +479,8 @@ class ProgressUpdate(BaseSchema):
             and self.phase_status != self.phase_progress.status
         ):
             raise ValueError("phase_status does not match phase_progress.status")
+        if self.run_summary is not None and self.run_progress is not None:
+            raise ValueError("run_summary is only allowed without run_progress")
         if (
             self.run_progress
             and self.phase is not None
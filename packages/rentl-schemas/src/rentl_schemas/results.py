@@ -43,23 +43,28 @@ PHASE_RESULT_METRIC_DEFINITIONS: dict[
         "context_note_count": ResultMetricUnit.NOTES,
         "glossary_term_count": ResultMetricUnit.TERMS,
         "character_count": ResultMetricUnit.CHARACTERS,
+        "reused_line_count": ResultMetricUnit.LINES,
     },
     PhaseName.PRETRANSLATION: {
         "annotation_count": ResultMetricUnit.COUNT,
         "annotated_line_count": ResultMetricUnit.LINES,
         "annotation_coverage": ResultMetricUnit.RATIO,
         "term_candidate_count": ResultMetricUnit.TERMS,
+        "reused_line_count": ResultMetricUnit.LINES,
     },
     PhaseName.TRANSLATE: {
         "translated_line_count": ResultMetricUnit.LINES,
+        "reused_line_count": ResultMetricUnit.LINES,
     },
     PhaseName.QA: {
         "issue_count": ResultMetricUnit.ISSUES,
+        "reused_line_count": ResultMetricUnit.LINES,
     },
     PhaseName.EDIT: {
         "edited_line_count": ResultMetricUnit.LINES,
         "change_count": ResultMetricUnit.EDITS,
         "changed_line_count": ResultMetricUnit.LINES,
+        "reused_line_count": ResultMetricUnit.LINES,
     },
     PhaseName.EXPORT: {
         "exported_line_count": ResultMetricUnit.LINES,
@@ -12,6 +12,7 @@ from rentl_schemas.primitives import (
     ArtifactId,
     JsonValue,
     LanguageCode,
+    LineId,
     PhaseName,
     RunId,
     Timestamp,
@@ -155,5 +156,31 @@ class RunStateRecord(BaseSchema):
         None, description="Storage location for the snapshot"
     )
     checksum_sha256: str | None = Field(
-        None, pattern=CHECKSUM_PATTERN, description="SHA-256 checksum if available"
+        None,
+        pattern=CHECKSUM_PATTERN,
+        description=(
+            "SHA-256 of the JSON-serialized state if available; it covers the"
+            " state only, not the stored record"
+        ),
+    )
+
+
+class PhaseCheckpointRecord(BaseSchema):
+    """Completed work chunk output persisted while a phase is running."""
+
+    run_id: RunId = Field(..., description="Run identifier")
+    phase: PhaseName = Field(..., description="Phase that produced the output")
+    target_language: LanguageCode | None = Field(
+        None, description="Target language for language-specific phases"
+    )
+    agent_name: str = Field(
+        ..., min_length=1, description="Agent pool that produced the output"
+    )
+    chunk_fingerprint: str = Field(
+        ...,
+        pattern=CHECKSUM_PATTERN,
+        description="SHA-256 of the chunk line IDs and phase input payload",
     )
+    line_ids: list[LineId] = Field(..., description="Line IDs covered by the chunk")
+    created_at: Timestamp = Field(..., description="Checkpoint timestamp")
+    output: dict[str, JsonValue] = Field(..., description="Serialized chunk output")
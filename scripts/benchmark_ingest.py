@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""Ingest throughput benchmark for the JSONL and CSV adapters.
+
+Generates large synthetic scripts, then times the bulk ingest path used by
+the adapters against the per-line path it falls back to for bad blocks.
+
+Usage:
+    uv run python scripts/benchmark_ingest.py [--lines N] [--format FORMAT]
+        [--fixtures-dir DIR]
+
+Examples:
+    # Benchmark both formats with 1M-line fixtures
+    uv run python scripts/benchmark_ingest.py
+
+    # Quick JSONL run, keeping the generated fixture
+    uv run python scripts/benchmark_ingest.py --lines 100000 --format jsonl \
+        --fixtures-dir /tmp/rentl-ingest
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+import json
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from rentl_io.ingest import (
+    CsvIngestAdapter,
+    JsonlIngestAdapter,
+    csv_adapter,
+    jsonl_adapter,
+)
+from rentl_schemas.io import IngestSource, SourceLine
+from rentl_schemas.primitives import FileFormat
+
+LINES_PER_SCENE = 40
+SPEAKERS = ("Alice", "Bob", "Narrator", None)
+
+
+def write_jsonl_fixture(path: Path, line_count: int) -> None:
+    """Write a synthetic JSONL script.
+
+    Args:
+        path: Output path.
+        line_count: Number of lines to write.
+    """
+    with open(path, "w", encoding="utf-8") as handle:
+        for index in range(line_count):
+            record: dict[str, object] = {
+                "line_id": f"line_{index + 1}",
+                "scene_id": f"scene_{index // LINES_PER_SCENE + 1}",
+                "text": f"Synthetic source line number {index + 1}.",
+            }
+            speaker = SPEAKERS[index % len(SPEAKERS)]
+            if speaker is not None:
+                record["speaker"] = speaker
+            if index % 10 == 0:
+                record["metadata"] = {"voice": f"v{index}", "choice": False}
+            handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def write_csv_fixture(path: Path, line_count: int) -> None:
+    """Write a synthetic CSV script.
+
+    Args:
+        path: Output path.
+        line_count: Number of rows to write.
+    """
+    with open(path, "w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["line_id", "text", "scene_id", "speaker", "metadata"])
+        for index in range(line_count):
+            speaker = SPEAKERS[index % len(SPEAKERS)] or ""
+            metadata = json.dumps({"voice": f"v{index}"}) if index % 10 == 0 else ""
+            writer.writerow([
+                f"line_{index + 1}",
+                f"Synthetic source line number {index + 1}.",
+                f"scene_{index // LINES_PER_SCENE + 1}",
+                speaker,
+                metadata,
+            ])
+
+
+def load_jsonl_per_line(source: IngestSource) -> list[SourceLine]:
+    """Parse JSONL one line at a time, as before bulk validation.
+
+    Args:
+        source: Ingest source descriptor.
+
+    Returns:
+        list[SourceLine]: Parsed source lines.
+    """
+    with open(source.input_path, encoding="utf-8") as handle:
+        return [
+            jsonl_adapter._parse_line(raw_line, line_number, source.input_path)
+            for line_number, raw_line in enumerate(handle, start=1)
+            if raw_line.strip()
+        ]
+
+
+def load_csv_per_row(source: IngestSource) -> list[SourceLine]:
+    """Parse CSV one row at a time, as before bulk validation.
+
+    Args:
+        source: Ingest source descriptor.
+
+    Returns:
+        list[SourceLine]: Parsed source lines.
+    """
+    with open(source.input_path, encoding="utf-8", newline="") as handle:
+        reader = csv.DictReader(handle)
+        columns = list(reader.fieldnames or [])
+        return [
+            SourceLine.model_validate(
+                csv_adapter._row_fields(row, row_number, columns, source.input_path)
+            )
+            for row_number, row in enumerate(reader, start=2)
+        ]
+
+
+def time_call(label: str, load: Callable[[], list[SourceLine]]) -> float:
+    """Time one ingest run and print its throughput.
+
+    Args:
+        label: Row label.
+        load: Loader to time.
+
+    Returns:
+        float: Elapsed seconds.
+    """
+    started = time.perf_counter()
+    lines = load()
+    elapsed = time.perf_counter() - started
+    rate = len(lines) / elapsed if elapsed else float("inf")
+    print(f"  {label:<10} {elapsed:8.2f}s  {rate:>12,.0f} lines/s")
+    return elapsed
+
+
+def benchmark(file_format: FileFormat, fixtures_dir: Path, line_count: int) -> None:
+    """Generate a fixture and compare bulk and per-line ingest.
+
+    Args:
+        file_format: Format to benchmark.
+        fixtures_dir: Directory for the generated fixture.
+        line_count: Number of lines in the fixture.
+    """
+    path = fixtures_dir / f"script_{line_count}.{file_format.value}"
+    if not path.exists():
+        if file_format == FileFormat.JSONL:
+            write_jsonl_fixture(path, line_count)
+        else:
+            write_csv_fixture(path, line_count)
+    source = IngestSource(input_path=str(path), format=file_format)
+    if file_format == FileFormat.JSONL:
+        adapter: JsonlIngestAdapter | CsvIngestAdapter = JsonlIngestAdapter()
+        per_line = load_jsonl_per_line
+    else:
+        adapter = CsvIngestAdapter()
+        per_line = load_csv_per_row
+
+    print(f"{file_format.value.upper()} ({line_count:,} lines, {path})")
+    per_line_s = time_call("per-line", lambda: per_line(source))
+    bulk_s = time_call("bulk", lambda: asyncio.run(adapter.load_source(source)))
+    print(f"  speedup    {per_line_s / bulk_s:8.2f}x")
+
+
+def main() -> None:
+    """Run the ingest benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=1_000_000)
+    parser.add_argument(
+        "--format",
+        choices=[FileFormat.JSONL.value, FileFormat.CSV.value],
+        action="append",
+        help="Format to benchmark (repeatable; default: both)",
+    )
+    parser.add_argument(
+        "--fixtures-dir",
+        type=Path,
+        default=None,
+        help="Reuse or keep fixtures here instead of a temporary directory",
+    )
+    args = parser.parse_args()
+    formats = [FileFormat(value) for value in args.format or ["jsonl", "csv"]]
+
+    if args.fixtures_dir is not None:
+        args.fixtures_dir.mkdir(parents=True, exist_ok=True)
+        for file_format in formats:
+            benchmark(file_format, args.fixtures_dir, args.lines)
+        return
+    with tempfile.TemporaryDirectory(prefix="rentl-ingest-") as temp_dir:
+        for file_format in formats:
+            benchmark(file_format, Path(temp_dir), args.lines)
+
+
+if __name__ == "__main__":
+    main()
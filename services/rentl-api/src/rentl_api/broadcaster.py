@@ -0,0 +1,195 @@
+"""In-memory fan-out of orchestrator progress and log events."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator
+from typing import Literal
+
+from pydantic import Field
+
+from rentl_core.ports.orchestrator import LogSinkProtocol, ProgressSinkProtocol
+from rentl_core.status import StatusAggregator
+from rentl_schemas.base import BaseSchema
+from rentl_schemas.events import ProgressEvent
+from rentl_schemas.logs import LogEntry
+from rentl_schemas.primitives import RunId, RunStatus
+from rentl_schemas.progress import ProgressUpdate
+from rentl_schemas.responses import RunStatusResult
+
+_TERMINAL_EVENTS = {ProgressEvent.RUN_COMPLETED, ProgressEvent.RUN_FAILED}
+_TERMINAL_STATUSES = {RunStatus.COMPLETED, RunStatus.FAILED, RunStatus.CANCELLED}
+
+
+class RunStreamEvent(BaseSchema):
+    """Status, progress or log event pushed to run subscribers."""
+
+    event: Literal["status", "progress", "log"] = Field(
+        ..., description="Event stream kind"
+    )
+    run_id: RunId = Field(..., description="Run identifier")
+    status: RunStatusResult | None = Field(
+        None, description="Run status at subscription time for status events"
+    )
+    progress: ProgressUpdate | None = Field(
+        None, description="Progress update for progress events"
+    )
+    log: LogEntry | None = Field(None, description="Log entry for log events")
+
+
+class RunEventBroadcaster(ProgressSinkProtocol, LogSinkProtocol):
+    """Progress and log sink that fans events out to live subscribers.
+
+    Compose it with the run's regular sinks so the orchestrator pushes events
+    here as they happen. Status for every observed run is kept current with a
+    ``StatusAggregator``, and each subscriber gets its own bounded queue.
+    Publishing never waits on subscribers: a subscriber that falls
+    ``max_queue`` events behind loses its oldest events instead of stalling
+    the run. Only the ``max_finished_runs`` most recently finished runs are
+    kept; older ones are forgotten once their subscribers have drained.
+    """
+
+    def __init__(self, *, max_queue: int = 1000, max_finished_runs: int = 100) -> None:
+        """Initialize the broadcaster.
+
+        Args:
+            max_queue: Events buffered per subscriber before dropping.
+            max_finished_runs: Completed or failed runs whose status is kept.
+
+        Raises:
+            ValueError: If ``max_queue`` is not positive or
+                ``max_finished_runs`` is negative.
+        """
+        if max_queue <= 0:
+            raise ValueError("max_queue must be positive")
+        if max_finished_runs < 0:
+            raise ValueError("max_finished_runs must not be negative")
+        self._max_queue = max_queue
+        self._max_finished_runs = max_finished_runs
+        self._aggregators: dict[RunId, StatusAggregator] = {}
+        self._subscribers: dict[RunId, set[asyncio.Queue[RunStreamEvent]]] = {}
+        # Insertion-ordered so the oldest finished runs are evicted first
+        self._finished: dict[RunId, None] = {}
+
+    async def emit_progress(self, update: ProgressUpdate) -> None:
+        """Fold a progress update into run status and publish it."""
+        # Orchestrator payloads reference live run state; freeze them here
+        update = update.model_copy(deep=True)
+        self._aggregator(update.run_id).ingest([update])
+        self._publish(
+            RunStreamEvent(event="progress", run_id=update.run_id, progress=update)
+        )
+        if update.event in _TERMINAL_EVENTS:
+            self._finished.pop(update.run_id, None)
+            self._finished[update.run_id] = None
+            self._evict_finished()
+
+    async def emit_log(self, entry: LogEntry) -> None:
+        """Publish a log entry to subscribers of its run."""
+        entry = entry.model_copy(deep=True)
+        self._aggregator(entry.run_id)
+        self._publish(RunStreamEvent(event="log", run_id=entry.run_id, log=entry))
+
+    def end_run(self, status: RunStatusResult) -> None:
+        """Close subscriber streams for a run that stopped unreported.
+
+        Runs that fail before the orchestrator starts, or that crash without a
+        terminal progress event, would otherwise leave their streams open.
+
+        Args:
+            status: Terminal status sent to subscribers as a ``status`` event.
+        """
+        self._publish(
+            RunStreamEvent(event="status", run_id=status.run_id, status=status)
+        )
+        if status.run_id in self._aggregators:
+            self._finished.pop(status.run_id, None)
+            self._finished[status.run_id] = None
+            self._evict_finished()
+
+    def run_ids(self) -> list[RunId]:
+        """Return runs observed by the broadcaster, oldest first.
+
+        Returns:
+            list[RunId]: Observed run identifiers.
+        """
+        return list(self._aggregators)
+
+    def status(self, run_id: RunId) -> RunStatusResult | None:
+        """Return the live status of a run.
+
+        Args:
+            run_id: Run identifier.
+
+        Returns:
+            RunStatusResult | None: Status snapshot, or None for unknown runs.
+        """
+        aggregator = self._aggregators.get(run_id)
+        if aggregator is None:
+            return None
+        return aggregator.build_result(
+            run_state=None, log_reference=None, progress_file=None
+        )
+
+    async def subscribe(self, run_id: RunId) -> AsyncGenerator[RunStreamEvent]:
+        """Subscribe to events for a run until it completes or fails.
+
+        The subscription is registered when iteration starts, together with a
+        leading ``status`` event holding the run status at that moment, so the
+        status plus the events after it cover the run without gaps. The stream
+        ends right after the status event when the run already finished.
+
+        Args:
+            run_id: Run identifier.
+
+        Yields:
+            RunStreamEvent: Status event, then events published afterwards.
+        """
+        queue: asyncio.Queue[RunStreamEvent] = asyncio.Queue(maxsize=self._max_queue)
+        self._subscribers.setdefault(run_id, set()).add(queue)
+        try:
+            status = self.status(run_id)
+            yield RunStreamEvent(event="status", run_id=run_id, status=status)
+            if status is not None and status.status in _TERMINAL_STATUSES:
+                return
+            while True:
+                event = await queue.get()
+                yield event
+                if _is_terminal(event):
+                    return
+        finally:
+            subscribers = self._subscribers.get(run_id, set())
+            subscribers.discard(queue)
+            if not subscribers:
+                self._subscribers.pop(run_id, None)
+                self._evict_finished()
+
+    def _aggregator(self, run_id: RunId) -> StatusAggregator:
+        aggregator = self._aggregators.get(run_id)
+        if aggregator is None:
+            aggregator = self._aggregators[run_id] = StatusAggregator(run_id)
+        return aggregator
+
+    def _evict_finished(self) -> None:
+        excess = len(self._finished) - self._max_finished_runs
+        for run_id in list(self._finished):
+            if excess <= 0:
+                return
+            # Keep runs with live subscribers until their streams drain
+            if run_id in self._subscribers:
+                continue
+            del self._finished[run_id]
+            self._aggregators.pop(run_id, None)
+            excess -= 1
+
+    def _publish(self, event: RunStreamEvent) -> None:
+        for queue in self._subscribers.get(event.run_id, ()):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+
+def _is_terminal(event: RunStreamEvent) -> bool:
+    if event.progress is not None:
+        return event.progress.event in _TERMINAL_EVENTS
+    return event.status is not None and event.status.status in _TERMINAL_STATUSES
@@ -0,0 +1,78 @@
+"""In-process pipeline job executor with warm shared resources."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from rentl_api.broadcaster import RunEventBroadcaster
+from rentl_api.jobs import (
+    JobConfigError,
+    JobExecutorProtocol,
+    JobStatus,
+    PipelineJob,
+    job_run_status,
+)
+from rentl_llm.model_registry import ModelRegistry
+from rentl_runner.pipeline import PipelineConfigError, run_pipeline_job
+
+
+class PipelineJobExecutor(JobExecutorProtocol):
+    """Run pipeline jobs in the API process.
+
+    One ``ModelRegistry`` serves every job, so provider HTTP/2 connection
+    pools and model instances stay warm between jobs, as do the agent profile
+    and prompt layer caches. Job progress and logs go to run storage as for
+    ``rentl run-pipeline`` and to the broadcaster for live API clients.
+    """
+
+    def __init__(
+        self, broadcaster: RunEventBroadcaster, workspace: Path | None = None
+    ) -> None:
+        """Initialize the executor.
+
+        Args:
+            broadcaster: Broadcaster receiving job progress and logs.
+            workspace: Optional API workspace that each job's configured
+                workspace must lie within.
+        """
+        self._broadcaster = broadcaster
+        self._workspace = workspace
+        self._model_registry = ModelRegistry()
+
+    async def execute(self, job: PipelineJob) -> None:
+        """Run a job's pipeline to completion.
+
+        Other pipeline failures propagate after the run's live streams have
+        been closed.
+
+        Args:
+            job: Claimed pipeline job.
+
+        Raises:
+            JobConfigError: If the job's configuration is invalid or its
+                workspace lies outside the API workspace.
+        """
+        request = job.request
+        try:
+            await run_pipeline_job(
+                Path(request.config_path),
+                run_id=job.run_id,
+                target_languages=request.target_languages,
+                input_path=Path(request.input_path) if request.input_path else None,
+                model_registry=self._model_registry,
+                progress_sink=self._broadcaster,
+                log_sink=self._broadcaster,
+                workspace_root=self._workspace,
+            )
+        except Exception as exc:
+            # Config and preflight errors fail the job before the run emits
+            # anything, so end the run's streams explicitly
+            failed = job.model_copy(update={"status": JobStatus.FAILED})
+            self._broadcaster.end_run(job_run_status(failed))
+            if isinstance(exc, PipelineConfigError):
+                raise JobConfigError(str(exc)) from exc
+            raise
+
+    async def aclose(self) -> None:
+        """Close pooled provider connections."""
+        await self._model_registry.aclose()
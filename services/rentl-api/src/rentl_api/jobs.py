@@ -0,0 +1,375 @@
+"""Persistent pipeline job queue and the worker pool that drains it."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+from contextlib import closing, suppress
+from datetime import UTC, datetime
+from enum import StrEnum
+from pathlib import Path
+from typing import Protocol
+from uuid import uuid7
+
+from pydantic import Field
+
+from rentl_schemas.base import BaseSchema
+from rentl_schemas.primitives import LanguageCode, RunId, RunStatus, Timestamp
+from rentl_schemas.responses import RunStatusResult
+
+_logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL UNIQUE,
+    status TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, seq);
+"""
+
+
+class JobStatus(StrEnum):
+    """Lifecycle state of a queued pipeline job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+_JOB_RUN_STATUSES = {
+    JobStatus.QUEUED: RunStatus.PENDING,
+    JobStatus.RUNNING: RunStatus.RUNNING,
+    JobStatus.COMPLETED: RunStatus.COMPLETED,
+    JobStatus.FAILED: RunStatus.FAILED,
+}
+
+
+class PipelineJobRequest(BaseSchema):
+    """Pipeline job submitted to the API."""
+
+    config_path: str = Field(..., min_length=1, description="Path to rentl.toml")
+    input_path: str | None = Field(
+        None, description="Optional ingest input overriding the configured one"
+    )
+    target_languages: list[LanguageCode] | None = Field(
+        None, description="Optional subset of configured target languages"
+    )
+
+
+class PipelineJob(BaseSchema):
+    """Queued pipeline job and its execution state."""
+
+    run_id: RunId = Field(..., description="Run identifier assigned to the job")
+    request: PipelineJobRequest = Field(..., description="Submitted job request")
+    status: JobStatus = Field(..., description="Job lifecycle state")
+    submitted_at: Timestamp = Field(..., description="Submission timestamp")
+    started_at: Timestamp | None = Field(None, description="Execution start")
+    completed_at: Timestamp | None = Field(None, description="Execution end")
+    error: str | None = Field(None, description="Failure message if failed")
+    error_code: str | None = Field(None, description="Failure code if failed")
+
+
+def job_run_status(job: PipelineJob) -> RunStatusResult:
+    """Summarize a job as a run status.
+
+    Used for runs the orchestrator has not reported on, such as jobs still
+    waiting in the queue or jobs that failed before the run started.
+
+    Args:
+        job: Pipeline job.
+
+    Returns:
+        RunStatusResult: Run status derived from the job lifecycle.
+    """
+    return RunStatusResult(
+        run_id=job.run_id,
+        status=_JOB_RUN_STATUSES[JobStatus(job.status)],
+        current_phase=None,
+        updated_at=job.completed_at or job.started_at or job.submitted_at,
+    )
+
+
+class JobConfigError(Exception):
+    """Raised by executors when a job's configuration is rejected."""
+
+
+class JobExecutorProtocol(Protocol):
+    """Executes one pipeline job; raising marks the job failed."""
+
+    async def execute(self, job: PipelineJob) -> None:
+        """Run the job's pipeline to completion."""
+        raise NotImplementedError
+
+
+class SqliteJobQueue:
+    """SQLite-backed FIFO job queue that survives API restarts."""
+
+    def __init__(self, database_path: str) -> None:
+        """Initialize the job queue.
+
+        Args:
+            database_path: Path to the SQLite database file.
+        """
+        self._path = Path(database_path)
+        self._initialized = False
+
+    async def enqueue(self, request: PipelineJobRequest) -> PipelineJob:
+        """Queue a pipeline job.
+
+        Args:
+            request: Job request.
+
+        Returns:
+            PipelineJob: Queued job with its assigned run identifier.
+        """
+        job = PipelineJob(
+            run_id=uuid7(),
+            request=request,
+            status=JobStatus.QUEUED,
+            submitted_at=_now_timestamp(),
+        )
+        await asyncio.to_thread(
+            self._execute,
+            "INSERT INTO jobs (run_id, status, payload) VALUES (?, ?, ?)",
+            (str(job.run_id), str(job.status), job.model_dump_json()),
+        )
+        return job
+
+    async def claim(self) -> PipelineJob | None:
+        """Mark the oldest queued job as running and return it.
+
+        Returns:
+            PipelineJob | None: Claimed job, or None when the queue is empty.
+        """
+        return await asyncio.to_thread(self._claim)
+
+    async def save(self, job: PipelineJob) -> None:
+        """Persist an updated job.
+
+        Args:
+            job: Job to store.
+        """
+        await asyncio.to_thread(
+            self._execute,
+            "UPDATE jobs SET status = ?, payload = ? WHERE run_id = ?",
+            (str(job.status), job.model_dump_json(), str(job.run_id)),
+        )
+
+    async def get(self, run_id: RunId) -> PipelineJob | None:
+        """Load a job by run identifier.
+
+        Args:
+            run_id: Run identifier.
+
+        Returns:
+            PipelineJob | None: Stored job if present.
+        """
+        rows = await asyncio.to_thread(
+            self._execute, "SELECT payload FROM jobs WHERE run_id = ?", (str(run_id),)
+        )
+        return PipelineJob.model_validate_json(str(rows[0][0])) if rows else None
+
+    async def list_jobs(self, limit: int | None = None) -> list[PipelineJob]:
+        """List jobs, newest first.
+
+        Args:
+            limit: Optional maximum number of jobs.
+
+        Returns:
+            list[PipelineJob]: Stored jobs.
+        """
+        rows = await asyncio.to_thread(
+            self._execute,
+            "SELECT payload FROM jobs ORDER BY seq DESC LIMIT ?",
+            (-1 if limit is None else limit,),
+        )
+        return [PipelineJob.model_validate_json(str(row[0])) for row in rows]
+
+    async def requeue_running(self) -> int:
+        """Return jobs interrupted by a shutdown to the queue.
+
+        Returns:
+            int: Number of jobs requeued.
+        """
+        return await asyncio.to_thread(self._requeue_running)
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self._path, timeout=30, isolation_level=None)
+        if not self._initialized:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            self._initialized = True
+        return connection
+
+    def _execute(
+        self, sql: str, parameters: tuple[object, ...] = ()
+    ) -> list[tuple[object, ...]]:
+        with closing(self._connect()) as connection:
+            return connection.execute(sql, parameters).fetchall()
+
+    def _claim(self) -> PipelineJob | None:
+        with closing(self._connect()) as connection:
+            # IMMEDIATE takes the write lock up front so two workers never
+            # claim the same row
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = connection.execute(
+                    "SELECT payload FROM jobs WHERE status = ? ORDER BY seq LIMIT 1",
+                    (JobStatus.QUEUED.value,),
+                ).fetchone()
+                if row is None:
+                    connection.execute("COMMIT")
+                    return None
+                job = PipelineJob.model_validate_json(str(row[0])).model_copy(
+                    update={
+                        "status": JobStatus.RUNNING,
+                        "started_at": _now_timestamp(),
+                    }
+                )
+                connection.execute(
+                    "UPDATE jobs SET status = ?, payload = ? WHERE run_id = ?",
+                    (str(job.status), job.model_dump_json(), str(job.run_id)),
+                )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        return job
+
+    def _requeue_running(self) -> int:
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                "SELECT payload FROM jobs WHERE status = ?",
+                (JobStatus.RUNNING.value,),
+            ).fetchall()
+            for (payload,) in rows:
+                job = PipelineJob.model_validate_json(str(payload)).model_copy(
+                    update={"status": JobStatus.QUEUED, "started_at": None}
+                )
+                connection.execute(
+                    "UPDATE jobs SET status = ?, payload = ? WHERE run_id = ?",
+                    (str(job.status), job.model_dump_json(), str(job.run_id)),
+                )
+        return len(rows)
+
+
+class JobWorkerPool:
+    """Fixed pool of workers executing queued jobs in this process.
+
+    Workers share the executor and everything it keeps warm between jobs.
+    LLM requests from concurrent jobs also share the process-wide request
+    governor, so per-endpoint concurrency and rate limits are a budget for
+    the whole pool rather than for each job.
+    """
+
+    def __init__(
+        self,
+        queue: SqliteJobQueue,
+        executor: JobExecutorProtocol,
+        *,
+        workers: int = 2,
+        poll_interval_s: float = 5.0,
+    ) -> None:
+        """Initialize the worker pool.
+
+        Args:
+            queue: Job queue to drain.
+            executor: Executor that runs each job.
+            workers: Number of jobs executed concurrently.
+            poll_interval_s: Seconds between queue checks while idle.
+
+        Raises:
+            ValueError: If ``workers`` or ``poll_interval_s`` is not positive.
+        """
+        if workers <= 0 or poll_interval_s <= 0:
+            raise ValueError("workers and poll_interval_s must be positive")
+        self._queue = queue
+        self._executor = executor
+        self._workers = workers
+        self._poll_interval_s = poll_interval_s
+        self._wakeup = asyncio.Event()
+        self._tasks: list[asyncio.Task[None]] = []
+
+    async def start(self) -> None:
+        """Requeue interrupted jobs and start the workers."""
+        requeued = await self._queue.requeue_running()
+        if requeued:
+            _logger.info("Requeued %d interrupted pipeline job(s)", requeued)
+        self._wakeup = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(self._work(), name=f"rentl-job-worker-{index}")
+            for index in range(self._workers)
+        ]
+
+    def notify(self) -> None:
+        """Wake idle workers after a job was queued."""
+        self._wakeup.set()
+
+    async def stop(self) -> None:
+        """Cancel the workers; jobs they were running are requeued on start."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+
+    async def _work(self) -> None:
+        while True:
+            # Clear before claiming so a job queued meanwhile still wakes us
+            self._wakeup.clear()
+            try:
+                job = await self._queue.claim()
+            except Exception:
+                # A locked or unreachable queue must not kill the worker
+                _logger.exception("Failed to claim a pipeline job")
+                await self._idle()
+                continue
+            if job is None:
+                await self._idle()
+                continue
+            await self._run(job)
+
+    async def _idle(self) -> None:
+        with suppress(TimeoutError):
+            await asyncio.wait_for(self._wakeup.wait(), timeout=self._poll_interval_s)
+
+    async def _run(self, job: PipelineJob) -> None:
+        try:
+            await self._executor.execute(job)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            _logger.exception("Pipeline job %s failed", job.run_id)
+            job = job.model_copy(
+                update={
+                    "status": JobStatus.FAILED,
+                    "error": str(exc) or repr(exc),
+                    "error_code": (
+                        "config_error"
+                        if isinstance(exc, JobConfigError)
+                        else "runtime_error"
+                    ),
+                }
+            )
+        else:
+            job = job.model_copy(update={"status": JobStatus.COMPLETED})
+        try:
+            await self._queue.save(
+                job.model_copy(update={"completed_at": _now_timestamp()})
+            )
+        except Exception:
+            # The job stays running in the queue and is requeued on restart
+            _logger.exception("Failed to record pipeline job %s", job.run_id)
+            await self._idle()
+
+
+def _now_timestamp() -> Timestamp:
+    value = datetime.now(tz=UTC).isoformat()
+    return value.replace("+00:00", "Z")
@@ -1,18 +1,123 @@
 """API entry point - thin adapter over rentl-core."""
 
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
+from pathlib import Path
+from typing import Annotated
 
 import uvicorn
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
 
+from rentl_api.broadcaster import RunEventBroadcaster
+from rentl_api.executor import PipelineJobExecutor
+from rentl_api.jobs import (
+    JobStatus,
+    JobWorkerPool,
+    PipelineJob,
+    PipelineJobRequest,
+    SqliteJobQueue,
+    job_run_status,
+)
 from rentl_core import VERSION
-from rentl_schemas.responses import ApiResponse, MetaInfo
+from rentl_core.ports.storage import StorageErrorCode
+from rentl_runner.pipeline import PipelineConfigError, resolve_workspace_path
+from rentl_schemas.exit_codes import resolve_exit_code
+from rentl_schemas.primitives import RunId, RunStatus
+from rentl_schemas.responses import (
+    ApiResponse,
+    ErrorResponse,
+    MetaInfo,
+    RunStatusResult,
+)
+
+DEFAULT_JOBS_DATABASE = ".rentl/api/jobs.db"
+DEFAULT_JOB_WORKERS = 2
+
+_TERMINAL_STATUSES = {RunStatus.COMPLETED, RunStatus.FAILED, RunStatus.CANCELLED}
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Start the job worker pool for the lifetime of the server.
+
+    ``RENTL_API_JOBS_DB`` sets the queue database and ``RENTL_API_WORKERS``
+    the number of jobs run concurrently. Jobs whose configured workspace lies
+    outside the API workspace fail with a ``config_error``.
+
+    Args:
+        app: Application being served.
+
+    Yields:
+        None: While the server is running.
+    """
+    queue = SqliteJobQueue(os.environ.get("RENTL_API_JOBS_DB", DEFAULT_JOBS_DATABASE))
+    executor = PipelineJobExecutor(app.state.broadcaster, _api_workspace())
+    workers = JobWorkerPool(
+        queue,
+        executor,
+        workers=int(os.environ.get("RENTL_API_WORKERS", DEFAULT_JOB_WORKERS)),
+    )
+    app.state.job_queue = queue
+    app.state.job_workers = workers
+    await workers.start()
+    try:
+        yield
+    finally:
+        await workers.stop()
+        await executor.aclose()
+
 
 app = FastAPI(
     title="rentl",
     description="Agentic localization pipeline API",
     version=str(VERSION),
+    lifespan=lifespan,
 )
+app.state.broadcaster = RunEventBroadcaster()
+
+
+def get_broadcaster(request: Request) -> RunEventBroadcaster:
+    """Return the broadcaster that run sinks publish to.
+
+    Args:
+        request: Incoming request.
+
+    Returns:
+        RunEventBroadcaster: Application-wide run event broadcaster.
+    """
+    return request.app.state.broadcaster
+
+
+def get_job_queue(request: Request) -> SqliteJobQueue:
+    """Return the persistent pipeline job queue.
+
+    Args:
+        request: Incoming request.
+
+    Returns:
+        SqliteJobQueue: Application job queue.
+    """
+    return request.app.state.job_queue
+
+
+def get_job_workers(request: Request) -> JobWorkerPool:
+    """Return the worker pool draining the job queue.
+
+    Args:
+        request: Incoming request.
+
+    Returns:
+        JobWorkerPool: Application worker pool.
+    """
+    return request.app.state.job_workers
+
+
+BroadcasterDep = Annotated[RunEventBroadcaster, Depends(get_broadcaster)]
+JobQueueDep = Annotated[SqliteJobQueue, Depends(get_job_queue)]
+JobWorkersDep = Annotated[JobWorkerPool, Depends(get_job_workers)]
 
 
 @app.get("/health")
@@ -25,10 +130,240 @@ async def health() -> ApiResponse[dict[str, str]]:
     return ApiResponse[dict[str, str]](
         data={"status": "ok", "version": str(VERSION)},
         error=None,
-        meta=MetaInfo(
-            timestamp=datetime.now(UTC).isoformat().replace("+00:00", "Z"),
-            request_id=None,
+        meta=_meta(),
+    )
+
+
+@app.post("/jobs", status_code=202, response_model=ApiResponse[PipelineJob])
+async def submit_job(
+    request: PipelineJobRequest, queue: JobQueueDep, workers: JobWorkersDep
+) -> ApiResponse[PipelineJob] | JSONResponse:
+    """Queue a pipeline job for the worker pool.
+
+    Config and input paths must lie within the API workspace, set with
+    ``RENTL_API_WORKSPACE`` and defaulting to the server's working directory;
+    they are stored resolved to absolute paths.
+
+    Args:
+        request: Job request.
+        queue: Pipeline job queue.
+        workers: Worker pool to wake.
+
+    Returns:
+        ApiResponse envelope with the queued job, whose run identifier keys the
+        run status and event endpoints, or a 400 error envelope for paths
+        outside the workspace.
+    """
+    try:
+        request = _confine_request(request, _api_workspace())
+    except PipelineConfigError as exc:
+        return _error_response(400, "config_error", str(exc))
+    job = await queue.enqueue(request)
+    workers.notify()
+    return ApiResponse[PipelineJob](data=job, error=None, meta=_meta())
+
+
+@app.get("/jobs")
+async def list_jobs(
+    queue: JobQueueDep, limit: int | None = None
+) -> ApiResponse[list[PipelineJob]]:
+    """List pipeline jobs, newest first.
+
+    Args:
+        queue: Pipeline job queue.
+        limit: Optional maximum number of jobs.
+
+    Returns:
+        ApiResponse envelope with stored jobs.
+    """
+    jobs = await queue.list_jobs(limit)
+    return ApiResponse[list[PipelineJob]](data=jobs, error=None, meta=_meta())
+
+
+@app.get("/jobs/{run_id}", response_model=ApiResponse[PipelineJob])
+async def get_job(
+    run_id: RunId, queue: JobQueueDep
+) -> ApiResponse[PipelineJob] | JSONResponse:
+    """Get a pipeline job.
+
+    Args:
+        run_id: Run identifier of the job.
+        queue: Pipeline job queue.
+
+    Returns:
+        ApiResponse envelope with the job, or a 404 error envelope.
+    """
+    job = await queue.get(run_id)
+    if job is None:
+        return _not_found(f"Job not found: {run_id}")
+    return ApiResponse[PipelineJob](data=job, error=None, meta=_meta())
+
+
+@app.get("/runs")
+async def list_runs(broadcaster: BroadcasterDep) -> ApiResponse[list[RunStatusResult]]:
+    """List runs observed by this API process.
+
+    Args:
+        broadcaster: Run event broadcaster.
+
+    Returns:
+        ApiResponse envelope with one status summary per run, without per-agent
+        telemetry.
+    """
+    results = []
+    for run_id in broadcaster.run_ids():
+        status = broadcaster.status(run_id)
+        if status is not None:
+            results.append(status.model_copy(update={"agents": None}))
+    return ApiResponse[list[RunStatusResult]](data=results, error=None, meta=_meta())
+
+
+@app.get("/runs/{run_id}/status", response_model=ApiResponse[RunStatusResult])
+async def get_run_status(
+    run_id: RunId, broadcaster: BroadcasterDep, queue: JobQueueDep
+) -> ApiResponse[RunStatusResult] | JSONResponse:
+    """Get the live status of a run.
+
+    Runs submitted as jobs report their job state until the orchestrator
+    starts reporting on them.
+
+    Args:
+        run_id: Run identifier.
+        broadcaster: Run event broadcaster.
+        queue: Pipeline job queue.
+
+    Returns:
+        ApiResponse envelope with the run status, or a 404 error envelope.
+    """
+    status = await _run_status(run_id, broadcaster, queue)
+    if status is None:
+        return _not_found(f"Run not found: {run_id}")
+    return ApiResponse[RunStatusResult](data=status, error=None, meta=_meta())
+
+
+@app.get("/runs/{run_id}/events", response_model=None)
+async def stream_run_events(
+    run_id: RunId, broadcaster: BroadcasterDep, queue: JobQueueDep
+) -> StreamingResponse | JSONResponse:
+    """Stream run progress and log events as server-sent events.
+
+    The stream opens with a ``status`` event carrying the current run status,
+    then pushes ``progress`` and ``log`` events as the orchestrator emits them
+    and closes once the run completes or fails. Streams for finished runs
+    close right after the status event. Queued jobs stream from their job
+    status until the run starts.
+
+    Args:
+        run_id: Run identifier.
+        broadcaster: Run event broadcaster.
+        queue: Pipeline job queue.
+
+    Returns:
+        Server-sent event stream, or a 404 error envelope for unknown runs.
+    """
+    if await _run_status(run_id, broadcaster, queue) is None:
+        return _not_found(f"Run not found: {run_id}")
+
+    async def _stream() -> AsyncIterator[str]:
+        # The subscription registers on first iteration, so a client that
+        # disconnects before the response starts leaves nothing behind
+        events = broadcaster.subscribe(run_id)
+        try:
+            async for event in events:
+                if event.event == "status":
+                    # The leading status is resolved again once subscribed so
+                    # a job that finished meanwhile is not missed
+                    status = event.status
+                    if status is None or status.status not in _TERMINAL_STATUSES:
+                        status = await _run_status(run_id, broadcaster, queue)
+                    if status is None:
+                        return
+                    yield _sse(event.event, status.model_dump_json())
+                    if status.status in _TERMINAL_STATUSES:
+                        return
+                    continue
+                payload = event.progress if event.progress is not None else event.log
+                if payload is not None:
+                    yield _sse(event.event, payload.model_dump_json(exclude_none=True))
+        finally:
+            await events.aclose()
+
+    return StreamingResponse(
+        _stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+async def _run_status(
+    run_id: RunId, broadcaster: RunEventBroadcaster, queue: SqliteJobQueue
+) -> RunStatusResult | None:
+    status = broadcaster.status(run_id)
+    if status is not None and status.status in _TERMINAL_STATUSES:
+        return status
+    job = await queue.get(run_id)
+    if job is None:
+        return status
+    # A job that failed before or without a terminal run event outranks the
+    # stale live status
+    if status is None or job.status in {JobStatus.COMPLETED, JobStatus.FAILED}:
+        return job_run_status(job)
+    return status
+
+
+def _api_workspace() -> Path:
+    return Path(os.environ.get("RENTL_API_WORKSPACE", "."))
+
+
+def _confine_request(
+    request: PipelineJobRequest, workspace: Path
+) -> PipelineJobRequest:
+    config_path = resolve_workspace_path(Path(request.config_path), workspace)
+    input_path = (
+        resolve_workspace_path(Path(request.input_path), workspace)
+        if request.input_path
+        else None
+    )
+    return request.model_copy(
+        update={
+            "config_path": str(config_path),
+            "input_path": str(input_path) if input_path else None,
+        }
+    )
+
+
+def _sse(event: str, data: str) -> str:
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+def _not_found(message: str) -> JSONResponse:
+    return _error_response(
+        404, StorageErrorCode.NOT_FOUND.value, message, domain="storage"
+    )
+
+
+def _error_response(
+    status_code: int, code: str, message: str, *, domain: str | None = None
+) -> JSONResponse:
+    response = ApiResponse[None](
+        data=None,
+        error=ErrorResponse(
+            code=code,
+            message=message,
+            details=None,
+            exit_code=resolve_exit_code(code, domain=domain).value,
         ),
+        meta=_meta(),
+    )
+    return JSONResponse(
+        status_code=status_code, content=response.model_dump(mode="json")
+    )
+
+
+def _meta() -> MetaInfo:
+    return MetaInfo(
+        timestamp=datetime.now(UTC).isoformat().replace("+00:00", "Z"),
+        request_id=None,
     )
 
 
@@ -9,17 +9,16 @@ import os
 import sys
 import time
 import tomllib
-from collections.abc import Awaitable, Sequence
+from collections.abc import Awaitable
 from datetime import UTC, datetime
 from enum import Enum
 from itertools import combinations
 from pathlib import Path
-from typing import NamedTuple, TypeVar, cast
+from typing import TypeVar, cast
 from uuid import UUID, uuid7
 
 import typer
 from anyio import Path as AsyncPath
-from dotenv import load_dotenv
 from pydantic import ValidationError
 from rich import print as rprint
 from rich.console import Console, Group, RenderableType
@@ -36,8 +35,7 @@ from rich.progress import (
 from rich.table import Table
 
 from rentl_agents.providers import detect_provider
-from rentl_agents.wiring import build_agent_pools
-from rentl_core import VERSION, AgentTelemetryEmitter, build_status_result
+from rentl_core import VERSION, StatusAggregator, build_status_result
 from rentl_core.benchmark.eval_sets.downloader import KatawaShoujoDownloader
 from rentl_core.benchmark.eval_sets.loader import EvalSetLoader
 from rentl_core.benchmark.eval_sets.parser import RenpyDialogueParser
@@ -69,50 +67,42 @@ from rentl_core.migrate import (
     auto_migrate_file,
     migrate_config,
 )
-from rentl_core.orchestrator import (
-    PipelineOrchestrator,
-    PipelineRunContext,
-    hydrate_run_context,
-)
+from rentl_core.orchestrator import PipelineRunContext
 from rentl_core.ports.export import ExportBatchError, ExportError, ExportResult
 from rentl_core.ports.ingest import IngestBatchError, IngestError
 from rentl_core.ports.orchestrator import (
+    FlushableSinkProtocol,
     LogSinkProtocol,
     OrchestrationError,
     ProgressSinkProtocol,
 )
-from rentl_core.ports.storage import (
-    ArtifactStoreProtocol,
-    StorageBatchError,
-    StorageError,
-)
+from rentl_core.ports.storage import StorageBatchError, StorageError
 from rentl_core.secrets import check_config_secrets
 from rentl_io import write_output
-from rentl_io.export.router import get_export_adapter
-from rentl_io.ingest.router import get_ingest_adapter
-from rentl_io.storage.filesystem import (
-    FileSystemArtifactStore,
-    FileSystemLogStore,
-    FileSystemRunStateStore,
-)
+from rentl_io.storage.filesystem import FileSystemRunStateStore
 from rentl_io.storage.log_sink import build_log_sink
-from rentl_io.storage.progress_sink import (
-    CompositeProgressSink,
-    FileSystemProgressSink,
-)
+from rentl_io.storage.progress_sink import CompositeProgressSink
+from rentl_io.storage.sqlite import SqliteRunStateStore
 from rentl_llm.openai_runtime import OpenAICompatibleRuntime
-from rentl_llm.provider_factory import PreflightEndpoint, assert_preflight
-from rentl_schemas.base import BaseSchema
+from rentl_runner.pipeline import (
+    PipelineConfigError,
+    StorageBundle,
+    build_config_redactor,
+    build_log_store,
+    build_run_state_store,
+    build_storage_bundle,
+    close_stores,
+    load_dotenv_files,
+    load_run_config,
+    load_run_state,
+    resolve_enabled_phases,
+    resolve_target_languages,
+    run_phase_plan,
+    storage_database_path,
+)
 from rentl_schemas.benchmark.report import PairwiseSummary
 from rentl_schemas.benchmark.rubric import HeadToHeadResult
-from rentl_schemas.config import (
-    LanguageConfig,
-    LoggingConfig,
-    LogSinkConfig,
-    ModelSettings,
-    OpenRouterProviderRoutingConfig,
-    RunConfig,
-)
+from rentl_schemas.config import OpenRouterProviderRoutingConfig, RunConfig
 from rentl_schemas.events import (
     CommandCompletedData,
     CommandEvent,
@@ -121,28 +111,19 @@ from rentl_schemas.events import (
     ProgressEvent,
 )
 from rentl_schemas.exit_codes import ExitCode, resolve_exit_code
-from rentl_schemas.io import ExportTarget, IngestSource, SourceLine, TranslatedLine
+from rentl_schemas.io import ExportTarget, SourceLine, TranslatedLine
 from rentl_schemas.llm import (
     LlmConnectionReport,
     LlmEndpointTarget,
 )
 from rentl_schemas.logs import LogEntry
-from rentl_schemas.phases import (
-    ContextPhaseOutput,
-    EditPhaseOutput,
-    PretranslationPhaseOutput,
-    QaPhaseOutput,
-    TranslatePhaseOutput,
-)
 from rentl_schemas.pipeline import PhaseRunRecord, RunState
 from rentl_schemas.primitives import (
     PIPELINE_PHASE_ORDER,
-    ArtifactId,
     FileFormat,
     JsonValue,
     LanguageCode,
     LogLevel,
-    LogSinkType,
     PhaseName,
     PhaseStatus,
     RunId,
@@ -159,12 +140,6 @@ from rentl_schemas.progress import (
     RunProgress,
     SegmentedUsageTotals,
 )
-from rentl_schemas.redaction import (
-    DEFAULT_PATTERNS,
-    RedactionConfig,
-    Redactor,
-    build_redactor,
-)
 from rentl_schemas.responses import (
     ApiResponse,
     ErrorResponse,
@@ -173,13 +148,7 @@ from rentl_schemas.responses import (
     RunStatusResult,
 )
 from rentl_schemas.results import PhaseResultMetric, ResultMetricUnit
-from rentl_schemas.storage import (
-    ArtifactMetadata,
-    LogFileReference,
-    StorageBackend,
-    StorageReference,
-)
-from rentl_schemas.validation import validate_run_config
+from rentl_schemas.storage import LogFileReference, StorageBackend, StorageReference
 
 INPUT_OPTION = typer.Option(
     ..., "--input", "-i", help="JSONL file of TranslatedLine records"
@@ -215,6 +184,11 @@ CONFIG_OPTION = typer.Option(
 RUN_ID_OPTION = typer.Option(
     None, "--run-id", help="Run identifier to resume or continue"
 )
+INCREMENTAL_FROM_OPTION = typer.Option(
+    None,
+    "--incremental-from",
+    help="Prior run identifier whose outputs are reused for unchanged lines",
+)
 PHASE_OPTION = typer.Option(..., "--phase", help="Phase to run")
 TARGET_LANGUAGE_OPTION = typer.Option(
     None, "--target-language", "-t", help="Target language code (repeatable)"
@@ -374,7 +348,7 @@ def doctor(config_path: Path = CONFIG_OPTION) -> None:
     is_tty = sys.stdout.isatty()
 
     # Load .env files before running checks so API keys are available
-    _load_dotenv(config_path)
+    load_dotenv_files(config_path)
 
     # Build runtime for connectivity check
     runtime = _build_llm_runtime()
@@ -964,6 +938,7 @@ def run_pipeline(
     config_path: Path = CONFIG_OPTION,
     run_id: str | None = RUN_ID_OPTION,
     target_languages: list[str] | None = TARGET_LANGUAGE_OPTION,
+    incremental_from: str | None = INCREMENTAL_FROM_OPTION,
 ) -> None:
     """Run the full pipeline plan.\f
 
@@ -979,40 +954,26 @@ def run_pipeline(
         config = _load_resolved_config(config_path)
         resolved_run_id = _resolve_run_id(run_id)
         command_run_id = resolved_run_id
-        bundle = _build_storage_bundle(
-            config, resolved_run_id, allow_console_logs=False
+        baseline_run_id = (
+            _parse_run_id(incremental_from) if incremental_from is not None else None
         )
+        bundle = build_storage_bundle(config, resolved_run_id, allow_console_logs=False)
         interactive = _should_render_progress()
         if interactive:
             console = Console(stderr=True)
             progress = _build_progress(console)
             reporter = _ProgressReporter(bundle.progress_sink, progress, console)
-            bundle = _StorageBundle(
-                run_state_store=bundle.run_state_store,
-                artifact_store=bundle.artifact_store,
-                log_store=bundle.log_store,
-                log_sink=bundle.log_sink,
-                progress_sink=reporter,
-                progress_path=bundle.progress_path,
-                redactor=bundle.redactor,
-            )
+            bundle = bundle._replace(progress_sink=reporter)
         else:
             stderr_sink = _StderrProgressSink()
             composite = CompositeProgressSink([bundle.progress_sink, stderr_sink])
-            bundle = _StorageBundle(
-                run_state_store=bundle.run_state_store,
-                artifact_store=bundle.artifact_store,
-                log_store=bundle.log_store,
-                log_sink=bundle.log_sink,
-                progress_sink=composite,
-                progress_path=bundle.progress_path,
-                redactor=bundle.redactor,
-            )
+            bundle = bundle._replace(progress_sink=composite)
         log_sink = bundle.log_sink
         args: dict[str, JsonValue] = {
             "config_path": str(config_path),
             "run_id": str(resolved_run_id),
             "target_languages": _as_json_list(target_languages),
+            "incremental_from": incremental_from,
         }
         _emit_command_log_sync(
             log_sink,
@@ -1026,7 +987,7 @@ def run_pipeline(
         if interactive:
             _render_run_start(
                 run_id=resolved_run_id,
-                phases=_resolve_enabled_phases(config),
+                phases=resolve_enabled_phases(config),
                 config=config,
                 console=console,
             )
@@ -1038,6 +999,7 @@ def run_pipeline(
                         bundle=bundle,
                         run_id=resolved_run_id,
                         target_languages=target_languages,
+                        baseline_run_id=baseline_run_id,
                     )
                 )
         else:
@@ -1047,6 +1009,7 @@ def run_pipeline(
                     bundle=bundle,
                     run_id=resolved_run_id,
                     target_languages=target_languages,
+                    baseline_run_id=baseline_run_id,
                 )
             )
         _emit_command_log_sync(
@@ -1076,11 +1039,7 @@ def run_pipeline(
     if progress is not None:
         _render_run_execution_summary(response.data, console=console, config=config)
         if response.error is not None:
-            log_file = (
-                str(Path(config.project.paths.logs_dir) / f"{command_run_id}.jsonl")
-                if config
-                else None
-            )
+            log_file = _log_location(config, command_run_id) if config else None
             _render_run_error(response.error, console=console, log_file=log_file)
             raise typer.Exit(code=response.error.exit_code)
         return
@@ -1111,21 +1070,11 @@ def run_phase(
         config = _load_resolved_config(config_path)
         resolved_run_id = _resolve_run_id(run_id)
         command_run_id = resolved_run_id
-        bundle = _build_storage_bundle(
-            config, resolved_run_id, allow_console_logs=False
-        )
+        bundle = build_storage_bundle(config, resolved_run_id, allow_console_logs=False)
         if not _should_render_progress():
             stderr_sink = _StderrProgressSink()
             composite = CompositeProgressSink([bundle.progress_sink, stderr_sink])
-            bundle = _StorageBundle(
-                run_state_store=bundle.run_state_store,
-                artifact_store=bundle.artifact_store,
-                log_store=bundle.log_store,
-                log_sink=bundle.log_sink,
-                progress_sink=composite,
-                progress_path=bundle.progress_path,
-                redactor=bundle.redactor,
-            )
+            bundle = bundle._replace(progress_sink=composite)
         log_sink = bundle.log_sink
         args: dict[str, JsonValue] = {
             "config_path": str(config_path),
@@ -1189,11 +1138,7 @@ def run_phase(
     if _should_render_progress():
         _render_run_execution_summary(response.data, console=None, config=config)
         if response.error is not None:
-            log_file = (
-                str(Path(config.project.paths.logs_dir) / f"{command_run_id}.jsonl")
-                if config
-                else None
-            )
+            log_file = _log_location(config, command_run_id) if config else None
             _render_run_error(response.error, console=None, log_file=log_file)
             raise typer.Exit(code=response.error.exit_code)
         return
@@ -1223,11 +1168,11 @@ def status(
             raise ValueError("--json is not supported with --watch")
         config = _load_resolved_config(config_path)
         resolved_run_id = _resolve_status_run_id(config, run_id)
-        bundle = _build_storage_bundle(config, resolved_run_id)
+        bundle = build_storage_bundle(config, resolved_run_id)
         if watch:
             _watch_status(bundle, resolved_run_id)
             return
-        run_state = asyncio.run(_load_run_state(bundle, resolved_run_id))
+        run_state = asyncio.run(load_run_state(bundle, resolved_run_id))
         log_reference = asyncio.run(bundle.log_store.get_log_reference(resolved_run_id))
         progress_updates = _read_progress_updates(bundle.progress_path)
         progress_file = _build_progress_reference(bundle.progress_path)
@@ -1527,7 +1472,7 @@ async def _benchmark_compare_async(
             # CLI override mode - config loading is optional
             with contextlib.suppress(Exception):
                 # Config not available, use explicit env vars only
-                await asyncio.to_thread(_load_dotenv, config_path)
+                await asyncio.to_thread(load_dotenv_files, config_path)
             base_url = judge_base_url
             # Detect provider from URL
             provider_caps = detect_provider(base_url)
@@ -1573,7 +1518,7 @@ async def _benchmark_compare_async(
             max_output_tokens = 4096
         else:
             # Config-based mode - load config for judge endpoint
-            await asyncio.to_thread(_load_dotenv, config_path)
+            await asyncio.to_thread(load_dotenv_files, config_path)
             config = await asyncio.to_thread(_load_resolved_config, config_path)
 
             # Use config endpoint (legacy single endpoint or multi-endpoint default)
@@ -1796,13 +1741,6 @@ async def _benchmark_compare_async(
 
 ResponseT = TypeVar("ResponseT")
 
-_LLM_PHASES = {
-    PhaseName.CONTEXT,
-    PhaseName.PRETRANSLATION,
-    PhaseName.TRANSLATE,
-    PhaseName.QA,
-    PhaseName.EDIT,
-}
 _LANGUAGE_PHASES = {
     PhaseName.TRANSLATE,
     PhaseName.QA,
@@ -1811,91 +1749,6 @@ _LANGUAGE_PHASES = {
 }
 
 
-class _ConfigError(Exception):
-    """Raised for CLI configuration issues."""
-
-
-class _StorageBundle(NamedTuple):
-    run_state_store: FileSystemRunStateStore
-    artifact_store: ArtifactStoreProtocol
-    log_store: FileSystemLogStore
-    log_sink: LogSinkProtocol
-    progress_sink: ProgressSinkProtocol
-    progress_path: Path
-    redactor: Redactor | None
-
-
-_ModelT = TypeVar("_ModelT", bound=BaseSchema)
-
-
-class _RedactingArtifactStore:
-    """Artifact store wrapper that automatically injects redactor."""
-
-    def __init__(
-        self, delegate: FileSystemArtifactStore, redactor: Redactor | None
-    ) -> None:
-        """Initialize the wrapper.
-
-        Args:
-            delegate: Underlying artifact store
-            redactor: Redactor to inject into write operations
-        """
-        self._delegate = delegate
-        self._redactor = redactor
-
-    async def write_artifact_json(
-        self, metadata: ArtifactMetadata, payload: BaseSchema
-    ) -> ArtifactMetadata:
-        """Write a JSON artifact with automatic redaction.
-
-        Returns:
-            ArtifactMetadata: Stored artifact metadata.
-        """
-        return await self._delegate.write_artifact_json(
-            metadata, payload, redactor=self._redactor
-        )
-
-    async def write_artifact_jsonl(
-        self, metadata: ArtifactMetadata, payload: Sequence[BaseSchema]
-    ) -> ArtifactMetadata:
-        """Write a JSONL artifact with automatic redaction.
-
-        Returns:
-            ArtifactMetadata: Stored artifact metadata.
-        """
-        return await self._delegate.write_artifact_jsonl(
-            metadata, payload, redactor=self._redactor
-        )
-
-    async def list_artifacts(self, run_id: RunId) -> list[ArtifactMetadata]:
-        """List artifacts for a run.
-
-        Returns:
-            list[ArtifactMetadata]: List of artifacts for the run.
-        """
-        return await self._delegate.list_artifacts(run_id)
-
-    async def load_artifact_json(
-        self, artifact_id: ArtifactId, model: type[_ModelT]
-    ) -> _ModelT:
-        """Load a JSON artifact.
-
-        Returns:
-            _ModelT: Parsed artifact model.
-        """
-        return await self._delegate.load_artifact_json(artifact_id, model)
-
-    async def load_artifact_jsonl(
-        self, artifact_id: ArtifactId, model: type[_ModelT]
-    ) -> list[_ModelT]:
-        """Load a JSONL artifact.
-
-        Returns:
-            list[_ModelT]: List of parsed artifact models.
-        """
-        return await self._delegate.load_artifact_jsonl(artifact_id, model)
-
-
 def _now_timestamp() -> str:
     timestamp = datetime.now(UTC).isoformat()
     return timestamp.replace("+00:00", "Z")
@@ -1917,6 +1770,16 @@ class _ProgressReporter(ProgressSinkProtocol):
         await self._sink.emit_progress(update)
         self._handle_update(update)
 
+    async def flush(self) -> None:
+        """Write all buffered progress updates of the wrapped sink."""
+        if isinstance(self._sink, FlushableSinkProtocol):
+            await self._sink.flush()
+
+    async def aclose(self) -> None:
+        """Flush and stop the wrapped sink's background writer."""
+        if isinstance(self._sink, FlushableSinkProtocol):
+            await self._sink.aclose()
+
     def _handle_update(self, update: ProgressUpdate) -> None:
         if update.event == ProgressEvent.PHASE_STARTED and update.phase is not None:
             self._console.print(f"Starting {update.phase}")
@@ -1995,37 +1858,24 @@ def _as_json_list(values: list[str] | None) -> list[JsonValue] | None:
 
 
 def _load_resolved_config(config_path: Path) -> RunConfig:
-    config = _load_run_config(config_path)
-    config = _resolve_project_paths(config, config_path)
-    return _resolve_agent_paths(config)
-
-
-def _resolve_agent_paths(config: RunConfig) -> RunConfig:
-    if config.agents is None:
-        return config
-    workspace_dir = Path(config.project.paths.workspace_dir)
-    agents_config = config.agents
-    updated_agents = agents_config.model_copy(
-        update={
-            "prompts_dir": str(
-                _resolve_path(Path(agents_config.prompts_dir), workspace_dir)
-            ),
-            "agents_dir": str(
-                _resolve_path(Path(agents_config.agents_dir), workspace_dir)
-            ),
-        }
-    )
-    return config.model_copy(update={"agents": updated_agents})
+    # The CLI runs one config per process, so its .env files go straight into
+    # os.environ; long-lived hosts read them per job instead
+    load_dotenv_files(config_path)
+    return load_run_config(config_path, migrate=_auto_migrate_if_needed)
 
 
 def _build_command_log_sink(config: RunConfig) -> LogSinkProtocol:
-    log_store = FileSystemLogStore(logs_dir=config.project.paths.logs_dir)
-    redactor = _build_redactor(config)
+    log_store = build_log_store(config)
+    redactor = build_config_redactor(config)
     return build_log_sink(config.logging, log_store, redactor=redactor)
 
 
 async def _emit_command_log(log_sink: LogSinkProtocol, entry: LogEntry) -> None:
+    # Each command log runs in its own event loop; closing stops the writer
+    # task here instead of leaving it for asyncio.run to cancel
     await log_sink.emit_log(entry)
+    if isinstance(log_sink, FlushableSinkProtocol):
+        await log_sink.aclose()
 
 
 def _emit_command_log_sync(log_sink: LogSinkProtocol, entry: LogEntry) -> None:
@@ -2206,14 +2056,14 @@ def _auto_migrate_if_needed(
         Migrated config dict (or original if already up to date)
 
     Raises:
-        _ConfigError: If migration fails
+        PipelineConfigError: If migration fails
     """
     try:
         result: AutoMigrateResult = auto_migrate_file(
             config_path, cast(ConfigDict, payload)
         )
     except MigrateError as exc:
-        raise _ConfigError(str(exc)) from exc
+        raise PipelineConfigError(str(exc)) from exc
 
     if not result.migrated:
         return payload
@@ -2244,70 +2094,6 @@ def _auto_migrate_if_needed(
     return cast(dict[str, JsonValue], result.config_dict)
 
 
-def _load_run_config(config_path: Path) -> RunConfig:
-    _load_dotenv(config_path)
-    if not config_path.exists():
-        raise _ConfigError(f"Config not found: {config_path}")
-    try:
-        with open(config_path, "rb") as handle:
-            payload: dict[str, JsonValue] = tomllib.load(handle)
-    except (OSError, tomllib.TOMLDecodeError) as exc:
-        raise _ConfigError(f"Failed to read config: {exc}") from exc
-    if not isinstance(payload, dict):
-        raise _ConfigError("Config root must be a TOML table")
-
-    # Auto-migrate if schema version is outdated
-    payload = _auto_migrate_if_needed(config_path, payload)
-
-    return validate_run_config(payload)
-
-
-def _load_dotenv(config_path: Path) -> None:
-    """Load .env and .env.local files from config directory.
-
-    .env.local takes precedence over .env (loaded second with override=False).
-    """
-    config_dir = config_path.parent
-    env_path = config_dir / ".env"
-    env_local_path = config_dir / ".env.local"
-
-    if env_path.exists():
-        load_dotenv(env_path, override=False)
-    if env_local_path.exists():
-        load_dotenv(env_local_path, override=False)
-
-
-def _resolve_project_paths(config: RunConfig, config_path: Path) -> RunConfig:
-    config_dir = config_path.parent
-    workspace_dir = Path(config.project.paths.workspace_dir)
-    if not workspace_dir.is_absolute():
-        workspace_dir = (config_dir / workspace_dir).resolve()
-    input_path = _resolve_path(Path(config.project.paths.input_path), workspace_dir)
-    output_dir = _resolve_path(Path(config.project.paths.output_dir), workspace_dir)
-    logs_dir = _resolve_path(Path(config.project.paths.logs_dir), workspace_dir)
-    updated_paths = config.project.paths.model_copy(
-        update={
-            "workspace_dir": str(workspace_dir),
-            "input_path": str(input_path),
-            "output_dir": str(output_dir),
-            "logs_dir": str(logs_dir),
-        }
-    )
-    updated_project = config.project.model_copy(update={"paths": updated_paths})
-    return config.model_copy(update={"project": updated_project})
-
-
-def _resolve_path(path: Path, base_dir: Path) -> Path:
-    base_dir = base_dir.resolve()
-    resolved = path if path.is_absolute() else base_dir / path
-    resolved = resolved.resolve()
-    try:
-        resolved.relative_to(base_dir)
-    except ValueError as exc:
-        raise _ConfigError(f"Path must stay within workspace: {resolved}") from exc
-    return resolved
-
-
 def _resolve_run_id(run_id: str | None) -> RunId:
     if run_id is None:
         return uuid7()
@@ -2324,18 +2110,6 @@ def _parse_run_id(run_id: str) -> RunId:
     return value
 
 
-def _resolve_target_languages(
-    config: RunConfig, target_languages: list[str] | None
-) -> list[LanguageCode]:
-    if target_languages is None:
-        return config.project.languages.target_languages
-    validated = LanguageConfig(
-        source_language=config.project.languages.source_language,
-        target_languages=target_languages,
-    )
-    return validated.target_languages
-
-
 def _resolve_phase_languages(
     config: RunConfig, phase: PhaseName, target_language: str | None
 ) -> list[LanguageCode]:
@@ -2344,25 +2118,12 @@ def _resolve_phase_languages(
             raise ValueError("target_language is only valid for language phases")
         return []
     if target_language is not None:
-        return _resolve_target_languages(config, [target_language])
+        return resolve_target_languages(config, [target_language])
     if len(config.project.languages.target_languages) == 1:
         return config.project.languages.target_languages
     raise ValueError("target_language is required when multiple targets are configured")
 
 
-def _resolve_phase_model(config: RunConfig, phase: PhaseName) -> ModelSettings | None:
-    for entry in config.pipeline.phases:
-        if entry.phase == phase:
-            if entry.model is not None:
-                return entry.model
-            return config.pipeline.default_model
-    return config.pipeline.default_model
-
-
-def _resolve_enabled_phases(config: RunConfig) -> list[PhaseName]:
-    return [PhaseName(phase.phase) for phase in config.pipeline.phases if phase.enabled]
-
-
 def _resolve_phase_plan(config: RunConfig, phase: PhaseName) -> list[PhaseName]:
     ordered = [PhaseName(entry.phase) for entry in config.pipeline.phases]
     if phase not in ordered:
@@ -2380,178 +2141,11 @@ def _resolve_phase_plan(config: RunConfig, phase: PhaseName) -> list[PhaseName]:
     ]
 
 
-def _ensure_api_key(config: RunConfig, phases: list[PhaseName]) -> None:
-    if not any(phase in _LLM_PHASES for phase in phases):
-        return
-    if config.endpoints is None:
-        endpoint = config.endpoint
-        if endpoint is None:
-            raise _ConfigError("Missing endpoint configuration")
-        env_var = endpoint.api_key_env
-        if os.getenv(env_var) is None:
-            raise _ConfigError(f"Missing API key environment variable: {env_var}")
-        return
-    lookup = {
-        endpoint.provider_name: endpoint for endpoint in config.endpoints.endpoints
-    }
-    used_refs: set[str] = set()
-    for phase in phases:
-        if phase not in _LLM_PHASES:
-            continue
-        model = _resolve_phase_model(config, phase)
-        endpoint_ref = config.resolve_endpoint_ref(model=model)
-        if endpoint_ref is None:
-            continue
-        used_refs.add(endpoint_ref)
-    for endpoint_ref in sorted(used_refs):
-        endpoint = lookup.get(endpoint_ref)
-        if endpoint is None:
-            raise _ConfigError(f"Unknown endpoint reference: {endpoint_ref}")
-        env_var = endpoint.api_key_env
-        if os.getenv(env_var) is None:
-            raise _ConfigError(
-                "Missing API key environment variable: "
-                f"{env_var} (endpoint: {endpoint_ref})"
-            )
-
-
-def _build_preflight_endpoints(
-    config: RunConfig, phases: list[PhaseName]
-) -> list[PreflightEndpoint]:
-    """Build preflight endpoint descriptors for all LLM phases.
-
-    Deduplicates by (base_url, model_id, endpoint_ref) so that endpoints
-    sharing URL/model but using different endpoint refs or routing configs
-    are each validated independently.
-
-    Args:
-        config: Run configuration.
-        phases: Enabled pipeline phases.
-
-    Returns:
-        List of PreflightEndpoint objects for validation.
-    """
-    endpoints: list[PreflightEndpoint] = []
-    seen: set[tuple[str, str, str | None]] = set()
-
-    for phase in phases:
-        if phase not in _LLM_PHASES:
-            continue
-        model = _resolve_phase_model(config, phase)
-        if model is None:
-            continue
-        endpoint_ref = config.resolve_endpoint_ref(model=model)
-
-        if config.endpoints is not None and endpoint_ref is not None:
-            lookup = {ep.provider_name: ep for ep in config.endpoints.endpoints}
-            ep_config = lookup.get(endpoint_ref)
-            if ep_config is None:
-                continue
-            base_url = ep_config.base_url
-            api_key_env = ep_config.api_key_env
-            openrouter_provider = ep_config.openrouter_provider
-            strict_tools = ep_config.strict_tools
-        elif config.endpoint is not None:
-            base_url = config.endpoint.base_url
-            api_key_env = config.endpoint.api_key_env
-            openrouter_provider = config.endpoint.openrouter_provider
-            strict_tools = config.endpoint.strict_tools
-        else:
-            continue
-
-        key = (base_url, model.model_id, endpoint_ref)
-        if key in seen:
-            continue
-        seen.add(key)
-
-        api_key = os.getenv(api_key_env, "")
-
-        endpoints.append(
-            PreflightEndpoint(
-                base_url=base_url,
-                api_key=api_key,
-                model_id=model.model_id,
-                phase_label=phase,
-                endpoint_ref=endpoint_ref,
-                openrouter_provider=openrouter_provider,
-                strict_tools=strict_tools,
-            )
-        )
-
-    return endpoints
-
-
-def _build_redactor(config: RunConfig) -> Redactor:
-    """Build a redactor from config and resolved env var values.
-
-    Args:
-        config: Runtime configuration with endpoint definitions
-
-    Returns:
-        Redactor: Configured redactor instance
-    """
-    # Collect all api_key_env names from config
-    env_var_names: list[str] = []
-
-    # Legacy single endpoint
-    if config.endpoint is not None:
-        env_var_names.append(config.endpoint.api_key_env)
-
-    # Multi-endpoint configuration
-    if config.endpoints is not None:
-        for endpoint in config.endpoints.endpoints:
-            env_var_names.append(endpoint.api_key_env)
-
-    # Build redaction config with default patterns
-    redaction_config = RedactionConfig(
-        patterns=DEFAULT_PATTERNS, env_var_names=env_var_names
-    )
-
-    # Collect actual env var values
-    env_values = {
-        name: os.environ[name] for name in env_var_names if name in os.environ
-    }
-
-    return build_redactor(redaction_config, env_values)
-
-
-def _build_storage_bundle(
-    config: RunConfig,
-    run_id: RunId,
-    progress_sink: ProgressSinkProtocol | None = None,
-    *,
-    allow_console_logs: bool = True,
-) -> _StorageBundle:
-    workspace_dir = Path(config.project.paths.workspace_dir)
-    base_dir = workspace_dir / ".rentl"
-    run_state_dir = base_dir / "run_state"
-    artifact_dir = base_dir / "artifacts"
-    log_store = FileSystemLogStore(logs_dir=config.project.paths.logs_dir)
-    progress_path = _progress_path(config.project.paths.logs_dir, run_id)
-    logging_config = _build_logging_config(config, allow_console_logs)
-    redactor = _build_redactor(config)
-    log_sink = build_log_sink(logging_config, log_store, redactor=redactor)
-    file_progress_sink = FileSystemProgressSink(str(progress_path))
-    raw_artifact_store = FileSystemArtifactStore(base_dir=str(artifact_dir))
-    wrapped_artifact_store = _RedactingArtifactStore(raw_artifact_store, redactor)
-    return _StorageBundle(
-        run_state_store=FileSystemRunStateStore(base_dir=str(run_state_dir)),
-        artifact_store=wrapped_artifact_store,
-        log_store=log_store,
-        log_sink=log_sink,
-        progress_sink=progress_sink or file_progress_sink,
-        progress_path=progress_path,
-        redactor=redactor,
-    )
-
-
-def _build_logging_config(config: RunConfig, allow_console_logs: bool) -> LoggingConfig:
-    if allow_console_logs:
-        return config.logging
-    sinks = [sink for sink in config.logging.sinks if sink.type != LogSinkType.CONSOLE]
-    if not sinks:
-        sinks = [LogSinkConfig(type=LogSinkType.FILE)]
-    return LoggingConfig(sinks=sinks)
+def _log_location(config: RunConfig, run_id: RunId) -> str:
+    database_path = storage_database_path(config)
+    if database_path is not None:
+        return database_path
+    return str(Path(config.project.paths.logs_dir) / f"{run_id}.jsonl")
 
 
 def _render_run_start(
@@ -2721,279 +2315,57 @@ def _render_run_error(
         rprint(message)
 
 
-def _progress_path(logs_dir: str, run_id: RunId) -> Path:
-    return Path(logs_dir) / "progress" / f"{run_id}.jsonl"
-
-
-def _build_orchestrator(
-    config: RunConfig, bundle: _StorageBundle, phases: list[PhaseName]
-) -> PipelineOrchestrator:
-    agent_pools = None
-    if any(phase in _LLM_PHASES for phase in phases):
-        telemetry_emitter = AgentTelemetryEmitter(
-            progress_sink=bundle.progress_sink,
-            log_sink=bundle.log_sink,
-            clock=_now_timestamp,
-        )
-        try:
-            agent_pools = build_agent_pools(
-                config=config,
-                telemetry_emitter=telemetry_emitter,
-                phases=phases,
-            )
-        except ValueError as exc:
-            raise _ConfigError(str(exc)) from exc
-    return PipelineOrchestrator(
-        ingest_adapter=get_ingest_adapter(config.project.formats.input_format),
-        export_adapter=get_export_adapter(config.project.formats.output_format),
-        context_agents=agent_pools.context_agents if agent_pools else None,
-        pretranslation_agents=agent_pools.pretranslation_agents
-        if agent_pools
-        else None,
-        translate_agents=agent_pools.translate_agents if agent_pools else None,
-        qa_agents=agent_pools.qa_agents if agent_pools else None,
-        edit_agents=agent_pools.edit_agents if agent_pools else None,
-        log_sink=bundle.log_sink,
-        progress_sink=bundle.progress_sink,
-        run_state_store=bundle.run_state_store,
-        artifact_store=bundle.artifact_store,
-    )
-
-
-async def _load_or_create_run_context(
-    orchestrator: PipelineOrchestrator,
-    bundle: _StorageBundle,
-    run_id: RunId,
-    config: RunConfig,
-) -> PipelineRunContext:
-    record = await bundle.run_state_store.load_run_state(run_id)
-    if record is None:
-        return orchestrator.create_run(run_id=run_id, config=config)
-    run = hydrate_run_context(config, record.state)
-    await _hydrate_run_outputs(bundle, run, record.state)
-    return run
-
-
-def _latest_phase_records(
-    state: RunState,
-) -> dict[tuple[PhaseName, LanguageCode | None], PhaseRunRecord]:
-    latest: dict[tuple[PhaseName, LanguageCode | None], PhaseRunRecord] = {}
-    for record in state.phase_history or []:
-        if record.status != PhaseStatus.COMPLETED:
-            continue
-        if record.stale:
-            continue
-        key = (PhaseName(record.phase), record.target_language)
-        existing = latest.get(key)
-        if existing is None or record.revision > existing.revision:
-            latest[key] = record
-    return latest
-
-
-async def _load_artifact_jsonl[ModelT: BaseSchema](
-    store: ArtifactStoreProtocol,
-    artifact_id: UUID,
-    model: type[ModelT],
-) -> list[ModelT]:
-    return await store.load_artifact_jsonl(artifact_id, model)
-
-
-async def _load_single_artifact[ModelT: BaseSchema](
-    store: ArtifactStoreProtocol,
-    artifact_id: UUID,
-    model: type[ModelT],
-) -> ModelT | None:
-    items = await _load_artifact_jsonl(store, artifact_id, model)
-    if not items:
-        return None
-    return items[0]
-
-
-async def _hydrate_run_outputs(
-    bundle: _StorageBundle,
-    run: PipelineRunContext,
-    state: RunState,
-) -> None:
-    latest_records = _latest_phase_records(state)
-    if not latest_records:
-        return
-    store = bundle.artifact_store
-
-    for (phase, target_language), record in latest_records.items():
-        if not record.artifact_ids:
-            continue
-        artifact_id = record.artifact_ids[-1]
-        match phase:
-            case PhaseName.INGEST:
-                if run.source_lines:
-                    continue
-                run.source_lines = await store.load_artifact_jsonl(
-                    artifact_id, SourceLine
-                )
-            case PhaseName.CONTEXT:
-                if run.context_output is not None:
-                    continue
-                payload = await _load_single_artifact(
-                    store, artifact_id, ContextPhaseOutput
-                )
-                if payload is not None:
-                    run.context_output = payload
-            case PhaseName.PRETRANSLATION:
-                if run.pretranslation_output is not None:
-                    continue
-                payload = await _load_single_artifact(
-                    store, artifact_id, PretranslationPhaseOutput
-                )
-                if payload is not None:
-                    run.pretranslation_output = payload
-            case PhaseName.TRANSLATE if target_language is not None:
-                if target_language in run.translate_outputs:
-                    continue
-                payload = await _load_single_artifact(
-                    store, artifact_id, TranslatePhaseOutput
-                )
-                if payload is not None:
-                    run.translate_outputs[target_language] = payload
-            case PhaseName.QA if target_language is not None:
-                if target_language in run.qa_outputs:
-                    continue
-                payload = await _load_single_artifact(store, artifact_id, QaPhaseOutput)
-                if payload is not None:
-                    run.qa_outputs[target_language] = payload
-            case PhaseName.EDIT if target_language is not None:
-                if target_language in run.edit_outputs:
-                    continue
-                payload = await _load_single_artifact(
-                    store, artifact_id, EditPhaseOutput
-                )
-                if payload is not None:
-                    run.edit_outputs[target_language] = payload
-            case PhaseName.EXPORT if target_language is not None:
-                if target_language in run.export_results:
-                    continue
-                payload = await _load_single_artifact(store, artifact_id, ExportResult)
-                if payload is not None:
-                    run.export_results[target_language] = payload
-
-
-def _build_ingest_source(
-    config: RunConfig,
-    phases: list[PhaseName],
-    input_path: Path | None,
-) -> IngestSource | None:
-    if PhaseName.INGEST not in phases:
-        if input_path is not None:
-            raise ValueError("input_path is only valid when running ingest")
-        return None
-    workspace_dir = Path(config.project.paths.workspace_dir)
-    resolved = input_path or Path(config.project.paths.input_path)
-    if input_path is not None:
-        resolved = _resolve_path(resolved, workspace_dir)
-    return IngestSource(
-        input_path=str(resolved),
-        format=FileFormat(config.project.formats.input_format),
-    )
-
-
-def _build_export_targets(
-    config: RunConfig,
-    phases: list[PhaseName],
-    run_id: RunId,
-    target_languages: list[LanguageCode] | None,
-    output_path: Path | None,
-) -> dict[LanguageCode, ExportTarget] | None:
-    if PhaseName.EXPORT not in phases:
-        if output_path is not None:
-            raise ValueError("output_path is only valid when running export")
-        return None
-    languages = target_languages or config.project.languages.target_languages
-    if not languages:
-        raise ValueError("No target languages configured")
-    if output_path is not None and len(languages) > 1:
-        raise ValueError("output_path requires a single target language")
-    output_format = FileFormat(config.project.formats.output_format)
-    output_dir = Path(config.project.paths.output_dir)
-    run_dir = output_dir / f"run-{run_id}"
-    run_dir.mkdir(parents=True, exist_ok=True)
-    resolved_override: Path | None = None
-    if output_path is not None:
-        resolved_override = _resolve_path(
-            output_path, Path(config.project.paths.workspace_dir)
-        )
-    targets: dict[LanguageCode, ExportTarget] = {}
-    for language in languages:
-        path = resolved_override
-        if path is None:
-            path = run_dir / f"{language}.{output_format.value}"
-        target = ExportTarget(output_path=str(path), format=output_format)
-        targets[language] = target
-    return targets
-
-
-async def _load_run_state(bundle: _StorageBundle, run_id: RunId) -> RunState | None:
-    record = await bundle.run_state_store.load_run_state(run_id)
-    if record is None:
-        return None
-    return record.state
-
-
 async def _run_pipeline_async(
     *,
     config: RunConfig,
-    bundle: _StorageBundle,
+    bundle: StorageBundle,
     run_id: RunId,
     target_languages: list[str] | None,
+    baseline_run_id: RunId | None = None,
 ) -> RunExecutionResult:
-    phases = _resolve_enabled_phases(config)
+    phases = resolve_enabled_phases(config)
     if not phases:
         raise ValueError("No enabled phases configured")
-    languages = _resolve_target_languages(config, target_languages)
-    _ensure_api_key(config, phases)
-    preflight_endpoints = _build_preflight_endpoints(config, phases)
-    if preflight_endpoints:
-        await assert_preflight(preflight_endpoints)
-    orchestrator = await asyncio.to_thread(_build_orchestrator, config, bundle, phases)
-    run = await _load_or_create_run_context(orchestrator, bundle, run_id, config)
-    ingest_source = _build_ingest_source(config, phases, input_path=None)
-    export_targets = await asyncio.to_thread(
-        _build_export_targets, config, phases, run.run_id, languages, None
-    )
-    await orchestrator.run_plan(
-        run,
-        phases=phases,
-        target_languages=languages,
-        ingest_source=ingest_source,
-        export_targets=export_targets,
-    )
-    run_state = await _load_run_state(bundle, run.run_id)
-    log_reference = await bundle.log_store.get_log_reference(run.run_id)
-    progress_file = _build_progress_reference(bundle.progress_path)
-    progress_updates = await asyncio.to_thread(
-        _read_progress_updates, bundle.progress_path
-    )
-    report_data = _build_run_report_data(
-        run_id=run.run_id,
-        run_state=run_state,
-        progress_updates=progress_updates,
-    )
-    await asyncio.to_thread(
-        _write_run_report,
-        _report_path(config.project.paths.logs_dir, run.run_id),
-        report_data,
-    )
-    return _build_run_execution_result(
-        run=run,
-        run_state=run_state,
-        log_reference=log_reference,
-        progress_file=progress_file,
-        phase_record=None,
-    )
+    try:
+        run = await run_phase_plan(
+            config,
+            bundle,
+            run_id=run_id,
+            phases=phases,
+            target_languages=resolve_target_languages(config, target_languages),
+            baseline_run_id=baseline_run_id,
+        )
+        run_state = await load_run_state(bundle, run.run_id)
+        log_reference = await bundle.log_store.get_log_reference(run.run_id)
+        progress_file = _build_progress_reference(bundle.progress_path)
+        progress_updates = await asyncio.to_thread(
+            _read_progress_updates, bundle.progress_path
+        )
+        report_data = _build_run_report_data(
+            run_id=run.run_id,
+            run_state=run_state,
+            progress_updates=progress_updates,
+        )
+        await asyncio.to_thread(
+            _write_run_report,
+            _report_path(config.project.paths.logs_dir, run.run_id),
+            report_data,
+        )
+        return _build_run_execution_result(
+            run=run,
+            run_state=run_state,
+            log_reference=log_reference,
+            progress_file=progress_file,
+            phase_record=None,
+        )
+    finally:
+        close_stores(bundle)
 
 
 async def _run_phase_async(
     *,
     config: RunConfig,
-    bundle: _StorageBundle,
+    bundle: StorageBundle,
     run_id: RunId,
     phase: PhaseName,
     target_language: str | None,
@@ -3002,52 +2374,42 @@ async def _run_phase_async(
 ) -> RunExecutionResult:
     phases = _resolve_phase_plan(config, phase)
     languages = _resolve_phase_languages(config, phase, target_language)
-    _ensure_api_key(config, phases)
-    preflight_endpoints = _build_preflight_endpoints(config, phases)
-    if preflight_endpoints:
-        await assert_preflight(preflight_endpoints)
-    orchestrator = await asyncio.to_thread(_build_orchestrator, config, bundle, phases)
-    run = await _load_or_create_run_context(orchestrator, bundle, run_id, config)
-    ingest_source = _build_ingest_source(config, phases, input_path=input_path)
-    export_targets = await asyncio.to_thread(
-        _build_export_targets,
-        config,
-        phases,
-        run.run_id,
-        languages or None,
-        output_path,
-    )
-    await orchestrator.run_plan(
-        run,
-        phases=phases,
-        target_languages=languages or None,
-        ingest_source=ingest_source,
-        export_targets=export_targets,
-    )
-    run_state = await _load_run_state(bundle, run.run_id)
-    log_reference = await bundle.log_store.get_log_reference(run.run_id)
-    progress_file = _build_progress_reference(bundle.progress_path)
-    progress_updates = await asyncio.to_thread(
-        _read_progress_updates, bundle.progress_path
-    )
-    report_data = _build_run_report_data(
-        run_id=run.run_id,
-        run_state=run_state,
-        progress_updates=progress_updates,
-    )
-    await asyncio.to_thread(
-        _write_run_report,
-        _report_path(config.project.paths.logs_dir, run.run_id),
-        report_data,
-    )
-    phase_record = _find_phase_record(run.phase_history, phase, languages)
-    return _build_run_execution_result(
-        run=run,
-        run_state=run_state,
-        log_reference=log_reference,
-        progress_file=progress_file,
-        phase_record=phase_record,
-    )
+    try:
+        run = await run_phase_plan(
+            config,
+            bundle,
+            run_id=run_id,
+            phases=phases,
+            target_languages=languages or None,
+            input_path=input_path,
+            output_path=output_path,
+        )
+        run_state = await load_run_state(bundle, run.run_id)
+        log_reference = await bundle.log_store.get_log_reference(run.run_id)
+        progress_file = _build_progress_reference(bundle.progress_path)
+        progress_updates = await asyncio.to_thread(
+            _read_progress_updates, bundle.progress_path
+        )
+        report_data = _build_run_report_data(
+            run_id=run.run_id,
+            run_state=run_state,
+            progress_updates=progress_updates,
+        )
+        await asyncio.to_thread(
+            _write_run_report,
+            _report_path(config.project.paths.logs_dir, run.run_id),
+            report_data,
+        )
+        phase_record = _find_phase_record(run.phase_history, phase, languages)
+        return _build_run_execution_result(
+            run=run,
+            run_state=run_state,
+            log_reference=log_reference,
+            progress_file=progress_file,
+            phase_record=phase_record,
+        )
+    finally:
+        close_stores(bundle)
 
 
 def _find_phase_record(
@@ -3077,9 +2439,7 @@ def _build_progress_reference(path: Path | None) -> StorageReference | None:
 def _resolve_status_run_id(config: RunConfig, run_id: str | None) -> RunId:
     if run_id is not None:
         return _parse_run_id(run_id)
-    workspace_dir = Path(config.project.paths.workspace_dir)
-    run_state_dir = workspace_dir / ".rentl" / "run_state"
-    store = FileSystemRunStateStore(base_dir=str(run_state_dir))
+    store = build_run_state_store(config)
     records = asyncio.run(store.list_run_index(limit=1))
     if not records:
         raise ValueError("No runs found")
@@ -3319,27 +2679,30 @@ def _write_run_report(path: Path, data: dict[str, JsonValue]) -> None:
     path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
 
 
-def _watch_status(bundle: _StorageBundle, run_id: RunId) -> None:
-    updates: list[ProgressUpdate] = []
+def _watch_status(bundle: StorageBundle, run_id: RunId) -> None:
+    aggregator = StatusAggregator(run_id)
     offset = 0
     log_reference = asyncio.run(bundle.log_store.get_log_reference(run_id))
     progress_file = _build_progress_reference(bundle.progress_path)
     final_status = None
     no_state_count = 0
     max_no_state_iterations = 20  # 10 seconds of no state before warning
+    run_state: RunState | None = None
+    state_signature: object = _UNSET_STATE_SIGNATURE
 
     with Live(refresh_per_second=4) as live:
         while True:
-            run_state = asyncio.run(_load_run_state(bundle, run_id))
+            # Only reload run state when its backing file changed on disk
+            signature = _run_state_signature(bundle, run_id)
+            if signature is None or signature != state_signature:
+                run_state = asyncio.run(load_run_state(bundle, run_id))
+                state_signature = signature
             new_updates, offset = _read_progress_updates_since(
                 bundle.progress_path, offset
             )
-            if new_updates:
-                updates.extend(new_updates)
-            status_result = build_status_result(
-                run_id=run_id,
+            aggregator.ingest(new_updates)
+            status_result = aggregator.build_result(
                 run_state=run_state,
-                progress_updates=updates,
                 log_reference=log_reference,
                 progress_file=progress_file,
             )
@@ -3395,6 +2758,32 @@ def _watch_status(bundle: _StorageBundle, run_id: RunId) -> None:
         raise typer.Exit(code=ExitCode.ORCHESTRATION_ERROR.value)
 
 
+_UNSET_STATE_SIGNATURE = object()
+
+
+def _run_state_signature(
+    bundle: StorageBundle, run_id: RunId
+) -> tuple[tuple[int, int] | None, ...] | None:
+    store = bundle.run_state_store
+    if isinstance(store, FileSystemRunStateStore):
+        paths = [store.state_path(run_id)]
+    elif isinstance(store, SqliteRunStateStore):
+        # WAL mode lands commits in the -wal file until a checkpoint
+        database_path = store.database_path
+        paths = [database_path, database_path.with_name(f"{database_path.name}-wal")]
+    else:
+        return None
+    return tuple(_file_signature(path) for path in paths)
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
 def _render_status(result: RunStatusResult) -> None:
     panel = _build_status_panel(result)
     rprint(panel)
@@ -3755,7 +3144,7 @@ def _error_from_exception(exc: Exception) -> ErrorResponse:
                 details=None,
                 exit_code=exit_code.value,
             )
-        case _ConfigError():
+        case PipelineConfigError():
             exit_code = resolve_exit_code("config_error")
             return ErrorResponse(
                 code="config_error",
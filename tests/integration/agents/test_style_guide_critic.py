@@ -95,7 +95,8 @@ def then_profile_has_valid_qa_prompts(ctx: StyleGuideCriticContext) -> None:
     assert ctx.profile.prompts.agent.content
     assert ctx.profile.prompts.user_template.content
     # Check for expected template variables
-    assert "{{style_guide}}" in ctx.profile.prompts.user_template.content
+    assert ctx.profile.prompts.static_context is not None
+    assert "{{style_guide}}" in ctx.profile.prompts.static_context.content
     assert "{{lines_to_review}}" in ctx.profile.prompts.user_template.content
 
 
@@ -12,6 +12,7 @@ from pytest_bdd import given, scenarios, then, when
 from typer.testing import CliRunner
 
 import rentl.main as cli_main
+from tests.integration.conftest import write_rentl_config
 
 if TYPE_CHECKING:
     pass
@@ -32,12 +33,19 @@ class ExportContext:
 
 
 @given("a JSONL file with translated lines", target_fixture="ctx")
-def given_jsonl_with_translated_lines(tmp_path: Path) -> ExportContext:
+def given_jsonl_with_translated_lines(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> ExportContext:
     """Create a JSONL file with translated lines.
 
+    Export loads the default config, so write one into ``tmp_path`` and run
+    from there to keep its command logs out of the working tree.
+
     Returns:
         ExportContext with input and output paths set.
     """
+    write_rentl_config(tmp_path, tmp_path)
+    monkeypatch.chdir(tmp_path)
     ctx = ExportContext()
     ctx.input_path = tmp_path / "translated.jsonl"
     ctx.output_path = tmp_path / "output"
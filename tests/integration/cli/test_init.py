@@ -13,6 +13,7 @@ from pytest_bdd import given, scenarios, then, when
 from typer.testing import CliRunner
 
 import rentl.main as cli_main
+import rentl_runner.pipeline as runner_pipeline
 from rentl_agents.providers import detect_provider
 from rentl_agents.runtime import ProfileAgent
 from rentl_agents.wiring import AgentPoolBundle, build_agent_pools
@@ -252,7 +253,7 @@ def then_pipeline_executes_end_to_end(
     async def _noop_preflight(endpoints: list[object]) -> None:  # noqa: RUF029
         preflight_called["count"] += 1
 
-    monkeypatch.setattr(cli_main, "assert_preflight", _noop_preflight)
+    monkeypatch.setattr(runner_pipeline, "assert_preflight", _noop_preflight)
 
     # Verify pipeline has required ingest and export phases
     # Without these, the pipeline will fail at runtime
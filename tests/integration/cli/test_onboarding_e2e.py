@@ -17,6 +17,7 @@ from pytest_bdd import given, scenarios, then, when
 from typer.testing import CliRunner
 
 import rentl.main as cli_main
+import rentl_runner.pipeline as runner_pipeline
 from rentl_agents.runtime import ProfileAgent
 from tests.integration.conftest import FakeLlmRuntime, make_mock_agent_run
 
@@ -148,7 +149,7 @@ def when_run_pipeline(
     assert ctx.config_path is not None
     assert ctx.project_dir is not None
 
-    # Set fake API key so _ensure_api_key() and _build_preflight_endpoints()
+    # Set fake API key so _ensure_api_keys() and _build_preflight_endpoints()
     # pass without real credentials (init sets api_key_env = RENTL_LOCAL_API_KEY)
     monkeypatch.setenv("RENTL_LOCAL_API_KEY", "fake-api-key-for-e2e-test")
 
@@ -158,7 +159,7 @@ def when_run_pipeline(
     async def _noop_preflight(endpoints: list[object]) -> None:  # noqa: RUF029
         preflight_called["count"] += 1
 
-    monkeypatch.setattr(cli_main, "assert_preflight", _noop_preflight)
+    monkeypatch.setattr(runner_pipeline, "assert_preflight", _noop_preflight)
 
     # Store preflight tracker on context for assertion in then step
     ctx.preflight_called = preflight_called
@@ -14,6 +14,7 @@ from pydantic import BaseModel
 from typer.testing import CliRunner
 
 from rentl_agents.runtime import ProfileAgent
+from rentl_agents.templates import TemplateContext
 from rentl_llm.openai_runtime import OpenAICompatibleRuntime
 from rentl_schemas.llm import LlmPromptRequest, LlmPromptResponse
 from rentl_schemas.phases import (
@@ -133,7 +134,7 @@ class FakeLlmRuntime:
 
 
 def make_mock_agent_run() -> tuple[
-    Callable[[ProfileAgent, BaseModel], Awaitable[BaseModel]],
+    Callable[..., Awaitable[BaseModel]],
     dict[str, int],
     dict[str, int],
 ]:
@@ -145,7 +146,12 @@ def make_mock_agent_run() -> tuple[
     mock_call_count: dict[str, int] = {"count": 0}
     edit_line_index: dict[str, int] = {"index": 0}
 
-    async def mock_agent_run(self: ProfileAgent, payload: BaseModel) -> BaseModel:
+    async def mock_agent_run(
+        self: ProfileAgent,
+        payload: BaseModel,
+        context: TemplateContext | None = None,
+        cacheable: Callable[[BaseModel], bool] | None = None,
+    ) -> BaseModel:
         """Return schema-valid output based on agent's output_type.
 
         For batch operations, returns outputs matching all input IDs to satisfy
@@ -154,6 +160,8 @@ def make_mock_agent_run() -> tuple[
         Args:
             self: ProfileAgent instance (patched method).
             payload: Input payload for the agent (phase-specific schema).
+            context: Per-call template context (unused by the mock).
+            cacheable: Response cache check (unused by the mock).
 
         Returns:
             Schema-valid output matching the agent's output_type.
@@ -190,7 +198,19 @@ def make_mock_agent_run() -> tuple[
             return IdiomAnnotationList(reviews=reviews)
         elif output_type == TranslationResultList:
             source_lines = getattr(payload, "source_lines", [])
-            if not source_lines:
+            qa_issues = getattr(payload, "qa_issues", None)
+            if qa_issues is not None:
+                # Batched edit: one result per QA-flagged line
+                flagged_ids = {issue.line_id for issue in qa_issues}
+                translations = [
+                    TranslationResultLine(
+                        line_id=line.line_id,
+                        text="Final edited translation",
+                    )
+                    for line in getattr(payload, "translated_lines", [])
+                    if line.line_id in flagged_ids
+                ]
+            elif not source_lines:
                 translations = [
                     TranslationResultLine(
                         line_id="line_001",
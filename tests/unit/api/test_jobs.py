@@ -0,0 +1,276 @@
+"""Unit tests for the pipeline job queue and worker pool."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import Mapping
+from pathlib import Path
+from typing import cast
+
+import pytest
+from fastapi.testclient import TestClient
+
+import rentl_runner.pipeline as runner_pipeline
+from rentl_api.broadcaster import RunEventBroadcaster
+from rentl_api.executor import PipelineJobExecutor
+from rentl_api.jobs import (
+    JobConfigError,
+    JobStatus,
+    JobWorkerPool,
+    PipelineJob,
+    PipelineJobRequest,
+    SqliteJobQueue,
+)
+from rentl_api.main import app, get_job_queue, get_job_workers
+from rentl_core.init import InitAnswers, StandardEnvVar, generate_project
+from rentl_runner.pipeline import StorageBundle
+from rentl_schemas.config import RunConfig
+from rentl_schemas.primitives import FileFormat
+
+
+class _RecordingExecutor:
+    def __init__(self) -> None:
+        self.executed: list[str] = []
+
+    async def execute(self, job: PipelineJob) -> None:
+        self.executed.append(job.request.config_path)
+        if job.request.config_path == "broken.toml":
+            raise ValueError("config not found")
+        if job.request.config_path == "escaped.toml":
+            raise JobConfigError("workspace escapes")
+
+
+def _generate_project(project_dir: Path) -> Path:
+    generate_project(
+        InitAnswers(
+            project_name="game",
+            game_name="game",
+            source_language="ja",
+            target_languages=["en"],
+            base_url="http://localhost:11434/v1",
+            model_id="test-model",
+            input_format=FileFormat.JSONL,
+        ),
+        project_dir,
+    )
+    return project_dir
+
+
+def test_job_queue_claims_in_submission_order(tmp_path: Path) -> None:
+    """Jobs are claimed oldest first and survive a restart."""
+    queue = SqliteJobQueue(str(tmp_path / "jobs.db"))
+
+    async def _exercise() -> tuple[list[PipelineJob], PipelineJob | None, int]:
+        first = await queue.enqueue(PipelineJobRequest(config_path="a.toml"))
+        await queue.enqueue(PipelineJobRequest(config_path="b.toml"))
+        claimed = await queue.claim()
+        assert claimed is not None
+        assert claimed.run_id == first.run_id
+        requeued = await SqliteJobQueue(str(tmp_path / "jobs.db")).requeue_running()
+        return await queue.list_jobs(), await queue.claim(), requeued
+
+    jobs, reclaimed, requeued = asyncio.run(_exercise())
+
+    assert [job.request.config_path for job in jobs] == ["b.toml", "a.toml"]
+    assert requeued == 1
+    assert reclaimed is not None
+    assert reclaimed.request.config_path == "a.toml"
+    assert reclaimed.status == JobStatus.RUNNING
+
+
+def test_worker_pool_records_job_outcomes(tmp_path: Path) -> None:
+    """Workers execute queued jobs and persist completion or failure."""
+    queue = SqliteJobQueue(str(tmp_path / "jobs.db"))
+    executor = _RecordingExecutor()
+    workers = JobWorkerPool(queue, executor, workers=2, poll_interval_s=0.01)
+
+    async def _drain() -> list[PipelineJob]:
+        await queue.enqueue(PipelineJobRequest(config_path="rentl.toml"))
+        await queue.enqueue(PipelineJobRequest(config_path="broken.toml"))
+        await queue.enqueue(PipelineJobRequest(config_path="escaped.toml"))
+        await workers.start()
+        try:
+            for _ in range(500):
+                jobs = await queue.list_jobs()
+                if all(job.completed_at is not None for job in jobs):
+                    return jobs
+                await asyncio.sleep(0.01)
+        finally:
+            await workers.stop()
+        raise AssertionError("jobs did not finish")
+
+    jobs = {job.request.config_path: job for job in asyncio.run(_drain())}
+
+    assert sorted(executor.executed) == ["broken.toml", "escaped.toml", "rentl.toml"]
+    assert jobs["rentl.toml"].status == JobStatus.COMPLETED
+    assert jobs["rentl.toml"].error_code is None
+    assert jobs["broken.toml"].status == JobStatus.FAILED
+    assert jobs["broken.toml"].error == "config not found"
+    assert jobs["broken.toml"].error_code == "runtime_error"
+    assert jobs["escaped.toml"].error_code == "config_error"
+
+
+def test_executor_rejects_config_workspace_outside_api_workspace(
+    tmp_path: Path,
+) -> None:
+    """A config whose workspace escapes the API workspace fails as config_error."""
+    project_dir = _generate_project(tmp_path / "api" / "game")
+    config_path = project_dir / "rentl.toml"
+    config_path.write_text(
+        config_path.read_text(encoding="utf-8").replace(
+            'workspace_dir = "."', f'workspace_dir = "{tmp_path / "elsewhere"}"'
+        ),
+        encoding="utf-8",
+    )
+    executor = PipelineJobExecutor(RunEventBroadcaster(), tmp_path / "api")
+
+    async def _execute() -> None:
+        job = await SqliteJobQueue(str(tmp_path / "jobs.db")).enqueue(
+            PipelineJobRequest(config_path=str(config_path))
+        )
+        try:
+            await executor.execute(job)
+        finally:
+            await executor.aclose()
+
+    with pytest.raises(JobConfigError, match="workspace"):
+        asyncio.run(_execute())
+
+
+def test_executor_resolves_each_jobs_env_separately(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Back-to-back jobs each see their own .env key, not the first job's."""
+    key_env = StandardEnvVar.API_KEY.value
+    monkeypatch.delenv(key_env, raising=False)
+    config_paths: list[Path] = []
+    for name in ("first", "second"):
+        project_dir = _generate_project(tmp_path / name)
+        (project_dir / ".env").write_text(f"{key_env}=key-{name}\n", encoding="utf-8")
+        config_paths.append(project_dir / "rentl.toml")
+    seen_keys: list[str | None] = []
+
+    async def _record_plan(
+        config: RunConfig, bundle: StorageBundle, **kwargs: object
+    ) -> None:
+        environ = cast(Mapping[str, str], kwargs["environ"])
+        seen_keys.append(environ.get(key_env))
+        await runner_pipeline.close_sinks(bundle)
+
+    monkeypatch.setattr(runner_pipeline, "run_phase_plan", _record_plan)
+    executor = PipelineJobExecutor(RunEventBroadcaster())
+
+    async def _execute() -> None:
+        queue = SqliteJobQueue(str(tmp_path / "jobs.db"))
+        try:
+            for config_path in config_paths:
+                job = await queue.enqueue(
+                    PipelineJobRequest(config_path=str(config_path))
+                )
+                await executor.execute(job)
+        finally:
+            await executor.aclose()
+
+    asyncio.run(_execute())
+
+    assert seen_keys == ["key-first", "key-second"]
+    assert key_env not in os.environ
+
+
+class _FlakyQueue(SqliteJobQueue):
+    def __init__(self, path: str) -> None:
+        super().__init__(path)
+        self.failures = {"claim": 1, "save": 1}
+
+    def _fail_once(self, operation: str) -> None:
+        if self.failures[operation]:
+            self.failures[operation] -= 1
+            raise OSError("database is locked")
+
+    async def claim(self) -> PipelineJob | None:
+        self._fail_once("claim")
+        return await super().claim()
+
+    async def save(self, job: PipelineJob) -> None:
+        self._fail_once("save")
+        await super().save(job)
+
+
+def test_worker_pool_survives_queue_failures(tmp_path: Path) -> None:
+    """A failing claim or save is logged and the worker keeps running."""
+    queue = _FlakyQueue(str(tmp_path / "jobs.db"))
+    executor = _RecordingExecutor()
+    workers = JobWorkerPool(queue, executor, workers=1, poll_interval_s=0.01)
+
+    async def _drain() -> list[str]:
+        await queue.enqueue(PipelineJobRequest(config_path="a.toml"))
+        await queue.enqueue(PipelineJobRequest(config_path="b.toml"))
+        await workers.start()
+        try:
+            for _ in range(500):
+                jobs = await queue.list_jobs()
+                if any(job.status == JobStatus.COMPLETED for job in jobs):
+                    return executor.executed
+                await asyncio.sleep(0.01)
+        finally:
+            await workers.stop()
+        raise AssertionError("worker stopped after a queue failure")
+
+    assert asyncio.run(_drain()) == ["a.toml", "b.toml"]
+    assert queue.failures == {"claim": 0, "save": 0}
+
+
+def test_job_endpoints_queue_and_report_jobs(tmp_path: Path) -> None:
+    """Submitted jobs are queued, workers are woken and jobs are retrievable."""
+    queue = SqliteJobQueue(str(tmp_path / "jobs.db"))
+    workers = JobWorkerPool(queue, _RecordingExecutor())
+    app.dependency_overrides[get_job_queue] = lambda: queue
+    app.dependency_overrides[get_job_workers] = lambda: workers
+    try:
+        client = TestClient(app)
+        submitted = client.post(
+            "/jobs", json={"config_path": "rentl.toml", "target_languages": ["ja"]}
+        )
+        run_id = submitted.json()["data"]["run_id"]
+        job = client.get(f"/jobs/{run_id}").json()
+        listed = client.get("/jobs", params={"limit": 1}).json()
+        missing = client.get("/jobs/01890a5c-91c8-7b2a-9f51-9b40d0cfb712")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert submitted.status_code == 202
+    assert job["data"]["status"] == "queued"
+    assert job["data"]["request"]["target_languages"] == ["ja"]
+    assert [item["run_id"] for item in listed["data"]] == [run_id]
+    assert missing.status_code == 404
+
+
+def test_job_endpoints_confine_paths_to_workspace(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Job paths resolve within the API workspace and cannot escape it."""
+    monkeypatch.setenv("RENTL_API_WORKSPACE", str(tmp_path))
+    queue = SqliteJobQueue(str(tmp_path / "jobs.db"))
+    workers = JobWorkerPool(queue, _RecordingExecutor())
+    app.dependency_overrides[get_job_queue] = lambda: queue
+    app.dependency_overrides[get_job_workers] = lambda: workers
+    try:
+        client = TestClient(app)
+        accepted = client.post(
+            "/jobs", json={"config_path": "rentl.toml", "input_path": "in.jsonl"}
+        )
+        escaped = client.post("/jobs", json={"config_path": "../rentl.toml"})
+        absolute = client.post(
+            "/jobs", json={"config_path": "rentl.toml", "input_path": "/etc/passwd"}
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    request = accepted.json()["data"]["request"]
+    assert request["config_path"] == str(tmp_path.resolve() / "rentl.toml")
+    assert request["input_path"] == str(tmp_path.resolve() / "in.jsonl")
+    assert escaped.status_code == 400
+    assert escaped.json()["error"]["code"] == "config_error"
+    assert absolute.status_code == 400
+    assert len(asyncio.run(queue.list_jobs())) == 1
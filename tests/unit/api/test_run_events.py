@@ -0,0 +1,218 @@
+"""Unit tests for the run status API and event broadcaster."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from uuid import UUID
+
+from fastapi.testclient import TestClient
+
+from rentl_api.broadcaster import RunEventBroadcaster
+from rentl_api.jobs import (
+    JobStatus,
+    PipelineJob,
+    PipelineJobRequest,
+    SqliteJobQueue,
+    job_run_status,
+)
+from rentl_api.main import app, get_broadcaster, get_job_queue
+from rentl_schemas.events import ProgressEvent
+from rentl_schemas.logs import LogEntry
+from rentl_schemas.primitives import LogLevel, PhaseName, PhaseStatus, RunId
+from rentl_schemas.progress import (
+    PhaseProgress,
+    ProgressPercentMode,
+    ProgressSummary,
+    ProgressUpdate,
+    RunProgress,
+)
+
+RUN_ID: RunId = UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb710")
+OTHER_RUN_ID: RunId = UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb711")
+
+
+def _progress(run_id: RunId, event: ProgressEvent) -> ProgressUpdate:
+    summary = ProgressSummary(
+        percent_complete=None,
+        percent_mode=ProgressPercentMode.UNAVAILABLE,
+        eta_seconds=None,
+        notes=None,
+    )
+    return ProgressUpdate(
+        run_id=run_id,
+        event=event,
+        timestamp="2026-02-03T12:00:00Z",
+        run_progress=RunProgress(
+            phases=[
+                PhaseProgress(
+                    phase=PhaseName.INGEST,
+                    status=PhaseStatus.RUNNING,
+                    summary=summary,
+                )
+            ],
+            summary=summary,
+        ),
+    )
+
+
+def _log(run_id: RunId) -> LogEntry:
+    return LogEntry(
+        timestamp="2026-02-03T12:00:01Z",
+        level=LogLevel.INFO,
+        event="phase_started",
+        run_id=run_id,
+        phase=PhaseName.INGEST,
+        message="Ingest started",
+        data=None,
+    )
+
+
+def test_broadcaster_fans_out_events_until_run_finishes() -> None:
+    """Subscribers receive their run's events and stop at completion."""
+    broadcaster = RunEventBroadcaster()
+
+    async def _collect() -> list[str]:
+        events = broadcaster.subscribe(RUN_ID)
+        first = await anext(events)
+        await broadcaster.emit_progress(_progress(RUN_ID, ProgressEvent.RUN_STARTED))
+        await broadcaster.emit_log(_log(OTHER_RUN_ID))
+        await broadcaster.emit_log(_log(RUN_ID))
+        await broadcaster.emit_progress(_progress(RUN_ID, ProgressEvent.RUN_COMPLETED))
+        return [first.event] + [event.event async for event in events]
+
+    assert asyncio.run(_collect()) == ["status", "progress", "log", "progress"]
+    assert broadcaster.run_ids() == [RUN_ID, OTHER_RUN_ID]
+    status = broadcaster.status(RUN_ID)
+    assert status is not None
+    assert status.status == "completed"
+
+
+def test_broadcaster_drops_oldest_events_for_slow_subscribers() -> None:
+    """A full subscriber queue never blocks publishing."""
+    broadcaster = RunEventBroadcaster(max_queue=1)
+
+    async def _collect() -> list[str]:
+        events = broadcaster.subscribe(RUN_ID)
+        await anext(events)
+        await broadcaster.emit_log(_log(RUN_ID))
+        await broadcaster.emit_progress(_progress(RUN_ID, ProgressEvent.RUN_COMPLETED))
+        return [event.event async for event in events]
+
+    assert asyncio.run(_collect()) == ["progress"]
+
+
+def test_broadcaster_registers_subscribers_lazily() -> None:
+    """A subscription that is never iterated leaves no queue behind."""
+    broadcaster = RunEventBroadcaster()
+
+    async def _publish() -> None:
+        broadcaster.subscribe(RUN_ID)
+        await broadcaster.emit_log(_log(RUN_ID))
+
+    asyncio.run(_publish())
+
+    assert broadcaster._subscribers == {}
+
+
+def test_broadcaster_evicts_oldest_finished_runs() -> None:
+    """Only the most recently finished runs keep their status."""
+    broadcaster = RunEventBroadcaster(max_finished_runs=1)
+
+    async def _run() -> None:
+        await broadcaster.emit_progress(_progress(RUN_ID, ProgressEvent.RUN_COMPLETED))
+        await broadcaster.emit_progress(
+            _progress(OTHER_RUN_ID, ProgressEvent.RUN_STARTED)
+        )
+        await broadcaster.emit_progress(
+            _progress(OTHER_RUN_ID, ProgressEvent.RUN_COMPLETED)
+        )
+
+    asyncio.run(_run())
+
+    assert broadcaster.run_ids() == [OTHER_RUN_ID]
+    assert broadcaster.status(RUN_ID) is None
+
+
+def test_broadcaster_keeps_finished_runs_with_live_subscribers() -> None:
+    """A finished run is evicted only after its subscribers drain."""
+    broadcaster = RunEventBroadcaster(max_finished_runs=0)
+
+    async def _run() -> tuple[list[RunId], list[str]]:
+        await broadcaster.emit_progress(_progress(RUN_ID, ProgressEvent.RUN_STARTED))
+        events = broadcaster.subscribe(RUN_ID)
+        await anext(events)
+        await broadcaster.emit_progress(_progress(RUN_ID, ProgressEvent.RUN_COMPLETED))
+        retained = broadcaster.run_ids()
+        return retained, [event.event async for event in events]
+
+    retained, remaining = asyncio.run(_run())
+
+    assert retained == [RUN_ID]
+    assert remaining == ["progress"]
+    assert broadcaster.run_ids() == []
+
+
+def test_broadcaster_end_run_closes_streams() -> None:
+    """Ending a run that never reported closes its subscriptions."""
+    broadcaster = RunEventBroadcaster()
+
+    async def _collect() -> list[str | None]:
+        events = broadcaster.subscribe(RUN_ID)
+        await anext(events)
+        job = PipelineJob(
+            run_id=RUN_ID,
+            request=PipelineJobRequest(config_path="rentl.toml"),
+            status=JobStatus.FAILED,
+            submitted_at="2026-02-03T12:00:00Z",
+        )
+        broadcaster.end_run(job_run_status(job))
+        return [event.status.status if event.status else None async for event in events]
+
+    assert asyncio.run(_collect()) == ["failed"]
+
+
+def test_run_endpoints_serve_live_status(tmp_path: Path) -> None:
+    """Run list, status and event stream endpoints read the broadcaster."""
+    broadcaster = RunEventBroadcaster()
+    asyncio.run(
+        broadcaster.emit_progress(_progress(RUN_ID, ProgressEvent.RUN_COMPLETED))
+    )
+    queue = SqliteJobQueue(str(tmp_path / "jobs.db"))
+    app.dependency_overrides[get_broadcaster] = lambda: broadcaster
+    app.dependency_overrides[get_job_queue] = lambda: queue
+    try:
+        client = TestClient(app)
+        runs = client.get("/runs").json()
+        status = client.get(f"/runs/{RUN_ID}/status").json()
+        missing = client.get(f"/runs/{OTHER_RUN_ID}/status")
+        stream = client.get(f"/runs/{RUN_ID}/events")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert [run["run_id"] for run in runs["data"]] == [str(RUN_ID)]
+    assert status["data"]["status"] == "completed"
+    assert missing.status_code == 404
+    assert missing.json()["error"]["code"] == "not_found"
+    assert stream.headers["content-type"].startswith("text/event-stream")
+    assert stream.text.startswith("event: status\ndata: ")
+
+
+def test_run_endpoints_fall_back_to_job_status(tmp_path: Path) -> None:
+    """Runs of jobs the orchestrator has not reported on use the job state."""
+    broadcaster = RunEventBroadcaster()
+    queue = SqliteJobQueue(str(tmp_path / "jobs.db"))
+    job = asyncio.run(queue.enqueue(PipelineJobRequest(config_path="rentl.toml")))
+    app.dependency_overrides[get_broadcaster] = lambda: broadcaster
+    app.dependency_overrides[get_job_queue] = lambda: queue
+    try:
+        client = TestClient(app)
+        queued = client.get(f"/runs/{job.run_id}/status").json()
+        asyncio.run(queue.save(job.model_copy(update={"status": JobStatus.FAILED})))
+        stream = client.get(f"/runs/{job.run_id}/events")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert queued["data"]["status"] == "pending"
+    assert stream.text.startswith("event: status\ndata: ")
+    assert '"status":"failed"' in stream.text
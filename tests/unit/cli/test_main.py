@@ -25,9 +25,24 @@ from rentl_core.migrate import ConfigDict, dict_to_toml
 from rentl_core.orchestrator import PipelineOrchestrator
 from rentl_core.ports.orchestrator import LogSinkProtocol
 from rentl_core.ports.storage import LogStoreProtocol
-from rentl_io.storage import FileSystemLogStore
+from rentl_io.storage import (
+    FileSystemLogStore,
+    FileSystemRunStateStore,
+    SqliteArtifactStore,
+    SqliteLogStore,
+    SqliteRunStateStore,
+)
 from rentl_io.storage.log_sink import RedactingLogSink, StorageLogSink
-from rentl_schemas.config import RunConfig
+from rentl_runner.pipeline import (
+    PipelineConfigError,
+    RedactingArtifactStore,
+    build_storage_bundle,
+    close_sinks,
+    load_dotenv_files,
+    load_or_create_run_context,
+    storage_database_path,
+)
+from rentl_schemas.config import RunConfig, StorageConfig
 from rentl_schemas.events import CommandEvent, ProgressEvent
 from rentl_schemas.exit_codes import ExitCode
 from rentl_schemas.io import SourceLine
@@ -455,6 +470,92 @@ def test_run_pipeline_errors_on_missing_endpoint_key(tmp_path: Path) -> None:
     assert "SECONDARY_KEY" in response["error"]["message"]
 
 
+def test_close_sinks_writes_buffered_progress_tail(tmp_path: Path) -> None:
+    """Closing the bundle's sinks writes progress still buffered in memory."""
+    workspace_dir = tmp_path / "workspace"
+    workspace_dir.mkdir()
+    config = cli_main._load_resolved_config(_write_config(tmp_path, workspace_dir))
+    run_id = uuid7()
+    bundle = build_storage_bundle(config, run_id, allow_console_logs=False)
+    summary = ProgressSummary(
+        percent_complete=None,
+        percent_mode=ProgressPercentMode.UNAVAILABLE,
+        eta_seconds=None,
+        notes=None,
+    )
+    phase_progress = PhaseProgress(
+        phase=PhaseName.INGEST,
+        status=PhaseStatus.FAILED,
+        summary=summary,
+        metrics=None,
+        started_at=None,
+        completed_at=None,
+    )
+    update = ProgressUpdate(
+        run_id=run_id,
+        event=ProgressEvent.RUN_FAILED,
+        timestamp="2026-02-03T10:00:00Z",
+        run_progress=RunProgress(
+            phases=[phase_progress], summary=summary, phase_weights=None
+        ),
+        message="Run failed",
+    )
+
+    async def _emit_then_close() -> None:
+        await bundle.progress_sink.emit_progress(update)
+        await close_sinks(bundle)
+
+    asyncio.run(_emit_then_close())
+
+    lines = bundle.progress_path.read_text(encoding="utf-8").splitlines()
+    assert [ProgressUpdate.model_validate_json(line) for line in lines] == [update]
+
+
+def test_build_storage_bundle_selects_sqlite_backend(tmp_path: Path) -> None:
+    """The sqlite storage backend routes state, artifacts and logs to one DB."""
+    workspace_dir = tmp_path / "workspace"
+    workspace_dir.mkdir()
+    config = cli_main._load_resolved_config(_write_config(tmp_path, workspace_dir))
+    config = config.model_copy(
+        update={"storage": StorageConfig(backend=StorageBackend.SQLITE)}
+    )
+
+    bundle = build_storage_bundle(config, uuid7(), allow_console_logs=False)
+
+    assert isinstance(bundle.run_state_store, SqliteRunStateStore)
+    assert isinstance(bundle.log_store, SqliteLogStore)
+    assert isinstance(
+        cast(RedactingArtifactStore, bundle.artifact_store)._delegate,
+        SqliteArtifactStore,
+    )
+    assert storage_database_path(config) == str(
+        (workspace_dir / ".rentl" / "rentl.db").resolve()
+    )
+    with pytest.raises(ValueError, match="No runs found"):
+        cli_main._resolve_status_run_id(config, None)
+
+
+def test_run_state_signature_tracks_state_file_changes(tmp_path: Path) -> None:
+    """Watch mode reloads run state only when its file changes."""
+    workspace_dir = tmp_path / "workspace"
+    workspace_dir.mkdir()
+    config = cli_main._load_resolved_config(_write_config(tmp_path, workspace_dir))
+    run_id = uuid7()
+    bundle = build_storage_bundle(config, run_id, allow_console_logs=False)
+    store = cast(FileSystemRunStateStore, bundle.run_state_store)
+
+    missing = cli_main._run_state_signature(bundle, run_id)
+    state_path = store.state_path(run_id)
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    state_path.write_text("{}", encoding="utf-8")
+    written = cli_main._run_state_signature(bundle, run_id)
+
+    assert missing == (None,)
+    assert written is not None
+    assert written != missing
+    assert cli_main._run_state_signature(bundle, run_id) == written
+
+
 def test_load_or_create_run_context_hydrates_outputs(tmp_path: Path) -> None:
     """Hydration restores phase outputs from stored artifacts."""
     workspace_dir = tmp_path / "workspace"
@@ -462,7 +563,7 @@ def test_load_or_create_run_context_hydrates_outputs(tmp_path: Path) -> None:
     config_path = _write_config(tmp_path, workspace_dir)
     config = cli_main._load_resolved_config(config_path)
     run_id = uuid7()
-    bundle = cli_main._build_storage_bundle(
+    bundle = build_storage_bundle(
         config,
         run_id,
         allow_console_logs=False,
@@ -629,7 +730,7 @@ def test_load_or_create_run_context_hydrates_outputs(tmp_path: Path) -> None:
     orchestrator = PipelineOrchestrator(log_sink=_NoopLogSink())
 
     run = asyncio.run(
-        cli_main._load_or_create_run_context(
+        load_or_create_run_context(
             orchestrator,
             bundle,
             run_id,
@@ -3149,14 +3250,14 @@ def test_auto_migrate_if_needed_unsupported_schema_raises_config_error(
         }
     }
 
-    with pytest.raises(cli_main._ConfigError, match="No migration path"):
+    with pytest.raises(PipelineConfigError, match="No migration path"):
         cli_main._auto_migrate_if_needed(config_path, payload)
 
 
 def test_load_dotenv_loads_env_file(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    """Test that _load_dotenv loads .env file from config directory."""
+    """Test that load_dotenv_files loads .env file from config directory."""
     config_path = tmp_path / "rentl.toml"
     config_path.write_text("[project]\n", encoding="utf-8")
 
@@ -3168,7 +3269,7 @@ def test_load_dotenv_loads_env_file(
     monkeypatch.delenv("TEST_ENV_KEY", raising=False)
 
     # Load dotenv
-    cli_main._load_dotenv(config_path)
+    load_dotenv_files(config_path)
 
     # Verify the key was loaded from .env
     assert os.getenv("TEST_ENV_KEY") == "value_from_env"
@@ -3177,7 +3278,7 @@ def test_load_dotenv_loads_env_file(
 def test_load_dotenv_loads_env_local_file(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    """Test that _load_dotenv loads .env.local file from config directory."""
+    """Test that load_dotenv_files loads .env.local file from config directory."""
     config_path = tmp_path / "rentl.toml"
     config_path.write_text("[project]\n", encoding="utf-8")
 
@@ -3189,7 +3290,7 @@ def test_load_dotenv_loads_env_local_file(
     monkeypatch.delenv("TEST_LOCAL_KEY", raising=False)
 
     # Load dotenv
-    cli_main._load_dotenv(config_path)
+    load_dotenv_files(config_path)
 
     # Verify the key was loaded from .env.local
     assert os.getenv("TEST_LOCAL_KEY") == "value_from_local"
@@ -3198,7 +3299,7 @@ def test_load_dotenv_loads_env_local_file(
 def test_load_dotenv_both_env_and_env_local(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    """Test that _load_dotenv loads both .env and .env.local files.
+    """Test that load_dotenv_files loads both .env and .env.local files.
 
     Note: Currently .env takes precedence when both files define the same key
     (both are loaded with override=False, so first loaded wins).
@@ -3226,7 +3327,7 @@ def test_load_dotenv_both_env_and_env_local(
     monkeypatch.delenv("LOCAL_ONLY_KEY", raising=False)
 
     # Load dotenv
-    cli_main._load_dotenv(config_path)
+    load_dotenv_files(config_path)
 
     # Verify both files are loaded
     assert os.getenv("ENV_ONLY_KEY") == "env_value"
@@ -3238,7 +3339,7 @@ def test_load_dotenv_both_env_and_env_local(
 def test_load_dotenv_handles_missing_env_files(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    """Test that _load_dotenv handles missing .env files gracefully."""
+    """Test that load_dotenv_files handles missing .env files gracefully."""
     config_path = tmp_path / "rentl.toml"
     config_path.write_text("[project]\n", encoding="utf-8")
 
@@ -3247,7 +3348,7 @@ def test_load_dotenv_handles_missing_env_files(
     assert not (tmp_path / ".env.local").exists()
 
     # Should not raise an exception
-    cli_main._load_dotenv(config_path)
+    load_dotenv_files(config_path)
 
 
 def _make_progress_update(
@@ -0,0 +1,92 @@
+"""Unit tests for token-budget-aware chunking."""
+
+from __future__ import annotations
+
+from operator import itemgetter
+
+import pytest
+
+from rentl_core.chunking import (
+    MIN_CHUNK_TOKEN_BUDGET,
+    derive_chunk_token_budget,
+    estimate_tokens,
+    pack_by_token_budget,
+    split_chunk,
+)
+
+
+def _pack(
+    items: list[tuple[str, str | None, int]], budget: int, max_items: int = 10
+) -> list[list[str]]:
+    chunks = pack_by_token_budget(
+        items,
+        cost=itemgetter(2),
+        budget=budget,
+        max_items=max_items,
+        group_key=itemgetter(1),
+    )
+    return [[name for name, _, _ in chunk] for chunk in chunks]
+
+
+def test_estimate_tokens_counts_wide_characters_individually() -> None:
+    """CJK characters count as one token each; other text as ~4 chars."""
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcdefgh") == 2
+    assert estimate_tokens("こんにちは") == 5
+    assert estimate_tokens("はいabc") == 3
+
+
+def test_derive_chunk_token_budget_uses_output_and_context_limits() -> None:
+    """Budget follows max_output_tokens, capped by the context window."""
+    assert derive_chunk_token_budget(max_output_tokens=4096) == 2048
+    assert (
+        derive_chunk_token_budget(max_output_tokens=4096, context_window_tokens=7168)
+        == 1024
+    )
+    assert (
+        derive_chunk_token_budget(max_output_tokens=4096, context_window_tokens=4096)
+        == MIN_CHUNK_TOKEN_BUDGET
+    )
+
+
+def test_pack_combines_small_scenes_up_to_budget() -> None:
+    """Consecutive scenes share a chunk while they fit the budget."""
+    items = [
+        ("a1", "s1", 3),
+        ("a2", "s1", 3),
+        ("b1", "s2", 3),
+        ("c1", "s3", 3),
+        ("c2", "s3", 3),
+    ]
+
+    assert _pack(items, budget=9) == [["a1", "a2", "b1"], ["c1", "c2"]]
+
+
+def test_pack_splits_oversized_scene_at_budget() -> None:
+    """A scene larger than the budget is split greedily."""
+    items = [("a1", "s1", 4), ("a2", "s1", 4), ("a3", "s1", 4), ("b1", "s2", 1)]
+
+    assert _pack(items, budget=8) == [["a1", "a2"], ["a3"], ["b1"]]
+
+
+def test_pack_respects_item_cap_and_isolates_oversized_items() -> None:
+    """Chunks never exceed max_items and an oversized item stands alone."""
+    items = [("a", None, 1), ("b", None, 1), ("c", None, 50), ("d", None, 1)]
+
+    assert _pack(items, budget=10, max_items=1) == [["a"], ["b"], ["c"], ["d"]]
+    assert _pack(items, budget=10) == [["a", "b"], ["c"], ["d"]]
+
+
+def test_pack_rejects_non_positive_limits() -> None:
+    """Budget and item cap must be positive."""
+    with pytest.raises(ValueError, match="budget"):
+        _pack([], budget=0)
+    with pytest.raises(ValueError, match="max_items"):
+        _pack([], budget=1, max_items=0)
+
+
+def test_split_chunk_halves_items() -> None:
+    """Split keeps order and requires at least two items."""
+    assert split_chunk([1, 2, 3]) == [[1], [2, 3]]
+    with pytest.raises(ValueError):
+        split_chunk([1])
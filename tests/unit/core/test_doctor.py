@@ -10,7 +10,6 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-import rentl.main as cli_main
 from rentl_core.doctor import (
     CheckStatus,
     check_api_keys,
@@ -23,6 +22,7 @@ from rentl_core.doctor import (
     run_doctor,
 )
 from rentl_core.ports.llm import LlmRuntimeProtocol
+from rentl_runner.pipeline import load_dotenv_files
 from rentl_schemas.config import (
     CacheConfig,
     ConcurrencyConfig,
@@ -551,14 +551,14 @@ class TestCheckApiKeys:
         """Test that API keys loaded from .env are visible to doctor checks.
 
         This simulates the scenario where the CLI layer has already loaded
-        .env files via _load_dotenv() before calling run_doctor().
+        .env files via load_dotenv_files() before calling run_doctor().
         The actual dotenv loading happens in the CLI layer, but this test
         verifies that once loaded, the keys are visible to the checks.
         """
         # Clear env first
         monkeypatch.delenv("TEST_API_KEY", raising=False)
 
-        # Simulate what happens after _load_dotenv() loads .env
+        # Simulate what happens after load_dotenv_files() loads .env
         monkeypatch.setenv("TEST_API_KEY", "key_from_dotenv")
 
         # Verify the check can see the key
@@ -878,7 +878,7 @@ class TestRunDoctor:
 
         This test simulates the doctor workflow where the CLI layer loads
         .env files from the config directory before calling run_doctor().
-        The actual dotenv loading happens in the CLI (_load_dotenv), but
+        The actual dotenv loading happens in the CLI (load_dotenv_files), but
         this verifies that once loaded, the keys are visible to all checks.
 
         This documents the expected integration between CLI dotenv loading
@@ -896,7 +896,7 @@ class TestRunDoctor:
         monkeypatch.delenv("TEST_KEY", raising=False)
 
         # Simulate CLI layer having loaded .env file from config directory
-        # (In real usage, _load_dotenv(config_path) would do this)
+        # (In real usage, load_dotenv_files(config_path) would do this)
         monkeypatch.setenv("TEST_KEY", "value_from_dotenv")
 
         # Run doctor - it should see the environment variable
@@ -941,7 +941,7 @@ class TestRunDoctor:
         monkeypatch.delenv("LOCAL_ONLY", raising=False)
 
         # Load dotenv files (as CLI layer does)
-        cli_main._load_dotenv(config_path)
+        load_dotenv_files(config_path)
 
         # Run doctor
         report = await run_doctor(config_path, runtime=None)
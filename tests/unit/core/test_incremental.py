@@ -0,0 +1,75 @@
+"""Unit tests for incremental run baselines."""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from rentl_core.incremental import IncrementalBaseline, source_line_digest
+from rentl_schemas.io import SourceLine
+from rentl_schemas.phases import ContextPhaseOutput, GlossaryTerm, SceneSummary
+from rentl_schemas.primitives import RunId
+
+RUN_ID: RunId = UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb701")
+
+
+def _context(summary: str, translation: str) -> ContextPhaseOutput:
+    return ContextPhaseOutput(
+        run_id=RUN_ID,
+        glossary=[GlossaryTerm(term="Sword", translation=translation)],
+        scene_summaries=[
+            SceneSummary(scene_id="scene_1", summary="Intro", characters=[]),
+            SceneSummary(scene_id="scene_2", summary=summary, characters=[]),
+        ],
+        context_notes=[],
+    )
+
+
+def _lines() -> list[SourceLine]:
+    return [
+        SourceLine(line_id="line_1", scene_id="scene_1", text="Hello"),
+        SourceLine(line_id="line_2", scene_id="scene_1", text="The Sword"),
+        SourceLine(line_id="line_3", scene_id="scene_2", text="Run"),
+        SourceLine(line_id="line_4", text="Credits"),
+    ]
+
+
+def test_source_line_digest_ignores_line_id() -> None:
+    """Digests depend on content, not identifiers."""
+    line = SourceLine(line_id="line_1", scene_id="scene_1", text="Hello")
+
+    assert source_line_digest(line) == source_line_digest(
+        line.model_copy(update={"line_id": "line_9"})
+    )
+    assert source_line_digest(line) != source_line_digest(
+        line.model_copy(update={"speaker": "Aki"})
+    )
+
+
+def test_reusable_lines_require_unchanged_context_inputs() -> None:
+    """Changed text, scene summaries and mentioned glossary terms block reuse."""
+    baseline = IncrementalBaseline(
+        run_id=RUN_ID,
+        source_lines=_lines(),
+        context_output=_context("Chase", "Blade"),
+    )
+    lines = _lines()
+    lines[3] = lines[3].model_copy(update={"text": "Staff roll"})
+
+    assert baseline.unchanged_line_ids(lines) == {"line_1", "line_2", "line_3"}
+    assert baseline.reusable_line_ids(lines, _context("Chase", "Blade")) == {
+        "line_1",
+        "line_2",
+        "line_3",
+    }
+    assert baseline.reusable_line_ids(lines, _context("Escape", "Katana")) == {"line_1"}
+
+
+def test_reusable_scenes_require_same_membership() -> None:
+    """Scenes gaining or changing lines are summarized again."""
+    baseline = IncrementalBaseline(run_id=RUN_ID, source_lines=_lines())
+    lines = [
+        *_lines(),
+        SourceLine(line_id="line_5", scene_id="scene_2", text="Hide"),
+    ]
+
+    assert baseline.reusable_scene_ids(lines) == {"scene_1"}
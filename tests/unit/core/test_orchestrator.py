@@ -2,16 +2,28 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import asyncio
+import hashlib
+from collections.abc import AsyncIterator, Sequence
 from uuid import UUID
 
 import pytest
 from pydantic import Field
 from pydantic_ai.exceptions import UnexpectedModelBehavior, UsageLimitExceeded
 
+from rentl_core.incremental import IncrementalBaseline
 from rentl_core.orchestrator import (
+    LanguageAgentPool,
     PhaseAgentPool,
     PipelineOrchestrator,
+    PipelineRunContext,
+    _build_edit_input,  # noqa: PLC2701
+    _build_work_chunks,  # noqa: PLC2701
+    _resolve_agent_parallelism,  # noqa: PLC2701
+    _run_agent_pool,  # noqa: PLC2701
+    _RunContextIndex,  # noqa: PLC2701
+    _WorkChunk,  # noqa: PLC2701
+    _WorkChunkBuilder,  # noqa: PLC2701
     hydrate_run_context,
 )
 from rentl_core.ports.export import ExportResult, ExportSummary
@@ -20,7 +32,12 @@ from rentl_core.ports.orchestrator import (
     OrchestrationError,
     ProgressSinkProtocol,
 )
-from rentl_core.ports.storage import ArtifactStoreProtocol
+from rentl_core.ports.storage import (
+    ArtifactStoreProtocol,
+    PhaseCheckpointStoreProtocol,
+    RunStateStoreProtocol,
+)
+from rentl_core.status import replay_run_progress
 from rentl_schemas.base import BaseSchema
 from rentl_schemas.config import (
     AgentsConfig,
@@ -44,6 +61,7 @@ from rentl_schemas.events import ProgressEvent, RunEvent
 from rentl_schemas.io import ExportTarget, IngestSource, SourceLine, TranslatedLine
 from rentl_schemas.logs import LogEntry
 from rentl_schemas.phases import (
+    ContextNote,
     ContextPhaseInput,
     ContextPhaseOutput,
     EditPhaseInput,
@@ -60,6 +78,7 @@ from rentl_schemas.pipeline import PhaseRunRecord, RunMetadata, RunState
 from rentl_schemas.primitives import (
     ArtifactId,
     FileFormat,
+    LanguageCode,
     LogSinkType,
     PhaseName,
     PhaseStatus,
@@ -76,8 +95,15 @@ from rentl_schemas.progress import (
     ProgressUpdate,
     RunProgress,
 )
-from rentl_schemas.qa import QaSummary
-from rentl_schemas.storage import ArtifactFormat, ArtifactMetadata, ArtifactRole
+from rentl_schemas.qa import QaIssue, QaSummary
+from rentl_schemas.storage import (
+    ArtifactFormat,
+    ArtifactMetadata,
+    ArtifactRole,
+    PhaseCheckpointRecord,
+    RunIndexRecord,
+    RunStateRecord,
+)
 from rentl_schemas.version import VersionInfo
 
 
@@ -111,6 +137,12 @@ class _StubIngestAdapter:
     async def load_source(self, source: IngestSource) -> list[SourceLine]:
         return self._source_lines
 
+    async def iter_source(
+        self, source: IngestSource, *, batch_size: int = 1000
+    ) -> AsyncIterator[list[SourceLine]]:
+        for index in range(0, len(self._source_lines), batch_size):
+            yield self._source_lines[index : index + batch_size]
+
 
 class _StubContextAgent:
     """Stub context agent for orchestrator tests."""
@@ -277,6 +309,33 @@ class _StubProgressSink(ProgressSinkProtocol):
         self.updates.append(update)
 
 
+class _RecordingRunStateStore(RunStateStoreProtocol):
+    def __init__(self) -> None:
+        self.states: list[RunStateRecord] = []
+        self.indexes: list[RunIndexRecord] = []
+
+    async def save_run_state(self, record: RunStateRecord) -> None:
+        self.states.append(record)
+
+    async def load_run_state(self, run_id: RunId) -> RunStateRecord | None:
+        raise NotImplementedError("load not used in tests")
+
+    async def save_run_index(self, record: RunIndexRecord) -> None:
+        self.indexes.append(record)
+
+    async def list_run_index(
+        self,
+        status: RunStatus | None = None,
+        limit: int | None = None,
+    ) -> list[RunIndexRecord]:
+        raise NotImplementedError("list not used in tests")
+
+
+class _FailingRunStateStore(_RecordingRunStateStore):
+    async def save_run_state(self, record: RunStateRecord) -> None:
+        raise OSError("disk full")
+
+
 class _StubArtifactStore(ArtifactStoreProtocol):
     def __init__(self) -> None:
         self.jsonl_calls: list[tuple[ArtifactMetadata, list[BaseSchema]]] = []
@@ -306,6 +365,46 @@ class _StubArtifactStore(ArtifactStoreProtocol):
         raise NotImplementedError("load jsonl not used in tests")
 
 
+class _StubCheckpointStore(PhaseCheckpointStoreProtocol):
+    def __init__(self) -> None:
+        self.records: list[PhaseCheckpointRecord] = []
+        self.cleared: list[tuple[PhaseName, LanguageCode | None]] = []
+
+    async def append_checkpoint(self, record: PhaseCheckpointRecord) -> None:
+        self.records.append(record)
+
+    async def load_checkpoints(
+        self,
+        run_id: RunId,
+        phase: PhaseName,
+        target_language: LanguageCode | None = None,
+    ) -> list[PhaseCheckpointRecord]:
+        return [
+            record
+            for record in self.records
+            if record.run_id == run_id
+            and record.phase == phase
+            and record.target_language == target_language
+        ]
+
+    async def clear_checkpoints(
+        self,
+        run_id: RunId,
+        phase: PhaseName,
+        target_language: LanguageCode | None = None,
+    ) -> None:
+        self.cleared.append((phase, target_language))
+        self.records = [
+            record
+            for record in self.records
+            if not (
+                record.run_id == run_id
+                and record.phase == phase
+                and record.target_language == target_language
+            )
+        ]
+
+
 def _build_run_config() -> RunConfig:
     project = ProjectConfig(
         schema_version=VersionInfo(major=0, minor=1, patch=0),
@@ -558,6 +657,156 @@ async def test_agent_pool_non_retryable_error_aborts_immediately() -> None:
         await pool.run_batch(inputs)
 
 
+class _DelayAgent:
+    """Agent whose latency is the payload value in milliseconds."""
+
+    def __init__(self, completed: list[int]) -> None:
+        self._completed = completed
+        self._active = 0
+        self.max_active = 0
+
+    async def run(self, payload: _NumberInput) -> _NumberOutput:
+        self._active += 1
+        self.max_active = max(self.max_active, self._active)
+        try:
+            await asyncio.sleep(payload.value / 1000)
+        finally:
+            self._active -= 1
+        self._completed.append(payload.value)
+        return _NumberOutput(value=payload.value)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_agent_pool_slow_payload_does_not_stall_workers() -> None:
+    """Free workers keep pulling work while one payload is slow."""
+    completed: list[int] = []
+    agents = [_DelayAgent(completed), _DelayAgent(completed)]
+    pool = PhaseAgentPool(agents=agents)
+    inputs = [_NumberInput(value=value) for value in [200, 1, 2, 3, 4]]
+
+    outputs = await pool.run_batch(inputs)
+
+    assert [output.value for output in outputs] == [200, 1, 2, 3, 4]
+    # All fast payloads finish on the second worker before the slow one
+    assert completed == [1, 2, 3, 4, 200]
+    # Each worker owns its agent, so an agent never runs concurrently
+    assert all(agent.max_active == 1 for agent in agents)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_agent_pool_from_factory_shares_one_agent() -> None:
+    """Factory pools build one agent and run it count payloads at a time."""
+    completed: list[int] = []
+    built: list[_DelayAgent] = []
+
+    def _factory() -> _DelayAgent:
+        agent = _DelayAgent(completed)
+        built.append(agent)
+        return agent
+
+    pool = PhaseAgentPool.from_factory(factory=_factory, count=3)
+    inputs = [_NumberInput(value=value) for value in [5, 5, 5, 5]]
+
+    outputs = await pool.run_batch(inputs)
+
+    assert [output.value for output in outputs] == [5, 5, 5, 5]
+    assert len(built) == 1
+    assert built[0].max_active == 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_agent_pool_reports_each_completed_chunk() -> None:
+    """Progress callbacks fire once per completed payload."""
+    pool = PhaseAgentPool(agents=[_NumberAgent(), _NumberAgent()])
+    inputs = [_NumberInput(value=value) for value in range(5)]
+    reported: list[list[int]] = []
+
+    async def _on_batch(  # noqa: RUF029
+        batch_inputs: list[_NumberInput], batch_outputs: list[_NumberOutput]
+    ) -> None:
+        assert len(batch_inputs) == len(batch_outputs) == 1
+        reported.append([output.value for output in batch_outputs])
+
+    outputs = await _run_agent_pool(pool, inputs, 2, on_batch=_on_batch)
+
+    assert [output.value for output in outputs] == [0, 1, 2, 3, 4]
+    assert sorted(value for batch in reported for value in batch) == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_agent_pool_requeues_failures_with_backoff(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Retryable failures are re-enqueued after an exponential backoff."""
+    delays: list[float] = []
+    real_sleep = asyncio.sleep
+
+    async def _fake_sleep(delay: float) -> None:
+        delays.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr("rentl_core.orchestrator.asyncio.sleep", _fake_sleep)
+    agent = _FlakeyAgent(fail_count=2)
+    pool: PhaseAgentPool[_NumberInput, _NumberOutput] = PhaseAgentPool(
+        agents=[agent],
+        max_consecutive_failures=3,
+        retry_backoff_s=0.5,
+        retry_max_backoff_s=0.75,
+    )
+
+    outputs = await pool.run_batch([_NumberInput(value=7)])
+
+    assert [output.value for output in outputs] == [7]
+    assert delays == [pytest.approx(0.5), pytest.approx(0.75)]
+
+
+@pytest.mark.unit
+def test_scene_parallelism_honors_max_parallel_scenes() -> None:
+    """Scene-sharded phases cap concurrent chunks by max_parallel_scenes."""
+    execution = PhaseExecutionConfig(
+        strategy=PhaseWorkStrategy.SCENE,
+        scene_batch_size=2,
+        max_parallel_agents=8,
+    )
+    config = _with_phase_execution(_build_run_config(), PhaseName.CONTEXT, execution)
+    config = config.model_copy(
+        update={"concurrency": ConcurrencyConfig(max_parallel_scenes=6)}
+    )
+
+    assert _resolve_agent_parallelism(config, PhaseName.CONTEXT, execution) == 3
+
+    chunk_execution = PhaseExecutionConfig(
+        strategy=PhaseWorkStrategy.CHUNK, chunk_size=5, max_parallel_agents=8
+    )
+    assert _resolve_agent_parallelism(config, PhaseName.TRANSLATE, chunk_execution) == 8
+
+
+@pytest.mark.unit
+def test_scene_parallelism_prefers_phase_override() -> None:
+    """Phase-level max_parallel_scenes overrides the global setting."""
+    execution = PhaseExecutionConfig(
+        strategy=PhaseWorkStrategy.SCENE, scene_batch_size=1
+    )
+    config = _with_phase_execution(_build_run_config(), PhaseName.CONTEXT, execution)
+    phases = [
+        phase.model_copy(
+            update={"concurrency": ConcurrencyConfig(max_parallel_scenes=1)}
+        )
+        if phase.phase == PhaseName.CONTEXT
+        else phase
+        for phase in config.pipeline.phases
+    ]
+    config = config.model_copy(
+        update={"pipeline": config.pipeline.model_copy(update={"phases": phases})}
+    )
+
+    assert _resolve_agent_parallelism(config, PhaseName.CONTEXT, execution) == 1
+
+
 @pytest.mark.unit
 def test_hydrate_run_context_restores_phase_revisions() -> None:
     """Hydration restores phase revisions when missing from state."""
@@ -744,6 +993,164 @@ async def test_orchestrator_routes_sharded_by_route_id() -> None:
     assert route_ids == [{"route_1"}, {"route_2"}, {"route_3"}]
 
 
+class _CrashingContextAgent(_StubContextAgent):
+    """Context agent that records calls and can fail on a given line."""
+
+    def __init__(self, fail_on: str | None = None) -> None:
+        self.fail_on = fail_on
+        self.seen: list[str] = []
+
+    async def run(self, payload: ContextPhaseInput) -> ContextPhaseOutput:
+        line_ids = [line.line_id for line in payload.source_lines]
+        self.seen.extend(line_ids)
+        if self.fail_on in line_ids:
+            raise ValueError("process killed")
+        return await super().run(payload)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_orchestrator_resumes_phase_from_chunk_checkpoints() -> None:
+    """Completed chunks are checkpointed and skipped when the phase reruns."""
+    run_id: RunId = UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb5b1")
+    config = _with_phase_execution(
+        _build_run_config(),
+        PhaseName.CONTEXT,
+        PhaseExecutionConfig(strategy=PhaseWorkStrategy.CHUNK, chunk_size=1),
+    )
+    source_lines = [
+        SourceLine(
+            line_id=f"line_{index}",
+            scene_id=f"scene_{index}",
+            speaker=None,
+            text=f"Line {index}",
+            metadata=None,
+            source_columns=None,
+        )
+        for index in range(1, 4)
+    ]
+    checkpoint_store = _StubCheckpointStore()
+    crashing_agent = _CrashingContextAgent(fail_on="line_3")
+    orchestrator = PipelineOrchestrator(
+        log_sink=_StubLogSink(),
+        ingest_adapter=_StubIngestAdapter(source_lines),
+        context_agents=[
+            ("context_agent", PhaseAgentPool(agents=[crashing_agent])),
+        ],
+        checkpoint_store=checkpoint_store,
+    )
+    run = orchestrator.create_run(run_id=run_id, config=config)
+    await orchestrator.run_phase(
+        run,
+        PhaseName.INGEST,
+        ingest_source=IngestSource(input_path="/tmp/input.txt", format=FileFormat.TXT),
+    )
+
+    with pytest.raises(RuntimeError):
+        await orchestrator.run_phase(run, PhaseName.CONTEXT)
+
+    assert [record.line_ids for record in checkpoint_store.records] == [
+        ["line_1"],
+        ["line_2"],
+    ]
+
+    resumed_agent = _CrashingContextAgent()
+    resumed = PipelineOrchestrator(
+        log_sink=_StubLogSink(),
+        context_agents=[
+            ("context_agent", PhaseAgentPool(agents=[resumed_agent])),
+        ],
+        checkpoint_store=checkpoint_store,
+    )
+    await resumed.run_phase(run, PhaseName.CONTEXT)
+
+    assert resumed_agent.seen == ["line_3"]
+    assert run.context_output is not None
+    assert sorted(
+        summary.scene_id for summary in run.context_output.scene_summaries
+    ) == ["scene_1", "scene_2", "scene_3"]
+    assert checkpoint_store.cleared == [(PhaseName.CONTEXT, None)]
+    assert checkpoint_store.records == []
+
+
+class _GatedIngestAdapter(_StubIngestAdapter):
+    """Ingest adapter that holds back later lines until the gate opens."""
+
+    def __init__(self, source_lines: list[SourceLine]) -> None:
+        super().__init__(source_lines)
+        self.gate = asyncio.Event()
+
+    async def iter_source(
+        self, source: IngestSource, *, batch_size: int = 1000
+    ) -> AsyncIterator[list[SourceLine]]:
+        yield self._source_lines[:1]
+        await self.gate.wait()
+        yield self._source_lines[1:]
+
+
+class _GateOpeningContextAgent(_StubContextAgent):
+    def __init__(self, gate: asyncio.Event) -> None:
+        self._gate = gate
+        self.seen: list[str] = []
+
+    async def run(self, payload: ContextPhaseInput) -> ContextPhaseOutput:
+        self.seen.extend(line.line_id for line in payload.source_lines)
+        self._gate.set()
+        return await super().run(payload)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_plan_dispatches_context_chunks_while_ingest_streams() -> None:
+    """Context agents receive chunks before ingest has read the whole source."""
+    run_id: RunId = UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb5b2")
+    config = _with_phase_execution(
+        _build_run_config(),
+        PhaseName.CONTEXT,
+        PhaseExecutionConfig(strategy=PhaseWorkStrategy.CHUNK, chunk_size=1),
+    )
+    source_lines = [
+        SourceLine(line_id=f"line_{index}", scene_id=f"scene_{index}", text="Hi")
+        for index in range(1, 4)
+    ]
+    ingest_adapter = _GatedIngestAdapter(source_lines)
+    context_agent = _GateOpeningContextAgent(ingest_adapter.gate)
+    orchestrator = PipelineOrchestrator(
+        log_sink=_StubLogSink(),
+        ingest_adapter=ingest_adapter,
+        context_agents=[
+            ("context_agent", PhaseAgentPool(agents=[context_agent])),
+        ],
+    )
+    run = orchestrator.create_run(run_id=run_id, config=config)
+
+    # Ingest only finishes once the first context chunk has been dispatched
+    await asyncio.wait_for(
+        orchestrator.run_plan(
+            run,
+            phases=[PhaseName.INGEST, PhaseName.CONTEXT],
+            ingest_source=IngestSource(
+                input_path="/tmp/input.txt", format=FileFormat.TXT
+            ),
+        ),
+        timeout=5,
+    )
+
+    assert context_agent.seen == ["line_1", "line_2", "line_3"]
+    assert run.source_lines == source_lines
+    assert run.context_output is not None
+    assert sorted(
+        summary.scene_id for summary in run.context_output.scene_summaries
+    ) == ["scene_1", "scene_2", "scene_3"]
+    context_record = next(
+        record for record in run.phase_history if record.phase == PhaseName.CONTEXT
+    )
+    assert context_record.dependencies is not None
+    assert [dependency.phase for dependency in context_record.dependencies] == [
+        PhaseName.INGEST
+    ]
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_orchestrator_blocks_qa_without_translation() -> None:
@@ -995,6 +1402,108 @@ async def test_orchestrator_blocks_export_without_edit_when_enabled() -> None:
         await orchestrator.run_phase(run, PhaseName.EXPORT, target_language="ja")
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_state_saves_coalesce_start_transitions() -> None:
+    """Start transitions are debounced into the phase completion save."""
+    run_id: RunId = UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb5c9")
+    source = IngestSource(input_path="/tmp/input.txt", format=FileFormat.TXT)
+    source_lines = [
+        SourceLine(
+            line_id="line_1",
+            scene_id="scene_1",
+            speaker=None,
+            text="Hi",
+            metadata=None,
+            source_columns=None,
+        )
+    ]
+
+    immediate_store = _RecordingRunStateStore()
+    orchestrator = PipelineOrchestrator(
+        log_sink=_StubLogSink(),
+        ingest_adapter=_StubIngestAdapter(source_lines),
+        run_state_store=immediate_store,
+        run_state_debounce_s=0,
+    )
+    run = orchestrator.create_run(run_id=run_id, config=_build_run_config())
+    await orchestrator.run_phase(run, PhaseName.INGEST, ingest_source=source)
+    assert len(immediate_store.states) == 3
+
+    debounced_store = _RecordingRunStateStore()
+    orchestrator = PipelineOrchestrator(
+        log_sink=_StubLogSink(),
+        ingest_adapter=_StubIngestAdapter(source_lines),
+        run_state_store=debounced_store,
+        run_state_debounce_s=60,
+    )
+    run = orchestrator.create_run(run_id=run_id, config=_build_run_config())
+    await orchestrator.run_phase(run, PhaseName.INGEST, ingest_source=source)
+
+    assert len(debounced_store.states) == 1
+    assert len(debounced_store.indexes) == 1
+    record = debounced_store.states[0]
+    assert record.state.progress.phases[0].status == PhaseStatus.COMPLETED
+    assert record.checksum_sha256 is not None
+
+    # Nothing changed since the last save, so nothing is rewritten
+    await orchestrator._persist_run_state(run)
+    assert len(debounced_store.states) == 1
+    # The checksum covers the serialized state only
+    assert (
+        record.checksum_sha256
+        == hashlib.sha256(record.state.model_dump_json().encode("utf-8")).hexdigest()
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_debounced_run_state_failure_surfaces_on_next_save() -> None:
+    """A failed background save is raised into the run, not dropped."""
+    orchestrator = PipelineOrchestrator(
+        log_sink=_StubLogSink(),
+        run_state_store=_FailingRunStateStore(),
+        run_state_debounce_s=0.001,
+    )
+    run = orchestrator.create_run(
+        run_id=UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb5ca"),
+        config=_build_run_config(),
+    )
+
+    await orchestrator._persist_run_state(run, debounce=True)
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(OSError, match="disk full"):
+        await orchestrator._persist_run_state(run, debounce=True)
+    assert run._persist_error is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_forced_run_state_save_waits_for_cancelled_debounced_save() -> None:
+    """A forced save finishes the pending debounced save before writing."""
+    store = _RecordingRunStateStore()
+    orchestrator = PipelineOrchestrator(
+        log_sink=_StubLogSink(),
+        run_state_store=store,
+        run_state_debounce_s=60,
+    )
+    run = orchestrator.create_run(
+        run_id=UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb5cb"),
+        config=_build_run_config(),
+    )
+
+    await orchestrator._persist_run_state(run, debounce=True)
+    pending = run._pending_persist
+    assert pending is not None
+
+    await orchestrator._persist_run_state(run)
+
+    assert pending.done()
+    assert run._pending_persist is None
+    assert len(store.states) == 1
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_orchestrator_persists_ingest_artifacts() -> None:
@@ -1353,6 +1862,43 @@ async def test_ingest_emits_milestone_progress_events() -> None:
     assert any("Persisted 2 source lines" in msg for msg in progress_messages)
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_phase_progress_emits_deltas_between_snapshots() -> None:
+    """Phase progress updates are deltas until the snapshot interval elapses."""
+    run_id: RunId = UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb5f3")
+    source_lines = [
+        SourceLine(line_id=f"line_{index}", scene_id="scene_1", text="Hi")
+        for index in range(1, 3)
+    ]
+    progress_sink = _StubProgressSink()
+    orchestrator = PipelineOrchestrator(
+        log_sink=_StubLogSink(),
+        ingest_adapter=_StubIngestAdapter(source_lines),
+        progress_sink=progress_sink,
+        progress_snapshot_interval=2,
+    )
+    run = orchestrator.create_run(run_id=run_id, config=_build_run_config())
+
+    await orchestrator.run_phase(
+        run,
+        PhaseName.INGEST,
+        ingest_source=IngestSource(input_path="/tmp/input.txt", format=FileFormat.TXT),
+    )
+
+    phase_updates = [
+        update
+        for update in progress_sink.updates
+        if update.event == ProgressEvent.PHASE_PROGRESS
+    ]
+    assert [update.run_progress is None for update in phase_updates] == [True, False]
+    delta = phase_updates[0]
+    assert delta.phase_progress is not None
+    assert delta.phase_progress.phase == PhaseName.INGEST
+    assert delta.run_summary is not None
+    assert replay_run_progress(progress_sink.updates) == run.progress
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_phase_failure_includes_exception_type_in_message() -> None:
@@ -1520,3 +2066,493 @@ async def test_export_emits_milestone_progress_events() -> None:
     ]
     assert any("Selected 2 lines for export" in msg for msg in progress_messages)
     assert any("Wrote 2 lines" in msg for msg in progress_messages)
+
+
+def test_run_context_index_selects_chunk_context_in_output_order() -> None:
+    """Chunk inputs built from the index match per-line and per-scene context."""
+    run_id = UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb600")
+    orchestrator = PipelineOrchestrator(log_sink=_StubLogSink())
+    run = orchestrator.create_run(run_id=run_id, config=_build_run_config())
+    lines = [
+        SourceLine(line_id=f"line_{index}", scene_id=scene, text=f"Text {index}")
+        for index, scene in ((1, "scene_1"), (2, "scene_1"), (3, "scene_2"))
+    ]
+    notes = [
+        ContextNote(
+            note_id=UUID(f"01890a5c-91c8-7b2a-9f51-9b40d0cfb61{index}"),
+            line_id=line_id,
+            scene_id=scene_id,
+            note=f"Note {index}",
+        )
+        for index, (line_id, scene_id) in enumerate([
+            (None, "scene_1"),
+            ("line_3", None),
+            ("line_2", "scene_1"),
+            (None, "scene_2"),
+            ("line_1", None),
+        ])
+    ]
+    run.context_output = ContextPhaseOutput(
+        run_id=run_id,
+        phase=PhaseName.CONTEXT,
+        project_context=None,
+        style_guide=None,
+        glossary=None,
+        scene_summaries=[
+            SceneSummary(scene_id=scene_id, summary=scene_id, characters=[])
+            for scene_id in ("scene_2", "scene_1")
+        ],
+        context_notes=notes,
+    )
+    run.translate_outputs["ja"] = TranslatePhaseOutput(
+        run_id=run_id,
+        target_language="ja",
+        translated_lines=[
+            TranslatedLine(line_id=line.line_id, text=f"JA {line.line_id}")
+            for line in reversed(lines)
+        ],
+    )
+    issues = [
+        QaIssue(
+            issue_id=UUID(f"01890a5c-91c8-7b2a-9f51-9b40d0cfb62{index}"),
+            line_id=line_id,
+            category=QaCategory.STYLE,
+            severity=QaSeverity.MINOR,
+            message=f"Issue {index}",
+        )
+        for index, line_id in enumerate(["line_2", "line_3", "line_1", "line_2"])
+    ]
+    run.qa_outputs["ja"] = QaPhaseOutput(
+        run_id=run_id,
+        phase=PhaseName.QA,
+        target_language="ja",
+        issues=issues,
+        summary=QaSummary(
+            total_issues=len(issues),
+            by_category=dict.fromkeys(QaCategory, 0),
+            by_severity=dict.fromkeys(QaSeverity, 0),
+        ),
+    )
+    chunk = _WorkChunk(source_lines=lines[:2])
+
+    payload = _build_edit_input(run, "ja", chunk, _RunContextIndex(run, "ja"))
+
+    assert [summary.scene_id for summary in payload.scene_summaries or []] == [
+        "scene_1"
+    ]
+    assert [note.note for note in payload.context_notes or []] == [
+        "Note 0",
+        "Note 2",
+        "Note 4",
+    ]
+    assert [line.line_id for line in payload.translated_lines] == [
+        "line_2",
+        "line_1",
+    ]
+    assert [issue.message for issue in payload.qa_issues or []] == [
+        "Issue 0",
+        "Issue 2",
+        "Issue 3",
+    ]
+    assert payload.pretranslation_annotations is None
+
+
+def test_run_context_index_keeps_line_and_scene_ids_apart() -> None:
+    """A line ID equal to another scene's ID does not pull in its notes."""
+    run_id = UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb600")
+    orchestrator = PipelineOrchestrator(log_sink=_StubLogSink())
+    run = orchestrator.create_run(run_id=run_id, config=_build_run_config())
+    run.context_output = ContextPhaseOutput(
+        run_id=run_id,
+        phase=PhaseName.CONTEXT,
+        project_context=None,
+        style_guide=None,
+        glossary=None,
+        scene_summaries=[],
+        context_notes=[
+            ContextNote(
+                note_id=UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb630"),
+                scene_id="scene_1",
+                note="Scene note",
+            ),
+            ContextNote(
+                note_id=UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb631"),
+                line_id="scene_1",
+                note="Line note",
+            ),
+        ],
+    )
+    chunk = _WorkChunk(
+        source_lines=[SourceLine(line_id="scene_1", scene_id="scene_9", text="Hi")]
+    )
+
+    notes = _RunContextIndex(run).context_notes(chunk)
+
+    assert [note.note for note in notes or []] == ["Line note"]
+
+
+class _OverlapTranslateAgent(_StubTranslateAgent):
+    """Translate agent that records how many calls overlap."""
+
+    def __init__(self, tracker: dict[str, int]) -> None:
+        self._tracker = tracker
+
+    async def run(self, payload: TranslatePhaseInput) -> TranslatePhaseOutput:
+        self._tracker["active"] += 1
+        self._tracker["peak"] = max(self._tracker["peak"], self._tracker["active"])
+        await asyncio.sleep(0.01)
+        self._tracker["active"] -= 1
+        return await super().run(payload)
+
+
+@pytest.mark.parametrize(("max_parallel_languages", "expected_peak"), [(4, 2), (1, 1)])
+async def test_run_plan_overlaps_language_branches(
+    max_parallel_languages: int, expected_peak: int
+) -> None:
+    """Language branches run concurrently up to max_parallel_languages.
+
+    Overlapping branches share one phase metric; sequential branches reset it.
+    """
+    config = _build_run_config()
+    config = config.model_copy(
+        update={
+            "project": config.project.model_copy(
+                update={
+                    "languages": LanguageConfig(
+                        source_language="en", target_languages=["ja", "fr"]
+                    )
+                }
+            ),
+            "concurrency": ConcurrencyConfig(
+                max_parallel_languages=max_parallel_languages
+            ),
+        }
+    )
+    tracker = {"active": 0, "peak": 0}
+    progress_sink = _StubProgressSink()
+    orchestrator = PipelineOrchestrator(
+        log_sink=_StubLogSink(),
+        progress_sink=progress_sink,
+        ingest_adapter=_StubIngestAdapter([
+            SourceLine(line_id="line_1", scene_id="scene_1", text="Hi")
+        ]),
+        context_agents=[
+            ("context_agent", PhaseAgentPool(agents=[_StubContextAgent()]))
+        ],
+        pretranslation_agents=[
+            (
+                "pretranslation_agent",
+                PhaseAgentPool(agents=[_StubPretranslationAgent()]),
+            )
+        ],
+        translate_agents=[
+            (
+                "translate_agent",
+                PhaseAgentPool(
+                    agents=[_OverlapTranslateAgent(tracker) for _ in range(2)]
+                ),
+            )
+        ],
+    )
+    run = orchestrator.create_run(
+        run_id=UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb700"), config=config
+    )
+
+    await orchestrator.run_plan(
+        run,
+        phases=[
+            PhaseName.INGEST,
+            PhaseName.CONTEXT,
+            PhaseName.PRETRANSLATION,
+            PhaseName.TRANSLATE,
+        ],
+        ingest_source=IngestSource(input_path="/tmp/input.txt", format=FileFormat.TXT),
+    )
+
+    assert tracker["peak"] == expected_peak
+    assert set(run.translate_outputs) == {"ja", "fr"}
+    assert run.status == RunStatus.COMPLETED
+    assert run.current_phase is None
+    translate_progress = next(
+        phase for phase in run.progress.phases if phase.phase == PhaseName.TRANSLATE
+    )
+    assert translate_progress.status == PhaseStatus.COMPLETED
+    metric = (translate_progress.metrics or [])[0]
+    assert (metric.completed_units, metric.total_units) == (
+        expected_peak,
+        expected_peak,
+    )
+    started = [
+        update
+        for update in progress_sink.updates
+        if update.event == ProgressEvent.PHASE_STARTED
+        and update.phase == PhaseName.TRANSLATE
+    ]
+    assert len(started) == 2
+
+
+async def test_phase_agent_pool_shares_agents_across_concurrent_streams() -> None:
+    """Concurrent streams on one pool never drive the same agent at once."""
+    tracker = {"active": 0, "peak": 0}
+
+    class _TrackedAgent:
+        async def run(self, payload: _NumberInput) -> _NumberOutput:
+            tracker["active"] += 1
+            tracker["peak"] = max(tracker["peak"], tracker["active"])
+            await asyncio.sleep(0.005)
+            tracker["active"] -= 1
+            return _NumberOutput(value=payload.value)
+
+    pool = PhaseAgentPool(agents=[_TrackedAgent()])
+
+    first, second = await asyncio.gather(
+        pool.run_stream([_NumberInput(value=value) for value in range(3)]),
+        pool.run_stream([_NumberInput(value=value) for value in range(3, 6)]),
+    )
+
+    assert [output.value for output in first] == [0, 1, 2]
+    assert [output.value for output in second] == [3, 4, 5]
+    assert tracker["peak"] == 1
+
+
+async def test_language_agent_pool_routes_payloads_by_target_language() -> None:
+    """Payloads run on their language's pool and results keep input order."""
+    built: list[str] = []
+    seen: dict[str, list[str]] = {}
+
+    class _LanguageAgent:
+        def __init__(self, language: str) -> None:
+            self._language = language
+
+        async def run(self, payload: TranslatePhaseInput) -> TranslatePhaseOutput:
+            seen.setdefault(self._language, []).append(payload.source_lines[0].line_id)
+            return TranslatePhaseOutput(
+                run_id=payload.run_id,
+                target_language=payload.target_language,
+                translated_lines=[
+                    TranslatedLine(line_id=payload.source_lines[0].line_id, text="ok")
+                ],
+            )
+
+    def _factory(language: str) -> PhaseAgentPool:
+        built.append(language)
+        return PhaseAgentPool(agents=[_LanguageAgent(language)])
+
+    pool = LanguageAgentPool(_factory)
+    run_id: RunId = UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb5f1")
+    payloads = [
+        TranslatePhaseInput(
+            run_id=run_id,
+            target_language=language,
+            source_lines=[SourceLine(line_id=line_id, text="hi")],
+        )
+        for language, line_id in [("en", "a_1"), ("fr", "a_2"), ("en", "a_3")]
+    ]
+    reported: list[str] = []
+
+    async def _on_batch(  # noqa: RUF029
+        inputs: list[TranslatePhaseInput], _outputs: list[TranslatePhaseOutput]
+    ) -> None:
+        reported.extend(payload.source_lines[0].line_id for payload in inputs)
+
+    outputs = await _run_agent_pool(pool, payloads, None, _on_batch)
+
+    assert [output.target_language for output in outputs] == ["en", "fr", "en"]
+    assert built == ["en", "fr"]
+    assert pool.languages == ["en", "fr"]
+    assert seen == {"en": ["a_1", "a_3"], "fr": ["a_2"]}
+    assert sorted(reported) == ["a_1", "a_2", "a_3"]
+    await pool.run_batch(payloads[:1])
+    assert built == ["en", "fr"]
+
+
+class _RecordingTranslateAgent(_StubTranslateAgent):
+    def __init__(self) -> None:
+        self.line_ids: list[str] = []
+
+    async def run(self, payload: TranslatePhaseInput) -> TranslatePhaseOutput:
+        self.line_ids.extend(line.line_id for line in payload.source_lines)
+        return await super().run(payload)
+
+
+async def test_incremental_run_translates_only_changed_lines() -> None:
+    """Unchanged lines carry baseline outputs; only the delta reaches agents."""
+    config = _build_run_config()
+    baseline_lines = [
+        SourceLine(line_id="line_1", scene_id="scene_1", text="Hi"),
+        SourceLine(line_id="line_2", scene_id="scene_2", text="Bye"),
+        SourceLine(line_id="line_3", scene_id="scene_2", text="Later"),
+    ]
+    new_lines = [
+        baseline_lines[0],
+        baseline_lines[1].model_copy(update={"text": "Goodbye"}),
+        baseline_lines[2],
+    ]
+    ingest_source = IngestSource(input_path="/tmp/input.txt", format=FileFormat.TXT)
+    phases = [
+        PhaseName.INGEST,
+        PhaseName.CONTEXT,
+        PhaseName.PRETRANSLATION,
+        PhaseName.TRANSLATE,
+        PhaseName.QA,
+        PhaseName.EDIT,
+    ]
+
+    async def _run(
+        run_id: RunId,
+        source_lines: list[SourceLine],
+        baseline: IncrementalBaseline | None,
+    ) -> tuple[PipelineRunContext, _RecordingTranslateAgent]:
+        translate_agent = _RecordingTranslateAgent()
+        orchestrator = PipelineOrchestrator(
+            log_sink=_StubLogSink(),
+            ingest_adapter=_StubIngestAdapter(source_lines),
+            context_agents=[
+                ("context_agent", PhaseAgentPool(agents=[_StubContextAgent()])),
+            ],
+            pretranslation_agents=[
+                (
+                    "pretranslation_agent",
+                    PhaseAgentPool(agents=[_StubPretranslationAgent()]),
+                ),
+            ],
+            translate_agents=[
+                ("translate_agent", PhaseAgentPool(agents=[translate_agent])),
+            ],
+            qa_agents=[("qa_agent", PhaseAgentPool(agents=[_StubQaAgent()]))],
+            edit_agents=[("edit_agent", PhaseAgentPool(agents=[_StubEditAgent()]))],
+        )
+        run = orchestrator.create_run(run_id=run_id, config=config)
+        run.baseline = baseline
+        await orchestrator.run_plan(run, phases=phases, ingest_source=ingest_source)
+        return run, translate_agent
+
+    baseline_run, _ = await _run(
+        UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb601"), baseline_lines, None
+    )
+    baseline_run.translate_outputs["ja"].translated_lines[0].text = "carried"
+    run, translate_agent = await _run(
+        UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb602"),
+        new_lines,
+        IncrementalBaseline.from_run(baseline_run),
+    )
+
+    assert translate_agent.line_ids == ["line_2"]
+    assert [line.text for line in run.translate_outputs["ja"].translated_lines] == [
+        "carried",
+        "ja:Goodbye",
+        "ja:Later",
+    ]
+    assert [line.line_id for line in run.edit_outputs["ja"].edited_lines] == [
+        "line_1",
+        "line_2",
+        "line_3",
+    ]
+    translate_record = next(
+        record for record in run.phase_history if record.phase == PhaseName.TRANSLATE
+    )
+    assert translate_record.summary is not None
+    reused_metric = next(
+        metric
+        for metric in translate_record.summary.metrics
+        if metric.metric_key == "reused_line_count"
+    )
+    assert reused_metric.value == 2
+    carried = [
+        dependency
+        for dependency in translate_record.dependencies or []
+        if dependency.run_id is not None
+    ]
+    assert [(dep.phase, dep.run_id) for dep in carried] == [
+        (PhaseName.TRANSLATE, baseline_run.run_id)
+    ]
+    assert not any(record.stale for record in run.phase_history)
+
+
+def _line_ids(index_range: range) -> list[str]:
+    return [f"line_{index}" for index in index_range]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("execution", "expected"),
+    [
+        (
+            PhaseExecutionConfig(strategy=PhaseWorkStrategy.CHUNK, chunk_size=3),
+            [
+                _line_ids(range(3)),
+                _line_ids(range(3, 6)),
+                _line_ids(range(6, 9)),
+                _line_ids(range(9, 10)),
+            ],
+        ),
+        (
+            PhaseExecutionConfig(
+                strategy=PhaseWorkStrategy.CHUNK, chunk_size=4, chunk_token_budget=2
+            ),
+            [_line_ids(range(start, start + 2)) for start in range(0, 10, 2)],
+        ),
+        (
+            PhaseExecutionConfig(strategy=PhaseWorkStrategy.SCENE, scene_batch_size=2),
+            [_line_ids(range(6)), _line_ids(range(6, 10))],
+        ),
+        (
+            PhaseExecutionConfig(strategy=PhaseWorkStrategy.ROUTE),
+            [_line_ids(range(4)), _line_ids(range(4, 8)), _line_ids(range(8, 10))],
+        ),
+        (
+            PhaseExecutionConfig(strategy=PhaseWorkStrategy.FULL),
+            [_line_ids(range(10))],
+        ),
+    ],
+)
+def test_work_chunk_builder_cuts_across_batches(
+    execution: PhaseExecutionConfig, expected: list[list[str]]
+) -> None:
+    """Lines fed in batches are cut into the same chunks as the full list."""
+    source_lines = [
+        SourceLine(
+            line_id=f"line_{index}",
+            route_id=f"route_{index // 4}",
+            scene_id=f"scene_{index // 3}",
+            speaker=None,
+            text="Hi",
+            metadata=None,
+            source_columns=None,
+        )
+        for index in range(10)
+    ]
+
+    builder = _WorkChunkBuilder(execution, PhaseName.TRANSLATE)
+    chunks = []
+    for index in range(0, len(source_lines), 3):
+        chunks.extend(builder.add(source_lines[index : index + 3]))
+    chunks.extend(builder.finish())
+
+    batched = _build_work_chunks(source_lines, execution, PhaseName.TRANSLATE)
+    assert [[line.line_id for line in chunk.source_lines] for chunk in chunks] == (
+        expected
+    )
+    assert [[line.line_id for line in chunk.source_lines] for chunk in batched] == (
+        expected
+    )
+
+
+def test_work_chunks_cut_at_token_budget() -> None:
+    """Chunk strategy cuts early when lines exceed the token budget."""
+    texts = ["短い", "x" * 40, "y" * 8, "z" * 8, "w" * 8]
+    source_lines = [
+        SourceLine(line_id=f"line_{index}", text=text)
+        for index, text in enumerate(texts)
+    ]
+    execution = PhaseExecutionConfig(
+        strategy=PhaseWorkStrategy.CHUNK, chunk_size=3, chunk_token_budget=6
+    )
+
+    chunks = _build_work_chunks(source_lines, execution, PhaseName.TRANSLATE)
+
+    assert [[line.line_id for line in chunk.source_lines] for chunk in chunks] == [
+        ["line_0"],
+        ["line_1"],
+        ["line_2", "line_3", "line_4"],
+    ]
@@ -6,9 +6,9 @@ from uuid import uuid7
 
 import pytest
 
-from rentl_core.status import build_status_result
+from rentl_core.status import StatusAggregator, build_status_result
 from rentl_schemas.events import ProgressEvent
-from rentl_schemas.primitives import PhaseName, PhaseStatus, RunStatus
+from rentl_schemas.primitives import PhaseName, PhaseStatus, RunId, RunStatus
 from rentl_schemas.progress import (
     AgentStatus,
     AgentTelemetry,
@@ -200,3 +200,188 @@ def test_retry_updates_with_same_agent_run_id_counted_separately() -> None:
     assert result.agent_summary.waste_ratio > 0.0
     # Failed=100, retry=200 → waste=300, total=300 → waste_ratio=1.0
     assert result.agent_summary.waste_ratio == pytest.approx(1.0)
+
+
+def _summary(percent: float | None) -> ProgressSummary:
+    return ProgressSummary(
+        percent_complete=percent,
+        percent_mode=ProgressPercentMode.UNAVAILABLE
+        if percent is None
+        else ProgressPercentMode.ESTIMATED,
+        eta_seconds=None,
+        notes=None,
+    )
+
+
+def _phase(
+    phase: PhaseName, status: PhaseStatus, percent: float | None
+) -> PhaseProgress:
+    return PhaseProgress(
+        phase=phase,
+        status=status,
+        summary=_summary(percent),
+        metrics=None,
+        started_at=None,
+        completed_at=None,
+    )
+
+
+def test_build_status_result_replays_deltas_after_latest_snapshot() -> None:
+    """Delta updates are applied on top of the latest full snapshot."""
+    run_id = uuid7()
+    snapshot = ProgressUpdate(
+        run_id=run_id,
+        event=ProgressEvent.PHASE_STARTED,
+        timestamp="2026-02-03T12:00:00Z",
+        phase=PhaseName.CONTEXT,
+        phase_status=PhaseStatus.RUNNING,
+        run_progress=RunProgress(
+            phases=[
+                _phase(PhaseName.CONTEXT, PhaseStatus.RUNNING, 0.0),
+                _phase(PhaseName.TRANSLATE, PhaseStatus.PENDING, None),
+            ],
+            summary=_summary(0.0),
+            phase_weights=None,
+        ),
+        phase_progress=None,
+    )
+    deltas = [
+        ProgressUpdate(
+            run_id=run_id,
+            event=ProgressEvent.PHASE_PROGRESS,
+            timestamp=f"2026-02-03T12:00:0{index}Z",
+            phase=PhaseName.CONTEXT,
+            phase_status=PhaseStatus.RUNNING,
+            phase_progress=_phase(PhaseName.CONTEXT, PhaseStatus.RUNNING, percent),
+            run_summary=_summary(percent / 2),
+        )
+        for index, percent in enumerate((40.0, 80.0), start=1)
+    ]
+
+    result = build_status_result(
+        run_id=run_id,
+        run_state=None,
+        progress_updates=[snapshot, *deltas],
+        log_reference=None,
+        progress_file=None,
+    )
+
+    assert result.progress is not None
+    assert [phase.phase for phase in result.progress.phases] == [
+        PhaseName.CONTEXT,
+        PhaseName.TRANSLATE,
+    ]
+    assert result.progress.phases[0].summary.percent_complete == pytest.approx(80.0)
+    assert result.progress.phases[1].status == PhaseStatus.PENDING
+    assert result.progress.summary.percent_complete == pytest.approx(40.0)
+    assert snapshot.run_progress is not None
+    assert snapshot.run_progress.summary.percent_complete == pytest.approx(0.0)
+
+
+def test_progress_update_rejects_run_summary_with_snapshot() -> None:
+    """Delta run summaries cannot accompany a full snapshot."""
+    with pytest.raises(ValueError, match="run_summary"):
+        ProgressUpdate(
+            run_id=uuid7(),
+            event=ProgressEvent.RUN_STARTED,
+            timestamp="2026-02-03T12:00:00Z",
+            run_progress=RunProgress(
+                phases=[_phase(PhaseName.CONTEXT, PhaseStatus.PENDING, None)],
+                summary=_summary(None),
+                phase_weights=None,
+            ),
+            run_summary=_summary(None),
+        )
+
+
+def _agent_update(
+    run_id: RunId, status: AgentStatus, total_tokens: int, cost_usd: float | None
+) -> ProgressUpdate:
+    return ProgressUpdate(
+        run_id=run_id,
+        event=ProgressEvent.AGENT_PROGRESS,
+        timestamp="2026-02-03T12:00:00Z",
+        phase=PhaseName.CONTEXT,
+        agent_update=AgentTelemetry(
+            agent_run_id="scene_summarizer_001",
+            agent_name="scene_summarizer",
+            phase=PhaseName.CONTEXT,
+            status=status,
+            attempt=1,
+            usage=AgentUsageTotals(total_tokens=total_tokens, cost_usd=cost_usd),
+        ),
+    )
+
+
+def test_status_aggregator_replaces_agent_totals_incrementally() -> None:
+    """Later telemetry for an agent attempt replaces its earlier contribution."""
+    run_id = uuid7()
+    updates = [
+        _agent_update(run_id, AgentStatus.RUNNING, 10, None),
+        _agent_update(run_id, AgentStatus.RUNNING, 25, 0.5),
+        _agent_update(run_id, AgentStatus.FAILED, 40, 1.0),
+    ]
+    aggregator = StatusAggregator(run_id)
+
+    for update in updates:
+        aggregator.ingest([update])
+    result = aggregator.build_result(
+        run_state=None, log_reference=None, progress_file=None
+    )
+
+    assert result.agent_summary is not None
+    assert result.agent_summary.total == 1
+    assert result.agent_summary.by_status == {AgentStatus.FAILED: 1}
+    assert result.agent_summary.usage is not None
+    assert result.agent_summary.usage.total_tokens == 40
+    assert result.agent_summary.usage.cost_usd == pytest.approx(1.0)
+    assert result.agent_summary.total_cost_usd == pytest.approx(1.0)
+    assert result.agent_summary.waste_ratio == pytest.approx(1.0)
+    assert result == build_status_result(
+        run_id=run_id,
+        run_state=None,
+        progress_updates=updates,
+        log_reference=None,
+        progress_file=None,
+    )
+
+
+def test_status_aggregator_reuses_result_until_next_update() -> None:
+    """Polling without new updates returns the cached status result."""
+    run_id = uuid7()
+    aggregator = StatusAggregator(run_id)
+    aggregator.ingest([_agent_update(run_id, AgentStatus.RUNNING, 10, 0.1)])
+
+    first = aggregator.build_result(
+        run_state=None, log_reference=None, progress_file=None
+    )
+    second = aggregator.build_result(
+        run_state=None, log_reference=None, progress_file=None
+    )
+    aggregator.ingest([_agent_update(run_id, AgentStatus.COMPLETED, 20, 0.2)])
+    third = aggregator.build_result(
+        run_state=None, log_reference=None, progress_file=None
+    )
+
+    assert second is first
+    assert third is not first
+    assert third.agent_summary is not None
+    assert third.agent_summary.by_status == {AgentStatus.COMPLETED: 1}
+
+
+def test_status_aggregator_cost_totals_do_not_drift() -> None:
+    """Replacing an agent's cost many times leaves the exact latest cost."""
+    run_id = uuid7()
+    aggregator = StatusAggregator(run_id)
+
+    for _ in range(1000):
+        aggregator.ingest([_agent_update(run_id, AgentStatus.RUNNING, 10, 0.1)])
+        aggregator.ingest([_agent_update(run_id, AgentStatus.RUNNING, 10, 0.7)])
+    result = aggregator.build_result(
+        run_state=None, log_reference=None, progress_file=None
+    )
+
+    assert result.agent_summary is not None
+    assert result.agent_summary.total_cost_usd == pytest.approx(0.7, abs=1e-15)
+    assert result.agent_summary.usage is not None
+    assert result.agent_summary.usage.cost_usd == pytest.approx(0.7, abs=1e-15)
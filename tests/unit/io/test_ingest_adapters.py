@@ -3,13 +3,22 @@
 from __future__ import annotations
 
 import asyncio
+import threading
+from collections.abc import Generator
 from pathlib import Path
 
 import pytest
 
 from rentl_core.ports.ingest import IngestBatchError, IngestErrorCode
-from rentl_io.ingest import CsvIngestAdapter, JsonlIngestAdapter, TxtIngestAdapter
-from rentl_schemas.io import IngestSource
+from rentl_io.ingest import (
+    CsvIngestAdapter,
+    JsonlIngestAdapter,
+    TxtIngestAdapter,
+    csv_adapter,
+    jsonl_adapter,
+)
+from rentl_io.ingest.streaming import iter_line_batches
+from rentl_schemas.io import IngestSource, SourceLine
 from rentl_schemas.primitives import FileFormat
 
 
@@ -133,6 +142,111 @@ def test_jsonl_ingest_rejects_invalid_json(tmp_path: Path) -> None:
     assert exc.value.errors[0].details.line_number == 1
 
 
+def test_jsonl_ingest_falls_back_per_line_for_bad_blocks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Report per-line errors from bulk blocks that fail validation."""
+    monkeypatch.setattr(jsonl_adapter, "BULK_BLOCK_LINES", 2)
+    content = (
+        '{"line_id":"line_1","text":"Hello"}\n'
+        '{"line_id":"line_2","text":"Hi"}\n'
+        '{"line_id":"line_3","text":"Hey","source_columns":null}\n'
+        '{"line_id":"line_4","text":"Yo"}\n'
+        '{"line_id":"line_5","text":"Hey"}, {"line_id":"line_6","text":"Hi"}\n'
+        '{"line_id":"line_7","text":"Bye","speaker":"Alice"}\n'
+    )
+    path = tmp_path / "mixed.jsonl"
+    _write(path, content)
+    source = IngestSource(input_path=str(path), format=FileFormat.JSONL)
+    received: list[str] = []
+
+    async def _consume() -> None:
+        async for batch in JsonlIngestAdapter().iter_source(source):
+            received.extend(line.line_id for line in batch)
+
+    with pytest.raises(IngestBatchError) as exc:
+        asyncio.run(_consume())
+
+    assert received == ["line_1", "line_2", "line_4", "line_7"]
+    assert [
+        (error.code, error.details.line_number if error.details else None)
+        for error in exc.value.errors
+    ] == [
+        (IngestErrorCode.VALIDATION_ERROR, 3),
+        (IngestErrorCode.PARSE_ERROR, 5),
+    ]
+
+
+def test_jsonl_ingest_rejects_records_split_across_lines(tmp_path: Path) -> None:
+    """A record split over two lines is a parse error, not one record."""
+    content = '{"line_id":"a","text":"x"}, {"line_id":"b"\n"text":"y"}\n'
+    path = tmp_path / "split.jsonl"
+    _write(path, content)
+    source = IngestSource(input_path=str(path), format=FileFormat.JSONL)
+
+    with pytest.raises(IngestBatchError) as exc:
+        asyncio.run(JsonlIngestAdapter().load_source(source))
+
+    assert [
+        (error.code, error.details.line_number if error.details else None)
+        for error in exc.value.errors
+    ] == [
+        (IngestErrorCode.PARSE_ERROR, 1),
+        (IngestErrorCode.PARSE_ERROR, 2),
+    ]
+
+
+def test_csv_ingest_falls_back_per_row_for_bad_blocks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Report per-row errors in order from bulk blocks that fail validation."""
+    monkeypatch.setattr(csv_adapter, "BULK_BLOCK_ROWS", 3)
+    content = (
+        "line_id,text,speaker\n"
+        "line_1,Hello,Alice\n"
+        ",Hi,Bob\n"
+        "line_3,   ,Carol\n"
+        "line_4,Hey,\n"
+    )
+    path = tmp_path / "mixed.csv"
+    _write(path, content)
+    source = IngestSource(input_path=str(path), format=FileFormat.CSV)
+
+    with pytest.raises(IngestBatchError) as exc:
+        asyncio.run(CsvIngestAdapter().load_source(source))
+
+    assert [
+        (error.code, error.details.row_number if error.details else None)
+        for error in exc.value.errors
+    ] == [
+        (IngestErrorCode.MISSING_FIELD, 3),
+        (IngestErrorCode.VALIDATION_ERROR, 4),
+    ]
+
+
+def test_csv_ingest_handles_blank_and_ragged_rows(tmp_path: Path) -> None:
+    """Skip blank rows and pad short rows like a dict reader."""
+    content = (
+        "line_id,text,scene_id,speaker\n"
+        "line_1,Hello,scene_1,Alice\n"
+        "\n"
+        "line_2,Hi\n"
+        "line_3,Hey,scene_2,Bob,overflow\n"
+    )
+    path = tmp_path / "ragged.csv"
+    _write(path, content)
+    source = IngestSource(input_path=str(path), format=FileFormat.CSV)
+
+    lines = asyncio.run(CsvIngestAdapter().load_source(source))
+
+    assert [(line.line_id, line.scene_id, line.speaker) for line in lines] == [
+        ("line_1", "scene_1", "Alice"),
+        ("line_2", None, None),
+        ("line_3", "scene_2", "Bob"),
+    ]
+    assert lines[0].source_columns == ["line_id", "text", "scene_id", "speaker"]
+
+
 def test_jsonl_ingest_rejects_non_object(tmp_path: Path) -> None:
     """Reject JSONL lines that are not objects."""
     content = "[]\n"
@@ -181,3 +295,90 @@ def test_txt_ingest_rejects_empty_lines(tmp_path: Path) -> None:
     assert exc.value.errors[0].code == IngestErrorCode.MISSING_FIELD
     assert exc.value.errors[0].details is not None
     assert exc.value.errors[0].details.line_number == 2
+
+
+def test_jsonl_iter_source_streams_batches(tmp_path: Path) -> None:
+    """Stream JSONL lines in batches matching a full load."""
+    path = tmp_path / "source.jsonl"
+    _write(
+        path,
+        "".join(
+            f'{{"line_id":"line_{index}","text":"Hello {index}"}}\n'
+            for index in range(5)
+        ),
+    )
+    source = IngestSource(input_path=str(path), format=FileFormat.JSONL)
+    adapter = JsonlIngestAdapter()
+
+    async def _collect() -> list[list[str]]:
+        return [
+            [line.line_id for line in batch]
+            async for batch in adapter.iter_source(source, batch_size=2)
+        ]
+
+    batches = asyncio.run(_collect())
+
+    assert batches == [
+        ["line_0", "line_1"],
+        ["line_2", "line_3"],
+        ["line_4"],
+    ]
+    loaded = asyncio.run(adapter.load_source(source))
+    assert [line.line_id for line in loaded] == [
+        line_id for batch in batches for line_id in batch
+    ]
+
+
+def test_txt_iter_source_raises_batch_errors_after_valid_lines(
+    tmp_path: Path,
+) -> None:
+    """Yield valid lines before raising collected per-line errors."""
+    path = tmp_path / "source.txt"
+    _write(path, "First\n\nThird\n")
+    source = IngestSource(input_path=str(path), format=FileFormat.TXT)
+    adapter = TxtIngestAdapter()
+    received: list[str] = []
+
+    async def _consume() -> None:
+        async for batch in adapter.iter_source(source, batch_size=1):
+            received.extend(line.text for line in batch)
+
+    with pytest.raises(IngestBatchError) as exc:
+        asyncio.run(_consume())
+
+    assert received == ["First", "Third"]
+    assert exc.value.errors[0].details is not None
+    assert exc.value.errors[0].details.line_number == 2
+
+
+def test_iter_line_batches_propagates_cancellation_mid_batch() -> None:
+    """Cancelling while a batch is parsing raises CancelledError, not close()."""
+    started = threading.Event()
+    release = threading.Event()
+    closed: list[bool] = []
+
+    def _lines() -> Generator[SourceLine]:
+        try:
+            yield SourceLine(line_id="line_1", text="First")
+            started.set()
+            release.wait(timeout=5)
+            yield SourceLine(line_id="line_2", text="Second")
+        finally:
+            closed.append(True)
+
+    async def _consume() -> None:
+        async for _ in iter_line_batches(_lines(), batch_size=10):
+            pass
+
+    async def _cancel_mid_batch() -> None:
+        task = asyncio.create_task(_consume())
+        await asyncio.to_thread(started.wait, 5)
+        task.cancel()
+        # Let the cancellation reach the consumer while the parser is blocked
+        await asyncio.sleep(0.01)
+        release.set()
+        await task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(_cancel_mid_batch())
+    assert closed == [True]
@@ -8,6 +8,8 @@ from uuid import UUID
 
 from rentl_core.ports.orchestrator import LogSinkProtocol
 from rentl_io.storage import (
+    BufferedLogSink,
+    BufferedProgressSink,
     CompositeLogSink,
     CompositeProgressSink,
     ConsoleLogSink,
@@ -17,6 +19,7 @@ from rentl_io.storage import (
     RedactingLogSink,
     build_log_sink,
 )
+from rentl_io.storage.batch_writer import BatchWriter
 from rentl_io.storage.filesystem import FileSystemLogStore
 from rentl_schemas.config import LoggingConfig, LogSinkConfig
 from rentl_schemas.events import ProgressEvent
@@ -46,7 +49,34 @@ class _StubLogSink(LogSinkProtocol):
         self.entries.append(entry)
 
 
+class _RecordingLogStore:
+    def __init__(self) -> None:
+        self.batches: list[list[LogEntry]] = []
+
+    async def append_log(self, entry: LogEntry) -> None:
+        self.batches.append([entry])
+
+    async def append_logs(self, entries: list[LogEntry]) -> None:
+        self.batches.append(entries)
+
+    async def get_log_reference(self, run_id: RunId) -> None:
+        return None
+
+
 RUN_ID: RunId = UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb700")
+OTHER_RUN_ID: RunId = UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb701")
+
+
+def _build_log_entry(run_id: RunId, message: str) -> LogEntry:
+    return LogEntry(
+        timestamp="2026-01-26T12:00:00Z",
+        level=LogLevel.INFO,
+        event="agent_progress",
+        run_id=run_id,
+        phase=None,
+        message=message,
+        data=None,
+    )
 
 
 def _build_progress_update() -> ProgressUpdate:
@@ -360,3 +390,67 @@ def test_build_log_sink_without_redactor(tmp_path: Path) -> None:
 
     # Verify that the sink is not wrapped with redaction
     assert isinstance(sink, ConsoleLogSink)
+
+
+def test_buffered_log_sink_coalesces_entries_per_run() -> None:
+    """Buffered log sink writes batches split by run on size and flush."""
+    store = _RecordingLogStore()
+    sink = BufferedLogSink(store, batch_size=3, flush_interval_s=60)
+    run_ids = [RUN_ID, RUN_ID, OTHER_RUN_ID, RUN_ID]
+
+    async def _emit() -> list[list[str]]:
+        for index, run_id in enumerate(run_ids):
+            await sink.emit_log(_build_log_entry(run_id, f"entry {index}"))
+        await asyncio.sleep(0)
+        before_flush = [[entry.message for entry in batch] for batch in store.batches]
+        await sink.aclose()
+        return before_flush
+
+    before_flush = asyncio.run(_emit())
+
+    assert before_flush == [["entry 0", "entry 1"], ["entry 2"]]
+    assert [[entry.message for entry in batch] for batch in store.batches] == [
+        ["entry 0", "entry 1"],
+        ["entry 2"],
+        ["entry 3"],
+    ]
+
+
+def test_batch_writer_applies_backpressure() -> None:
+    """Producers wait while the pending buffer is full."""
+    release = asyncio.Event()
+    written: list[int] = []
+
+    async def _write(batch: list[int]) -> None:
+        await release.wait()
+        written.extend(batch)
+
+    async def _produce() -> None:
+        writer = BatchWriter(_write, batch_size=1, flush_interval_s=60, max_pending=1)
+        await writer.put(0)
+        await asyncio.sleep(0)
+        await writer.put(1)
+        blocked = asyncio.create_task(writer.put(2))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+        release.set()
+        await blocked
+        await writer.aclose()
+
+    asyncio.run(_produce())
+
+    assert written == [0, 1, 2]
+
+
+def test_buffered_progress_sink_survives_event_loop_changes(tmp_path: Path) -> None:
+    """Updates buffered under one event loop are written from the next one."""
+    path = tmp_path / "progress.jsonl"
+    sink = BufferedProgressSink(str(path), flush_interval_s=60)
+
+    asyncio.run(sink.emit_progress(_build_progress_update()))
+    assert not path.exists()
+    asyncio.run(sink.flush())
+
+    lines = path.read_text(encoding="utf-8").strip().splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["event"] == ProgressEvent.PHASE_STARTED
@@ -1,8 +1,10 @@
-"""Unit tests for filesystem storage adapters."""
+"""Unit tests for filesystem and SQLite storage adapters."""
 
 from __future__ import annotations
 
 import asyncio
+import sqlite3
+import threading
 from pathlib import Path
 from uuid import UUID
 
@@ -14,7 +16,12 @@ from rentl_io.storage import (
     FileSystemArtifactStore,
     FileSystemLogStore,
     FileSystemRunStateStore,
+    SqliteArtifactStore,
+    SqliteLogStore,
+    SqliteRunStateStore,
 )
+from rentl_io.storage import filesystem as filesystem_storage
+from rentl_io.storage.sqlite import _SqliteDatabase  # noqa: PLC2701
 from rentl_schemas.base import BaseSchema
 from rentl_schemas.logs import LogEntry
 from rentl_schemas.pipeline import RunMetadata, RunState
@@ -36,6 +43,7 @@ from rentl_schemas.storage import (
     ArtifactFormat,
     ArtifactMetadata,
     ArtifactRole,
+    PhaseCheckpointRecord,
     RunIndexRecord,
     RunStateRecord,
     StorageReference,
@@ -121,6 +129,32 @@ def test_filesystem_run_state_store_round_trip(tmp_path: Path) -> None:
     assert records[0].metadata.run_id == run_id
 
 
+def test_filesystem_run_state_store_replaces_snapshot_atomically(
+    tmp_path: Path,
+) -> None:
+    """Snapshots are replaced whole and leave no temp files behind."""
+    run_id: RunId = UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb601")
+    store = FileSystemRunStateStore(base_dir=str(tmp_path / "state"))
+    for stored_at in ("2026-01-26T00:00:01Z", "2026-01-26T00:00:02Z"):
+        asyncio.run(
+            store.save_run_state(
+                RunStateRecord(
+                    run_id=run_id,
+                    stored_at=stored_at,
+                    state=_build_run_state(run_id),
+                    location=None,
+                    checksum_sha256=None,
+                )
+            )
+        )
+
+    loaded = asyncio.run(store.load_run_state(run_id))
+    assert loaded is not None
+    assert loaded.stored_at == "2026-01-26T00:00:02Z"
+    state_path = store.state_path(run_id)
+    assert [path.name for path in state_path.parent.iterdir()] == [state_path.name]
+
+
 def test_filesystem_artifact_store_json_round_trip(tmp_path: Path) -> None:
     """Artifact store writes JSON artifacts and reloads them."""
     run_id: RunId = UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb601")
@@ -212,6 +246,174 @@ def test_filesystem_artifact_store_jsonl_round_trip(tmp_path: Path) -> None:
     assert [item.value for item in loaded] == ["one", "two"]
 
 
+def test_filesystem_artifact_store_checkpoint_round_trip(tmp_path: Path) -> None:
+    """Checkpoints append per phase, survive torn lines, and clear."""
+    run_id: RunId = UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb603")
+    store = FileSystemArtifactStore(base_dir=str(tmp_path / "artifacts"))
+    records = [
+        PhaseCheckpointRecord(
+            run_id=run_id,
+            phase=PhaseName.TRANSLATE,
+            target_language="ja",
+            agent_name="direct_translator",
+            chunk_fingerprint=str(index) * 64,
+            line_ids=[f"line_{index}"],
+            created_at="2026-01-26T00:00:04Z",
+            output={"value": str(index)},
+        )
+        for index in range(2)
+    ]
+
+    for record in records:
+        asyncio.run(store.append_checkpoint(record))
+    checkpoint_path = tmp_path / "artifacts" / str(run_id) / "checkpoints"
+    with open(checkpoint_path / "translate-ja.jsonl", "a", encoding="utf-8") as handle:
+        handle.write('{"run_id": "torn')
+
+    loaded = asyncio.run(store.load_checkpoints(run_id, PhaseName.TRANSLATE, "ja"))
+    assert [record.output for record in loaded] == [{"value": "0"}, {"value": "1"}]
+    assert asyncio.run(store.load_checkpoints(run_id, PhaseName.TRANSLATE, "fr")) == []
+
+    asyncio.run(store.clear_checkpoints(run_id, PhaseName.TRANSLATE, "ja"))
+    assert asyncio.run(store.load_checkpoints(run_id, PhaseName.TRANSLATE, "ja")) == []
+
+
+def _build_artifact_metadata(
+    run_id: RunId, artifact_id: ArtifactId
+) -> ArtifactMetadata:
+    return ArtifactMetadata(
+        artifact_id=artifact_id,
+        run_id=run_id,
+        role=ArtifactRole.PHASE_OUTPUT,
+        phase=PhaseName.CONTEXT,
+        target_language=None,
+        format=ArtifactFormat.JSON,
+        created_at="2026-01-26T00:00:03Z",
+        location=StorageReference(backend=None, path="/tmp/placeholder.json", uri=None),
+        description=None,
+        size_bytes=None,
+        checksum_sha256=None,
+        metadata=None,
+    )
+
+
+def test_filesystem_artifact_store_shards_index_per_run(tmp_path: Path) -> None:
+    """Artifact metadata is indexed per run and legacy global entries still load."""
+    base_dir = tmp_path / "artifacts"
+    run_ids: list[RunId] = [
+        UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb620"),
+        UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb621"),
+    ]
+    artifact_ids: list[ArtifactId] = [
+        UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb622"),
+        UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb623"),
+        UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb624"),
+    ]
+    store = FileSystemArtifactStore(base_dir=str(base_dir))
+    for run_id, artifact_id in zip(run_ids, artifact_ids, strict=False):
+        asyncio.run(
+            store.write_artifact_json(
+                _build_artifact_metadata(run_id, artifact_id),
+                _ArtifactPayload(value=str(artifact_id)),
+            )
+        )
+    legacy = asyncio.run(
+        FileSystemArtifactStore(base_dir=str(tmp_path / "old")).write_artifact_json(
+            _build_artifact_metadata(run_ids[0], artifact_ids[2]),
+            _ArtifactPayload(value="legacy"),
+        )
+    )
+    (base_dir / "index.jsonl").write_text(
+        legacy.model_dump_json(exclude_none=True) + "\n", encoding="utf-8"
+    )
+
+    assert (base_dir / str(run_ids[1]) / "index.jsonl").exists()
+    listed = asyncio.run(store.list_artifacts(run_ids[0]))
+    assert [item.artifact_id for item in listed] == [artifact_ids[2], artifact_ids[0]]
+    assert [
+        item.artifact_id for item in asyncio.run(store.list_artifacts(run_ids[1]))
+    ] == [artifact_ids[1]]
+    loaded = asyncio.run(store.load_artifact_json(artifact_ids[2], _ArtifactPayload))
+    assert loaded.value == "legacy"
+
+
+def test_filesystem_artifact_store_parses_legacy_index_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The legacy global index is re-read only after it changes."""
+    base_dir = tmp_path / "artifacts"
+    run_id: RunId = UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb628")
+    artifact_id: ArtifactId = UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb629")
+    legacy = asyncio.run(
+        FileSystemArtifactStore(base_dir=str(tmp_path / "old")).write_artifact_json(
+            _build_artifact_metadata(run_id, artifact_id),
+            _ArtifactPayload(value="legacy"),
+        )
+    )
+    legacy_index = base_dir / "index.jsonl"
+    legacy_index.parent.mkdir(parents=True)
+    legacy_index.write_text(
+        legacy.model_dump_json(exclude_none=True) + "\n", encoding="utf-8"
+    )
+    parsed: list[Path] = []
+    read_by_run = filesystem_storage._read_artifacts_by_run
+
+    def _counting_read(
+        index_path: Path,
+    ) -> dict[RunId, list[ArtifactMetadata]]:
+        parsed.append(index_path)
+        return read_by_run(index_path)
+
+    monkeypatch.setattr(filesystem_storage, "_read_artifacts_by_run", _counting_read)
+    store = FileSystemArtifactStore(base_dir=str(base_dir))
+
+    for _ in range(3):
+        assert asyncio.run(store.list_artifacts(run_id)) == [legacy]
+    assert parsed == [legacy_index]
+
+    legacy_index.write_text("", encoding="utf-8")
+    assert asyncio.run(store.list_artifacts(run_id)) == []
+    assert parsed == [legacy_index, legacy_index]
+
+
+def test_filesystem_artifact_store_offset_map_tracks_appends(tmp_path: Path) -> None:
+    """Lookups see entries appended by another store after the map was built."""
+    run_id: RunId = UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb625")
+    first_id: ArtifactId = UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb626")
+    second_id: ArtifactId = UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb627")
+    reader = FileSystemArtifactStore(base_dir=str(tmp_path / "artifacts"))
+    writer = FileSystemArtifactStore(base_dir=str(tmp_path / "artifacts"))
+
+    asyncio.run(
+        writer.write_artifact_json(
+            _build_artifact_metadata(run_id, first_id), _ArtifactPayload(value="one")
+        )
+    )
+    assert (
+        asyncio.run(reader.load_artifact_json(first_id, _ArtifactPayload)).value
+        == "one"
+    )
+
+    asyncio.run(
+        writer.write_artifact_json(
+            _build_artifact_metadata(run_id, second_id), _ArtifactPayload(value="two")
+        )
+    )
+    relocated = _build_artifact_metadata(run_id, first_id).model_copy(
+        update={"description": "rewritten"}
+    )
+    asyncio.run(writer.write_artifact_json(relocated, _ArtifactPayload(value="three")))
+
+    assert (
+        asyncio.run(reader.load_artifact_json(second_id, _ArtifactPayload)).value
+        == "two"
+    )
+    assert (
+        asyncio.run(reader.load_artifact_json(first_id, _ArtifactPayload)).value
+        == "three"
+    )
+
+
 def test_filesystem_artifact_store_missing_artifact(tmp_path: Path) -> None:
     """Artifact store returns not found for missing artifacts."""
     artifact_id: ArtifactId = UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb608")
@@ -297,3 +499,157 @@ def test_filesystem_log_store_rejects_mixed_run_ids(tmp_path: Path) -> None:
     with pytest.raises(StorageError) as exc_info:
         asyncio.run(store.append_logs([entry_one, entry_two]))
     assert exc_info.value.info.code == StorageErrorCode.VALIDATION_ERROR
+
+
+def test_sqlite_run_state_store_round_trip(tmp_path: Path) -> None:
+    """SQLite run state store upserts snapshots and filters the run index."""
+    store = SqliteRunStateStore(database_path=str(tmp_path / "rentl.db"))
+    run_ids: list[RunId] = [
+        UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb613"),
+        UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb614"),
+        UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb615"),
+    ]
+    for index, run_id in enumerate(run_ids):
+        state = _build_run_state(run_id)
+        if index == 1:
+            state.metadata.status = RunStatus.COMPLETED
+        record = RunStateRecord(
+            run_id=run_id,
+            stored_at="2026-01-26T00:00:01Z",
+            state=state,
+            location=None,
+            checksum_sha256=None,
+        )
+        asyncio.run(store.save_run_state(record))
+        asyncio.run(store.save_run_state(record))
+        asyncio.run(
+            store.save_run_index(
+                RunIndexRecord(
+                    metadata=state.metadata,
+                    project_name="demo",
+                    source_language="en",
+                    target_languages=["ja"],
+                    updated_at=f"2026-01-26T00:00:1{index}Z",
+                    progress=state.progress.summary,
+                    last_error=None,
+                )
+            )
+        )
+
+    loaded = asyncio.run(store.load_run_state(run_ids[0]))
+    assert loaded is not None
+    assert loaded.state.metadata.run_id == run_ids[0]
+    assert (
+        asyncio.run(store.load_run_state(UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb619")))
+        is None
+    )
+
+    latest = asyncio.run(store.list_run_index(limit=2))
+    assert [record.metadata.run_id for record in latest] == run_ids[:0:-1]
+    completed = asyncio.run(store.list_run_index(status=RunStatus.COMPLETED))
+    assert [record.metadata.run_id for record in completed] == [run_ids[1]]
+
+
+def test_sqlite_artifact_store_indexes_metadata(tmp_path: Path) -> None:
+    """SQLite artifact store keeps payload files and indexes metadata."""
+    run_id: RunId = UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb616")
+    artifact_id: ArtifactId = UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb617")
+    store = SqliteArtifactStore(
+        base_dir=str(tmp_path / "artifacts"),
+        database_path=str(tmp_path / "rentl.db"),
+    )
+    metadata = ArtifactMetadata(
+        artifact_id=artifact_id,
+        run_id=run_id,
+        role=ArtifactRole.PHASE_OUTPUT,
+        phase=PhaseName.TRANSLATE,
+        target_language="ja",
+        format=ArtifactFormat.JSONL,
+        created_at="2026-01-26T00:00:04Z",
+        location=StorageReference(
+            backend=None, path="/tmp/placeholder.jsonl", uri=None
+        ),
+        description=None,
+        size_bytes=None,
+        checksum_sha256=None,
+        metadata=None,
+    )
+    payloads = [_ArtifactPayload(value="one"), _ArtifactPayload(value="two")]
+
+    stored = asyncio.run(store.write_artifact_jsonl(metadata, payloads))
+    assert stored.location.path is not None
+    assert Path(stored.location.path).exists()
+    assert not (tmp_path / "artifacts" / "index.jsonl").exists()
+    assert not (tmp_path / "artifacts" / str(run_id) / "index.jsonl").exists()
+    assert not isinstance(store, FileSystemArtifactStore)
+
+    loaded = asyncio.run(store.load_artifact_jsonl(artifact_id, _ArtifactPayload))
+    assert [item.value for item in loaded] == ["one", "two"]
+    assert asyncio.run(store.list_artifacts(run_id)) == [stored]
+    assert (
+        asyncio.run(store.list_artifacts(UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb619")))
+        == []
+    )
+
+    with pytest.raises(StorageError) as exc_info:
+        asyncio.run(
+            store.load_artifact_json(
+                UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb619"), _ArtifactPayload
+            )
+        )
+    assert exc_info.value.info.code == StorageErrorCode.NOT_FOUND
+
+
+def test_sqlite_log_store_batches_entries(tmp_path: Path) -> None:
+    """SQLite log store appends batches and counts entries per run."""
+    run_id: RunId = UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb618")
+    store = SqliteLogStore(database_path=str(tmp_path / "rentl.db"))
+    entries = [
+        LogEntry(
+            timestamp=f"2026-01-26T00:00:1{index}Z",
+            level=LogLevel.INFO,
+            event="run_started",
+            run_id=run_id,
+            phase=None,
+            message="Run started",
+            data=None,
+        )
+        for index in range(3)
+    ]
+
+    assert asyncio.run(store.get_log_reference(run_id)) is None
+    asyncio.run(store.append_logs(entries[:2]))
+    asyncio.run(store.append_log(entries[2]))
+    reference = asyncio.run(store.get_log_reference(run_id))
+
+    assert reference is not None
+    assert reference.entry_count == 3
+    assert reference.created_at == "2026-01-26T00:00:10Z"
+    assert reference.updated_at == "2026-01-26T00:00:12Z"
+
+
+def test_sqlite_database_keeps_one_connection_per_thread(tmp_path: Path) -> None:
+    """Each thread reuses its connection until the database is closed."""
+    database = _SqliteDatabase(tmp_path / "rentl.db")
+
+    def _query_in_thread() -> None:
+        thread = threading.Thread(target=database.execute, args=("SELECT 1",))
+        thread.start()
+        thread.join()
+
+    database.execute("SELECT 1")
+    connection = database._connections[threading.current_thread()]
+    database.executemany(
+        "INSERT INTO logs (run_id, timestamp, payload) VALUES (?, ?, ?)",
+        [("run", "2026-01-26T00:00:00Z", "{}")],
+    )
+    assert database._connections[threading.current_thread()] is connection
+
+    _query_in_thread()
+    _query_in_thread()
+    assert len(database._connections) == 2
+
+    database.close()
+    assert database._connections == {}
+    with pytest.raises(sqlite3.ProgrammingError):
+        connection.execute("SELECT 1")
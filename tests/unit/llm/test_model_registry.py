@@ -0,0 +1,77 @@
+"""Unit tests for the per-run model registry."""
+
+from __future__ import annotations
+
+import pytest
+from pydantic_ai.models.openai import OpenAIChatModel
+
+from rentl_llm.model_registry import ModelRegistry
+
+_BASE_URL = "http://localhost:8000/v1"
+
+
+def _get_model(
+    registry: ModelRegistry,
+    *,
+    temperature: float = 0.2,
+    base_url: str = _BASE_URL,
+    max_connections: int | None = None,
+) -> OpenAIChatModel:
+    model, _settings = registry.get_model(
+        base_url=base_url,
+        api_key="test-key",
+        model_id="local-model",
+        temperature=temperature,
+        max_connections=max_connections,
+    )
+    assert isinstance(model, OpenAIChatModel)
+    return model
+
+
+def _pool_size(registry: ModelRegistry, base_url: str) -> int:
+    client = registry.http_client_for(base_url)
+    return client._transport._pool._max_connections  # type: ignore[attr-defined]
+
+
+async def test_registry_reuses_model_for_same_configuration() -> None:
+    """Identical configurations share one model instance."""
+    async with ModelRegistry() as registry:
+        first = _get_model(registry)
+        second = _get_model(registry)
+        other = _get_model(registry, temperature=0.9)
+
+    assert first is second
+    assert other is not first
+
+
+async def test_registry_shares_http_client_per_endpoint() -> None:
+    """Models on the same endpoint share a single pooled client."""
+    async with ModelRegistry() as registry:
+        _get_model(registry, max_connections=4)
+        _get_model(registry, temperature=0.9)
+        _get_model(registry, base_url="http://other:8000/v1")
+
+        assert registry.http_client_for(_BASE_URL + "/") is registry.http_client_for(
+            _BASE_URL
+        )
+        assert _pool_size(registry, _BASE_URL) == 4
+        assert _pool_size(registry, "http://other:8000/v1") == 100
+
+
+async def test_registry_close_releases_clients() -> None:
+    """Closing the registry closes pooled clients and rejects reuse."""
+    registry = ModelRegistry()
+    client = registry.http_client_for(_BASE_URL)
+
+    await registry.aclose()
+
+    assert client.is_closed
+    assert registry.closed
+    with pytest.raises(RuntimeError, match="closed"):
+        registry.http_client_for(_BASE_URL)
+
+
+def test_registry_rejects_non_positive_pool_size() -> None:
+    """Pool sizes must be positive."""
+    with pytest.raises(ValueError, match="max_connections"):
+        ModelRegistry(max_connections=0)
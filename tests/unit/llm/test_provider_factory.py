@@ -19,6 +19,7 @@ from rentl_llm.provider_factory import (
     PreflightIssue,
     ProviderFactoryError,
     assert_preflight,
+    build_prompt_cache_settings,
     create_model,
     enforce_provider_allowlist,
     run_preflight_checks,
@@ -139,6 +140,20 @@ class TestCreateModelOpenAIRouting:
         assert oai_settings["openai_reasoning_effort"] == "high"
 
 
+class TestPromptCacheSettings:
+    """Test provider prompt-cache hints."""
+
+    def test_openai_gets_prompt_cache_key(self) -> None:
+        """OpenAI requests carry the prefix key as prompt_cache_key."""
+        settings = build_prompt_cache_settings("https://api.openai.com/v1", "key-1")
+        assert settings == {"extra_body": {"prompt_cache_key": "key-1"}}
+
+    def test_other_providers_get_no_hints(self) -> None:
+        """Providers without a cache key parameter get no extra settings."""
+        for base_url in ("https://openrouter.ai/api/v1", "http://localhost:1234/v1"):
+            assert build_prompt_cache_settings(base_url, "key-1") == {}
+
+
 class TestModelIdValidation:
     """Tests for OpenRouter model ID validation."""
 
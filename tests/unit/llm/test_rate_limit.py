@@ -0,0 +1,298 @@
+"""Unit tests for the shared LLM request governor."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import httpx
+import openai
+import pytest
+from pydantic_ai.exceptions import ModelHTTPError
+from pydantic_ai.messages import ModelRequest, ModelResponse, TextPart, UserPromptPart
+from pydantic_ai.models import ModelRequestParameters
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+from pydantic_ai.usage import RequestUsage
+
+from rentl_llm.provider_factory import create_model
+from rentl_llm.rate_limit import (
+    EndpointRateLimiter,
+    RateLimitedModel,
+    RequestGovernor,
+    estimate_request_tokens,
+    get_request_governor,
+    is_rate_limit_error,
+    retry_after_from_error,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _rate_limit_error(headers: dict[str, str]) -> ModelHTTPError:
+    response = httpx.Response(
+        429, headers=headers, request=httpx.Request("POST", "http://x")
+    )
+    cause = openai.RateLimitError("rate limited", response=response, body=None)
+    error = ModelHTTPError(status_code=429, model_name="m", body=None)
+    error.__cause__ = cause
+    return error
+
+
+async def test_limiter_caps_in_flight_requests() -> None:
+    """No more than max_parallel_requests run concurrently."""
+    limiter = EndpointRateLimiter("endpoint", max_parallel_requests=2)
+    peak = 0
+
+    async def _task() -> None:
+        nonlocal peak
+        async with limiter.acquire():
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(_task() for _ in range(6)))
+
+    assert peak == 2
+    assert limiter.in_flight == 0
+
+
+async def test_limiter_scope_narrows_concurrency() -> None:
+    """Scoped limits apply on top of the endpoint-wide cap."""
+    limiter = EndpointRateLimiter("endpoint", max_parallel_requests=8)
+    peak = 0
+
+    async def _task() -> None:
+        nonlocal peak
+        async with limiter.acquire(scope="translate", scope_limit=1):
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.005)
+
+    await asyncio.gather(*(_task() for _ in range(4)))
+
+    assert peak == 1
+
+
+async def test_request_bucket_throttles_after_budget(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Requests beyond the per-minute budget wait for the bucket to refill."""
+    clock = _Clock()
+    limiter = EndpointRateLimiter("endpoint", requests_per_minute=60, clock=clock)
+    sleeps: list[float] = []
+
+    real_sleep = asyncio.sleep
+
+    async def _fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr("rentl_llm.rate_limit.asyncio.sleep", _fake_sleep)
+
+    for _ in range(61):
+        async with limiter.acquire():
+            pass
+
+    assert sleeps == [pytest.approx(1.0)]
+
+
+async def test_token_bucket_reconciles_actual_usage(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Unused token reservations are refunded to the budget."""
+    clock = _Clock()
+    limiter = EndpointRateLimiter("endpoint", tokens_per_minute=1000, clock=clock)
+    sleeps: list[float] = []
+
+    real_sleep = asyncio.sleep
+
+    async def _fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr("rentl_llm.rate_limit.asyncio.sleep", _fake_sleep)
+
+    async with limiter.acquire(900):
+        pass
+    limiter.record_usage(900, 100)
+    async with limiter.acquire(800):
+        pass
+
+    assert sleeps == []
+
+
+def test_record_rate_limit_sets_cooldown() -> None:
+    """429 responses pause the endpoint for the Retry-After window."""
+    clock = _Clock()
+    limiter = EndpointRateLimiter("endpoint", clock=clock)
+
+    applied = limiter.record_rate_limit(12.0)
+
+    assert applied == pytest.approx(12.0)
+    assert limiter.cooldown_remaining() == pytest.approx(12.0)
+    clock.now += 20
+    assert limiter.cooldown_remaining() == pytest.approx(0.0)
+
+
+def test_limiter_rejects_non_positive_limits() -> None:
+    """Limits must be positive."""
+    with pytest.raises(ValueError, match="max_parallel_requests"):
+        EndpointRateLimiter("endpoint", max_parallel_requests=0)
+
+
+def test_governor_shares_limiters_per_endpoint() -> None:
+    """Each endpoint keeps one limiter whose limits are updated in place."""
+    governor = RequestGovernor()
+
+    first = governor.limiter_for("http://a/v1", max_parallel_requests=4)
+    second = governor.limiter_for("http://a/v1", max_parallel_requests=4)
+    other = governor.limiter_for("http://b/v1", max_parallel_requests=4)
+    changed = governor.limiter_for("http://a/v1", max_parallel_requests=2)
+
+    assert first is second
+    assert other is not first
+    assert changed is first
+    assert changed.limits == (2, None, None)
+    assert isinstance(get_request_governor(), RequestGovernor)
+
+
+async def test_governor_limit_changes_keep_in_flight_slots() -> None:
+    """Changing limits keeps counting requests that already hold a slot."""
+    governor = RequestGovernor()
+    limiter = governor.limiter_for("http://a/v1", max_parallel_requests=2)
+    release = asyncio.Event()
+
+    async def _hold() -> None:
+        async with limiter.acquire():
+            await release.wait()
+
+    holders = [asyncio.create_task(_hold()) for _ in range(2)]
+    await asyncio.sleep(0)
+    assert limiter.in_flight == 2
+
+    assert governor.limiter_for("http://a/v1", max_parallel_requests=3) is limiter
+    holders.append(asyncio.create_task(_hold()))
+    await asyncio.sleep(0)
+    assert limiter.in_flight == 3
+
+    governor.limiter_for("http://a/v1", max_parallel_requests=1)
+    holders.append(asyncio.create_task(_hold()))
+    await asyncio.sleep(0)
+    assert limiter.in_flight == 3
+
+    release.set()
+    await asyncio.gather(*holders)
+    assert limiter.in_flight == 0
+
+
+def test_retry_after_parsing_from_error_chain() -> None:
+    """Retry-After hints are read from the provider response headers."""
+    assert retry_after_from_error(
+        _rate_limit_error({"retry-after": "7"})
+    ) == pytest.approx(7.0)
+    assert retry_after_from_error(
+        _rate_limit_error({"retry-after-ms": "1500"})
+    ) == pytest.approx(1.5)
+    future = datetime.now(UTC) + timedelta(seconds=30)
+    parsed = retry_after_from_error(
+        _rate_limit_error({"retry-after": format_datetime(future)})
+    )
+    assert parsed is not None
+    assert 25 <= parsed <= 30
+    assert retry_after_from_error(RuntimeError("boom")) is None
+
+
+def test_is_rate_limit_error_checks_status() -> None:
+    """Only 429 errors count as rate limiting."""
+    assert is_rate_limit_error(_rate_limit_error({}))
+    assert not is_rate_limit_error(
+        ModelHTTPError(status_code=500, model_name="m", body=None)
+    )
+
+
+def test_estimate_request_tokens_includes_max_output() -> None:
+    """Estimates count prompt characters and the output budget."""
+    messages = [ModelRequest(parts=[UserPromptPart(content="x" * 400)])]
+
+    assert estimate_request_tokens(messages, {"max_tokens": 50}) == 150
+    assert estimate_request_tokens(messages, None) == 100
+
+
+async def test_rate_limited_model_records_429() -> None:
+    """429 responses from the wrapped model feed the limiter cooldown."""
+
+    def _raise(_messages: list, _info: AgentInfo) -> ModelResponse:
+        raise _rate_limit_error({"retry-after": "3"})
+
+    limiter = EndpointRateLimiter("endpoint")
+    model = RateLimitedModel(FunctionModel(_raise), limiter)
+
+    with pytest.raises(ModelHTTPError):
+        await model.request(
+            [ModelRequest(parts=[UserPromptPart(content="hi")])],
+            None,
+            ModelRequestParameters(),
+        )
+
+    assert limiter.cooldown_remaining() > 2.0
+
+
+async def test_rate_limited_model_records_429_from_provider_first_attempt() -> None:
+    """A provider 429 starts the cooldown without SDK-internal retries."""
+    calls: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(
+            429,
+            headers={"retry-after": "3"},
+            json={"error": {"message": "rate limited"}},
+        )
+
+    limiter = EndpointRateLimiter("endpoint")
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+        wrapped, _settings = create_model(
+            base_url="http://localhost:8000/v1",
+            api_key="test-key",
+            model_id="test-model",
+            temperature=0.2,
+            http_client=client,
+        )
+        model = RateLimitedModel(wrapped, limiter)
+
+        with pytest.raises(ModelHTTPError):
+            await model.request(
+                [ModelRequest(parts=[UserPromptPart(content="hi")])],
+                None,
+                ModelRequestParameters(),
+            )
+
+    assert len(calls) == 1
+    assert limiter.cooldown_remaining() > 2.0
+
+
+async def test_rate_limited_model_passes_responses_through() -> None:
+    """Successful responses are returned unchanged."""
+
+    def _respond(_messages: list, _info: AgentInfo) -> ModelResponse:
+        return ModelResponse(
+            parts=[TextPart(content="ok")],
+            usage=RequestUsage(input_tokens=3, output_tokens=2),
+        )
+
+    limiter = EndpointRateLimiter("endpoint", tokens_per_minute=1000)
+    model = RateLimitedModel(FunctionModel(_respond), limiter)
+
+    response = await model.request(
+        [ModelRequest(parts=[UserPromptPart(content="hi")])],
+        None,
+        ModelRequestParameters(),
+    )
+
+    assert response.parts[0].content == "ok"  # type: ignore[union-attr]
+    assert limiter.in_flight == 0
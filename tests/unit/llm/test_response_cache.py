@@ -0,0 +1,183 @@
+"""Unit tests for the disk-backed LLM response cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from rentl_llm.response_cache import LlmResponseCache, build_response_cache_key
+from rentl_schemas.config import CacheConfig
+
+
+class _Clock:
+    def __init__(self, now: float = 1_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _key(**overrides: str) -> str:
+    params = {
+        "model_id": "gpt-5-nano",
+        "system_prompt": "system",
+        "user_prompt": "user",
+    }
+    params.update(overrides)
+    return build_response_cache_key(
+        model_id=params["model_id"],
+        model_settings={"temperature": 0.2},
+        system_prompt=params["system_prompt"],
+        user_prompt=params["user_prompt"],
+        output_schema={"type": "object"},
+        tool_names=["get_game_info"],
+    )
+
+
+def test_cache_key_is_stable_and_content_addressed() -> None:
+    """Identical requests share a key; any prompt change produces a new key."""
+    assert _key() == _key()
+    assert _key() != _key(user_prompt="other user")
+    assert _key() != _key(system_prompt="other system")
+    assert _key() != _key(model_id="other-model")
+
+
+def test_cache_key_ignores_tool_order() -> None:
+    """Tool ordering does not affect the key."""
+    first = build_response_cache_key(
+        model_id="m",
+        model_settings={},
+        system_prompt="s",
+        user_prompt="u",
+        output_schema={},
+        tool_names=["a", "b"],
+    )
+    second = build_response_cache_key(
+        model_id="m",
+        model_settings={},
+        system_prompt="s",
+        user_prompt="u",
+        output_schema={},
+        tool_names=["b", "a"],
+    )
+    assert first == second
+
+
+def test_cache_round_trip(tmp_path: Path) -> None:
+    """Stored payloads are returned on lookup."""
+    cache = LlmResponseCache(tmp_path)
+    key = _key()
+
+    assert cache.get_sync(key) is None
+    cache.put_sync(key, {"summary": "ok"})
+
+    assert cache.get_sync(key) == {"summary": "ok"}
+    assert len(cache) == 1
+
+
+async def test_cache_async_round_trip(tmp_path: Path) -> None:
+    """Async accessors delegate to the disk store."""
+    cache = LlmResponseCache(tmp_path)
+    key = _key()
+
+    await cache.put(key, ["a", "b"])
+
+    assert await cache.get(key) == ["a", "b"]
+
+
+def test_cache_entries_expire_after_ttl(tmp_path: Path) -> None:
+    """Entries older than the TTL are treated as misses and removed."""
+    clock = _Clock()
+    cache = LlmResponseCache(tmp_path, ttl_s=60, clock=clock)
+    key = _key()
+    cache.put_sync(key, {"summary": "ok"})
+
+    clock.now += 30
+    assert cache.get_sync(key) == {"summary": "ok"}
+
+    clock.now += 61
+    assert cache.get_sync(key) is None
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    """Exceeding max_entries evicts the least recently used to the low-water mark."""
+    clock = _Clock()
+    cache = LlmResponseCache(tmp_path, max_entries=10, clock=clock)
+    keys = [_key(user_prompt=f"u{i}") for i in range(11)]
+
+    for index, key in enumerate(keys[:10]):
+        cache.put_sync(key, index)
+        clock.now += 1
+    # Touch the first entry so the second and third become least recently used
+    assert cache.get_sync(keys[0]) == 0
+    clock.now += 1
+    cache.put_sync(keys[10], 10)
+
+    assert len(cache) == 9
+    assert cache.get_sync(keys[0]) == 0
+    assert cache.get_sync(keys[1]) is None
+    assert cache.get_sync(keys[2]) is None
+    assert cache.get_sync(keys[10]) == 10
+
+
+def test_caches_over_one_directory_share_the_entry_count(tmp_path: Path) -> None:
+    """Inserts through any instance count toward the shared max_entries."""
+    clock = _Clock()
+    first = LlmResponseCache(tmp_path, max_entries=10, clock=clock)
+    second = LlmResponseCache(tmp_path, max_entries=10, clock=clock)
+
+    for index in range(6):
+        first.put_sync(_key(user_prompt=f"a{index}"), index)
+        clock.now += 1
+    for index in range(5):
+        second.put_sync(_key(user_prompt=f"b{index}"), index)
+        clock.now += 1
+    assert len(first) == 9
+
+    for index in range(2):
+        first.put_sync(_key(user_prompt=f"c{index}"), index)
+        clock.now += 1
+
+    assert len(second) == 9
+
+
+def test_cache_discards_corrupt_entries(tmp_path: Path) -> None:
+    """Unreadable entries are removed instead of raising."""
+    cache = LlmResponseCache(tmp_path)
+    key = _key()
+    cache.put_sync(key, {"summary": "ok"})
+    entry_path = tmp_path / key[:2] / f"{key}.json"
+    entry_path.write_text("{not json", encoding="utf-8")
+
+    assert cache.get_sync(key) is None
+    assert not entry_path.exists()
+
+
+def test_cache_clear_removes_entries(tmp_path: Path) -> None:
+    """Clear empties the cache directory."""
+    cache = LlmResponseCache(tmp_path)
+    cache.put_sync(_key(), 1)
+    cache.put_sync(_key(user_prompt="x"), 2)
+
+    cache.clear()
+
+    assert len(cache) == 0
+
+
+def test_from_config_disabled_returns_none(tmp_path: Path) -> None:
+    """Disabled cache config yields no cache."""
+    config = CacheConfig(enabled=False, cache_dir=str(tmp_path))
+
+    assert LlmResponseCache.from_config(config) is None
+
+
+def test_from_config_resolves_relative_dir(tmp_path: Path) -> None:
+    """Relative cache directories resolve against the base directory."""
+    config = CacheConfig(enabled=True, cache_dir="cache", ttl_s=5, max_entries=3)
+
+    cache = LlmResponseCache.from_config(config, base_dir=tmp_path)
+
+    assert cache is not None
+    assert cache.cache_dir == tmp_path / "cache"
+    assert os.fspath(cache.cache_dir).startswith(os.fspath(tmp_path))
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import re
+from collections.abc import Callable
 from typing import cast
 from uuid import UUID
 
 import pytest
 from pydantic import BaseModel, ConfigDict, Field
+from pydantic_ai.exceptions import UnexpectedModelBehavior, UsageLimitExceeded
 
 from rentl_agents.runtime import ProfileAgent, ProfileAgentConfig
+from rentl_agents.templates import TemplateContext
 from rentl_agents.wiring import (
     ContextSceneSummarizerAgent,
     EditBasicEditorAgent,
@@ -47,16 +51,22 @@ class FakeAgent(BaseModel):
     )
     contexts: list[BaseModel] = Field(
         default_factory=list,
-        description="Recorded template contexts from update_context",
+        description="Template contexts passed to run()",
     )
     call_count: int = Field(default=0, description="Number of run() calls made so far")
 
-    def update_context(self, context: BaseModel) -> None:
-        """Record updated template context."""
+    async def run(
+        self,
+        payload: BaseModel,
+        context: BaseModel,
+        cacheable: Callable[[BaseModel], bool] | None = None,
+    ) -> BaseModel:
+        """Record the context and return the next predefined output.
+
+        Returns:
+            The next predefined output, repeating the last once exhausted.
+        """
         self.contexts.append(context)
-
-    async def run(self, payload: BaseModel) -> BaseModel:
-        """Return the next predefined output."""
         if self.call_count >= len(self.outputs):
             return self.outputs[-1]
         output = self.outputs[self.call_count]
@@ -119,6 +129,63 @@ async def test_translate_retries_on_alignment_error() -> None:
     assert output.translated_lines[1].line_id == "line_2"
 
 
+@pytest.mark.asyncio
+async def test_translate_repair_requests_only_missing_lines() -> None:
+    """Translate retry keeps aligned lines and re-requests only missing IDs."""
+    config = _build_config(max_output_retries=1)
+    source_lines = [
+        SourceLine(line_id="line_1", text="A", scene_id="scene_1"),
+        SourceLine(line_id="line_2", text="B", scene_id="scene_1"),
+        SourceLine(line_id="line_3", text="C", scene_id="scene_1"),
+    ]
+    payload = TranslatePhaseInput(
+        run_id=UUID("00000000-0000-7000-8000-000000000021"),
+        target_language="en",
+        source_lines=source_lines,
+        scene_summaries=None,
+        context_notes=None,
+        project_context=None,
+        pretranslation_annotations=None,
+        term_candidates=None,
+        glossary=None,
+        style_guide=None,
+    )
+    partial_result = TranslationResultList(
+        translations=[
+            TranslationResultLine(line_id="line_1", text="A1"),
+            TranslationResultLine(line_id="line_3", text="C1"),
+            TranslationResultLine(line_id="line_999", text="X"),
+        ]
+    )
+    repair_result = TranslationResultList(
+        translations=[TranslationResultLine(line_id="line_2", text="B1")]
+    )
+    fake = FakeAgent(outputs=[partial_result, repair_result])
+    agent = TranslateDirectTranslatorAgent(
+        profile_agent=cast(
+            ProfileAgent[TranslatePhaseInput, TranslationResultList], fake
+        ),
+        config=config,
+        chunk_size=10,
+        source_lang="ja",
+        target_lang="en",
+    )
+
+    output = await agent.run(payload)
+
+    assert [(line.line_id, line.text) for line in output.translated_lines] == [
+        ("line_1", "A1"),
+        ("line_2", "B1"),
+        ("line_3", "C1"),
+    ]
+    repair_context = cast(TemplateContext, fake.contexts[1])
+    assert repair_context.agent_variables["line_count"] == "1"
+    repair_lines = repair_context.agent_variables["annotated_source_lines"]
+    assert "line_2" in repair_lines
+    assert "line_1" not in repair_lines
+    assert "Missing: line_2" in repair_context.agent_variables["alignment_feedback"]
+
+
 @pytest.mark.asyncio
 async def test_translate_raises_after_retry_exhausted() -> None:
     """Translate agent raises after alignment retries are exhausted."""
@@ -234,11 +301,15 @@ async def test_edit_retries_on_alignment_error() -> None:
         glossary=None,
         style_guide=None,
     )
-    bad_result = TranslationResultLine(line_id="line_999", text="A2")
-    good_result = TranslationResultLine(line_id="line_1", text="A2")
+    bad_result = TranslationResultList(
+        translations=[TranslationResultLine(line_id="line_999", text="A2")]
+    )
+    good_result = TranslationResultList(
+        translations=[TranslationResultLine(line_id="line_1", text="A2")]
+    )
     agent = EditBasicEditorAgent(
         profile_agent=cast(
-            ProfileAgent[EditPhaseInput, TranslationResultLine],
+            ProfileAgent[EditPhaseInput, TranslationResultList],
             FakeAgent(outputs=[bad_result, good_result]),
         ),
         config=config,
@@ -290,8 +361,8 @@ async def test_context_retries_on_alignment_error() -> None:
 
 
 @pytest.mark.asyncio
-async def test_pretranslation_retries_on_extra_ids() -> None:
-    """Pretranslation agent retries when review line_id is not in input (extra IDs)."""
+async def test_pretranslation_drops_extra_ids_without_retry() -> None:
+    """Pretranslation agent drops extra review IDs instead of retrying."""
     config = _build_config(max_output_retries=1)
     source_lines = [SourceLine(line_id="line_1", text="A", scene_id="scene_1")]
     payload = PretranslationPhaseInput(
@@ -312,10 +383,10 @@ async def test_pretranslation_retries_on_extra_ids() -> None:
     good_result = IdiomAnnotationList(
         reviews=[IdiomReviewLine(line_id="line_1", idioms=[idiom])]
     )
+    fake = FakeAgent(outputs=[bad_result, good_result])
     agent = PretranslationIdiomLabelerAgent(
         profile_agent=cast(
-            ProfileAgent[PretranslationPhaseInput, IdiomAnnotationList],
-            FakeAgent(outputs=[bad_result, good_result]),
+            ProfileAgent[PretranslationPhaseInput, IdiomAnnotationList], fake
         ),
         config=config,
         chunk_size=10,
@@ -327,6 +398,7 @@ async def test_pretranslation_retries_on_extra_ids() -> None:
 
     assert len(output.annotations) == 1
     assert output.annotations[0].line_id == "line_1"
+    assert fake.call_count == 1
 
 
 @pytest.mark.asyncio
@@ -519,3 +591,143 @@ async def test_pretranslation_raises_after_retry_exhausted() -> None:
 
     with pytest.raises(RuntimeError, match="Alignment error"):
         await agent.run(payload)
+
+
+class LimitedTranslator(BaseModel):
+    """Fake translator that fails chunks with more lines than it can handle."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    max_lines: int = Field(description="Largest chunk translated without failure")
+    invalid_output: bool = Field(
+        default=False,
+        description="Fail oversized chunks with invalid output, not a usage limit",
+    )
+    requested: list[list[str]] = Field(
+        default_factory=list, description="Line IDs requested per run() call"
+    )
+
+    async def run(
+        self,
+        payload: BaseModel,
+        context: TemplateContext,
+        cacheable: Callable[[BaseModel], bool] | None = None,
+    ) -> TranslationResultList:
+        """Translate requested lines or fail when the chunk is too large.
+
+        Returns:
+            Translations for every requested line.
+
+        Raises:
+            UnexpectedModelBehavior: If the chunk is too large and
+                invalid_output is set.
+            UsageLimitExceeded: If the chunk is too large.
+        """
+        prompt_lines = context.agent_variables["annotated_source_lines"]
+        line_ids = re.findall(r"line_\d+", prompt_lines)
+        self.requested.append(line_ids)
+        if len(line_ids) > self.max_lines:
+            if self.invalid_output:
+                raise UnexpectedModelBehavior("invalid output")
+            raise UsageLimitExceeded("output token limit")
+        return TranslationResultList(
+            translations=[
+                TranslationResultLine(line_id=line_id, text=f"T-{line_id}")
+                for line_id in line_ids
+            ]
+        )
+
+
+def _translate_payload(source_lines: list[SourceLine]) -> TranslatePhaseInput:
+    return TranslatePhaseInput(
+        run_id=UUID("00000000-0000-7000-8000-000000000031"),
+        target_language="en",
+        source_lines=source_lines,
+        scene_summaries=None,
+        context_notes=None,
+        project_context=None,
+        pretranslation_annotations=None,
+        term_candidates=None,
+        glossary=None,
+        style_guide=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_translate_token_budget_packs_by_line_length() -> None:
+    """Token-budgeted chunks hold many short lines but few long ones."""
+    source_lines = [
+        SourceLine(line_id=f"line_{index}", text="はい", scene_id="scene_1")
+        for index in range(6)
+    ] + [
+        SourceLine(line_id=f"line_{index}", text="あ" * 60, scene_id="scene_2")
+        for index in range(6, 9)
+    ]
+    fake = LimitedTranslator(max_lines=100)
+    agent = TranslateDirectTranslatorAgent(
+        profile_agent=cast(
+            ProfileAgent[TranslatePhaseInput, TranslationResultList], fake
+        ),
+        config=_build_config(),
+        chunk_size=50,
+        chunk_token_budget=80,
+    )
+
+    output = await agent.run(_translate_payload(source_lines))
+
+    assert [len(line_ids) for line_ids in fake.requested] == [6, 1, 1, 1]
+    assert [line.line_id for line in output.translated_lines] == [
+        line.line_id for line in source_lines
+    ]
+
+
+@pytest.mark.asyncio
+async def test_translate_splits_budgeted_chunk_after_usage_limit() -> None:
+    """A budgeted chunk that hits a limit is retried as smaller chunks."""
+    source_lines = [
+        SourceLine(line_id=f"line_{index}", text="A", scene_id="scene_1")
+        for index in range(4)
+    ]
+    fake = LimitedTranslator(max_lines=2)
+    agent = TranslateDirectTranslatorAgent(
+        profile_agent=cast(
+            ProfileAgent[TranslatePhaseInput, TranslationResultList], fake
+        ),
+        config=_build_config(max_output_retries=0),
+        chunk_size=10,
+        chunk_token_budget=1000,
+    )
+
+    output = await agent.run(_translate_payload(source_lines))
+
+    assert fake.requested == [
+        ["line_0", "line_1", "line_2", "line_3"],
+        ["line_0", "line_1"],
+        ["line_2", "line_3"],
+    ]
+    assert [(line.line_id, line.text) for line in output.translated_lines] == [
+        (f"line_{index}", f"T-line_{index}") for index in range(4)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_translate_does_not_split_chunk_after_invalid_output() -> None:
+    """Failures other than limits retry the whole chunk and then give up."""
+    source_lines = [
+        SourceLine(line_id=f"line_{index}", text="A", scene_id="scene_1")
+        for index in range(4)
+    ]
+    fake = LimitedTranslator(max_lines=2, invalid_output=True)
+    agent = TranslateDirectTranslatorAgent(
+        profile_agent=cast(
+            ProfileAgent[TranslatePhaseInput, TranslationResultList], fake
+        ),
+        config=_build_config(max_output_retries=1),
+        chunk_size=10,
+        chunk_token_budget=1000,
+    )
+
+    with pytest.raises(UnexpectedModelBehavior):
+        await agent.run(_translate_payload(source_lines))
+
+    assert fake.requested == [[f"line_{index}" for index in range(4)]] * 2
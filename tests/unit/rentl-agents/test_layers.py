@@ -409,6 +409,69 @@ class TestPromptComposer:
         assert "Scene: scene_001" in result
         assert "Lines: Line 1\nLine 2" in result
 
+    def test_render_static_context(self) -> None:
+        """Test static context renders only when the profile defines it."""
+        composer = PromptComposer(registry=PromptLayerRegistry())
+        prompts = AgentPromptConfig(
+            agent=AgentPromptContent(content="Agent"),
+            user_template=AgentPromptContent(content="Lines: {{lines_to_review}}"),
+            static_context=AgentPromptContent(content="Guide: {{style_guide}}\n"),
+        )
+        agent_profile = AgentProfileConfig(
+            meta=AgentProfileMeta(
+                name="test_agent",
+                version="1.0.0",
+                phase=PhaseName.QA,
+                description="Test agent",
+                output_schema="StyleGuideReviewList",
+            ),
+            prompts=prompts,
+        )
+        context = TemplateContext(agent_variables={"style_guide": "Be terse."})
+
+        assert (
+            composer.render_static_context(agent_profile, context) == "Guide: Be terse."
+        )
+        no_static = agent_profile.model_copy(
+            update={"prompts": prompts.model_copy(update={"static_context": None})}
+        )
+        assert composer.render_static_context(no_static, context) is None
+
+    def test_prefix_variables(self) -> None:
+        """Test prefix variables cover system layers and static context only."""
+        registry = PromptLayerRegistry()
+        registry.set_root(
+            RootPromptConfig(system=PromptLayerContent(content="Root: {{game_name}}"))
+        )
+        registry.set_phase(
+            PhasePromptConfig(
+                phase=PhaseName.QA,
+                system=PromptLayerContent(content="Into {{target_lang}}"),
+            )
+        )
+        composer = PromptComposer(registry=registry)
+        agent_profile = AgentProfileConfig(
+            meta=AgentProfileMeta(
+                name="test_agent",
+                version="1.0.0",
+                phase=PhaseName.QA,
+                description="Test agent",
+                output_schema="StyleGuideReviewList",
+            ),
+            prompts=AgentPromptConfig(
+                agent=AgentPromptContent(content="From {{source_lang}}"),
+                user_template=AgentPromptContent(content="{{lines_to_review}}"),
+                static_context=AgentPromptContent(content="{{style_guide}}"),
+            ),
+        )
+
+        assert composer.prefix_variables(agent_profile) == {
+            "game_name",
+            "target_lang",
+            "source_lang",
+            "style_guide",
+        }
+
 
 class TestLayerLoadError:
     """Test cases for LayerLoadError."""
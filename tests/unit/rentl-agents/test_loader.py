@@ -129,6 +129,33 @@ content = "{{unknown_variable_xyz}}"
 
         assert "unknown" in str(exc_info.value).lower()
 
+    def test_load_static_context_rejects_chunk_variables(self, tmp_path: Path) -> None:
+        """Test static context may not reference per-chunk variables."""
+        profile_content = """
+[meta]
+name = "test_agent"
+version = "1.0.0"
+phase = "qa"
+description = "Test agent"
+output_schema = "StyleGuideReviewList"
+
+[prompts.agent]
+content = "You are a test agent."
+
+[prompts.static_context]
+content = "{{style_guide}}\\n{{lines_to_review}}"
+
+[prompts.user_template]
+content = "{{lines_to_review}}"
+"""
+        profile_path = tmp_path / "test_agent.toml"
+        profile_path.write_text(profile_content)
+
+        with pytest.raises(AgentProfileLoadError) as exc_info:
+            load_agent_profile(profile_path)
+
+        assert "lines_to_review" in str(exc_info.value)
+
     def test_load_unknown_output_schema(self, tmp_path: Path) -> None:
         """Test loading profile with unknown output schema raises error."""
         profile_content = """
@@ -6,6 +6,7 @@ import asyncio
 from collections.abc import AsyncIterator, Callable
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
 from uuid import uuid7
@@ -16,12 +17,18 @@ from pydantic_ai.messages import (
     ModelResponse,
     RetryPromptPart,
     ToolCallPart,
+    ToolReturnPart,
+    UserPromptPart,
 )
+from pydantic_ai.models import Model
+from pydantic_ai.models.function import AgentInfo, FunctionModel
 from pydantic_ai.tools import ToolDefinition
 from pydantic_ai.usage import RunUsage
 
-from rentl_agents.layers import PromptLayerRegistry
+from rentl_agents.layers import PromptComposer, PromptLayerRegistry
 from rentl_agents.runtime import ProfileAgent, ProfileAgentConfig
+from rentl_agents.templates import TemplateContext
+from rentl_agents.tools.game_info import GameInfoTool, ProjectContext
 from rentl_agents.tools.registry import ToolRegistry
 from rentl_schemas.agents import (
     AgentProfileConfig,
@@ -31,10 +38,13 @@ from rentl_schemas.agents import (
     PhasePromptConfig,
     PromptLayerContent,
     RootPromptConfig,
+    ToolAccessConfig,
 )
+from rentl_schemas.config import CacheConfig
 from rentl_schemas.io import SourceLine
 from rentl_schemas.phases import ContextPhaseInput, SceneSummary
 from rentl_schemas.primitives import PhaseName
+from rentl_schemas.progress import AgentUsageTotals
 
 
 def _build_profile() -> AgentProfileConfig:
@@ -242,6 +252,56 @@ def test_profile_agent_execute_non_openrouter_uses_openai_model() -> None:
     assert call_kwargs["output_type"] is SceneSummary
 
 
+def test_profile_agent_execute_uses_model_registry() -> None:
+    """A shared model registry replaces per-call model construction."""
+    profile = _build_profile()
+    registry = _build_registry()
+    config = ProfileAgentConfig(
+        api_key="test",
+        base_url="http://localhost:8000/v1",
+        model_id="gpt-5-nano",
+        max_requests_per_run=3,
+        max_parallel_requests=6,
+    )
+    model_registry = MagicMock()
+    model_registry.get_model.return_value = (
+        MagicMock(spec=Model),
+        {"temperature": 0.7},
+    )
+    agent = ProfileAgent(
+        profile=profile,
+        output_type=SceneSummary,
+        layer_registry=registry,
+        tool_registry=ToolRegistry(),
+        config=config,
+        model_registry=model_registry,
+    )
+    stub_output = SceneSummary(scene_id="scene_2", summary="ok", characters=["B"])
+    stub_run = _StubAgentRun(stub_output, RunUsage(requests=1))
+
+    @asynccontextmanager
+    async def _iter_stub(  # noqa: RUF029
+        *args: str,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> AsyncIterator[_StubAgentRun]:
+        yield stub_run
+
+    mock_agent_instance = MagicMock()
+    mock_agent_instance.iter = _iter_stub
+    mock_agent_cls = MagicMock(return_value=mock_agent_instance)
+
+    with (
+        patch("rentl_agents.runtime.create_model") as mock_factory,
+        patch("rentl_agents.runtime.Agent", _agent_shim(mock_agent_cls)),
+    ):
+        result, _usage = asyncio.run(agent._execute(_build_payload()))
+
+    assert result.scene_id == "scene_2"
+    mock_factory.assert_not_called()
+    model_registry.get_model.assert_called_once()
+    assert model_registry.get_model.call_args.kwargs["max_connections"] == 6
+
+
 def test_profile_agent_execute_sets_prepare_output_tools_when_required() -> None:
     """Required tool calls should gate output tools and register recovery."""
     profile = _build_profile()
@@ -320,6 +380,296 @@ def test_profile_agent_execute_sets_prepare_output_tools_when_required() -> None
     assert len(registered_instructions) == 1
 
 
+def test_profile_agent_execute_reuses_cached_response(tmp_path: Path) -> None:
+    """Identical requests are served from the response cache."""
+    config = ProfileAgentConfig(
+        api_key="test",
+        base_url="http://localhost:8000/v1",
+        model_id="gpt-5-nano",
+        response_cache=CacheConfig(enabled=True, cache_dir=str(tmp_path)),
+    )
+    agent = ProfileAgent(
+        profile=_build_profile(),
+        output_type=SceneSummary,
+        layer_registry=_build_registry(),
+        tool_registry=ToolRegistry(),
+        config=config,
+    )
+    stub_output = SceneSummary(scene_id="scene_1", summary="ok", characters=["A"])
+    stub_run = _StubAgentRun(stub_output, RunUsage(input_tokens=5, requests=1))
+
+    @asynccontextmanager
+    async def _iter_stub(  # noqa: RUF029
+        *args: str,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> AsyncIterator[_StubAgentRun]:
+        yield stub_run
+
+    mock_agent_instance = MagicMock()
+    mock_agent_instance.iter = _iter_stub
+    mock_agent_cls = MagicMock(return_value=mock_agent_instance)
+
+    with (
+        patch(
+            "rentl_agents.runtime.create_model",
+            return_value=(MagicMock(), {"temperature": 0.7}),
+        ),
+        patch("rentl_agents.runtime.Agent", _agent_shim(mock_agent_cls)),
+    ):
+        first, first_usage = asyncio.run(agent._execute(_build_payload()))
+        second, second_usage = asyncio.run(agent._execute(_build_payload()))
+
+    assert first == second
+    assert first_usage is not None
+    # Cache hits spend no tokens and never construct an Agent
+    assert second_usage == AgentUsageTotals(cost_usd=0.0)
+    assert mock_agent_cls.call_count == 1
+
+
+def test_profile_agent_execute_skips_cache_for_rejected_output(
+    tmp_path: Path,
+) -> None:
+    """Outputs failing the cacheable check are neither stored nor replayed."""
+    config = ProfileAgentConfig(
+        api_key="test",
+        base_url="http://localhost:8000/v1",
+        model_id="gpt-5-nano",
+        response_cache=CacheConfig(enabled=True, cache_dir=str(tmp_path)),
+    )
+    agent = ProfileAgent(
+        profile=_build_profile(),
+        output_type=SceneSummary,
+        layer_registry=_build_registry(),
+        tool_registry=ToolRegistry(),
+        config=config,
+    )
+    stub_output = SceneSummary(scene_id="scene_2", summary="ok", characters=["A"])
+    stub_run = _StubAgentRun(stub_output, RunUsage(input_tokens=5, requests=1))
+
+    @asynccontextmanager
+    async def _iter_stub(  # noqa: RUF029
+        *args: str,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> AsyncIterator[_StubAgentRun]:
+        yield stub_run
+
+    mock_agent_instance = MagicMock()
+    mock_agent_instance.iter = _iter_stub
+    mock_agent_cls = MagicMock(return_value=mock_agent_instance)
+
+    def _aligned(output: SceneSummary) -> bool:
+        return output.scene_id == "scene_1"
+
+    with (
+        patch(
+            "rentl_agents.runtime.create_model",
+            return_value=(MagicMock(), {"temperature": 0.7}),
+        ),
+        patch("rentl_agents.runtime.Agent", _agent_shim(mock_agent_cls)),
+    ):
+        asyncio.run(agent._execute(_build_payload(), None, _aligned))
+        asyncio.run(agent._execute(_build_payload(), None, _aligned))
+
+    assert mock_agent_cls.call_count == 2
+    assert not list(tmp_path.rglob("*.json"))
+
+
+def test_profile_agent_execute_prefetches_static_tools() -> None:
+    """Prefetched tools run locally once and reach the model as a completed call."""
+    profile = _build_profile().model_copy(
+        update={
+            "tools": ToolAccessConfig(
+                allowed=["get_game_info"],
+                required=["get_game_info"],
+                prefetch=["get_game_info"],
+            )
+        }
+    )
+    tool = GameInfoTool(ProjectContext(game_name="Prefetched"))
+    tool_registry = ToolRegistry()
+    tool_registry.register(tool)
+    seen: list[tuple[list[ModelMessage], AgentInfo]] = []
+
+    def _respond(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        seen.append((messages, info))
+        return ModelResponse(
+            parts=[
+                ToolCallPart(
+                    tool_name=info.output_tools[0].name,
+                    args={"scene_id": "scene_1", "summary": "ok", "characters": []},
+                )
+            ]
+        )
+
+    model_registry = MagicMock()
+    model_registry.get_model.return_value = (FunctionModel(_respond), {})
+    agent = ProfileAgent(
+        profile=profile,
+        output_type=SceneSummary,
+        layer_registry=_build_registry(),
+        tool_registry=tool_registry,
+        config=ProfileAgentConfig(
+            api_key="test",
+            base_url="http://localhost:8000/v1",
+            model_id="gpt-5-nano",
+        ),
+        model_registry=model_registry,
+    )
+
+    result, usage = asyncio.run(agent._execute(_build_payload()))
+    tool.update_context(ProjectContext(game_name="Changed"))
+    asyncio.run(agent._execute(_build_payload()))
+
+    assert result.summary == "ok"
+    assert usage is not None
+    assert usage.request_count == 1
+    messages, info = seen[0]
+    # The tool is not offered to the model; its result is already in history
+    assert info.function_tools == []
+    returns = [
+        part
+        for message in messages
+        for part in message.parts
+        if isinstance(part, ToolReturnPart)
+    ]
+    assert [part.tool_name for part in returns] == ["get_game_info"]
+    assert returns[0].content["game_name"] == "Prefetched"
+    # The agent reuses its first prefetch result for later chunks
+    later_returns = [
+        part
+        for message in seen[1][0]
+        for part in message.parts
+        if isinstance(part, ToolReturnPart)
+    ]
+    assert later_returns[0].content["game_name"] == "Prefetched"
+
+
+def test_profile_agent_execute_sends_static_prefix_before_chunk() -> None:
+    """Static context leads the prompt and OpenAI gets a prefix cache key."""
+    base = _build_profile()
+    profile = base.model_copy(
+        update={
+            "prompts": base.prompts.model_copy(
+                update={"static_context": AgentPromptContent(content="Static")}
+            )
+        }
+    )
+    seen: list[tuple[list[ModelMessage], AgentInfo]] = []
+
+    def _respond(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        seen.append((messages, info))
+        return ModelResponse(
+            parts=[
+                ToolCallPart(
+                    tool_name=info.output_tools[0].name,
+                    args={"scene_id": "scene_1", "summary": "ok", "characters": []},
+                )
+            ]
+        )
+
+    model_registry = MagicMock()
+    model_registry.get_model.return_value = (FunctionModel(_respond), {})
+    agent = ProfileAgent(
+        profile=profile,
+        output_type=SceneSummary,
+        layer_registry=_build_registry(),
+        tool_registry=ToolRegistry(),
+        config=ProfileAgentConfig(
+            api_key="test",
+            base_url="https://api.openai.com/v1",
+            model_id="gpt-5-nano",
+        ),
+        model_registry=model_registry,
+    )
+
+    asyncio.run(agent._execute(_build_payload()))
+
+    messages, info = seen[0]
+    prompts = [
+        part.content
+        for message in messages
+        for part in message.parts
+        if isinstance(part, UserPromptPart)
+    ]
+    assert prompts == ["Static", "User prompt"]
+    assert info.model_settings is not None
+    extra_body = info.model_settings.get("extra_body")
+    assert isinstance(extra_body, dict)
+    assert str(extra_body["prompt_cache_key"]).startswith("rentl-context-")
+
+
+def test_profile_agent_serves_concurrent_calls_with_own_context() -> None:
+    """One agent runs concurrent chunks, composing the shared prefix once."""
+    base = _build_profile()
+    profile = base.model_copy(
+        update={
+            "prompts": base.prompts.model_copy(
+                update={
+                    "agent": AgentPromptContent(content="Target {{target_lang}}"),
+                    "user_template": AgentPromptContent(content="{{scene_lines}}"),
+                }
+            )
+        }
+    )
+    seen: list[str] = []
+
+    async def _respond(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        await asyncio.sleep(0)
+        prompt = next(
+            part.content
+            for message in messages
+            for part in message.parts
+            if isinstance(part, UserPromptPart)
+        )
+        assert isinstance(prompt, str)
+        seen.append(prompt)
+        return ModelResponse(
+            parts=[
+                ToolCallPart(
+                    tool_name=info.output_tools[0].name,
+                    args={"scene_id": "scene_1", "summary": prompt, "characters": []},
+                )
+            ]
+        )
+
+    model_registry = MagicMock()
+    model_registry.get_model.return_value = (FunctionModel(_respond), {})
+    agent = ProfileAgent(
+        profile=profile,
+        output_type=SceneSummary,
+        layer_registry=_build_registry(),
+        tool_registry=ToolRegistry(),
+        config=ProfileAgentConfig(
+            api_key="test", base_url="http://localhost", model_id="gpt-5-nano"
+        ),
+        model_registry=model_registry,
+    )
+    contexts = [
+        TemplateContext(
+            phase_variables={"target_lang": "en"},
+            agent_variables={"scene_lines": f"chunk {index}"},
+        )
+        for index in range(3)
+    ]
+
+    async def _run_all() -> list[SceneSummary]:
+        return await asyncio.gather(
+            *(agent.run(_build_payload(), context) for context in contexts)
+        )
+
+    with patch.object(
+        PromptComposer,
+        "compose_system_prompt",
+        autospec=True,
+        side_effect=PromptComposer.compose_system_prompt,
+    ) as compose:
+        results = asyncio.run(_run_all())
+
+    assert [result.summary for result in results] == ["chunk 0", "chunk 1", "chunk 2"]
+    assert sorted(seen) == ["chunk 0", "chunk 1", "chunk 2"]
+    assert compose.call_count == 1
+
+
 # --- Tests for _required_tools_recovery logic ---
 
 
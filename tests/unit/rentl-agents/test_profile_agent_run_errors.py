@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
 from typing import TypedDict
 from uuid import uuid7
 
@@ -11,6 +12,7 @@ from pydantic_ai.exceptions import UnexpectedModelBehavior, UsageLimitExceeded
 
 from rentl_agents.layers import PromptLayerRegistry
 from rentl_agents.runtime import ProfileAgent, ProfileAgentConfig
+from rentl_agents.templates import TemplateContext
 from rentl_agents.tools.registry import ToolRegistry
 from rentl_schemas.agents import (
     AgentProfileConfig,
@@ -105,7 +107,10 @@ def test_profile_agent_run_raises_on_usage_limit() -> None:
 
     class UsageLimitAgent(ProfileAgent[ContextPhaseInput, SceneSummary]):
         async def _execute(
-            self, payload: ContextPhaseInput
+            self,
+            payload: ContextPhaseInput,
+            context: TemplateContext | None = None,
+            cacheable: Callable[[SceneSummary], bool] | None = None,
         ) -> tuple[SceneSummary, None]:
             raise UsageLimitExceeded("limit")
 
@@ -121,7 +126,10 @@ def test_profile_agent_run_raises_on_invalid_output() -> None:
 
     class InvalidOutputAgent(ProfileAgent[ContextPhaseInput, SceneSummary]):
         async def _execute(
-            self, payload: ContextPhaseInput
+            self,
+            payload: ContextPhaseInput,
+            context: TemplateContext | None = None,
+            cacheable: Callable[[SceneSummary], bool] | None = None,
         ) -> tuple[SceneSummary, None]:
             raise UnexpectedModelBehavior("invalid")
 
@@ -138,7 +146,10 @@ def test_profile_agent_run_retries_on_transient_error() -> None:
 
     class RetryAgent(ProfileAgent[ContextPhaseInput, SceneSummary]):
         async def _execute(
-            self, payload: ContextPhaseInput
+            self,
+            payload: ContextPhaseInput,
+            context: TemplateContext | None = None,
+            cacheable: Callable[[SceneSummary], bool] | None = None,
         ) -> tuple[SceneSummary, None]:
             call_count["count"] += 1
             if call_count["count"] == 1:
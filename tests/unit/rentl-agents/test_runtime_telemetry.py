@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
 from uuid import uuid7
 
 import pytest
@@ -14,6 +15,7 @@ from rentl_agents.runtime import (
     ProfileAgentConfig,
     _ValidationFailureInfo,  # noqa: PLC2701
 )
+from rentl_agents.templates import TemplateContext
 from rentl_agents.tools.registry import ToolRegistry
 from rentl_core.telemetry import AgentTelemetryEmitter
 from rentl_io.storage import InMemoryProgressSink
@@ -129,7 +131,10 @@ def test_profile_agent_emits_telemetry_on_success() -> None:
 
     class StubProfileAgent(ProfileAgent[ContextPhaseInput, SceneSummary]):
         async def _execute(
-            self, payload: ContextPhaseInput
+            self,
+            payload: ContextPhaseInput,
+            context: TemplateContext | None = None,
+            cacheable: Callable[[SceneSummary], bool] | None = None,
         ) -> tuple[SceneSummary, AgentUsageTotals | None]:
             return await _execute_stub(payload)
 
@@ -182,7 +187,10 @@ def test_profile_agent_emits_retry_progress() -> None:
 
     class StubProfileAgent(ProfileAgent[ContextPhaseInput, SceneSummary]):
         async def _execute(
-            self, payload: ContextPhaseInput
+            self,
+            payload: ContextPhaseInput,
+            context: TemplateContext | None = None,
+            cacheable: Callable[[SceneSummary], bool] | None = None,
         ) -> tuple[SceneSummary, AgentUsageTotals | None]:
             return await _execute_stub(payload)
 
@@ -232,7 +240,10 @@ def test_profile_agent_emits_required_tool_satisfaction_marker() -> None:
 
     class StubProfileAgent(ProfileAgent[ContextPhaseInput, SceneSummary]):
         async def _execute(
-            self, payload: ContextPhaseInput
+            self,
+            payload: ContextPhaseInput,
+            context: TemplateContext | None = None,
+            cacheable: Callable[[SceneSummary], bool] | None = None,
         ) -> tuple[SceneSummary, AgentUsageTotals | None]:
             return await _execute_stub(payload)
 
@@ -263,7 +274,10 @@ def test_profile_agent_emits_diagnostics_on_unexpected_model_behavior() -> None:
 
     class FailingAgent(ProfileAgent[ContextPhaseInput, SceneSummary]):
         async def _execute(
-            self, payload: ContextPhaseInput
+            self,
+            payload: ContextPhaseInput,
+            context: TemplateContext | None = None,
+            cacheable: Callable[[SceneSummary], bool] | None = None,
         ) -> tuple[SceneSummary, AgentUsageTotals | None]:
             exc = UnexpectedModelBehavior("Exceeded maximum retries (10)")
             exc._validation_failure_info = _ValidationFailureInfo(  # type: ignore[attr-defined]
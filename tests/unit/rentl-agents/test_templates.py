@@ -131,6 +131,14 @@ class TestGetAllowedVariablesForLayer:
         assert "target_lang" in allowed
         assert "source_lines" in allowed  # Translate uses source_lines, not source_text
 
+    def test_edit_phase(self) -> None:
+        """Test edit phase layer variables are batch-level only."""
+        allowed = get_allowed_variables_for_layer("edit")
+
+        assert "lines_to_edit" in allowed
+        assert "line_id" not in allowed  # Edit runs in batches, not per line
+        assert "qa_issues" not in allowed
+
     def test_unknown_phase_raises(self) -> None:
         """Test unknown phase raises ValueError."""
         with pytest.raises(ValueError):
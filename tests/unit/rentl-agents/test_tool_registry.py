@@ -12,6 +12,20 @@ from rentl_agents.tools import (
     ToolRegistry,
     get_default_registry,
 )
+from rentl_schemas.primitives import JsonValue
+
+
+class _SceneLookupTool:
+    @property
+    def name(self) -> str:
+        return "lookup_scene"
+
+    @property
+    def description(self) -> str:
+        return "Look up a scene."
+
+    def execute(self, scene_id: str) -> dict[str, JsonValue]:
+        return {"scene_id": scene_id}
 
 
 class TestToolRegistry:
@@ -111,6 +125,28 @@ class TestToolRegistry:
         assert isinstance(callables[0], Tool)
         assert callables[0].name == "get_game_info"
 
+    def test_execute_prefetched(self) -> None:
+        """Test prefetched tools are executed locally by name."""
+        registry = ToolRegistry()
+        registry.register(GameInfoTool(ProjectContext(game_name="Prefetched")))
+
+        results = registry.execute_prefetched(["get_game_info"])
+
+        assert list(results) == ["get_game_info"]
+        assert results["get_game_info"]["game_name"] == "Prefetched"
+
+    def test_validate_prefetched_rejects_tools_with_arguments(self) -> None:
+        """Test only argument-free registered tools can be prefetched."""
+        registry = ToolRegistry()
+        registry.register(GameInfoTool())
+        registry.register(_SceneLookupTool())
+
+        registry.validate_prefetched(["get_game_info"])
+        with pytest.raises(ValueError, match="requires: scene_id"):
+            registry.validate_prefetched(["lookup_scene"])
+        with pytest.raises(ToolNotFoundError):
+            registry.validate_prefetched(["nonexistent"])
+
 
 class TestGameInfoTool:
     """Test cases for GameInfoTool class."""
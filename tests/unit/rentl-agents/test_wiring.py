@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from pathlib import Path
 from unittest.mock import AsyncMock
 from uuid import UUID
@@ -9,16 +10,21 @@ from uuid import UUID
 import pytest
 from pydantic import ValidationError
 
+from rentl_agents.profiles.loader import load_agent_profile
 from rentl_agents.runtime import ProfileAgentConfig
+from rentl_agents.templates import TemplateContext
 from rentl_agents.wiring import (
     ContextSceneSummarizerAgent,
     EditBasicEditorAgent,
     PretranslationIdiomLabelerAgent,
     QaStyleGuideCriticAgent,
     TranslateDirectTranslatorAgent,
+    _load_agent_profile_specs,  # noqa: PLC2701
     _merge_config,  # noqa: PLC2701
     _resolve_max_consecutive_failures,  # noqa: PLC2701
     _resolve_phase_retry,  # noqa: PLC2701
+    _resolve_response_cache,  # noqa: PLC2701
+    _with_required_tools_from_profile,  # noqa: PLC2701
     build_agent_pools,
     create_context_agent_from_profile,
     create_edit_agent_from_profile,
@@ -29,7 +35,7 @@ from rentl_agents.wiring import (
     get_default_prompts_dir,
     resolve_agent_path,
 )
-from rentl_core.orchestrator import PhaseAgentPool
+from rentl_core.orchestrator import LanguageAgentPool, PhaseAgentPool
 from rentl_schemas.config import (
     AgentsConfig,
     CacheConfig,
@@ -50,13 +56,20 @@ from rentl_schemas.config import (
     RunConfig,
 )
 from rentl_schemas.io import TranslatedLine
-from rentl_schemas.phases import EditPhaseInput, TranslationResultLine
+from rentl_schemas.phases import (
+    EditPhaseInput,
+    TranslationResultLine,
+    TranslationResultList,
+)
 from rentl_schemas.primitives import (
     FileFormat,
     LogSinkType,
     PhaseName,
     PhaseWorkStrategy,
+    QaCategory,
+    QaSeverity,
 )
+from rentl_schemas.qa import QaIssue
 from rentl_schemas.version import VersionInfo
 
 
@@ -269,13 +282,17 @@ def test_build_agent_pools_resolves_endpoint_and_retry(
     monkeypatch.setenv("SECONDARY_KEY", "secondary")
 
     pools = build_agent_pools(config=config)
-    translate_pool = pools.translate_agents[0][1]
+    translate_pools = pools.translate_agents[0][1]
+    assert isinstance(translate_pools, LanguageAgentPool)
+    translate_pool = translate_pools.pool_for("en")
     assert isinstance(translate_pool, PhaseAgentPool)
     translate_agent = translate_pool._agents[0]
     assert isinstance(translate_agent, TranslateDirectTranslatorAgent)
     assert translate_agent._config.base_url == "http://localhost:9999/v1"
     assert translate_agent._config.max_retries == 5
     assert translate_agent._config.retry_base_delay == pytest.approx(2.0)
+    assert translate_agent._config.max_parallel_requests == 8
+    assert translate_agent._config.phase_max_parallel_requests is None
     context_pool = pools.context_agents[0][1]
     assert isinstance(context_pool, PhaseAgentPool)
     assert context_pool._max_parallel is None
@@ -358,28 +375,145 @@ def test_build_agent_pools_uses_package_defaults_when_agents_is_none(
     pretranslation_agent = pretranslation_pool._agents[0]
     assert isinstance(pretranslation_agent, PretranslationIdiomLabelerAgent)
 
-    translate_pool = pools.translate_agents[0][1]
+    translate_pools = pools.translate_agents[0][1]
+    assert isinstance(translate_pools, LanguageAgentPool)
+    translate_pool = translate_pools.pool_for("en")
     assert isinstance(translate_pool, PhaseAgentPool)
     translate_agent = translate_pool._agents[0]
     assert isinstance(translate_agent, TranslateDirectTranslatorAgent)
 
-    qa_pool = pools.qa_agents[0][1]
+    qa_pools = pools.qa_agents[0][1]
+    assert isinstance(qa_pools, LanguageAgentPool)
+    qa_pool = qa_pools.pool_for("en")
     assert isinstance(qa_pool, PhaseAgentPool)
     qa_agent = qa_pool._agents[0]
     assert isinstance(qa_agent, QaStyleGuideCriticAgent)
 
-    edit_pool = pools.edit_agents[0][1]
+    edit_pools = pools.edit_agents[0][1]
+    assert isinstance(edit_pools, LanguageAgentPool)
+    edit_pool = edit_pools.pool_for("en")
     assert isinstance(edit_pool, PhaseAgentPool)
     edit_agent = edit_pool._agents[0]
     assert isinstance(edit_agent, EditBasicEditorAgent)
 
 
+def test_build_agent_pools_wires_language_phases_per_target(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Language-specific phases build one cached pool per target language."""
+    repo_root = Path(__file__).resolve().parents[3]
+    project = ProjectConfig(
+        schema_version=VersionInfo(major=0, minor=1, patch=0),
+        project_name="test",
+        paths=ProjectPaths(
+            workspace_dir=str(repo_root),
+            input_path="input.txt",
+            output_dir="out",
+            logs_dir="logs",
+        ),
+        formats=FormatConfig(input_format=FileFormat.TXT, output_format=FileFormat.TXT),
+        languages=LanguageConfig(source_language="ja", target_languages=["en", "fr"]),
+    )
+    pipeline = PipelineConfig(
+        default_model=ModelSettings(model_id="gpt-4"),
+        phases=[
+            PhaseConfig(phase=PhaseName.CONTEXT, agents=["scene_summarizer"]),
+            PhaseConfig(phase=PhaseName.TRANSLATE, agents=["direct_translator"]),
+        ],
+    )
+    config = RunConfig(
+        project=project,
+        logging=LoggingConfig(sinks=[LogSinkConfig(type=LogSinkType.NOOP)]),
+        agents=None,
+        endpoint=ModelEndpointConfig(
+            provider_name="test",
+            base_url="http://localhost",
+            api_key_env="TEST_KEY",
+        ),
+        pipeline=pipeline,
+        concurrency=ConcurrencyConfig(),
+        retry=RetryConfig(),
+        cache=CacheConfig(),
+    )
+    monkeypatch.setenv("TEST_KEY", "fake-key")
+
+    pools = build_agent_pools(config=config)
+    context_pool = pools.context_agents[0][1]
+    translate_pools = pools.translate_agents[0][1]
+
+    assert isinstance(context_pool, PhaseAgentPool)
+    assert context_pool._agents[0]._target_lang == "en"
+    assert isinstance(translate_pools, LanguageAgentPool)
+    assert translate_pools.languages == []
+    french_pool = translate_pools.pool_for("fr")
+    english_pool = translate_pools.pool_for("en")
+    assert translate_pools.pool_for("fr") is french_pool
+    assert translate_pools.languages == ["fr", "en"]
+    assert isinstance(french_pool, PhaseAgentPool)
+    assert isinstance(english_pool, PhaseAgentPool)
+    assert french_pool._agents[0]._target_lang == "fr"
+    assert english_pool._agents[0]._target_lang == "en"
+    assert french_pool._agents[0]._profile_agent._profile is (
+        english_pool._agents[0]._profile_agent._profile
+    )
+
+
 def test_profile_agent_config_requires_model_id() -> None:
     """Omitting model_id raises ValidationError."""
     with pytest.raises(ValidationError, match="model_id"):
         ProfileAgentConfig(api_key="test-key")
 
 
+def test_prefetched_tools_are_not_required_from_the_model() -> None:
+    """Default profiles prefetch get_game_info instead of requiring a call."""
+    profile_path = get_default_agents_dir() / "translate" / "direct_translator.toml"
+    profile = load_agent_profile(profile_path)
+
+    config = _with_required_tools_from_profile(_build_config(), profile)
+
+    assert profile.tools.prefetch == ["get_game_info"]
+    assert config.required_tool_calls is None
+
+
+def _edit_payload(line_count: int, flagged: set[str] | None = None) -> EditPhaseInput:
+    translated_lines = [
+        TranslatedLine(
+            line_id=f"line_{index}",
+            scene_id="scene_1",
+            speaker=None,
+            source_text=f"Hi {index}",
+            text=f"Hello {index}",
+            metadata=None,
+            source_columns=None,
+        )
+        for index in range(1, line_count + 1)
+    ]
+    qa_issues = [
+        QaIssue(
+            issue_id=UUID(f"00000000-0000-7000-8000-{index:012d}"),
+            line_id=line_id,
+            category=QaCategory.STYLE,
+            severity=QaSeverity.MINOR,
+            message=f"Fix {line_id}",
+        )
+        for index, line_id in enumerate(sorted(flagged or set()), start=1)
+    ]
+    return EditPhaseInput(
+        run_id=UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb5f0"),
+        target_language="en",
+        translated_lines=translated_lines,
+        qa_issues=qa_issues or None,
+        reviewer_notes=None,
+        scene_summaries=None,
+        context_notes=None,
+        project_context=None,
+        pretranslation_annotations=None,
+        term_candidates=None,
+        glossary=None,
+        style_guide=None,
+    )
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_edit_agent_aggregate_validation_rejects_mismatched_lines() -> None:
@@ -387,11 +521,10 @@ async def test_edit_agent_aggregate_validation_rejects_mismatched_lines() -> Non
     # Build a mock profile agent that returns wrong line_id
     mock_profile = AsyncMock()
     mock_profile.run = AsyncMock(
-        side_effect=lambda _payload: TranslationResultLine(
-            line_id="line_999", text="edited"
+        side_effect=lambda _payload, _context, cacheable=None: TranslationResultList(
+            translations=[TranslationResultLine(line_id="line_999", text="edited")]
         )
     )
-    mock_profile.update_context = lambda _ctx: None
 
     config = _build_config()
     agent = EditBasicEditorAgent(
@@ -400,34 +533,10 @@ async def test_edit_agent_aggregate_validation_rejects_mismatched_lines() -> Non
         source_lang="ja",
         target_lang="en",
     )
-    payload = EditPhaseInput(
-        run_id=UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb5f0"),
-        target_language="en",
-        translated_lines=[
-            TranslatedLine(
-                line_id="line_1",
-                scene_id="scene_1",
-                speaker=None,
-                source_text="Hi",
-                text="Hello",
-                metadata=None,
-                source_columns=None,
-            ),
-        ],
-        qa_issues=None,
-        reviewer_notes=None,
-        scene_summaries=None,
-        context_notes=None,
-        project_context=None,
-        pretranslation_annotations=None,
-        term_candidates=None,
-        glossary=None,
-        style_guide=None,
-    )
 
     # The alignment retry logic will exhaust retries and raise RuntimeError
-    with pytest.raises(RuntimeError, match="line_id must match"):
-        await agent.run(payload)
+    with pytest.raises(RuntimeError, match="Alignment error"):
+        await agent.run(_edit_payload(1, flagged={"line_1"}))
 
 
 @pytest.mark.unit
@@ -436,9 +545,10 @@ async def test_edit_agent_aggregate_validation_passes_on_matching_lines() -> Non
     """EditBasicEditorAgent succeeds when output lines match input."""
     mock_profile = AsyncMock()
     mock_profile.run = AsyncMock(
-        return_value=TranslationResultLine(line_id="line_1", text="edited")
+        return_value=TranslationResultList(
+            translations=[TranslationResultLine(line_id="line_1", text="edited")]
+        )
     )
-    mock_profile.update_context = lambda _ctx: None
 
     config = _build_config()
     agent = EditBasicEditorAgent(
@@ -447,34 +557,89 @@ async def test_edit_agent_aggregate_validation_passes_on_matching_lines() -> Non
         source_lang="ja",
         target_lang="en",
     )
-    payload = EditPhaseInput(
-        run_id=UUID("01890a5c-91c8-7b2a-9f51-9b40d0cfb5f0"),
-        target_language="en",
-        translated_lines=[
-            TranslatedLine(
-                line_id="line_1",
-                scene_id="scene_1",
-                speaker=None,
-                source_text="Hi",
-                text="Hello",
-                metadata=None,
-                source_columns=None,
-            ),
-        ],
-        qa_issues=None,
-        reviewer_notes=None,
-        scene_summaries=None,
-        context_notes=None,
-        project_context=None,
-        pretranslation_annotations=None,
-        term_candidates=None,
-        glossary=None,
-        style_guide=None,
-    )
 
-    result = await agent.run(payload)
+    result = await agent.run(_edit_payload(1, flagged={"line_1"}))
     assert len(result.edited_lines) == 1
     assert result.edited_lines[0].line_id == "line_1"
+    assert result.edited_lines[0].text == "edited"
+    assert result.change_log[0].reason == "Fix line_1"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_edit_agent_batches_only_flagged_lines() -> None:
+    """Unflagged lines skip the model and flagged lines are edited in chunks."""
+    contexts: list[TemplateContext] = []
+
+    def _edit(
+        _payload: EditPhaseInput,
+        context: TemplateContext,
+        cacheable: Callable[[TranslationResultList], bool] | None = None,
+    ) -> TranslationResultList:
+        contexts.append(context)
+        lines_to_edit = context.agent_variables["lines_to_edit"]
+        ids = [
+            line_id
+            for line_id in ("line_2", "line_4", "line_5")
+            if f"[{line_id}]" in lines_to_edit
+        ]
+        return TranslationResultList(
+            translations=[
+                TranslationResultLine(line_id=line_id, text=f"edited {line_id}")
+                for line_id in ids
+            ]
+        )
+
+    mock_profile = AsyncMock()
+    mock_profile.run = AsyncMock(side_effect=_edit)
+
+    agent = EditBasicEditorAgent(
+        profile_agent=mock_profile,
+        config=_build_config(),
+        chunk_size=2,
+        source_lang="ja",
+        target_lang="en",
+    )
+
+    result = await agent.run(_edit_payload(6, flagged={"line_2", "line_4", "line_5"}))
+
+    assert mock_profile.run.await_count == 2
+    assert [context.agent_variables["line_count"] for context in contexts] == [
+        "2",
+        "1",
+    ]
+    assert [line.text for line in result.edited_lines] == [
+        "Hello 1",
+        "edited line_2",
+        "Hello 3",
+        "edited line_4",
+        "edited line_5",
+        "Hello 6",
+    ]
+    assert [edit.line_id for edit in result.change_log] == [
+        "line_2",
+        "line_4",
+        "line_5",
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_edit_agent_skips_model_without_qa_issues() -> None:
+    """Lines pass through untouched when QA flagged nothing."""
+    mock_profile = AsyncMock()
+
+    agent = EditBasicEditorAgent(profile_agent=mock_profile, config=_build_config())
+
+    result = await agent.run(_edit_payload(3))
+
+    mock_profile.run.assert_not_awaited()
+    assert [line.text for line in result.edited_lines] == [
+        "Hello 1",
+        "Hello 2",
+        "Hello 3",
+    ]
+    assert result.change_log == []
 
 
 class TestResolveAgentPath:
@@ -648,3 +813,57 @@ class TestResolveMaxConsecutiveFailuresMerge:
         result = _resolve_max_consecutive_failures(config, PhaseName.TRANSLATE)
 
         assert result == 1
+
+
+_CACHE_TEST_PHASES = [
+    PhaseConfig(phase=PhaseName.TRANSLATE, agents=["direct_translator"]),
+]
+
+
+class TestResolveResponseCache:
+    """Tests for _resolve_response_cache."""
+
+    def test_disabled_cache_resolves_to_none(self) -> None:
+        """Disabled cache settings are not passed to agents."""
+        config = _minimal_run_config(phase_overrides=_CACHE_TEST_PHASES)
+
+        assert _resolve_response_cache(config) is None
+
+    def test_relative_cache_dir_resolves_against_workspace(
+        self, tmp_path: Path
+    ) -> None:
+        """Relative cache directories are anchored to the workspace."""
+        base = _minimal_run_config(phase_overrides=_CACHE_TEST_PHASES)
+        paths = base.project.paths.model_copy(update={"workspace_dir": str(tmp_path)})
+        config = base.model_copy(
+            update={
+                "project": base.project.model_copy(update={"paths": paths}),
+                "cache": CacheConfig(enabled=True, cache_dir="cache", ttl_s=60),
+            }
+        )
+
+        result = _resolve_response_cache(config)
+
+        assert result is not None
+        assert result.cache_dir == str(tmp_path.resolve() / "cache")
+        assert result.ttl_s == 60
+
+
+def test_agent_profile_specs_are_cached_until_profiles_change(tmp_path: Path) -> None:
+    """Long-lived hosts reuse parsed profiles until a TOML file changes."""
+    agents_dir = tmp_path / "agents"
+    translate_dir = agents_dir / "translate"
+    translate_dir.mkdir(parents=True)
+    source = get_default_agents_dir() / "translate" / "direct_translator.toml"
+    target = translate_dir / "direct_translator.toml"
+    target.write_text(source.read_text(encoding="utf-8"), encoding="utf-8")
+
+    first = _load_agent_profile_specs(agents_dir)
+    second = _load_agent_profile_specs(agents_dir)
+    target.write_text(
+        source.read_text(encoding="utf-8") + "\n# edited\n", encoding="utf-8"
+    )
+    third = _load_agent_profile_specs(agents_dir)
+
+    assert second["direct_translator"] is first["direct_translator"]
+    assert third["direct_translator"] is not first["direct_translator"]
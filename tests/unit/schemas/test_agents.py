@@ -32,6 +32,15 @@ def test_tool_access_rejects_required_not_allowed() -> None:
         )
 
 
+def test_tool_access_rejects_prefetch_not_allowed() -> None:
+    """Prefetched tools must be present in allowed tools."""
+    with pytest.raises(ValidationError, match="prefetch tools"):
+        ToolAccessConfig(
+            allowed=["lookup_context"],
+            prefetch=["get_game_info"],
+        )
+
+
 def test_agent_profile_meta_coerces_phase_string() -> None:
     """Ensure AgentProfileMeta coerces phase string to PhaseName."""
     meta = AgentProfileMeta(
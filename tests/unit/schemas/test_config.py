@@ -22,6 +22,7 @@ from rentl_schemas.config import (
     ProjectPaths,
     RetryConfig,
     RunConfig,
+    StorageConfig,
 )
 from rentl_schemas.primitives import (
     FileFormat,
@@ -29,6 +30,7 @@ from rentl_schemas.primitives import (
     PhaseName,
     PhaseWorkStrategy,
 )
+from rentl_schemas.storage import StorageBackend
 from rentl_schemas.version import VersionInfo
 
 
@@ -125,6 +127,26 @@ def test_phase_execution_rejects_full_with_chunk_size() -> None:
         )
 
 
+def test_phase_execution_accepts_chunk_token_budget() -> None:
+    """Ensure chunk strategy accepts a token budget alongside chunk_size."""
+    execution = PhaseExecutionConfig(
+        strategy=PhaseWorkStrategy.CHUNK,
+        chunk_size=50,
+        chunk_token_budget=2048,
+    )
+    assert execution.chunk_token_budget == 2048
+
+
+def test_phase_execution_rejects_token_budget_without_chunk_strategy() -> None:
+    """Ensure chunk_token_budget is rejected for non-chunk strategies."""
+    with pytest.raises(ValidationError):
+        PhaseExecutionConfig(
+            strategy=PhaseWorkStrategy.SCENE,
+            scene_batch_size=1,
+            chunk_token_budget=2048,
+        )
+
+
 def test_format_config_coerces_string_values() -> None:
     """Ensure format strings are coerced to enums."""
     config = FormatConfig.model_validate({
@@ -734,3 +756,22 @@ def test_run_config_skips_validation_for_non_openrouter_endpoint() -> None:
     )
     assert config.pipeline.default_model is not None
     assert config.pipeline.default_model.model_id == "local-model"
+
+
+def test_storage_config_accepts_sqlite_backend() -> None:
+    """Ensure the SQLite backend is selectable from TOML-style values."""
+    config = StorageConfig.model_validate({
+        "backend": "sqlite",
+        "database_path": ".rentl/runs.db",
+    })
+
+    assert config.backend == StorageBackend.SQLITE
+    assert StorageConfig().backend == StorageBackend.FILESYSTEM
+
+
+def test_storage_config_rejects_unsupported_backends() -> None:
+    """Ensure unimplemented backends and stray database paths are rejected."""
+    with pytest.raises(ValidationError):
+        StorageConfig(backend=StorageBackend.S3)
+    with pytest.raises(ValidationError):
+        StorageConfig(database_path="runs.db")